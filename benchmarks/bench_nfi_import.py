@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Measure how long it takes to import NostalgiaForInfinityX6 the way the freqtrade
+strategy resolver does (strategies directory on sys.path, module loaded from its
+file), in fresh interpreters so nothing is shared between runs.
+
+Reported per run:
+  deps      freqtrade, pandas, pandas_ta and talib (paid by every strategy)
+  strategy  the strategy module itself - what startup, hyperopt worker spawn and
+            list-strategies pay for NFI
+  lazy      the nfi submodules imported on first use by a trading bot/backtest
+
+"cold" runs use an empty bytecode cache (first start after an update), "warm" runs
+reuse the cached .pyc files.
+
+Usage:
+    python benchmarks/bench_nfi_import.py [--runs 5] [--strategy-file PATH]
+
+Pass --strategy-file with an older copy of the strategy (e.g. from `git show`) to
+compare against it.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+STRATEGIES_DIR = Path(__file__).resolve().parents[1] / "strategies"
+LAZY_MODULES = ["entries", "long_exits", "long_grinding", "short_exits", "short_grinding"]
+
+CHILD = """
+import importlib.util, json, sys, time
+strategy_file = sys.argv[1]
+sys.path.insert(0, sys.argv[2])
+tik = time.perf_counter()
+import freqtrade.strategy, pandas, pandas_ta, talib.abstract
+deps = time.perf_counter() - tik
+tik = time.perf_counter()
+spec = importlib.util.spec_from_file_location("NostalgiaForInfinityX6", strategy_file)
+module = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(module)
+strategy = time.perf_counter() - tik
+tik = time.perf_counter()
+if hasattr(sys.modules.get("nfi"), "import_submodule"):
+    for name in json.loads(sys.argv[3]):
+        sys.modules["nfi"].import_submodule(name)
+lazy = time.perf_counter() - tik
+print(json.dumps({"deps": deps, "strategy": strategy, "lazy": lazy}))
+"""
+
+
+def measure(strategy_file: Path, cold: bool) -> dict:
+    env = dict(os.environ)
+    with tempfile.TemporaryDirectory() as pycache:
+        if cold:
+            env["PYTHONPYCACHEPREFIX"] = pycache
+        result = subprocess.run(
+            [sys.executable, "-c", CHILD, str(strategy_file), str(STRATEGIES_DIR), json.dumps(LAZY_MODULES)],
+            env=env, capture_output=True, text=True, check=True,
+        )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--strategy-file", type=Path, default=STRATEGIES_DIR / "NostalgiaForInfinityX6.py")
+    args = parser.parse_args()
+
+    # Populate the regular bytecode cache once so warm runs measure what they claim to
+    measure(args.strategy_file, cold=False)
+
+    print(f"{args.strategy_file}")
+    print(f"{'mode':<6} {'deps ms':>10} {'strategy ms':>12} {'lazy ms':>10} {'total ms':>10}")
+    for mode in ("cold", "warm"):
+        runs = [measure(args.strategy_file, cold=(mode == "cold")) for _ in range(args.runs)]
+        deps, strategy, lazy = (statistics.median(run[key] for run in runs) * 1000 for key in ("deps", "strategy", "lazy"))
+        print(f"{mode:<6} {deps:>10.1f} {strategy:>12.1f} {lazy:>10.1f} {deps + strategy + lazy:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
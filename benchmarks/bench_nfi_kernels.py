@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+Benchmark the rolling extremes of NostalgiaForInfinityX6's indicators
+(shared.rolling.rolling_max / rolling_min, the van Herk/Gil-Werman block scan)
+against the pandas `rolling(window).max()` / `.min()` they replaced, checking
+that both produce the same values.
+
+The windows are the ones the strategy uses; --rows sets the candles of every
+frame (the informative frames are shorter than the base one in a bot, the cost
+per candle is the same).
+
+Usage:
+    python benchmarks/bench_nfi_kernels.py [--rows 100000] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "strategies"))
+
+from shared.rolling import rolling_max, rolling_min  # noqa: E402
+
+# (column, window, extreme) of every rolling extreme in NostalgiaForInfinityX6
+EXTREMES = {
+    "informative 1d": [("high", window, "max") for window in (6, 12, 20, 30)]
+    + [("low", window, "min") for window in (6, 12, 20, 30)],
+    "informative 4h": [("change_pct", window, extreme) for window in (3, 6) for extreme in ("min", "max")]
+    + [("high", window, "max") for window in (6, 12, 24)] + [("low", window, "min") for window in (6, 12, 24)],
+    "informative 1h": [("high", window, "max") for window in (6, 12, 24)]
+    + [("low", window, "min") for window in (6, 12, 24)],
+    "base 5m": [("close", window, extreme) for window in (12, 48) for extreme in ("max", "min")]
+    + [("volume", 72, "min")],
+}
+
+
+def make_ohlcv(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, rows)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.005, rows)) * close
+    return pd.DataFrame({
+        "open": open_,
+        "high": np.maximum(open_, close) + spread,
+        "low": np.minimum(open_, close) - spread,
+        "close": close,
+        "change_pct": (close - open_) / open_ * 100.0,
+        "volume": rng.lognormal(10, 1, rows),
+    })
+
+
+def pandas_extremes(df: pd.DataFrame, extremes: list) -> list:
+    return [getattr(df[column].rolling(window), extreme)() for column, window, extreme in extremes]
+
+
+def numpy_extremes(df: pd.DataFrame, extremes: list) -> list:
+    kernels = {"max": rolling_max, "min": rolling_min}
+    return [kernels[extreme](df[column].to_numpy(), window) for column, window, extreme in extremes]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.rows)
+    print(f"{'frame':<40} {'pandas ms':>10} {'numpy ms':>10} {'speedup':>8}")
+    for name, extremes in EXTREMES.items():
+        for reference, kernel in zip(pandas_extremes(df, extremes), numpy_extremes(df, extremes)):
+            if not np.array_equal(reference.to_numpy(), kernel, equal_nan=True):
+                raise AssertionError(f"{name}: kernel output differs from pandas reference")
+        pandas_time = min(timeit.repeat(lambda: pandas_extremes(df, extremes), number=1, repeat=args.repeat)) * 1000
+        numpy_time = min(timeit.repeat(lambda: numpy_extremes(df, extremes), number=1, repeat=args.repeat)) * 1000
+        label = f"{name} ({len(extremes)} extremes)"
+        print(f"{label:<40} {pandas_time:>10.2f} {numpy_time:>10.2f} {pandas_time / numpy_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
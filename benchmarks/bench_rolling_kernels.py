@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Benchmark the windowed drawdown and VWAP kernels in strategies/shared/rolling.py
+against the pandas expressions they replaced in
+PerpSpotBasisStrategy_Enhanced.calculate_risk_metrics and
+calculate_enhanced_volume_features, checking that both produce the same values.
+
+Usage:
+    python benchmarks/bench_rolling_kernels.py [--rows 100000] [--repeat 5]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "strategies"))
+
+from shared.rolling import rolling_drawdown, rolling_vwap  # noqa: E402
+
+DRAWDOWN_WINDOW = 50
+VWAP_WINDOW = 20
+
+
+# Reference pandas expressions (as previously shipped in PerpSpotBasisStrategy_Enhanced)
+
+def drawdown(df: pd.DataFrame) -> pd.Series:
+    returns = df["close"].pct_change()
+    cumulative_returns = (1 + returns).cumprod()
+    rolling_max = cumulative_returns.rolling(DRAWDOWN_WINDOW).max()
+    return (cumulative_returns - rolling_max) / rolling_max
+
+
+def vwap(df: pd.DataFrame) -> pd.Series:
+    typical_price = (df["high"] + df["low"] + df["close"]) / 3
+    return (typical_price * df["volume"]).rolling(VWAP_WINDOW).sum() / df["volume"].rolling(VWAP_WINDOW).sum()
+
+
+def make_ohlcv(rows: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 30000 * np.exp(np.cumsum(rng.normal(0, 0.002, rows)))
+    spread = np.abs(rng.normal(0, 0.001, rows)) * close
+    volume = rng.lognormal(10, 1.5, rows)
+    volume[rng.random(rows) < 0.01] = 0.0  # illiquid candles
+    return pd.DataFrame({"high": close + spread, "low": close - spread, "close": close, "volume": volume})
+
+
+def check(reference, kernel, name: str, skip: int = 0) -> None:
+    reference = np.asarray(reference, dtype=float)[skip:]
+    kernel = np.asarray(kernel, dtype=float)[skip:]
+    if not np.allclose(reference, kernel, rtol=1e-9, atol=1e-12, equal_nan=True):
+        raise AssertionError(f"{name}: kernel output differs from pandas reference")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    df = make_ohlcv(args.rows)
+    typical_price = ((df["high"] + df["low"] + df["close"]) / 3).to_numpy()
+    volume = df["volume"].to_numpy()
+    close = df["close"].to_numpy()
+
+    cases = [
+        (f"drawdown {DRAWDOWN_WINDOW}",
+         lambda: drawdown(df),
+         lambda: rolling_drawdown(close, DRAWDOWN_WINDOW),
+         DRAWDOWN_WINDOW),  # the cumprod formulation starts one candle later
+        (f"vwap {VWAP_WINDOW}",
+         lambda: vwap(df),
+         lambda: rolling_vwap(typical_price, volume, VWAP_WINDOW),
+         0),
+    ]
+    print(f"{'kernel':<40} {'pandas ms':>10} {'numpy ms':>10} {'speedup':>8}")
+    for name, reference, kernel, skip in cases:
+        check(reference(), kernel(), name, skip)
+        pandas_time = min(timeit.repeat(reference, number=1, repeat=args.repeat)) * 1000
+        numpy_time = min(timeit.repeat(kernel, number=1, repeat=args.repeat)) * 1000
+        print(f"{name:<40} {pandas_time:>10.2f} {numpy_time:>10.2f} {pandas_time / numpy_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
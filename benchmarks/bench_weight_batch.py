@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark the batched weight evaluation of strategies/shared/score_base.py
+(ScoreBase.signals, used by AlexStrategyFinalV8Hyper.evaluate_weights) against
+evaluating the candidates one at a time with the pandas expressions of
+AlexStrategyFinalV8Hyper (S as a sum of weighted columns, T, then the entry
+and exit masks), checking that both give the same signals.
+
+The normalized indicators and filters are synthetic: the cost only depends on
+the number of candles and candidates.
+
+Usage:
+    python benchmarks/bench_weight_batch.py [--rows 20000] [--candidates 256] [--repeat 3]
+"""
+import argparse
+import sys
+import timeit
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "strategies"))
+
+from shared.score_base import COMPONENTS, PARAMETERS, ScoreBase, component_weights  # noqa: E402
+
+HORIZON = 2
+SIGNALS = ("enter_long", "enter_short", "exit_long", "exit_short")
+
+
+def make_base(rows: int, seed: int = 0) -> tuple:
+    rng = np.random.default_rng(seed)
+    normalized = pd.DataFrame({f"normalized_{name}": rng.normal(0, 1, rows) for name in COMPONENTS})
+    normalized.iloc[:30] = np.nan  # rolling warmup
+    momentum_factor = np.where(rng.random(rows) < 0.2, 1.5, 1.0)
+    filters = pd.DataFrame({name: rng.choice([-1, 0, 1], rows) for name in ("R", "R2", "V", "V2")})
+    volume = np.where(rng.random(rows) < 0.02, 0.0, rng.lognormal(10, 1, rows))
+    components = normalized.to_numpy().copy()
+    components[:, COMPONENTS.index("momentum")] *= momentum_factor
+    regime = (filters["R"] * filters["R2"] * filters["V"] * filters["V2"]).to_numpy(dtype=np.float64)
+    base = ScoreBase(pd.concat([normalized, filters], axis=1), components, momentum_factor, regime)
+    frame = pd.concat([normalized, filters, pd.DataFrame({"volume": volume})], axis=1)
+    frame["momentum_factor"] = momentum_factor
+    return base, frame
+
+
+# Reference: one candidate at a time (as previously shipped in AlexStrategyFinalV8Hyper)
+
+def signals_one(df: pd.DataFrame, w: list, threshold_buy: float, threshold_sell: float) -> dict:
+    w_momentum = w[3] * df["momentum_factor"]
+    score = w[0] * df["normalized_ma"] + w[1] * df["normalized_macd"] + w[2] * df["normalized_roc"] + \
+        w[3] * df["normalized_rsi"] + w[4] * df["normalized_bb_width"] + w[5] * df["normalized_cci"] + \
+        w_momentum * df["normalized_momentum"] + w[8] * df["normalized_stoch"] + w[7] * df["normalized_atr"] + \
+        w[6] * df["normalized_obv"]
+    target = (score * df["R"] * df["R2"] * df["V"] * df["V2"]).shift(-HORIZON)
+    return {
+        "enter_long": ((target > threshold_buy) & (df["volume"] > 0)).to_numpy(),
+        "enter_short": ((target < threshold_sell) & (df["volume"] > 0)).to_numpy(),
+        "exit_long": (target < threshold_sell).to_numpy(),
+        "exit_short": (target > threshold_buy).to_numpy(),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--rows", type=int, default=20_000)
+    parser.add_argument("--candidates", type=int, default=256)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    base, frame = make_base(args.rows)
+    rng = np.random.default_rng(1)
+    parameters = rng.random((args.candidates, len(PARAMETERS)))
+    threshold_buy = rng.uniform(-1, 1, args.candidates)
+    threshold_sell = rng.uniform(-1, 1, args.candidates)
+    volume = frame["volume"].to_numpy()
+
+    def one_by_one():
+        return [signals_one(frame, list(parameters[j]), threshold_buy[j], threshold_sell[j])
+                for j in range(args.candidates)]
+
+    def batched(dtype):
+        return base.astype(dtype).signals(component_weights(parameters), threshold_buy, threshold_sell,
+                                          volume, HORIZON)
+
+    reference = one_by_one()
+    for dtype in (np.float64, np.float32):
+        masks = batched(dtype)
+        flips = sum(int(np.sum(masks[name][:, j] != reference[j][name]))
+                    for j in range(args.candidates) for name in SIGNALS)
+        if dtype == np.float64 and flips:
+            raise AssertionError(f"float64 batch differs from the pandas reference on {flips} signals")
+        print(f"{np.dtype(dtype).name}: {flips} of {args.rows * args.candidates * len(SIGNALS)} signals "
+              "differ from the pandas reference")
+
+    pandas_time = min(timeit.repeat(one_by_one, number=1, repeat=args.repeat)) * 1000
+    print(f"\n{'candidates x candles':<28} {'evaluation':<22} {'ms':>10} {'speedup':>8}")
+    label = f"{args.candidates} x {args.rows}"
+    print(f"{label:<28} {'pandas one by one':<22} {pandas_time:>10.1f} {'':>8}")
+    for dtype in (np.float64, np.float32):
+        base.astype(dtype)  # conversion is done once per base
+        numpy_time = min(timeit.repeat(lambda: batched(dtype), number=1, repeat=args.repeat)) * 1000
+        name = f"batched {np.dtype(dtype).name}"
+        print(f"{label:<28} {name:<22} {numpy_time:>10.1f} {pandas_time / numpy_time:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,126 @@
+#!/usr/bin/env python3
+"""
+Measure the restart hit rate of NostalgiaForInfinityX6's warm start snapshots
+(strategies/nfi/warm_start.py) and check that they never serve stale frames.
+
+A live bot is simulated on synthetic 5m candles and 1h/4h/1d informative
+candles: it shuts down at a uniformly random time within a candle (writing its
+snapshot, as the atexit hook does) and comes back after --downtime seconds,
+startup included. The first analysis after the restart then asks WarmStart for
+the snapshot with the candles the exchange would serve at that time. Reported
+per downtime: the share of restarts served from the snapshot.
+
+Every served frame is checked against the candles it was asked for, and a
+revised older informative candle (a day back) must make the snapshot miss.
+
+Usage:
+    python benchmarks/check_nfi_warm_start.py [--restarts 200] [--downtime 15 30 60 120 240 300]
+"""
+import argparse
+import sys
+import tempfile
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "strategies"))
+
+from nfi.signal_cache import frame_digest  # noqa: E402
+from nfi.warm_start import WarmStart  # noqa: E402
+
+CANDLE_SECONDS = 300
+WINDOW = 1000  # 5m candles of the analysed frame
+INFORMATIVE = {"1h": 12, "4h": 48, "1d": 288}  # informative timeframe -> 5m candles per candle
+INFORMATIVE_WINDOW = 500
+PAIR = "BTC/USDT"
+FINGERPRINT = "strategy and parameters"
+
+
+def make_candles(num_candles: int, seed: int = 0) -> pd.DataFrame:
+    rng = np.random.default_rng(seed)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.002, num_candles)))
+    open_ = np.concatenate(([close[0]], close[:-1]))
+    spread = np.abs(rng.normal(0, 0.001, num_candles)) * close
+    return pd.DataFrame({
+        "date": pd.date_range("2024-01-01", periods=num_candles, freq="5min", tz="UTC"),
+        "open": open_, "high": np.maximum(open_, close) + spread, "low": np.minimum(open_, close) - spread,
+        "close": close, "volume": rng.lognormal(10, 1, num_candles),
+    })
+
+
+def resample(candles: pd.DataFrame, size: int) -> pd.DataFrame:
+    groups = candles.groupby(np.arange(len(candles)) // size)
+    return pd.DataFrame({
+        "date": groups["date"].first(), "open": groups["open"].first(), "high": groups["high"].max(),
+        "low": groups["low"].min(), "close": groups["close"].last(), "volume": groups["volume"].sum(),
+    }).reset_index(drop=True)
+
+
+class Exchange:
+    """Closed candles of every timeframe as served at a given 5m candle"""
+
+    def __init__(self, candles: pd.DataFrame):
+        self.candles = candles
+        self.informative = {timeframe: resample(candles, size) for timeframe, size in INFORMATIVE.items()}
+
+    def frame(self, last: int) -> pd.DataFrame:
+        return self.candles.iloc[last + 1 - WINDOW:last + 1].reset_index(drop=True)
+
+    def digests(self, last: int, revised: bool = False) -> dict:
+        digests = {}
+        for timeframe, size in INFORMATIVE.items():
+            informative = self.informative[timeframe].iloc[:(last + 1) // size].tail(INFORMATIVE_WINDOW).copy()
+            if revised and timeframe == "1h":
+                informative.iloc[-24, informative.columns.get_loc("volume")] *= 1.01
+            digests[f"{PAIR} {timeframe}"] = frame_digest(informative)
+        return digests
+
+
+def populate(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.copy()
+    df["rsi_like"] = df["close"].pct_change().rolling(14).mean()
+    return df
+
+
+def restart(exchange: Exchange, store: Path, last: int, offset: float, downtime: float, revised: bool):
+    """Snapshot at candle last, restart downtime seconds later: (served frame or None, fresh frame)"""
+    before = WarmStart(store, 30)
+    before.record(PAIR, populate(exchange.frame(last)), FINGERPRINT, exchange.digests(last))
+    before.save()
+    now = last + int((offset + downtime) // CANDLE_SECONDS)
+    fresh = exchange.frame(now)
+    after = WarmStart(store, 30)
+    return after.load(PAIR, FINGERPRINT, fresh, exchange.digests(now, revised)), fresh
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--restarts", type=int, default=200)
+    parser.add_argument("--downtime", type=float, nargs="+", default=[15, 30, 60, 120, 240, 300])
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(1)
+    exchange = Exchange(make_candles(6000))
+    first = max(WINDOW, INFORMATIVE["1d"] * 4)
+    print(f"{'downtime s':>10} {'hit rate':>10} {'expected':>10}")
+    with tempfile.TemporaryDirectory() as store:
+        for downtime in args.downtime:
+            hits = 0
+            for _ in range(args.restarts):
+                last = int(rng.integers(first, len(exchange.candles) - 2))
+                offset = rng.uniform(0, CANDLE_SECONDS)
+                served, fresh = restart(exchange, Path(store), last, offset, downtime, revised=False)
+                if served is not None:
+                    if not served[fresh.columns].equals(fresh):
+                        raise AssertionError("snapshot served for other candles")
+                    hits += 1
+                revised, _ = restart(exchange, Path(store), last, offset, downtime, revised=True)
+                if revised is not None:
+                    raise AssertionError("snapshot served despite a revised informative candle")
+            expected = max(0.0, 1 - downtime / CANDLE_SECONDS)
+            print(f"{downtime:>10.0f} {hits / args.restarts:>9.0%} {expected:>9.0%}")
+
+
+if __name__ == "__main__":
+    main()
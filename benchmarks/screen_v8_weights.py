@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Screen AlexStrategyFinalV8Hyper weight candidates on downloaded candles before
+a hyperopt or backtest: random w0..w8/threshold sets are drawn from the
+strategy's parameter ranges and evaluated in batches with
+AlexStrategyFinalV8Hyper.evaluate_weights (one matrix product per batch and
+pair), then ranked by the forward return of their entries.
+
+The edge of a candidate is the mean return of its entries, long entries
+counting the move and short entries its opposite, from the open of the candle
+after the signal to the open target_horizon candles later. It ignores exits,
+ROI, stoploss, fees and leverage: it narrows the search, the selected
+candidates are confirmed with freqtrade backtesting. The first candidate is
+the strategy's current parameters (hyperopts/AlexStrategyFinalV8Hyper.json).
+
+The strategy is loaded from hyperopts/ with freqtrade's resolver and the
+candles with freqtrade's data loader, both from the given config.
+
+Usage:
+    python user_data/benchmarks/screen_v8_weights.py -c user_data/config_test.json [--timerange 20240101-20241231]
+        [--pairs BTC/USDT:USDT ...] [--candidates 4096] [--batch 256] [--min-entries 30] [--top 10]
+"""
+import argparse
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+ROOT = Path(__file__).resolve().parents[1]
+sys.path.insert(0, str(ROOT / "strategies"))
+
+from freqtrade.configuration import Configuration, TimeRange  # noqa: E402
+from freqtrade.data.history import load_pair_history  # noqa: E402
+from freqtrade.resolvers import StrategyResolver  # noqa: E402
+
+STRATEGY = "AlexStrategyFinalV8Hyper"
+WEIGHTS = [f"w{i}" for i in range(9)]
+
+
+def sample_candidates(strategy, candidates: int, seed: int) -> tuple:
+    """(candidates, 9) weights, threshold_buy and threshold_sell; row 0 the current parameters"""
+    rng = np.random.default_rng(seed)
+    weights = np.column_stack([rng.uniform(getattr(strategy, name).low, getattr(strategy, name).high, candidates)
+                               for name in WEIGHTS])
+    threshold_buy = rng.uniform(strategy.threshold_buy.low, strategy.threshold_buy.high, candidates)
+    threshold_sell = rng.uniform(strategy.threshold_sell.low, strategy.threshold_sell.high, candidates)
+    weights[0] = [getattr(strategy, name).value for name in WEIGHTS]
+    threshold_buy[0] = strategy.threshold_buy.value
+    threshold_sell[0] = strategy.threshold_sell.value
+    return weights, threshold_buy, threshold_sell
+
+
+def forward_returns(candles, horizon: int) -> np.ndarray:
+    """Return from the open after every candle to the open horizon candles later (NaN at the end)"""
+    open_ = candles["open"].to_numpy(dtype=np.float64)
+    returns = np.full(len(open_), np.nan)
+    if horizon + 1 < len(open_):
+        returns[:-horizon - 1] = open_[horizon + 1:] / open_[1:-horizon] - 1
+    return returns
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-c", "--config", nargs="+", required=True)
+    parser.add_argument("--timerange")
+    parser.add_argument("--pairs", nargs="+", help="default: the pair whitelist of the config")
+    parser.add_argument("--candidates", type=int, default=4096)
+    parser.add_argument("--batch", type=int, default=256)
+    parser.add_argument("--min-entries", type=int, default=30)
+    parser.add_argument("--top", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    config = Configuration.from_files(args.config)
+    config.update({"strategy": STRATEGY, "strategy_path": str(ROOT / "hyperopts")})
+    strategy = StrategyResolver.load_strategy(config)
+    pairs = args.pairs or config["exchange"]["pair_whitelist"]
+    timerange = TimeRange.parse_timerange(args.timerange) if args.timerange else None
+
+    weights, threshold_buy, threshold_sell = sample_candidates(strategy, args.candidates, args.seed)
+    edge = np.zeros(args.candidates)
+    entries = np.zeros(args.candidates, dtype=np.int64)
+    for pair in pairs:
+        candles = load_pair_history(pair, strategy.timeframe, config["datadir"], timerange=timerange,
+                                    data_format=config.get("dataformat_ohlcv"),
+                                    candle_type=config.get("candle_type_def"))
+        if candles.empty:
+            print(f"{pair}: no {strategy.timeframe} candles, skipped")
+            continue
+        returns = forward_returns(candles, strategy.target_horizon)
+        known = ~np.isnan(returns)
+        returns = np.where(known, returns, 0.0)
+        for start in range(0, args.candidates, args.batch):
+            batch = slice(start, start + args.batch)
+            signals = strategy.evaluate_weights(candles, {"pair": pair}, weights[batch], threshold_buy[batch],
+                                                threshold_sell[batch])
+            long, short = signals["enter_long"] & known[:, None], signals["enter_short"] & known[:, None]
+            edge[batch] += returns @ long - returns @ short
+            entries[batch] += long.sum(axis=0) + short.sum(axis=0)
+        print(f"{pair}: {len(candles)} candles screened")
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean_edge = np.where(entries >= args.min_entries, edge / entries, -np.inf)
+    order = np.argsort(-mean_edge, kind="stable")[:args.top]
+    print(f"\n{'rank':>4} {'candidate':>9} {'entries':>8} {'mean edge':>10}")
+    for rank, j in enumerate(order, 1):
+        if not np.isfinite(mean_edge[j]):
+            break
+        print(f"{rank:>4} {j:>9} {entries[j]:>8} {mean_edge[j]:>10.4%}")
+    current = f"{mean_edge[0]:.4%}" if np.isfinite(mean_edge[0]) else "below --min-entries"
+    print(f"current parameters (candidate 0): {entries[0]} entries, mean edge {current}")
+
+    best = order[0]
+    if np.isfinite(mean_edge[best]):
+        print("\nbuy/sell params of the best candidate, to confirm with freqtrade backtesting:")
+        buy = {"threshold_buy": round(float(threshold_buy[best]), 5)}
+        buy.update({name: round(float(value), 5) for name, value in zip(WEIGHTS, weights[best])})
+        print(json.dumps({"buy": buy, "sell": {"threshold_sell": round(float(threshold_sell[best]), 5)}}, indent=4))
+
+
+if __name__ == "__main__":
+    main()
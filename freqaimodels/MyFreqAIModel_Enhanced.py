@@ -26,9 +26,11 @@ class MyFreqAIModel_Enhanced(BaseClassifierModel):
         y = data_dictionary["train_labels"].values.ravel()
         sample_weights = data_dictionary.get("train_weights")
 
-        # Handle string labels
-        self.label_encoder = LabelEncoder()
-        y_encoded = self.label_encoder.fit_transform(y)
+        # Handle string labels: codes from a hash lookup (pd.Categorical sorts its
+        # categories like LabelEncoder.classes_) rather than sorting every label
+        labels = pd.Categorical(y)
+        self.label_encoder = LabelEncoder().fit(labels.categories.to_numpy())
+        y_encoded = labels.codes
         
         # Feature selection to reduce overfitting
         if X.shape[1] > 10:  # Only if we have many features
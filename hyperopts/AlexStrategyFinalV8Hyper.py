@@ -1,4 +1,6 @@
 import logging
+import os
+import sys
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 from functools import reduce
@@ -11,6 +13,15 @@ from technical import qtpylib
 
 from freqtrade.strategy import IStrategy, RealParameter, DecimalParameter
 
+# The strategy path of hyperopts is this directory, the shared helpers live next to the strategies.
+# Added once: the resolver loads this module again for every hyperopt worker and reload.
+STRATEGIES_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'strategies')
+if STRATEGIES_DIR not in sys.path:
+    sys.path.append(STRATEGIES_DIR)
+from shared.memo import INPUTS  # noqa: E402
+from shared.rolling import RollingMoments  # noqa: E402
+from shared.score_base import COMPONENTS, ScoreBase, ScoreBaseCache, component_weights  # noqa: E402
+
 logger = logging.getLogger(__name__)
 
 
@@ -77,6 +88,10 @@ class AlexStrategyFinalV8Hyper(IStrategy):
     w7 = RealParameter(0, 1, default=0.05, space='buy')
     w8 = RealParameter(0, 1, default=0.15, space='buy')
 
+    target_horizon = 2  # Define your prediction horizon here
+    # Weight independent layer of the target (see build_score_base), per pair
+    score_bases = ScoreBaseCache()
+
     def feature_engineering_expand_all(self, dataframe: DataFrame, period: int, metadata: Dict, **kwargs):
         dataframe["%-cci-period"] = ta.CCI(dataframe, timeperiod=20)
         dataframe["%-rsi-period"] = ta.RSI(dataframe, timeperiod=10)
@@ -114,6 +129,29 @@ class AlexStrategyFinalV8Hyper(IStrategy):
         return dataframe
 
     def populate_indicators(self, dataframe: DataFrame, metadata: Dict) -> DataFrame:
+        # Everything but the weights comes from the cached indicator layer of the pair's candles
+        base = self.score_bases.get(metadata['pair'], dataframe, self.build_score_base)
+        columns = base.columns.set_axis(dataframe.index, axis=0)
+        dataframe = pd.concat([dataframe.drop(columns=columns.columns, errors='ignore'), columns], axis=1)
+
+        # Dynamic Weights Adjustment: a higher weight for momentum if the trend is strong
+        dataframe['w_momentum'] = self.w3.value * base.momentum_factor
+
+        # Calculate aggregate score S (one matrix-vector product of the normalized indicators and the weights)
+        dataframe['S'] = base.score(ScoreBase.weights(self))
+
+        # Get Final Target Score to incorporate new calculations
+        dataframe['T'] = dataframe['S'] * base.regime
+
+        # Assign the target score T to the AI target column
+        dataframe['&-target'] = dataframe['T'].shift(-self.target_horizon)
+
+        return dataframe
+
+    def build_score_base(self, dataframe: DataFrame) -> ScoreBase:
+        """
+        Weight independent part of the target: indicators, their normalization and the market filters
+        """
         dataframe['ma'] = ta.SMA(dataframe, timeperiod=10)
         dataframe['roc'] = ta.ROC(dataframe, timeperiod=2)
         dataframe['macd'], dataframe['macdsignal'], dataframe['macdhist'] = ta.MACD(dataframe['close'], slowperiod=12,
@@ -133,52 +171,28 @@ class AlexStrategyFinalV8Hyper(IStrategy):
         # Why? Normalizing the indicators will make them comparable and allow us to assign weights to them.
         # How? We will calculate the z-score of each indicator by subtracting the rolling mean and dividing by the
         # rolling standard deviation. This will give us a normalized value that is centered around 0 with a standard
-        # deviation of 1.
-        dataframe['normalized_stoch'] = (dataframe['stoch'] - dataframe['stoch'].rolling(window=14).mean()) / dataframe[
-            'stoch'].rolling(window=14).std()
-        dataframe['normalized_atr'] = (dataframe['atr'] - dataframe['atr'].rolling(window=14).mean()) / dataframe[
-            'atr'].rolling(window=14).std()
-        dataframe['normalized_obv'] = (dataframe['obv'] - dataframe['obv'].rolling(window=14).mean()) / dataframe[
-            'obv'].rolling(window=14).std()
-        dataframe['normalized_ma'] = (dataframe['close'] - dataframe['close'].rolling(window=10).mean()) / dataframe[
-            'close'].rolling(window=10).std()
-        dataframe['normalized_macd'] = (dataframe['macd'] - dataframe['macd'].rolling(window=26).mean()) / dataframe[
-            'macd'].rolling(window=26).std()
-        dataframe['normalized_roc'] = (dataframe['roc'] - dataframe['roc'].rolling(window=2).mean()) / dataframe[
-            'roc'].rolling(window=2).std()
-        dataframe['normalized_momentum'] = (dataframe['momentum'] - dataframe['momentum'].rolling(window=4).mean()) / \
-                                           dataframe['momentum'].rolling(window=4).std()
-        dataframe['normalized_rsi'] = (dataframe['rsi'] - dataframe['rsi'].rolling(window=10).mean()) / dataframe[
-            'rsi'].rolling(window=10).std()
-        dataframe['normalized_bb_width'] = (dataframe['bb_upperband'] - dataframe['bb_lowerband']).rolling(
-            window=20).mean() / (dataframe['bb_upperband'] - dataframe['bb_lowerband']).rolling(window=20).std()
-        dataframe['normalized_cci'] = (dataframe['cci'] - dataframe['cci'].rolling(window=20).mean()) / dataframe[
-            'cci'].rolling(window=20).std()
-
+        # deviation of 1. All rolling means and stds of this method come from one batched pass.
         # Dynamic Weights (Example: Increase the weight of momentum in a strong trend)
         trend_strength = abs(dataframe['ma'] - dataframe['close'])
+        normalized = ['stoch', 'atr', 'obv', 'ma', 'macd', 'roc', 'momentum', 'rsi', 'cci']
+        moments = RollingMoments(dataframe, [
+            ('stoch', 'stoch', 14), ('atr', 'atr', 14), ('obv', 'obv', 14), ('ma', 'close', 10),
+            ('macd', 'macd', 26), ('roc', 'roc', 2), ('momentum', 'momentum', 4), ('rsi', 'rsi', 10),
+            ('cci', 'cci', 20), ('bb_width', dataframe['bb_upperband'] - dataframe['bb_lowerband'], 20),
+            ('trend_strength', trend_strength, 14),
+        ])
+        block = moments.frame(normalized, [f'normalized_{name}' for name in normalized])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            block['normalized_bb_width'] = moments.mean('bb_width') / moments.std('bb_width')
+        dataframe = pd.concat([dataframe.drop(columns=block.columns, errors='ignore'), block], axis=1)
+
         # Calculate the rolling mean and standard deviation of the trend strength to determine a strong trend
         # The threshold is set to 1.5 times the standard deviation above the mean, but can be adjusted as needed
-        strong_trend_threshold = trend_strength.rolling(window=14).mean() + 1.5 * trend_strength.rolling(
-            window=14).std()
+        strong_trend_threshold = moments.mean('trend_strength') + 1.5 * moments.std('trend_strength')
         # Assign a higher weight to momentum if the trend is strong
         is_strong_trend = trend_strength > strong_trend_threshold
-
-        # Dynamic Weights Adjustment
-        trend_strength = abs(dataframe['ma'] - dataframe['close'])
-        strong_trend_threshold = trend_strength.rolling(window=14).mean() + 1.5 * trend_strength.rolling(window=14).std()
-        is_strong_trend = trend_strength > strong_trend_threshold
-        dataframe['w_momentum'] = np.where(is_strong_trend, self.w3.value * 1.5, self.w3.value)
-
-        # Calculate aggregate score S
-        w = [self.w0.value, self.w1.value, self.w2.value, self.w3.value, self.w4.value, self.w5.value, self.w6.value,
-             self.w7.value, self.w8.value]
-        dataframe['S'] = w[0] * dataframe['normalized_ma'] + w[1] * dataframe['normalized_macd'] + w[2] * dataframe[
-            'normalized_roc'] + w[3] * dataframe['normalized_rsi'] + w[4] * \
-                         dataframe['normalized_bb_width'] + w[5] * dataframe['normalized_cci'] + dataframe[
-            'w_momentum'] * dataframe['normalized_momentum'] + self.w8.value * dataframe[
-            'normalized_stoch'] + self.w7.value * dataframe['normalized_atr'] + self.w6.value * \
-                         dataframe['normalized_obv']
+        # Momentum weight relative to w3
+        momentum_factor = np.where(is_strong_trend, 1.5, 1.0)
 
         # Step 3: Market Regime Filter R
         dataframe['R'] = 0
@@ -212,16 +226,49 @@ class AlexStrategyFinalV8Hyper(IStrategy):
         dataframe['V'] = np.where(dataframe['V_norm'] > 1, 1, np.where(dataframe['V_norm'] < -1, -1, 0))
         dataframe['V2'] = np.where(dataframe['V2_norm'] > 1, 1, np.where(dataframe['V2_norm'] < -1, -1, 0))
 
-        # Get Final Target Score to incorporate new calculations
-        dataframe['T'] = dataframe['S'] * dataframe['R'] * dataframe['R2'] * dataframe['V'] * dataframe['V2']
-
-        # Assign the target score T to the AI target column
-        target_horizon = 2  # Define your prediction horizon here
-        dataframe['&-target'] = dataframe['T'].shift(-target_horizon)
-
-        return dataframe
+        # Normalized indicators as one (candles, components) matrix, the momentum column already carrying the
+        # trend factor of its weight: S is then components @ weights
+        components = np.empty((len(dataframe), len(COMPONENTS)))
+        for i, name in enumerate(COMPONENTS):
+            components[:, i] = dataframe[f'normalized_{name}']
+        components[:, COMPONENTS.index('momentum')] *= momentum_factor
+        regime = (dataframe['R'] * dataframe['R2'] * dataframe['V'] * dataframe['V2']).to_numpy(dtype=np.float64)
+
+        columns = dataframe.drop(columns=INPUTS)
+        return ScoreBase(columns, components, momentum_factor, regime)
+
+    def weighted_target(self, dataframe: DataFrame, metadata: Dict) -> pd.Series:
+        """
+        &-target of the current weights, from the pair's cached score base. The weights are buy space
+        parameters while populate_indicators runs once per hyperopt: the entry/exit callbacks apply them.
+        """
+        base = self.score_bases.get(metadata['pair'], dataframe, self.build_score_base)
+        target = pd.Series(base.target(ScoreBase.weights(self)), index=dataframe.index)
+        return target.shift(-self.target_horizon)
+
+    def evaluate_weights(self, dataframe: DataFrame, metadata: Dict, parameters, threshold_buy,
+                         threshold_sell) -> dict:
+        """
+        Entry and exit signals of a batch of candidate parameter sets, from one matrix product.
+        Used by benchmarks/screen_v8_weights.py to rank candidates before a backtest.
+
+        The float32 evaluation may flip the signal of a candle whose target is within float32
+        rounding of a threshold; the selected candidates are confirmed by a regular backtest.
+
+        :param dataframe: DataFrame the pair's candles
+        :param metadata: dict with the pair
+        :param parameters: (k, 9) array the w0..w8 values of every candidate
+        :param threshold_buy: float or (k,) array
+        :param threshold_sell: float or (k,) array
+        :return: dict enter_long, enter_short, exit_long, exit_short -> (candles, k) bool arrays,
+            the signals populate_entry_trend/populate_exit_trend give for each candidate
+        """
+        base = self.score_bases.get(metadata['pair'], dataframe, self.build_score_base).astype(np.float32)
+        return base.signals(component_weights(parameters), threshold_buy, threshold_sell,
+                            dataframe['volume'].to_numpy(), self.target_horizon)
 
     def populate_entry_trend(self, df: DataFrame, metadata: Dict) -> DataFrame:
+        df['&-target'] = self.weighted_target(df, metadata)
         enter_long_conditions = [
             df['&-target'] > self.threshold_buy.value,
             df['volume'] > 0
@@ -26,10 +26,17 @@ import talib.abstract as ta
 from pandas import DataFrame
 from technical import qtpylib
 
+from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.exchange.exchange_utils import *
 from freqtrade.strategy import IStrategy, RealParameter
 from technical.pivots_points import pivots_points
 
+from shared.corr_features import CorrFeatureCache
+from shared.memo import INPUTS, CandleMemo
+from shared.rolling import RollingMoments, bollinger_bands, rolling_mean_std
+from shared.row_cache import RowCache
+from shared.score_base import COMPONENTS, ScoreBase, ScoreBaseCache
+
 logger = logging.getLogger(__name__)
 
 """
@@ -43,6 +50,14 @@ and includes dynamic features like:
 - Dynamic trailing stops and leverage
 """
 
+# Columns of feature_engineering_expand_all, in the order FreqAI receives them
+PERIOD_FEATURES = [
+    "%-cci-period", "%-rsi-period", "%-momentum-period", '%-ma-period', '%-macd-period', '%-macdsignal-period',
+    '%-macdhist-period', '%-roc-period', "bb_lowerband-period", "bb_middleband-period", "bb_upperband-period",
+    "%-bb_width-period", "%-close-bb_lower-period",
+]
+
+
 class AlexStrategyFinalV9(IStrategy):
     """
     This is an example strategy that uses the LSTMRegressor model to predict the target score.
@@ -108,6 +123,11 @@ class AlexStrategyFinalV9(IStrategy):
     w7 = RealParameter(0, 1, default=0.05, space='buy')  # ATR (normalized_atr)
     w8 = RealParameter(0, 1, default=0.10, space='buy')  # Stochastic Oscillator (normalized_stoch)
 
+    # Weight independent layer of the target (see build_score_base), per pair
+    score_bases = ScoreBaseCache()
+    # Features of feature_engineering_expand_all shared by its calls for the different periods, per pair and timeframe
+    period_features = CandleMemo()
+
     plot_config = {
         'main_plot': {
             'ma_100': {'color': 'blue'},
@@ -142,36 +162,80 @@ class AlexStrategyFinalV9(IStrategy):
         """
         Feature engineering for the AI model using rolling windows
         """
-        # Basic technical indicators with rolling periods
-        dataframe["%-cci-period"] = ta.CCI(dataframe, timeperiod=20)
-        dataframe["%-rsi-period"] = ta.RSI(dataframe, timeperiod=10)
-        dataframe["%-momentum-period"] = ta.MOM(dataframe, timeperiod=4)
-        dataframe['%-ma-period'] = ta.SMA(dataframe, timeperiod=10)
-        dataframe['%-macd-period'], dataframe['%-macdsignal-period'], dataframe['%-macdhist-period'] = ta.MACD(
-            dataframe['close'], slowperiod=12, fastperiod=26)
-        dataframe['%-roc-period'] = ta.ROC(dataframe, timeperiod=2)
-
-        # Bollinger Bands
-        bollinger = qtpylib.bollinger_bands(
-            qtpylib.typical_price(dataframe), window=period, stds=2.2
-        )
-        dataframe["bb_lowerband-period"] = bollinger["lower"]
-        dataframe["bb_middleband-period"] = bollinger["mid"]
-        dataframe["bb_upperband-period"] = bollinger["upper"]
-        dataframe["%-bb_width-period"] = (
-            dataframe["bb_upperband-period"]
-            - dataframe["bb_lowerband-period"]
-        ) / dataframe["bb_middleband-period"]
-        dataframe["%-close-bb_lower-period"] = (
-            dataframe["close"] / dataframe["bb_lowerband-period"]
-        )
+        # The features of the correlated pairs are computed once per candle and shared by all traded pairs
+        if metadata['pair'] in self.corr_features.pairs:
+            return self.corr_features.apply(self.expand_all_features, dataframe, metadata['pair'], metadata.get('tf'),
+                                            period, metadata=metadata)
+        return self.expand_all_features(dataframe, period, metadata=metadata)
 
-        return dataframe
+    def expand_all_features(self, dataframe: DataFrame, period: int, metadata: Dict) -> DataFrame:
+        """
+        The features of feature_engineering_expand_all for one pair and period
+        """
+        # Only the Bollinger Bands depend on period. The other indicators, and the bands of every configured
+        # period, are computed once per pair and timeframe and shared by the calls of the other periods.
+        features = self.period_features.get((metadata['pair'], metadata.get('tf')), dataframe,
+                                            self.build_period_features)
+        if period not in features['bands']:
+            bollinger = qtpylib.bollinger_bands(qtpylib.typical_price(dataframe), window=period, stds=2.2)
+            features['bands'][period] = self.band_features(
+                dataframe['close'].to_numpy(dtype=np.float64),
+                *(bollinger[band].to_numpy() for band in ('lower', 'mid', 'upper')))
+
+        # One float64 block of all feature columns, a new array: the cached ones are shared by later calls
+        block = np.concatenate([features['indicators'], features['bands'][period]])
+        features = DataFrame(block.T, index=dataframe.index, columns=PERIOD_FEATURES, copy=False)
+        if dataframe.columns.isin(PERIOD_FEATURES).any():
+            dataframe = dataframe.drop(columns=PERIOD_FEATURES, errors='ignore')
+        return pd.concat([dataframe, features], axis=1)
+
+    def build_period_features(self, dataframe: DataFrame) -> dict:
+        """
+        The period independent features of feature_engineering_expand_all and the band features of all periods
+        """
+        # Basic technical indicators with rolling periods
+        macd, macdsignal, macdhist = ta.MACD(dataframe['close'], slowperiod=12, fastperiod=26)
+        indicators = np.vstack([np.asarray(values, dtype=np.float64) for values in (
+            ta.CCI(dataframe, timeperiod=20),
+            ta.RSI(dataframe, timeperiod=10),
+            ta.MOM(dataframe, timeperiod=4),
+            ta.SMA(dataframe, timeperiod=10),
+            macd,
+            macdsignal,
+            macdhist,
+            ta.ROC(dataframe, timeperiod=2),
+        )])
+
+        # Bollinger Bands of every period from one rolling pass (qtpylib.bollinger_bands over the typical price)
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        typical_price = qtpylib.typical_price(dataframe).to_numpy(dtype=np.float64)
+        periods = [int(period) for period in
+                   self.config.get('freqai', {}).get('feature_parameters', {}).get('indicator_periods_candles', [])]
+        bands = {}
+        if periods and not np.isnan(typical_price).any():
+            lower, middle, upper = bollinger_bands(typical_price, periods, 2.2)
+            bands = {period: self.band_features(close, lower[i], middle[i], upper[i])
+                     for i, period in enumerate(periods)}
+        return {'indicators': indicators, 'bands': bands}
+
+    @staticmethod
+    def band_features(close: np.ndarray, lower: np.ndarray, middle: np.ndarray, upper: np.ndarray) -> np.ndarray:
+        """The Bollinger Band rows of a period's features (the last five of PERIOD_FEATURES)"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.array([lower, middle, upper, (upper - lower) / middle, close / lower])
 
     def feature_engineering_expand_basic(self, dataframe: DataFrame, metadata: Dict, **kwargs):
         """
         Basic feature engineering
         """
+        if metadata['pair'] in self.corr_features.pairs:
+            return self.corr_features.apply(self.expand_basic_features, dataframe, metadata['pair'], metadata.get('tf'))
+        return self.expand_basic_features(dataframe)
+
+    def expand_basic_features(self, dataframe: DataFrame) -> DataFrame:
+        """
+        The features of feature_engineering_expand_basic for one pair
+        """
         dataframe["%-pct-change"] = dataframe["close"].pct_change()
         dataframe["%-raw_volume"] = dataframe["volume"]
         dataframe["%-raw_price"] = dataframe["close"]
@@ -192,7 +256,33 @@ class AlexStrategyFinalV9(IStrategy):
         Calculate the target variable for FreqAI prediction
         This is the core of the strategy's logic
         """
-        
+        # Everything but the weights comes from the cached indicator layer of the pair's candles
+        base = self.score_bases.get(metadata['pair'], dataframe, self.build_score_base)
+        columns = base.columns.set_axis(dataframe.index, axis=0)
+        dataframe = pd.concat([dataframe.drop(columns=columns.columns, errors='ignore'), columns], axis=1)
+
+        # Dynamic Weights Adjustment: the momentum weight grows with the trend strength (up to twice w3)
+        dataframe['w_momentum'] = self.w3.value * base.momentum_factor
+
+        # Step 2: Calculate aggregate score S
+        # S = w0 * normalized_ma + w1 * normalized_macd + w2 * normalized_roc + w3 * normalized_rsi +
+        #     w4 * normalized_bb_width + w5 * normalized_cci + w_momentum * normalized_momentum +
+        #     w8 * normalized_stoch + w7 * normalized_atr + w6 * normalized_obv
+        weights = ScoreBase.weights(self)
+        dataframe['S'] = base.score(weights)
+
+        # Get Final Target Score to incorporate new calculations
+        dataframe['T'] = dataframe['S'] * base.regime
+
+        # Assign the target score T to the AI target column
+        target_horizon = 1  # Define your prediction horizon here
+        dataframe['&-target'] = dataframe['T'].shift(-target_horizon)
+        return dataframe
+
+    def build_score_base(self, dataframe: DataFrame) -> ScoreBase:
+        """
+        Weight independent part of the target: indicators, their normalization and the market filters
+        """
         # Calculate basic technical indicators
         dataframe['ma'] = ta.SMA(dataframe, timeperiod=10)
         dataframe['roc'] = ta.ROC(dataframe, timeperiod=2)
@@ -210,52 +300,38 @@ class AlexStrategyFinalV9(IStrategy):
         dataframe['obv'] = ta.OBV(dataframe)
         dataframe['ma_100'] = ta.SMA(dataframe, timeperiod=100)
 
+        # Volatility measures of step 4, normalized in the same pass as the indicators
+        bb_width = (dataframe['bb_upperband'] - dataframe['bb_lowerband']) / dataframe['bb_middleband']
+        dataframe['V_mean'] = 1 / (bb_width + 1e-8)  # Avoid division by zero
+        dataframe['V2_mean'] = 1 / (dataframe['atr'] + 1e-8)  # Avoid division by zero
+        # Calculate trend strength as the absolute difference between MA and close price
+        trend_strength = abs(dataframe['ma'] - dataframe['close'])
+
         # Step 1: Normalize Indicators:
         # Why? Normalizing the indicators will make them comparable and allow us to assign weights to them.
         # How? We will calculate the z-score of each indicator by subtracting the rolling mean and dividing by the
         # rolling standard deviation. This will give us a normalized value that is centered around 0 with a standard
-        # deviation of 1.
-        dataframe['normalized_stoch'] = (dataframe['stoch'] - dataframe['stoch'].rolling(window=14).mean()) / dataframe['stoch'].rolling(window=14).std()
-        dataframe['normalized_atr'] = (dataframe['atr'] - dataframe['atr'].rolling(window=14).mean()) / dataframe['atr'].rolling(window=14).std()
-        dataframe['normalized_obv'] = (dataframe['obv'] - dataframe['obv'].rolling(window=14).mean()) / dataframe['obv'].rolling(window=14).std()
-        dataframe['normalized_ma'] = (dataframe['close'] - dataframe['close'].rolling(window=10).mean()) / dataframe['close'].rolling(window=10).std()
-        dataframe['normalized_macd'] = (dataframe['macd'] - dataframe['macd'].rolling(window=26).mean()) / dataframe['macd'].rolling(window=26).std()
-        dataframe['normalized_roc'] = (dataframe['roc'] - dataframe['roc'].rolling(window=2).mean()) / dataframe['roc'].rolling(window=2).std()
-        dataframe['normalized_momentum'] = (dataframe['momentum'] - dataframe['momentum'].rolling(window=4).mean()) / \
-                                             dataframe['momentum'].rolling(window=4).std()
-        dataframe['normalized_rsi'] = (dataframe['rsi'] - dataframe['rsi'].rolling(window=10).mean()) / dataframe['rsi'].rolling(window=10).std()
-        dataframe['normalized_bb_width'] = (dataframe['bb_upperband'] - dataframe['bb_lowerband']).rolling(
-            window=20).mean() / (dataframe['bb_upperband'] - dataframe['bb_lowerband']).rolling(window=20).std()
-        dataframe['normalized_cci'] = (dataframe['cci'] - dataframe['cci'].rolling(window=20).mean()) / dataframe['cci'].rolling(window=20).std()
+        # deviation of 1. All rolling means and stds of this method come from one batched pass.
+        normalized = ['stoch', 'atr', 'obv', 'ma', 'macd', 'roc', 'momentum', 'rsi', 'cci']
+        moments = RollingMoments(dataframe, [
+            ('stoch', 'stoch', 14), ('atr', 'atr', 14), ('obv', 'obv', 14), ('ma', 'close', 10),
+            ('macd', 'macd', 26), ('roc', 'roc', 2), ('momentum', 'momentum', 4), ('rsi', 'rsi', 10),
+            ('cci', 'cci', 20), ('bb_width', dataframe['bb_upperband'] - dataframe['bb_lowerband'], 20),
+            ('trend_strength', trend_strength, 14), ('V_mean', 'V_mean', 50), ('V2_mean', 'V2_mean', 50),
+        ])
+        block = moments.frame(normalized, [f'normalized_{name}' for name in normalized])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            block['normalized_bb_width'] = moments.mean('bb_width') / moments.std('bb_width')
+        dataframe = pd.concat([dataframe.drop(columns=block.columns, errors='ignore'), block], axis=1)
 
         # Dynamic Weights Adjustment
-        # Calculate trend strength as the absolute difference between MA and close price
-        trend_strength = abs(dataframe['ma'] - dataframe['close'])
         # Calculate rolling mean and stddev once to avoid redundancy
-        rolling_mean = trend_strength.rolling(window=14).mean()
-        rolling_stddev = trend_strength.rolling(window=14).std()
+        rolling_mean, rolling_stddev = moments.mean('trend_strength'), moments.std('trend_strength')
         # Calculate a more dynamic strong trend threshold
         strong_trend_threshold = rolling_mean + 1.5 * rolling_stddev
-        # Determine strong trend condition
-        is_strong_trend = trend_strength > strong_trend_threshold
-        # Apply dynamic weight adjustment, could also consider a more gradual adjustment
-        dataframe['w_momentum'] = self.w3.value * (1 + 0.5 * (trend_strength / strong_trend_threshold))
-        # Optional: Clip the w_momentum values to prevent extreme cases
-        dataframe['w_momentum'] = dataframe['w_momentum'].clip(lower=self.w3.value, upper=self.w3.value * 2)
-
-        # Step 2: Calculate aggregate score S
-        w = [self.w0.value, self.w1.value, self.w2.value, self.w3.value, self.w4.value, self.w5.value, self.w6.value, self.w7.value, self.w8.value]
-      
-        dataframe['S'] = w[0] * dataframe['normalized_ma'] + \
-                         w[1] * dataframe['normalized_macd'] + \
-                         w[2] * dataframe['normalized_roc'] + \
-                         w[3] * dataframe['normalized_rsi'] + \
-                         w[4] * dataframe['normalized_bb_width'] + \
-                         w[5] * dataframe['normalized_cci'] + \
-                         dataframe['w_momentum'] * dataframe['normalized_momentum'] + \
-                         self.w8.value * dataframe['normalized_stoch'] + \
-                         self.w7.value * dataframe['normalized_atr'] + \
-                         self.w6.value * dataframe['normalized_obv']
+        # Momentum weight relative to w3, clipped to prevent extreme cases
+        # (w3 * factor clipped to [w3, 2 * w3] is w3 * (factor clipped to [1, 2]) for the non-negative w3)
+        momentum_factor = (1 + 0.5 * (trend_strength / strong_trend_threshold)).clip(lower=1, upper=2).to_numpy()
 
         # Step 3: Market Regime Filter R
         dataframe['R'] = 0
@@ -273,25 +349,11 @@ class AlexStrategyFinalV9(IStrategy):
         # the market is less volatile. So we are using the Bollinger Band width as a measure of volatility. You can
         # use other indicators to measure volatility as well. For example, you can use the ATR (Average True Range)
 
-        bb_width = (dataframe['bb_upperband'] - dataframe['bb_lowerband']) / dataframe['bb_middleband']
-        dataframe['V_mean'] = 1 / (bb_width + 1e-8)  # Avoid division by zero
-
-        # ATR-based Volatility Measure
-        dataframe['V2_mean'] = 1 / (dataframe['atr'] + 1e-8)  # Avoid division by zero
-
-        # Rolling window size for adaptive normalization
-        rolling_window = 50
-
-        # Normalize V_mean using a rolling window
-        mean_v = dataframe['V_mean'].rolling(window=rolling_window).mean()
-        std_v = dataframe['V_mean'].rolling(window=rolling_window).std()
-        dataframe['V_norm'] = (dataframe['V_mean'] - mean_v) / std_v
-        dataframe['V_norm'] = dataframe['V_norm'].fillna(0) 
-
-        # Normalize V2_mean using a rolling window
-        mean_v2 = dataframe['V2_mean'].rolling(window=rolling_window).mean()
-        std_v2 = dataframe['V2_mean'].rolling(window=rolling_window).std()
-        dataframe['V2_norm'] = (dataframe['V2_mean'] - mean_v2) / std_v2
+        # V_mean and V2_mean (computed before step 1) are 1 / Bollinger Band width and 1 / ATR, normalized over a
+        # rolling window of 50 candles
+        dataframe['V_norm'] = moments.zscore('V_mean')
+        dataframe['V_norm'] = dataframe['V_norm'].fillna(0)
+        dataframe['V2_norm'] = moments.zscore('V2_mean')
         dataframe['V2_norm'] = dataframe['V2_norm'].fillna(0)
 
         # Signal assignment using hysteresis
@@ -307,20 +369,38 @@ class AlexStrategyFinalV9(IStrategy):
         dataframe['V'] = dataframe['V'].ffill()  # Correct ffill usage
         dataframe['V2'] = dataframe['V2'].ffill()  # Correct ffill usage
 
-        # Get Final Target Score to incorporate new calculations
-        dataframe['T'] = dataframe['S'] * dataframe['R'] * dataframe['R2'] * dataframe['V'] * dataframe['V2']
+        # Normalized indicators as one (candles, components) matrix, the momentum column already carrying the
+        # trend factor of its weight: S is then components @ weights
+        components = np.empty((len(dataframe), len(COMPONENTS)))
+        for i, name in enumerate(COMPONENTS):
+            components[:, i] = dataframe[f'normalized_{name}']
+        components[:, COMPONENTS.index('momentum')] *= momentum_factor
+        regime = (dataframe['R'] * dataframe['R2'] * dataframe['V'] * dataframe['V2']).to_numpy(dtype=np.float64)
 
-        # Assign the target score T to the AI target column
-        target_horizon = 1  # Define your prediction horizon here
-        dataframe['&-target'] = dataframe['T'].shift(-target_horizon)
-        return dataframe
+        columns = dataframe.drop(columns=INPUTS)
+        return ScoreBase(columns, components, momentum_factor, regime)
         
+    def bot_start(self, **kwargs) -> None:
+        # ATR statistics of the candle the leverage and stoploss callbacks decide on
+        self.row_cache = RowCache(['atr', 'atr_mean', 'atr_std'], timeframe_to_minutes(self.timeframe))
+        # Features of the correlated pairs, computed once per candle for all traded pairs
+        self.corr_features = CorrFeatureCache(
+            self.config.get('freqai', {}).get('feature_parameters', {}).get('include_corr_pairlist', []))
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """
         This is where FreqAI is called to make predictions
         """
         self.freqai_info = self.config["freqai"]
         dataframe = self.freqai.start(dataframe, metadata, self)
+
+        # ATR and its rolling mean/std for leverage and custom_stoploss, computed once per candle
+        if 'atr' not in dataframe.columns:
+            dataframe['atr'] = ta.ATR(dataframe, timeperiod=14)
+        atr_mean, atr_std = rolling_mean_std(dataframe['atr'], [14])
+        dataframe['atr_mean'] = atr_mean[0]
+        dataframe['atr_std'] = atr_std[0]
+        self.row_cache.update(metadata['pair'], dataframe)
         
         # One can define indicators here if needed and add logic to populate_entry_trend and populate_exit_trend
         # dataframe["target_roi"] = dataframe["&-target_mean"] + dataframe["&-target_std"] * 1.25
@@ -383,21 +463,18 @@ class AlexStrategyFinalV9(IStrategy):
         """
         Calculate custom stoploss based on dynamic trailing stop logic.
         """
-        dataframe, row = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        row = self.row_cache.row(pair, current_time)
 
-        # If no valid dataframe is available (initial trades)
-        if dataframe is None or row is None:
+        # If no analyzed candle is available (initial trades)
+        if row is None:
             return self.stoploss
 
         # Simple ATR-based dynamic stoploss (you can enhance this)
-        try:
-            atr = dataframe['atr'].iat[-1] if 'atr' in dataframe.columns else None
-            if atr and not pd.isna(atr):
-                # Dynamic stoploss based on ATR
-                dynamic_stop = min(-0.02, -(atr * 2) / current_rate)  # 2x ATR or 2% minimum
-                return max(self.stoploss, dynamic_stop)
-        except (IndexError, KeyError):
-            pass
+        atr = row['atr']
+        if atr and not pd.isna(atr):
+            # Dynamic stoploss based on ATR
+            dynamic_stop = min(-0.02, -(atr * 2) / current_rate)  # 2x ATR or 2% minimum
+            return max(self.stoploss, dynamic_stop)
 
         return self.stoploss
 
@@ -412,30 +489,19 @@ class AlexStrategyFinalV9(IStrategy):
         """
         Dynamically adjust leverage based on volatility (ATR).
         """
-        # Get the analyzed dataframe for the pair and timeframe
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
-        
-        if dataframe is None or dataframe.empty:
-            return self.leverage_value  # Fallback to default leverage
+        # ATR statistics of the last analyzed candle (precomputed in populate_indicators)
+        row = self.row_cache.row(pair, current_time)
 
-        # Get the latest ATR value from the last candle
-        try:
-            atr = dataframe['atr'].iat[-1]  # Get the ATR of the most recent candle
-        except (IndexError, KeyError):
-            return self.leverage_value  # Fallback if ATR is not available
+        if row is None:
+            return self.leverage_value  # Fallback to default leverage
 
+        atr = row['atr']
         if pd.isna(atr):
             return self.leverage_value  # Fallback if ATR is NaN
 
         # Example: Lower leverage when volatility (ATR) is high
-        try:
-            rolling_mean = dataframe['atr'].rolling(window=14).mean().iat[-1]
-            rolling_stddev = dataframe['atr'].rolling(window=14).std().iat[-1]
-            
-            if atr > rolling_mean + 1.5 * rolling_stddev:
-                return self.leverage_value * 0.5  # Reduce leverage in volatile markets
-        except (IndexError, KeyError):
-            pass
+        if atr > row['atr_mean'] + 1.5 * row['atr_std']:
+            return self.leverage_value * 0.5  # Reduce leverage in volatile markets
 
         return self.leverage_value
 
@@ -2,13 +2,12 @@
 """
 Enhanced FreqAI strategy with perp-spot basis features
 """
-import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import IntParameter, DecimalParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
-import os
+
+from shared.features import BASIS_COLUMNS, TECHNICAL_COLUMNS, feature_library
+from shared.futures_data import FuturesLeg
 
 class PerpSpotBasisStrategy(IStrategy):
     timeframe = "5m"
@@ -30,27 +29,27 @@ class PerpSpotBasisStrategy(IStrategy):
     # Process only new candles
     process_only_new_candles = True
 
+    def bot_start(self, **kwargs) -> None:
+        """Perp candles: DataProvider when live, futures files in backtests"""
+        self.futures_leg = FuturesLeg(self)
+
+    def informative_pairs(self):
+        return self.futures_leg.informative_pairs()
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
 
         # Load futures data for basis calculations
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
-            dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_basis_features(dataframe)
+            dataframe = self.merge_futures_data(dataframe, futures_data, pair)
+            dataframe = self.calculate_basis_features(dataframe, pair)
 
         # Simplified feature set
-        dataframe = self.calculate_volume_features(dataframe)
+        dataframe = self.calculate_volume_features(dataframe, pair)
 
         # Technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
 
         return dataframe
 
@@ -63,91 +62,53 @@ class PerpSpotBasisStrategy(IStrategy):
                 f'/home/gil/freqtrade/user_data/data/binance/futures/{pair.replace("/", "_")}_USDT-5m-futures.feather',
                 f'/home/gil/freqtrade/user_data/data/binance/{pair.replace("/", "_")}_USDT-5m.feather'
             ]
-            
-            for futures_path in possible_paths:
-                if os.path.exists(futures_path):
-                    print(f"Loading futures data from: {futures_path}")
-                    df = pd.read_feather(futures_path)
-                    return df
-            
-            print(f"No futures data found for {pair}")
-            return None
+
+            # Live: DataProvider, otherwise cached per file and only re-read when the file changes
+            df = self.futures_leg.candles(pair, possible_paths)
+            if df is None:
+                print(f"No futures data found for {pair}")
+            return df
             
         except Exception as e:
             print(f"Error loading futures data: {e}")
             return None
 
-    def merge_futures_data(self, spot_df, futures_df):
+    def merge_futures_data(self, spot_df, futures_df, pair):
         """Merge spot and futures data"""
         try:
-            # Merge on date column
-            merged = pd.merge(spot_df, futures_df[['date', 'close', 'volume']],
-                            left_on='date', right_on='date', how='left',
-                            suffixes=('', '_perp'))
-
-            # Forward fill missing futures data
-            merged[['close_perp', 'volume_perp']] = merged[['close_perp', 'volume_perp']].ffill()
-
-            return merged
+            # Left join close/volume on date and forward fill, only merging candles not merged before
+            return self.futures_leg.merge(pair, spot_df, futures_df)
         except Exception as e:
             print(f"Error merging futures data: {e}")
             return spot_df
 
-    def calculate_basis_features(self, dataframe: DataFrame) -> DataFrame:
+    def calculate_basis_features(self, dataframe: DataFrame, pair: str) -> DataFrame:
         """Calculate perp-spot basis features"""
         if 'close_perp' not in dataframe.columns:
             return dataframe
 
-        # Basic basis calculation (perp - spot) / spot
-        dataframe['basis'] = (dataframe['close_perp'] - dataframe['close']) / dataframe['close'] * 100
-
-        # Basis moving averages
-        dataframe['basis_ma_10'] = ta.SMA(dataframe['basis'], timeperiod=10)
-        dataframe['basis_ma_30'] = ta.SMA(dataframe['basis'], timeperiod=30)
-
-        # Basis rate of change
-        dataframe['basis_roc'] = ta.ROC(dataframe['basis'], timeperiod=5)
-
-        # Z-score of basis
-        basis_mean = dataframe['basis'].rolling(window=50).mean()
-        basis_std = dataframe['basis'].rolling(window=50).std()
-        dataframe['basis_zscore'] = (dataframe['basis'] - basis_mean) / basis_std
+        # Basis (perp - spot) / spot in percent, moving averages, rate of change, z-score and momentum
+        dataframe = feature_library.apply(dataframe, pair, BASIS_COLUMNS)
 
         # Volume ratio
         dataframe['volume_ratio'] = dataframe['volume_perp'] / dataframe['volume']
 
-        # Basis momentum
-        dataframe['basis_momentum'] = dataframe['basis'] - dataframe['basis_ma_30']
-
         # Extreme basis conditions
         dataframe['basis_extreme_bull'] = (dataframe['basis_zscore'] > 2).astype(int)
         dataframe['basis_extreme_bear'] = (dataframe['basis_zscore'] < -2).astype(int)
 
         return dataframe
 
-    def calculate_volume_features(self, dataframe):
+    def calculate_volume_features(self, dataframe, pair):
         """Enhanced volume analysis features"""
         try:
-            # Volume moving averages
-            dataframe['volume_ma_10'] = ta.SMA(dataframe['volume'], timeperiod=10)
-            dataframe['volume_ma_30'] = ta.SMA(dataframe['volume'], timeperiod=30)
-
-            # Volume rate of change
-            dataframe['volume_roc'] = ta.ROC(dataframe['volume'], timeperiod=5)
+            # Volume moving averages, rate of change, OBV and rolling VWAP
+            dataframe = feature_library.apply(
+                dataframe, pair, ['volume_ma_10', 'volume_ma_30', 'volume_roc', 'obv', 'vwap'])
 
             # Volume ratio (current vs moving average)
             dataframe['volume_ratio_ma'] = dataframe['volume'] / dataframe['volume_ma_30']
 
-            # On-balance volume (OBV)
-            dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
-
-            # Volume weighted average price (VWAP)
-            # A/D is not a good proxy for VWAP. Let's calculate a rolling VWAP.
-            vwap_period = 20
-            cumulative_price_volume = (dataframe['close'] * dataframe['volume']).rolling(vwap_period).sum()
-            cumulative_volume = dataframe['volume'].rolling(vwap_period).sum()
-            dataframe['vwap'] = cumulative_price_volume / cumulative_volume
-
             # Volume extremes
             dataframe['high_volume'] = (dataframe['volume'] > dataframe['volume_ma_30'] * 1.5).astype(int)
             dataframe['low_volume'] = (dataframe['volume'] < dataframe['volume_ma_30'] * 0.5).astype(int)
@@ -6,9 +6,13 @@ import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import IntParameter, DecimalParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
-import os
+import logging
+
+from shared.features import BASIS_COLUMNS, TECHNICAL_COLUMNS, feature_library
+from shared.futures_data import futures_loader
+from shared.tracing import Tracer
+
+logger = logging.getLogger(__name__)
 
 class PerpSpotBasisStrategy_Debug(IStrategy):
     timeframe = "5m"
@@ -30,46 +34,48 @@ class PerpSpotBasisStrategy_Debug(IStrategy):
     # Process only new candles
     process_only_new_candles = True
 
+    # Debug output: first analysis of every pair, then one per day of 5m candles.
+    # Overridden by the "tracing" section of the config, e.g. {"enabled": false}
+    tracing = {'first': 1, 'every': 288, 'echo': True}
+
+    def bot_start(self, **kwargs) -> None:
+        self.tracer = Tracer(**{**self.tracing, **self.config.get('tracing', {})})
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
-        print(f"Processing pair: {pair}")
-        print(f"Dataframe shape: {dataframe.shape}")
-        print(f"Date range: {dataframe['date'].min()} to {dataframe['date'].max()}")
+        trace = self.tracer
+        trace.begin(pair)
+        trace(pair, "Processing pair: {}", pair)
+        trace(pair, "Dataframe shape: {}", dataframe.shape)
+        trace(pair, "Date range: {} to {}", lambda: dataframe['date'].min(), lambda: dataframe['date'].max())
 
         # Load futures data for basis calculations
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
-            print(f"Futures data loaded successfully for {pair}")
-            dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_basis_features(dataframe)
+            trace(pair, "Futures data loaded successfully for {}", pair)
+            dataframe = self.merge_futures_data(dataframe, futures_data, pair)
+            dataframe = self.calculate_basis_features(dataframe, pair)
         else:
-            print(f"No futures data found for {pair}")
+            trace(pair, "No futures data found for {}", pair)
 
         # Simplified feature set
-        dataframe = self.calculate_volume_features(dataframe)
+        dataframe = self.calculate_volume_features(dataframe, pair)
 
         # Technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
-
-        # Debug: Print available columns
-        print(f"Available columns: {dataframe.columns.tolist()}")
-        
-        # Check for FreqAI columns
-        freqai_cols = [col for col in dataframe.columns if col.startswith('&-')]
-        print(f"FreqAI columns found: {freqai_cols}")
-        
-        if '&-enter_long' in dataframe.columns:
-            print(f"FreqAI enter_long signal range: {dataframe['&-enter_long'].min()} to {dataframe['&-enter_long'].max()}")
-            print(f"FreqAI enter_long signal last 10 values: {dataframe['&-enter_long'].tail(10).tolist()}")
-        else:
-            print("WARNING: No &-enter_long column found!")
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
+
+        # Debug: available columns and FreqAI columns
+        if trace.traced(pair):
+            trace(pair, "Available columns: {}", dataframe.columns.tolist())
+            freqai_cols = [col for col in dataframe.columns if col.startswith('&-')]
+            trace(pair, "FreqAI columns found: {}", freqai_cols)
+
+            if '&-enter_long' in dataframe.columns:
+                signal = dataframe['&-enter_long']
+                trace(pair, "FreqAI enter_long signal range: {} to {}", signal.min(), signal.max())
+                trace(pair, "FreqAI enter_long signal last 10 values: {}", signal.tail(10).tolist())
+            else:
+                trace(pair, "WARNING: No &-enter_long column found!")
 
         return dataframe
 
@@ -80,20 +86,21 @@ class PerpSpotBasisStrategy_Debug(IStrategy):
             futures_pair = pair.replace('/', '_') + '_USDT-5m-futures.feather'
             futures_path = f'/home/gil/freqtrade/user_data/data/binance/futures/{futures_pair}'
             
-            print(f"Looking for futures data at: {futures_path}")
+            self.tracer(pair, "Looking for futures data at: {}", futures_path)
 
-            if not os.path.exists(futures_path):
-                print(f"Futures data file does not exist: {futures_path}")
+            # Cached per file, only re-read when the file changes
+            df = futures_loader.load([futures_path])
+            if df is None:
+                self.tracer(pair, "Futures data file does not exist: {}", futures_path)
                 return None
 
-            df = pd.read_feather(futures_path)
-            print(f"Loaded futures data: {df.shape} rows")
+            self.tracer(pair, "Loaded futures data: {} rows", df.shape)
             return df
         except Exception as e:
-            print(f"Error loading futures data: {e}")
+            logger.error(f"Error loading futures data for {pair}: {e}")
             return None
 
-    def merge_futures_data(self, spot_df, futures_df):
+    def merge_futures_data(self, spot_df, futures_df, pair):
         """Merge spot and futures data"""
         try:
             # Merge on date column
@@ -104,79 +111,54 @@ class PerpSpotBasisStrategy_Debug(IStrategy):
             # Forward fill missing futures data
             merged[['close_perp', 'volume_perp']] = merged[['close_perp', 'volume_perp']].ffill()
             
-            print(f"Merged data shape: {merged.shape}")
-            print(f"Perp data coverage: {merged['close_perp'].notna().sum()}/{len(merged)} rows")
+            self.tracer(pair, "Merged data shape: {}", merged.shape)
+            self.tracer(pair, "Perp data coverage: {}/{} rows", lambda: merged['close_perp'].notna().sum(), len(merged))
 
             return merged
         except Exception as e:
-            print(f"Error merging futures data: {e}")
+            logger.error(f"Error merging futures data for {pair}: {e}")
             return spot_df
 
-    def calculate_basis_features(self, dataframe: DataFrame) -> DataFrame:
+    def calculate_basis_features(self, dataframe: DataFrame, pair: str) -> DataFrame:
         """Calculate perp-spot basis features"""
         if 'close_perp' not in dataframe.columns:
-            print("No perp data available for basis calculation")
+            self.tracer(pair, "No perp data available for basis calculation")
             return dataframe
 
-        # Basic basis calculation (perp - spot) / spot
-        dataframe['basis'] = (dataframe['close_perp'] - dataframe['close']) / dataframe['close'] * 100
-
-        # Basis moving averages
-        dataframe['basis_ma_10'] = ta.SMA(dataframe['basis'], timeperiod=10)
-        dataframe['basis_ma_30'] = ta.SMA(dataframe['basis'], timeperiod=30)
-
-        # Basis rate of change
-        dataframe['basis_roc'] = ta.ROC(dataframe['basis'], timeperiod=5)
-
-        # Z-score of basis
-        basis_mean = dataframe['basis'].rolling(window=50).mean()
-        basis_std = dataframe['basis'].rolling(window=50).std()
-        dataframe['basis_zscore'] = (dataframe['basis'] - basis_mean) / basis_std
+        # Basis (perp - spot) / spot in percent, moving averages, rate of change, z-score and momentum
+        dataframe = feature_library.apply(dataframe, pair, BASIS_COLUMNS)
 
         # Volume ratio
         dataframe['volume_ratio'] = dataframe['volume_perp'] / dataframe['volume']
 
-        # Basis momentum
-        dataframe['basis_momentum'] = dataframe['basis'] - dataframe['basis_ma_30']
-
         # Extreme basis conditions
         dataframe['basis_extreme_bull'] = (dataframe['basis_zscore'] > 2).astype(int)
         dataframe['basis_extreme_bear'] = (dataframe['basis_zscore'] < -2).astype(int)
 
-        print(f"Basis stats - Mean: {dataframe['basis'].mean():.4f}, Std: {dataframe['basis'].std():.4f}")
-        print(f"Basis Z-score range: {dataframe['basis_zscore'].min():.2f} to {dataframe['basis_zscore'].max():.2f}")
+        self.tracer(pair, "Basis stats - Mean: {:.4f}, Std: {:.4f}",
+                    lambda: dataframe['basis'].mean(), lambda: dataframe['basis'].std())
+        self.tracer(pair, "Basis Z-score range: {:.2f} to {:.2f}",
+                    lambda: dataframe['basis_zscore'].min(), lambda: dataframe['basis_zscore'].max())
 
         return dataframe
 
-    def calculate_volume_features(self, dataframe):
+    def calculate_volume_features(self, dataframe, pair):
         """Enhanced volume analysis features"""
         try:
-            # Volume moving averages
-            dataframe['volume_ma_10'] = ta.SMA(dataframe['volume'], timeperiod=10)
-            dataframe['volume_ma_30'] = ta.SMA(dataframe['volume'], timeperiod=30)
-
-            # Volume rate of change
-            dataframe['volume_roc'] = ta.ROC(dataframe['volume'], timeperiod=5)
+            # Volume moving averages, rate of change, OBV and rolling VWAP
+            dataframe = feature_library.apply(
+                dataframe, pair, ['volume_ma_10', 'volume_ma_30', 'volume_roc', 'obv', 'vwap'])
 
             # Volume ratio (current vs moving average)
             dataframe['volume_ratio_ma'] = dataframe['volume'] / dataframe['volume_ma_30']
 
-            # On-balance volume (OBV)
-            dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
-
-            # Volume weighted average price (VWAP)
-            vwap_period = 20
-            cumulative_price_volume = (dataframe['close'] * dataframe['volume']).rolling(vwap_period).sum()
-            cumulative_volume = dataframe['volume'].rolling(vwap_period).sum()
-            dataframe['vwap'] = cumulative_price_volume / cumulative_volume
-
             # Volume extremes
             dataframe['high_volume'] = (dataframe['volume'] > dataframe['volume_ma_30'] * 1.5).astype(int)
             dataframe['low_volume'] = (dataframe['volume'] < dataframe['volume_ma_30'] * 0.5).astype(int)
 
             return dataframe
         except Exception as e:
-            print(f"Error calculating volume features: {e}")
+            logger.error(f"Error calculating volume features for {pair}: {e}")
             return dataframe
 
     freqai_prediction_threshold = DecimalParameter(0.5, 0.9, default=0.75, space='buy', optimize=True, load=True)
@@ -184,25 +166,26 @@ class PerpSpotBasisStrategy_Debug(IStrategy):
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
         
-        print(f"\n=== ENTRY LOGIC DEBUG for {pair} ===")
-        print(f"Dataframe shape in entry: {dataframe.shape}")
+        trace = self.tracer
+        trace(pair, "=== ENTRY LOGIC DEBUG for {} ===", pair)
+        trace(pair, "Dataframe shape in entry: {}", dataframe.shape)
         
         # Check for FreqAI signal
         if '&-enter_long' in dataframe.columns:
             freqai_signal = dataframe['&-enter_long'].iloc[-1]
             threshold = self.freqai_prediction_threshold.value
-            print(f"FreqAI signal: {freqai_signal}, Threshold: {threshold}")
+            trace(pair, "FreqAI signal: {}, Threshold: {}", freqai_signal, threshold)
             
             if freqai_signal > threshold:
-                print(f"FreqAI signal triggered! Setting enter_long=1")
+                trace(pair, "FreqAI signal triggered! Setting enter_long=1")
                 dataframe.loc[dataframe.index[-1], 'enter_long'] = 1
             else:
-                print(f"FreqAI signal below threshold")
+                trace(pair, "FreqAI signal below threshold")
         else:
-            print("No FreqAI signal column found!")
+            trace(pair, "No FreqAI signal column found!")
             
             # Alternative entry logic for testing without FreqAI
-            print("Using alternative entry logic...")
+            trace(pair, "Using alternative entry logic...")
             
             # Simple RSI + EMA crossover entry
             rsi_condition = dataframe['rsi'] < 30  # Oversold
@@ -211,14 +194,14 @@ class PerpSpotBasisStrategy_Debug(IStrategy):
             entry_condition = rsi_condition & ema_condition
             
             if entry_condition.iloc[-1]:
-                print("Alternative entry condition met!")
+                trace(pair, "Alternative entry condition met!")
                 dataframe.loc[dataframe.index[-1], 'enter_long'] = 1
             else:
-                print("Alternative entry condition not met")
+                trace(pair, "Alternative entry condition not met")
 
         # Debug: Check if any entry signals were set
-        entry_signals = dataframe['enter_long'].sum() if 'enter_long' in dataframe.columns else 0
-        print(f"Total entry signals in dataframe: {entry_signals}")
+        trace(pair, "Total entry signals in dataframe: {}",
+              lambda: dataframe['enter_long'].sum() if 'enter_long' in dataframe.columns else 0)
         
         return dataframe
 
@@ -1,6 +1,5 @@
 # Enhanced Perp-Spot Basis Trading Strategy with Debug
 import freqtrade.vendor.qtpylib.indicators as qtpylib
-import numpy as np
 import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from pandas import DataFrame
@@ -12,6 +11,10 @@ from typing import Dict, List, Optional
 from datetime import datetime
 import logging
 
+from shared.features import feature_library
+from shared.labels import ForwardReturnLabels
+from shared.tracing import Tracer
+
 logger = logging.getLogger(__name__)
 
 class PerpSpotBasisStrategy_DebugV2(IStrategy):
@@ -41,10 +44,19 @@ class PerpSpotBasisStrategy_DebugV2(IStrategy):
     freqai_label_period = 12
     freqai_min_return = 0.003
 
+    # Debug output: first analysis of every pair, then one per day of 5m candles.
+    # Overridden by the "tracing" section of the config, e.g. {"enabled": false}
+    tracing = {'first': 1, 'every': 288, 'echo': logger.info}
+
+    def bot_start(self, **kwargs) -> None:
+        self.tracer = Tracer(**{**self.tracing, **self.config.get('tracing', {})})
+        # Target labels: return over freqai_label_period candles above freqai_min_return
+        self.label_generator = ForwardReturnLabels([self.freqai_label_period], {'fixed': (self.freqai_min_return, 0.0)})
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
+        self.tracer.begin(metadata['pair'])
         # Basic indicators
-        dataframe['rsi'] = ta.RSI(dataframe)
-        dataframe['adx'] = ta.ADX(dataframe)
+        dataframe = feature_library.apply(dataframe, metadata['pair'], ['rsi', 'adx'])
         
         # Bollinger Bands
         bollinger = qtpylib.bollinger_bands(dataframe['close'], window=20, stds=2)
@@ -83,13 +95,13 @@ class PerpSpotBasisStrategy_DebugV2(IStrategy):
                 dataframe['basis_std'] = dataframe['basis'].rolling(20).std()
                 dataframe['basis_zscore'] = (dataframe['basis'] - dataframe['basis_ma']) / dataframe['basis_std']
                 
-                logger.info(f"Loaded futures data for {metadata['pair']} - basis calculated")
+                self.tracer(metadata['pair'], "Loaded futures data for {} - basis calculated", metadata['pair'])
             else:
                 dataframe['basis'] = 0
                 dataframe['basis_ma'] = 0
                 dataframe['basis_std'] = 1
                 dataframe['basis_zscore'] = 0
-                logger.warning(f"No futures data for {metadata['pair']}")
+                self.tracer(metadata['pair'], "No futures data for {}", metadata['pair'])
         except Exception as e:
             logger.error(f"Error loading futures data for {metadata['pair']}: {e}")
             dataframe['basis'] = 0
@@ -115,8 +127,7 @@ class PerpSpotBasisStrategy_DebugV2(IStrategy):
         ] = 1
         
         # Count signals for debugging
-        total_signals = dataframe['enter_long'].sum()
-        logger.info(f"{metadata['pair']}: Generated {total_signals} entry signals")
+        self.tracer(metadata['pair'], "{}: Generated {} entry signals", metadata['pair'], dataframe['enter_long'].sum)
         
         return dataframe
 
@@ -131,17 +142,9 @@ class PerpSpotBasisStrategy_DebugV2(IStrategy):
 
     def set_freqai_targets(self, dataframe: DataFrame, metadata: dict, **kwargs) -> DataFrame:
         """Set FreqAI targets with simple logic"""
-        # Calculate future returns
-        future_return = dataframe["close"].shift(-self.freqai_label_period) / dataframe["close"] - 1
-        
-        # Simple labeling
-        dataframe["&-enter_long"] = np.where(
-            future_return > self.freqai_min_return,
-            "enter",
-            "hold"
-        )
-        
-        dataframe["&-enter_long"] = dataframe["&-enter_long"].fillna("hold")
+        # Simple labeling: future return above freqai_min_return, 'hold' when unknown
+        labels = self.label_generator.labels(metadata['pair'], dataframe)
+        dataframe["&-enter_long"] = labels[(self.freqai_label_period, 'fixed')]
         
         return dataframe
 
@@ -9,13 +9,23 @@ Features:
 """
 import pandas as pd
 from freqtrade.strategy.interface import IStrategy
+from freqtrade.exchange import timeframe_to_minutes
 from freqtrade.strategy import IntParameter, DecimalParameter, CategoricalParameter
 from pandas import DataFrame
 import talib.abstract as ta
 import numpy as np
-import os
 from typing import Optional
 
+from shared.basis_store import BasisFeatureStore
+from shared.feature_block import BlockColumn, materialize
+from shared.features import feature_library
+from shared.futures_data import FuturesLeg
+from shared.labels import ForwardReturnLabels
+from shared.merge import merge_on_date
+from shared.row_cache import RowCache
+from shared.rolling import rolling_drawdown, rolling_mean_std, rolling_quantiles, rolling_vwap
+from shared.scoring import WeightedScore
+
 class PerpSpotBasisStrategy_Enhanced(IStrategy):
     timeframe = "5m"
     can_short = False
@@ -48,10 +58,26 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
     max_drawdown_threshold = DecimalParameter(0.05, 0.15, default=0.1, space='buy', optimize=True, load=True)
     position_size_multiplier = DecimalParameter(0.5, 1.5, default=1.0, space='buy', optimize=True, load=True)
 
+    # Weights of the signal quality sub-scores (trend, volume, volatility, macd, adx)
+    signal_quality_weights = {'trend': 1.0, 'volume': 1.0, 'volatility': 1.0, 'macd': 1.0, 'adx': 1.0}
+
     # FreqAI configuration
     freqai_label_period = 12
     freqai_min_return = 0.003
 
+    def bot_start(self, **kwargs) -> None:
+        """Perp candles (DataProvider when live, futures files in backtests), basis feature store and sizing cache"""
+        self.futures_leg = FuturesLeg(self)
+        # Basis features computed once per pair, shared with hyperopt and FreqAI training runs
+        self.basis_store = BasisFeatureStore(self.config['user_data_dir'] / 'basis-feature-store')
+        # Risk metrics of the candle sizing and risk callbacks decide on
+        self.row_cache = RowCache(['position_multiplier', 'risk_level', 'drawdown'], timeframe_to_minutes(self.timeframe))
+        # Target labels: return over freqai_label_period candles above the volatility adjusted threshold
+        self.label_generator = ForwardReturnLabels([self.freqai_label_period], {'risk_adjusted': (self.freqai_min_return, 2.0)})
+
+    def informative_pairs(self):
+        return self.futures_leg.informative_pairs()
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
         
@@ -59,16 +85,16 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
             dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_enhanced_basis_features(dataframe)
+            dataframe = self.calculate_enhanced_basis_features(dataframe, pair)
         
         # Enhanced technical indicators
-        dataframe = self.calculate_enhanced_technical_indicators(dataframe)
+        dataframe = self.calculate_enhanced_technical_indicators(dataframe, pair)
         
         # Market structure features
         dataframe = self.calculate_market_structure_features(dataframe)
         
         # Volume analysis
-        dataframe = self.calculate_enhanced_volume_features(dataframe)
+        dataframe = self.calculate_enhanced_volume_features(dataframe, pair)
         
         # Signal quality scoring
         dataframe = self.calculate_signal_quality_score(dataframe)
@@ -82,6 +108,8 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         # Trigger FreqAI pipeline
         dataframe = self.freqai.start(dataframe, metadata, self)
 
+        self.row_cache.update(pair, dataframe)
+
         return dataframe
 
     def load_futures_data(self, pair: str) -> pd.DataFrame:
@@ -94,35 +122,25 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
             f"user_data/data/binance/futures/{pair_formatted}-5m-futures.feather",
             f"user_data/data/binance/{pair_formatted}-5m-futures.feather",
         ]
-        
-        for futures_path in possible_paths:
-            if os.path.exists(futures_path):
-                try:
-                    futures_data = pd.read_feather(futures_path)
-                    return futures_data
-                except Exception as e:
-                    continue
-        
-        return None
+
+        # Live: DataProvider, otherwise cached per file and only re-read when the file changes
+        try:
+            return self.futures_leg.candles(pair, possible_paths)
+        except Exception:
+            return None
 
     def merge_futures_data(self, spot_df: pd.DataFrame, futures_df: pd.DataFrame) -> pd.DataFrame:
         """Merge spot and futures data on timestamp"""
         try:
-            if not isinstance(spot_df.index, pd.DatetimeIndex):
-                spot_df.index = pd.to_datetime(spot_df.index)
-            if not isinstance(futures_df.index, pd.DatetimeIndex):
-                futures_df.index = pd.to_datetime(futures_df.index)
-
-            futures_columns = ['open_perp', 'high_perp', 'low_perp', 'close_perp', 'volume_perp']
-            futures_df_renamed = futures_df[['open', 'high', 'low', 'close', 'volume']].copy()
-            futures_df_renamed.columns = futures_columns
+            # Align on the date column (freqtrade frames have a RangeIndex), only
+            # looking at the futures rows inside the spot window
+            merged_df = merge_on_date(spot_df, futures_df, ['open', 'high', 'low', 'close', 'volume'], suffix='_perp')
 
-            merged_df = spot_df.join(futures_df_renamed, how='left')
             return merged_df
         except Exception as e:
             return spot_df
 
-    def calculate_enhanced_basis_features(self, dataframe):
+    def calculate_enhanced_basis_features(self, dataframe, pair):
         """Enhanced basis features with volatility and momentum"""
         if 'close_perp' not in dataframe.columns:
             # Create dummy basis features if no futures data
@@ -134,73 +152,35 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
             dataframe['basis_zscore'] = 0
             return dataframe
 
-        # Basic basis calculation
-        dataframe['basis'] = (dataframe['close_perp'] - dataframe['close']) / dataframe['close']
-        dataframe['basis'] = dataframe['basis'].replace([np.inf, -np.inf], np.nan).ffill().bfill()
-
-        # Basis moving averages
-        dataframe['basis_ma_5'] = ta.SMA(dataframe['basis'], timeperiod=5)
-        dataframe['basis_ma_10'] = ta.SMA(dataframe['basis'], timeperiod=10)
-        dataframe['basis_ma_30'] = ta.SMA(dataframe['basis'], timeperiod=30)
-        dataframe['basis_ma_100'] = ta.SMA(dataframe['basis'], timeperiod=100)
-
-        # Basis volatility (rolling standard deviation)
-        dataframe['basis_volatility'] = dataframe['basis'].rolling(window=20).std()
-        
-        # Basis momentum and acceleration
-        dataframe['basis_momentum'] = dataframe['basis'] - dataframe['basis_ma_10']
-        dataframe['basis_acceleration'] = dataframe['basis_momentum'] - dataframe['basis_momentum'].shift(1)
-        
-        # Basis z-score with adaptive window
-        for window in [20, 50, 100]:
-            basis_mean = dataframe['basis'].rolling(window=window).mean()
-            basis_std = dataframe['basis'].rolling(window=window).std()
-            dataframe[f'basis_zscore_{window}'] = (dataframe['basis'] - basis_mean) / basis_std
-        
-        # Use the most stable z-score
-        dataframe['basis_zscore'] = dataframe['basis_zscore_50'].fillna(0)
-        
-        # Basis regime detection (trending vs mean-reverting)
-        dataframe['basis_regime'] = np.where(
-            abs(dataframe['basis_zscore']) > 2, 1,  # Trending
-            0  # Mean-reverting
-        )
-        
-        # Basis divergence from price momentum
-        price_momentum = dataframe['close'].pct_change(10)
-        dataframe['basis_price_divergence'] = dataframe['basis_momentum'] - price_momentum
+        # Basis, moving averages, volatility, momentum, z-scores (20/50/100), regime and
+        # price divergence: sliced from the per pair store, only new candles are computed
+        features = self.basis_store.features(pair, dataframe)
+        dataframe[list(features.columns)] = features
 
         return dataframe
 
-    def calculate_enhanced_technical_indicators(self, dataframe):
+    def calculate_enhanced_technical_indicators(self, dataframe, pair):
         """Enhanced technical indicators with multiple timeframes"""
         # Price indicators
         for period in [10, 20, 50, 100]:
-            dataframe[f'ema_{period}'] = ta.EMA(dataframe, timeperiod=period)
-            dataframe[f'sma_{period}'] = ta.SMA(dataframe, timeperiod=period)
+            dataframe = feature_library.apply(dataframe, pair, [f'ema_{period}', f'sma_{period}'])
         
         # RSI with multiple periods
-        for period in [14, 21]:
-            dataframe[f'rsi_{period}'] = ta.RSI(dataframe, timeperiod=period)
-        dataframe['rsi'] = dataframe['rsi_14']  # Default
+        dataframe = feature_library.apply(dataframe, pair, ['rsi'])  # Default
+        dataframe['rsi_14'] = dataframe['rsi']
+        dataframe['rsi_21'] = ta.RSI(dataframe, timeperiod=21)
         
         # MACD with signal quality
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
+        dataframe = feature_library.apply(dataframe, pair, ['macd', 'macdsignal', 'macdhist'])
         dataframe['macd_strength'] = abs(dataframe['macdhist'])
         
         # Bollinger Bands with squeeze detection
-        bb = ta.BBANDS(dataframe)
-        dataframe['bb_upper'] = bb['upperband']
-        dataframe['bb_middle'] = bb['middleband']
-        dataframe['bb_lower'] = bb['lowerband']
+        dataframe = feature_library.apply(dataframe, pair, ['bb_upper', 'bb_middle', 'bb_lower'])
         dataframe['bb_width'] = (dataframe['bb_upper'] - dataframe['bb_lower']) / dataframe['bb_middle']
-        dataframe['bb_squeeze'] = dataframe['bb_width'] < dataframe['bb_width'].rolling(20).quantile(0.2)
+        dataframe['bb_squeeze'] = dataframe['bb_width'] < rolling_quantiles(dataframe['bb_width'], 20, [0.2])[0]
         
         # ADX for trend strength
-        dataframe['adx'] = ta.ADX(dataframe, timeperiod=14)
+        dataframe = feature_library.apply(dataframe, pair, ['adx'])
         dataframe['adx_strong'] = dataframe['adx'] > 25
         
         # Stochastic
@@ -225,7 +205,9 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         # Market volatility regime
         returns = dataframe['close'].pct_change()
         dataframe['volatility_20'] = returns.rolling(20).std()
-        dataframe['volatility_regime'] = dataframe['volatility_20'] > dataframe['volatility_20'].rolling(100).median()
+        # Rolling median, also used by the signal quality score
+        dataframe['volatility_median_100'] = rolling_quantiles(dataframe['volatility_20'], 100, [0.5])[0]
+        dataframe['volatility_regime'] = dataframe['volatility_20'] > dataframe['volatility_median_100']
         
         # Price momentum across multiple timeframes
         for period in [5, 10, 20]:
@@ -241,11 +223,10 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         
         return dataframe
 
-    def calculate_enhanced_volume_features(self, dataframe):
+    def calculate_enhanced_volume_features(self, dataframe, pair):
         """Enhanced volume analysis"""
         # Volume moving averages
-        for period in [10, 20, 50]:
-            dataframe[f'volume_ma_{period}'] = ta.SMA(dataframe['volume'], timeperiod=period)
+        dataframe = feature_library.apply(dataframe, pair, ['volume_ma_10', 'volume_ma_20', 'volume_ma_50'])
         
         # Volume ratios
         dataframe['volume_ratio_10'] = dataframe['volume'] / dataframe['volume_ma_10']
@@ -255,59 +236,50 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         dataframe['volume_trend'] = dataframe['volume_ma_10'] / dataframe['volume_ma_50']
         
         # On-balance volume and money flow
-        dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
+        dataframe = feature_library.apply(dataframe, pair, ['obv'])
         dataframe['obv_ma'] = ta.SMA(dataframe['obv'], timeperiod=20)
         dataframe['obv_trend'] = dataframe['obv'] > dataframe['obv_ma']
         
         # Volume-weighted average price
         typical_price = (dataframe['high'] + dataframe['low'] + dataframe['close']) / 3
-        dataframe['vwap'] = (typical_price * dataframe['volume']).rolling(20).sum() / \
-                           dataframe['volume'].rolling(20).sum()
+        dataframe['vwap'] = rolling_vwap(typical_price, dataframe['volume'], 20)
         
         # Volume surge detection
-        dataframe['volume_surge'] = dataframe['volume'] > dataframe['volume'].rolling(50).quantile(0.8)
+        dataframe['volume_surge'] = dataframe['volume'] > rolling_quantiles(dataframe['volume'], 50, [0.8])[0]
         
         return dataframe
 
     def calculate_signal_quality_score(self, dataframe):
         """Calculate a comprehensive signal quality score"""
-        scores = []
+        score = WeightedScore(len(dataframe), self.signal_quality_weights)
         
         # Trend alignment score
-        trend_score = dataframe['trend_consistency']
-        scores.append(trend_score)
+        score.add('trend', dataframe['trend_consistency'])
         
         # Volume confirmation score
-        volume_score = np.minimum(dataframe['volume_ratio_20'] / 2.0, 1.0)  # Cap at 1.0
-        scores.append(volume_score)
+        score.add('volume', np.minimum(dataframe['volume_ratio_20'] / 2.0, 1.0))  # Cap at 1.0
         
         # Volatility appropriateness (not too high, not too low)
-        vol_score = 1 - abs(dataframe['volatility_20'] - dataframe['volatility_20'].rolling(100).median()) / \
-                    dataframe['volatility_20'].rolling(100).std()
-        vol_score = np.clip(vol_score, 0, 1)
-        scores.append(vol_score)
+        volatility_std_100 = rolling_mean_std(dataframe['volatility_20'], [100])[1][0]
+        vol_score = 1 - abs(dataframe['volatility_20'] - dataframe['volatility_median_100']) / volatility_std_100
+        score.add('volatility', np.clip(vol_score, 0, 1))
         
         # MACD strength score
-        macd_score = np.minimum(dataframe['macd_strength'] / dataframe['macd_strength'].rolling(50).quantile(0.8), 1.0)
-        scores.append(macd_score)
+        macd_strength_q80 = rolling_quantiles(dataframe['macd_strength'], 50, [0.8])[0]
+        score.add('macd', np.minimum(dataframe['macd_strength'] / macd_strength_q80, 1.0))
         
         # ADX trend strength score
-        adx_score = np.minimum(dataframe['adx'] / 50.0, 1.0)
-        scores.append(adx_score)
+        score.add('adx', np.minimum(dataframe['adx'] / 50.0, 1.0))
         
         # Combine scores
-        dataframe['signal_quality'] = pd.DataFrame(scores).T.mean(axis=1)
-        dataframe['signal_quality'] = dataframe['signal_quality'].fillna(0)
+        dataframe['signal_quality'] = score.mean(fill=0.0)
         
         return dataframe
 
     def calculate_risk_metrics(self, dataframe):
         """Calculate risk metrics for position sizing"""
-        # Recent drawdown
-        returns = dataframe['close'].pct_change()
-        cumulative_returns = (1 + returns).cumprod()
-        rolling_max = cumulative_returns.rolling(50).max()
-        dataframe['drawdown'] = (cumulative_returns - rolling_max) / rolling_max
+        # Recent drawdown (from the highest close of the last 50 candles)
+        dataframe['drawdown'] = rolling_drawdown(dataframe['close'], 50)
         
         # Current risk level
         dataframe['risk_level'] = abs(dataframe['drawdown'])
@@ -318,41 +290,39 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
         
         return dataframe
 
-    def prepare_freqai_features(self, dataframe):
-        """Prepare features for FreqAI with proper scaling"""
-        features = {}
-        
-        # Basis features
-        features['%-basis_zscore'] = dataframe.get('basis_zscore', 0).fillna(0).clip(-5, 5)
-        features['%-basis_volatility'] = dataframe.get('basis_volatility', 0).fillna(0).clip(0, 0.1) * 100
-        features['%-basis_momentum'] = dataframe.get('basis_momentum', 0).fillna(0).clip(-0.01, 0.01) * 1000
-        features['%-basis_regime'] = dataframe.get('basis_regime', 0).fillna(0)
-        
+    # FreqAI features: source column, NaN fill, clip range, log1p and scale
+    freqai_feature_columns = {
+        # Basis features (0 without perp data)
+        '%-basis_zscore': BlockColumn('basis_zscore', clip=(-5, 5)),
+        '%-basis_volatility': BlockColumn('basis_volatility', clip=(0, 0.1), scale=100),
+        '%-basis_momentum': BlockColumn('basis_momentum', clip=(-0.01, 0.01), scale=1000),
+        '%-basis_regime': BlockColumn('basis_regime', binary=True),
+
         # Technical indicators
-        features['%-rsi'] = dataframe['rsi'].fillna(50) / 100.0
-        features['%-adx'] = dataframe['adx'].fillna(20) / 100.0
-        features['%-macd_strength'] = np.log1p(dataframe['macd_strength'].fillna(0))
-        features['%-bb_width'] = dataframe['bb_width'].fillna(0).clip(0, 0.1) * 100
-        
+        '%-rsi': BlockColumn('rsi', fill=50, scale=0.01),
+        '%-adx': BlockColumn('adx', fill=20, scale=0.01),
+        '%-macd_strength': BlockColumn('macd_strength', log1p=True),
+        '%-bb_width': BlockColumn('bb_width', clip=(0, 0.1), scale=100),
+
         # Market structure
-        features['%-trend_consistency'] = dataframe['trend_consistency'].fillna(0)
-        features['%-volatility_regime'] = dataframe['volatility_regime'].astype(int)
-        features['%-momentum_5'] = dataframe['momentum_5'].fillna(0).clip(-0.05, 0.05) * 100
-        features['%-momentum_10'] = dataframe['momentum_10'].fillna(0).clip(-0.1, 0.1) * 50
-        
+        '%-trend_consistency': BlockColumn('trend_consistency'),
+        '%-volatility_regime': BlockColumn('volatility_regime', binary=True),
+        '%-momentum_5': BlockColumn('momentum_5', clip=(-0.05, 0.05), scale=100),
+        '%-momentum_10': BlockColumn('momentum_10', clip=(-0.1, 0.1), scale=50),
+
         # Volume features
-        features['%-volume_ratio'] = np.log1p(dataframe['volume_ratio_20'].fillna(1))
-        features['%-volume_trend'] = dataframe['volume_trend'].fillna(1).clip(0.5, 2.0)
-        features['%-obv_trend'] = dataframe['obv_trend'].astype(int)
-        
+        '%-volume_ratio': BlockColumn('volume_ratio_20', fill=1, log1p=True),
+        '%-volume_trend': BlockColumn('volume_trend', fill=1, clip=(0.5, 2.0)),
+        '%-obv_trend': BlockColumn('obv_trend', binary=True),
+
         # Signal quality
-        features['%-signal_quality'] = dataframe['signal_quality'].fillna(0)
-        
-        # Add features to dataframe
-        for key, value in features.items():
-            dataframe[key] = value
-        
-        return dataframe
+        '%-signal_quality': BlockColumn('signal_quality'),
+    }
+
+    def prepare_freqai_features(self, dataframe):
+        """Prepare features for FreqAI with proper scaling"""
+        # One float32 block of the scaled features, one int8 block of the flags and regimes
+        return materialize(dataframe, self.freqai_feature_columns)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         """Simplified entry logic to generate more trades"""
@@ -423,13 +393,13 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
                            proposed_stake: float, min_stake: float, max_stake: float, 
                            entry_tag: str, side: str, **kwargs) -> float:
         """Dynamic position sizing based on risk metrics"""
-        dataframe, _ = self.dp.get_analyzed_dataframe(pair, self.timeframe)
+        row = self.row_cache.row(pair, current_time)
         
-        if dataframe.empty:
+        if row is None:
             return proposed_stake
         
         # Get current position multiplier
-        current_multiplier = dataframe['position_multiplier'].iloc[-1]
+        current_multiplier = row['position_multiplier']
         
         # Apply user-defined multiplier
         final_multiplier = current_multiplier * self.position_size_multiplier.value
@@ -442,21 +412,10 @@ class PerpSpotBasisStrategy_Enhanced(IStrategy):
 
     def set_freqai_targets(self, dataframe: DataFrame, metadata: dict, **kwargs) -> DataFrame:
         """Set FreqAI targets with enhanced logic"""
-        # Calculate future returns
-        future_return = dataframe["close"].shift(-self.freqai_label_period) / dataframe["close"] - 1
-        
-        # More sophisticated labeling based on risk-adjusted returns
-        volatility = dataframe['close'].pct_change().rolling(20).std()
-        risk_adjusted_threshold = self.freqai_min_return * (1 + volatility * 2)
-        
-        # Create labels
-        dataframe["&-enter_long"] = np.where(
-            future_return > risk_adjusted_threshold,
-            "enter",
-            "hold"
-        )
-        
-        dataframe["&-enter_long"] = dataframe["&-enter_long"].fillna("hold")
+        # Labels based on risk-adjusted future returns: the return over freqai_label_period
+        # candles against freqai_min_return * (1 + 2 * 20 candle volatility), 'hold' when unknown
+        labels = self.label_generator.labels(metadata['pair'], dataframe)
+        dataframe["&-enter_long"] = labels[(self.freqai_label_period, 'risk_adjusted')]
         
         return dataframe
 
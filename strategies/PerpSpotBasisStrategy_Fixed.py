@@ -6,9 +6,9 @@ import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import DecimalParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
-import os
+
+from shared.features import TECHNICAL_COLUMNS, feature_library
+from shared.futures_data import futures_loader
 
 class PerpSpotBasisStrategy_Fixed(IStrategy):
     timeframe = "5m"
@@ -35,26 +35,16 @@ class PerpSpotBasisStrategy_Fixed(IStrategy):
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
             dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_basis_features(dataframe)
+            dataframe = self.calculate_basis_features(dataframe, pair)
 
         # Always calculate these basic features
-        dataframe = self.calculate_volume_features(dataframe)
+        dataframe = self.calculate_volume_features(dataframe, pair)
 
         # Technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
 
         # Bollinger Bands for additional signals
-        bb = ta.BBANDS(dataframe)
-        dataframe['bb_upper'] = bb['upperband']
-        dataframe['bb_middle'] = bb['middleband']
-        dataframe['bb_lower'] = bb['lowerband']
+        dataframe = feature_library.apply(dataframe, pair, ['bb_upper', 'bb_middle', 'bb_lower'])
 
         return dataframe
 
@@ -64,11 +54,8 @@ class PerpSpotBasisStrategy_Fixed(IStrategy):
             futures_pair = pair.replace('/', '_') + '_USDT-5m-futures.feather'
             futures_path = f'/home/gil/freqtrade/user_data/data/binance/futures/{futures_pair}'
 
-            if not os.path.exists(futures_path):
-                return None
-
-            df = pd.read_feather(futures_path)
-            return df
+            # Cached per file, only re-read when the file changes
+            return futures_loader.load([futures_path])
         except Exception:
             return None
 
@@ -84,39 +71,28 @@ class PerpSpotBasisStrategy_Fixed(IStrategy):
         except Exception:
             return spot_df
 
-    def calculate_basis_features(self, dataframe: DataFrame) -> DataFrame:
+    def calculate_basis_features(self, dataframe: DataFrame, pair: str) -> DataFrame:
         """Calculate perp-spot basis features if perp data is available"""
         if 'close_perp' not in dataframe.columns or dataframe['close_perp'].isna().all():
             return dataframe
 
         # Basic basis calculation
-        dataframe['basis'] = (dataframe['close_perp'] - dataframe['close']) / dataframe['close'] * 100
+        dataframe = feature_library.apply(dataframe, pair, ['basis'])
 
         # Only calculate if we have valid data
         if not dataframe['basis'].isna().all():
-            dataframe['basis_ma_10'] = ta.SMA(dataframe['basis'], timeperiod=10)
-            dataframe['basis_ma_30'] = ta.SMA(dataframe['basis'], timeperiod=30)
-            dataframe['basis_roc'] = ta.ROC(dataframe['basis'], timeperiod=5)
-
-            # Z-score of basis
-            basis_mean = dataframe['basis'].rolling(window=50).mean()
-            basis_std = dataframe['basis'].rolling(window=50).std()
-            dataframe['basis_zscore'] = (dataframe['basis'] - basis_mean) / basis_std
+            dataframe = feature_library.apply(dataframe, pair, ['basis_ma_10', 'basis_ma_30', 'basis_roc', 'basis_zscore'])
 
         return dataframe
 
-    def calculate_volume_features(self, dataframe):
+    def calculate_volume_features(self, dataframe, pair):
         """Calculate volume features"""
         try:
-            dataframe['volume_ma_20'] = ta.SMA(dataframe['volume'], timeperiod=20)
+            dataframe = feature_library.apply(dataframe, pair, ['volume_ma_20'])
             dataframe['volume_ratio'] = dataframe['volume'] / dataframe['volume_ma_20']
-            dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
 
-            # VWAP
-            vwap_period = 20
-            cumulative_price_volume = (dataframe['close'] * dataframe['volume']).rolling(vwap_period).sum()
-            cumulative_volume = dataframe['volume'].rolling(vwap_period).sum()
-            dataframe['vwap'] = cumulative_price_volume / cumulative_volume
+            # OBV and VWAP
+            dataframe = feature_library.apply(dataframe, pair, ['obv', 'vwap'])
 
             return dataframe
         except Exception:
@@ -8,7 +8,15 @@ from freqtrade.strategy import IntParameter, DecimalParameter
 from pandas import DataFrame
 import talib.abstract as ta
 import numpy as np
-import os
+import logging
+
+from shared.features import TECHNICAL_COLUMNS, feature_library
+from shared.futures_data import futures_loader
+from shared.merge import merge_on_date
+from shared.labels import ForwardReturnLabels
+from shared.tracing import Tracer
+
+logger = logging.getLogger(__name__)
 
 class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
     timeframe = "5m"
@@ -33,33 +41,37 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
     freqai_label_period = 12
     freqai_min_return = 0.003
 
+    # Debug output: first analysis of every pair, then one per day of 5m candles.
+    # Overridden by the "tracing" section of the config, e.g. {"enabled": false}
+    tracing = {'first': 1, 'every': 288, 'echo': True}
+
+    def bot_start(self, **kwargs) -> None:
+        self.tracer = Tracer(**{**self.tracing, **self.config.get('tracing', {})})
+        # Target labels: return over freqai_label_period candles above freqai_min_return
+        self.label_generator = ForwardReturnLabels([self.freqai_label_period], {'fixed': (self.freqai_min_return, 0.0)})
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
-        print(f"\n=== DEBUG: Populating indicators for {pair} ===")
-        print(f"Dataframe shape: {dataframe.shape}")
-        print(f"Dataframe columns: {list(dataframe.columns)}")
+        trace = self.tracer
+        trace.begin(pair)
+        trace(pair, "=== DEBUG: Populating indicators for {} ===", pair)
+        trace(pair, "Dataframe shape: {}", dataframe.shape)
+        trace(pair, "Dataframe columns: {}", lambda: list(dataframe.columns))
 
         # Load futures data for basis calculations
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
-            print(f"Futures data loaded successfully. Shape: {futures_data.shape}")
-            dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_basis_features(dataframe)
+            trace(pair, "Futures data loaded successfully. Shape: {}", futures_data.shape)
+            dataframe = self.merge_futures_data(dataframe, futures_data, pair)
+            dataframe = self.calculate_basis_features(dataframe, pair)
         else:
-            print("No futures data loaded - proceeding without basis features")
+            trace(pair, "No futures data loaded - proceeding without basis features")
 
         # Technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        macd = ta.MACD(dataframe)
-        dataframe["macd"] = macd["macd"]
-        dataframe["macdsignal"] = macd["macdsignal"]
-        dataframe["macdhist"] = macd["macdhist"]
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
 
         # Volume features
-        dataframe = self.calculate_volume_features(dataframe)
+        dataframe = self.calculate_volume_features(dataframe, pair)
 
         # FreqAI-specific feature engineering (prefix with %-)
         dataframe["%-basis_zscore"] = dataframe.get("basis_zscore", 0).fillna(0).clip(-5, 5)
@@ -78,18 +90,16 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
         dataframe["%-macdsignal_norm"] = (dataframe["macdsignal"].fillna(0) / dataframe["close"].replace(0, np.nan)).replace([np.inf, -np.inf], 0).fillna(0)
         dataframe["%-momentum"] = dataframe["close"].pct_change(periods=3).fillna(0)
 
-        freqai_feature_columns = [col for col in dataframe.columns if col.startswith("%-")]
-        print(f"FreqAI feature columns: {freqai_feature_columns}")
+        trace(pair, "FreqAI feature columns: {}", lambda: [col for col in dataframe.columns if col.startswith("%-")])
 
         # Trigger FreqAI pipeline (adds &- predictions)
         dataframe = self.freqai.start(dataframe, metadata, self)
 
-        print(f"Final dataframe columns: {list(dataframe.columns)}")
-        print(f"Final dataframe shape: {dataframe.shape}")
-        
+        trace(pair, "Final dataframe columns: {}", lambda: list(dataframe.columns))
+        trace(pair, "Final dataframe shape: {}", dataframe.shape)
+
         # Check for FreqAI columns
-        freqai_columns = [col for col in dataframe.columns if col.startswith('&-')]
-        print(f"FreqAI columns detected: {freqai_columns}")
+        trace(pair, "FreqAI columns detected: {}", lambda: [col for col in dataframe.columns if col.startswith('&-')])
 
         return dataframe
 
@@ -103,49 +113,37 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
             f"user_data/data/binance/futures/{pair_formatted}-5m-futures.feather",
             f"user_data/data/binance/{pair_formatted}-5m-futures.feather",
         ]
-        
-        for futures_path in possible_paths:
-            if os.path.exists(futures_path):
-                try:
-                    print(f"Loading futures data from: {futures_path}")
-                    futures_data = pd.read_feather(futures_path)
-                    print(f"Futures data loaded: {len(futures_data)} rows")
-                    return futures_data
-                except Exception as e:
-                    print(f"Error loading from {futures_path}: {e}")
-                    continue
-        
-        print(f"No futures data found for {pair}")
-        return None
 
-    def merge_futures_data(self, spot_df: pd.DataFrame, futures_df: pd.DataFrame) -> pd.DataFrame:
+        # Cached per file, only re-read when the file changes
+        try:
+            futures_data = futures_loader.load(possible_paths)
+        except Exception as e:
+            logger.error(f"Error loading futures data for {pair}: {e}")
+            return None
+        if futures_data is None:
+            self.tracer(pair, "No futures data found for {}", pair)
+            return None
+        self.tracer(pair, "Futures data loaded: {} rows", len(futures_data))
+        return futures_data
+
+    def merge_futures_data(self, spot_df: pd.DataFrame, futures_df: pd.DataFrame, pair: str) -> pd.DataFrame:
         """Merge spot and futures data on timestamp"""
         try:
-            # Ensure both dataframes have datetime index
-            if not isinstance(spot_df.index, pd.DatetimeIndex):
-                spot_df.index = pd.to_datetime(spot_df.index)
-            if not isinstance(futures_df.index, pd.DatetimeIndex):
-                futures_df.index = pd.to_datetime(futures_df.index)
-
-            # Rename futures columns to avoid conflicts
-            futures_columns = ['open_perp', 'high_perp', 'low_perp', 'close_perp', 'volume_perp']
-            futures_df_renamed = futures_df[['open', 'high', 'low', 'close', 'volume']].copy()
-            futures_df_renamed.columns = futures_columns
-
-            # Merge on index (timestamp)
-            merged_df = spot_df.join(futures_df_renamed, how='left')
-            print(f"Merged dataframe shape: {merged_df.shape}")
+            # Align on the date column (freqtrade frames have a RangeIndex), only
+            # looking at the futures rows inside the spot window
+            merged_df = merge_on_date(spot_df, futures_df, ['open', 'high', 'low', 'close', 'volume'], suffix='_perp')
+            self.tracer(pair, "Merged dataframe shape: {}", merged_df.shape)
 
             return merged_df
         except Exception as e:
-            print(f"Error merging futures data: {e}")
+            logger.error(f"Error merging futures data for {pair}: {e}")
             return spot_df
 
-    def calculate_basis_features(self, dataframe):
+    def calculate_basis_features(self, dataframe, pair):
         """Calculate perpetual-spot basis features"""
         try:
             if 'close_perp' not in dataframe.columns:
-                print("No perpetual data available for basis calculation")
+                self.tracer(pair, "No perpetual data available for basis calculation")
                 return dataframe
 
             # Basic basis calculation
@@ -172,58 +170,51 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
             # Fill any remaining NaN values
             dataframe['basis_zscore'] = dataframe['basis_zscore'].fillna(0)
 
-            print(f"Basis calculation completed")
-            non_nan_basis = dataframe['basis'].dropna()
-            if len(non_nan_basis) > 0:
-                print(f"Basis stats - Mean: {non_nan_basis.mean():.6f}, Std: {non_nan_basis.std():.6f}")
-                print(f"Basis Z-score range: {dataframe['basis_zscore'].min():.2f} to {dataframe['basis_zscore'].max():.2f}")
+            self.tracer(pair, "Basis calculation completed")
+            if self.tracer.traced(pair):
+                non_nan_basis = dataframe['basis'].dropna()
+                if len(non_nan_basis) > 0:
+                    self.tracer(pair, "Basis stats - Mean: {:.6f}, Std: {:.6f}", non_nan_basis.mean(), non_nan_basis.std())
+                    self.tracer(pair, "Basis Z-score range: {:.2f} to {:.2f}",
+                                dataframe['basis_zscore'].min(), dataframe['basis_zscore'].max())
 
             return dataframe
         except Exception as e:
-            print(f"Error calculating basis features: {e}")
+            logger.error(f"Error calculating basis features for {pair}: {e}")
             return dataframe
 
-    def calculate_volume_features(self, dataframe):
+    def calculate_volume_features(self, dataframe, pair):
         """Enhanced volume analysis features"""
         try:
-            # Volume moving averages
-            dataframe['volume_ma_10'] = ta.SMA(dataframe['volume'], timeperiod=10)
-            dataframe['volume_ma_30'] = ta.SMA(dataframe['volume'], timeperiod=30)
+            # Volume moving averages, OBV and rolling VWAP
+            dataframe = feature_library.apply(dataframe, pair, ['volume_ma_10', 'volume_ma_30', 'obv', 'vwap'])
 
             # Volume ratio (current vs moving average)
             dataframe['volume_ratio_ma'] = dataframe['volume'] / dataframe['volume_ma_30']
 
-            # On-balance volume (OBV)
-            dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
-
-            # Volume weighted average price (VWAP)
-            vwap_period = 20
-            cumulative_price_volume = (dataframe['close'] * dataframe['volume']).rolling(vwap_period).sum()
-            cumulative_volume = dataframe['volume'].rolling(vwap_period).sum()
-            dataframe['vwap'] = cumulative_price_volume / cumulative_volume
-
             return dataframe
         except Exception as e:
-            print(f"Error calculating volume features: {e}")
+            logger.error(f"Error calculating volume features for {pair}: {e}")
             return dataframe
 
     freqai_prediction_threshold = DecimalParameter(0.5, 0.9, default=0.75, space='buy', optimize=True, load=True)
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
-        print(f"\n=== DEBUG: Populating entry trend for {metadata['pair']} ===")
-        print(f"Dataframe shape: {dataframe.shape}")
+        pair = metadata['pair']
+        trace = self.tracer
+        trace(pair, "=== DEBUG: Populating entry trend for {} ===", pair)
+        trace(pair, "Dataframe shape: {}", dataframe.shape)
         
         # Initialize all entry signals to 0
         dataframe.loc[:, 'enter_long'] = 0
         
         # Check FreqAI columns
-        freqai_columns = [col for col in dataframe.columns if col.startswith('&-')]
-        print(f"Available FreqAI columns: {freqai_columns}")
+        trace(pair, "Available FreqAI columns: {}", lambda: [col for col in dataframe.columns if col.startswith('&-')])
         
         # Check if FreqAI enter_long signal exists
         if '&-enter_long' in dataframe.columns:
             enter_long_col = dataframe['&-enter_long']
-            print(f"FreqAI &-enter_long unique values: {enter_long_col.unique()}")
+            trace(pair, "FreqAI &-enter_long unique values: {}", enter_long_col.unique)
 
             proba_col = None
             for col in dataframe.columns:
@@ -236,36 +227,35 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
             if proba_col:
                 predictions = dataframe[proba_col].fillna(0)
                 freqai_condition = predictions > self.freqai_prediction_threshold.value
-                print(f"FreqAI probability column '{proba_col}' used, signals above threshold: {freqai_condition.sum()}")
+                trace(pair, "FreqAI probability column '{}' used, signals above threshold: {}", proba_col, freqai_condition.sum)
                 dataframe.loc[freqai_condition, 'enter_long'] = 1
             else:
                 freqai_condition = enter_long_col.astype(str).str.lower() == 'enter'
-                print(f"FreqAI class-based signals: {freqai_condition.sum()}")
+                trace(pair, "FreqAI class-based signals: {}", freqai_condition.sum)
                 dataframe.loc[freqai_condition, 'enter_long'] = 1
 
             if dataframe['enter_long'].sum() == 0:
-                print("  - No FreqAI signals above threshold, using fallback")
+                trace(pair, "  - No FreqAI signals above threshold, using fallback")
                 oversold = dataframe['rsi'] < 40
                 uptrend = dataframe['ema_20'] > dataframe['ema_50']
 
                 fallback_condition = oversold & uptrend
-                print(f"  - Fallback oversold signals: {oversold.sum()}")
-                print(f"  - Fallback uptrend signals: {uptrend.sum()}")
-                print(f"  - Combined fallback signals: {fallback_condition.sum()}")
+                trace(pair, "  - Fallback oversold signals: {}", oversold.sum)
+                trace(pair, "  - Fallback uptrend signals: {}", uptrend.sum)
+                trace(pair, "  - Combined fallback signals: {}", fallback_condition.sum)
 
                 dataframe.loc[fallback_condition, 'enter_long'] = 1
         else:
-            print("No &-enter_long column found! Using fallback conditions")
+            trace(pair, "No &-enter_long column found! Using fallback conditions")
             # More permissive fallback when no FreqAI
             oversold = dataframe['rsi'] < 40
             uptrend = dataframe['ema_20'] > dataframe['ema_50']
             
             fallback_condition = oversold & uptrend
-            print(f"Fallback signals: {fallback_condition.sum()}")
+            trace(pair, "Fallback signals: {}", fallback_condition.sum)
             dataframe.loc[fallback_condition, 'enter_long'] = 1
         
-        total_signals = dataframe['enter_long'].sum()
-        print(f"Total entry signals generated: {total_signals}")
+        trace(pair, "Total entry signals generated: {}", dataframe['enter_long'].sum)
         
         return dataframe
 
@@ -276,20 +266,14 @@ class PerpSpotBasisStrategy_FreqAI_Debug(IStrategy):
         strong_overbought = dataframe['rsi'] > 75
         dataframe.loc[strong_overbought, 'exit_long'] = 1
 
-        exit_signals = dataframe['exit_long'].sum()
-        print(f"Total exit signals generated: {exit_signals}")
+        self.tracer(metadata['pair'], "Total exit signals generated: {}", dataframe['exit_long'].sum)
 
         return dataframe
 
     def set_freqai_targets(self, dataframe: DataFrame, metadata: dict, **kwargs) -> DataFrame:
-        future_return = dataframe["close"].shift(-self.freqai_label_period) / dataframe["close"] - 1
-        dataframe["&-enter_long"] = np.where(
-            future_return > self.freqai_min_return,
-            "enter",
-            "hold"
-        )
-        dataframe["&-enter_long"] = dataframe["&-enter_long"].fillna("hold")
-        print(f"Set FreqAI targets for {metadata['pair']} with threshold {self.freqai_min_return}")
+        labels = self.label_generator.labels(metadata['pair'], dataframe)
+        dataframe["&-enter_long"] = labels[(self.freqai_label_period, 'fixed')]
+        self.tracer(metadata['pair'], "Set FreqAI targets for {} with threshold {}", metadata['pair'], self.freqai_min_return)
         return dataframe
 
     # FreqAI configuration - match config.json identifier
@@ -2,12 +2,12 @@
 """
 Simplified debug version without futures dependency
 """
-import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import DecimalParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
+
+from shared.features import TECHNICAL_COLUMNS, feature_library
+from shared.tracing import Tracer
 
 class PerpSpotBasisStrategy_Simple(IStrategy):
     timeframe = "5m"
@@ -26,43 +26,44 @@ class PerpSpotBasisStrategy_Simple(IStrategy):
 
     process_only_new_candles = True
 
+    # Debug output: first analysis of every pair, then one per day of 5m candles.
+    # Overridden by the "tracing" section of the config, e.g. {"enabled": false}
+    tracing = {'first': 1, 'every': 288, 'echo': True}
+
+    def bot_start(self, **kwargs) -> None:
+        self.tracer = Tracer(**{**self.tracing, **self.config.get('tracing', {})})
+
     def populate_indicators(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
-        print(f"Processing {pair} - Shape: {dataframe.shape}")
+        trace = self.tracer
+        trace.begin(pair)
+        trace(pair, "Processing {} - Shape: {}", pair, dataframe.shape)
 
         # Basic technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        
-        # MACD
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
 
         # Volume indicators
-        dataframe['volume_ma_20'] = ta.SMA(dataframe['volume'], timeperiod=20)
+        dataframe = feature_library.apply(dataframe, pair, ['volume_ma_20'])
         dataframe['volume_ratio'] = dataframe['volume'] / dataframe['volume_ma_20']
 
         # Print some stats
-        print(f"RSI range: {dataframe['rsi'].min():.1f} - {dataframe['rsi'].max():.1f}")
-        print(f"EMA20 vs EMA50 crossovers: {(dataframe['ema_20'] > dataframe['ema_50']).sum()}")
-        
-        # Check for FreqAI columns
-        freqai_cols = [col for col in dataframe.columns if col.startswith('&-')]
-        if freqai_cols:
-            print(f"FreqAI columns: {freqai_cols}")
-            if '&-enter_long' in dataframe.columns:
-                signal_range = dataframe['&-enter_long'].dropna()
-                if len(signal_range) > 0:
-                    print(f"FreqAI signal range: {signal_range.min():.3f} - {signal_range.max():.3f}")
-                    print(f"Recent signals: {signal_range.tail(5).tolist()}")
-                else:
-                    print("FreqAI column exists but contains only NaN values")
-        else:
-            print("No FreqAI columns found")
+        if trace.traced(pair):
+            trace(pair, "RSI range: {:.1f} - {:.1f}", dataframe['rsi'].min(), dataframe['rsi'].max())
+            trace(pair, "EMA20 vs EMA50 crossovers: {}", (dataframe['ema_20'] > dataframe['ema_50']).sum())
+
+            # Check for FreqAI columns
+            freqai_cols = [col for col in dataframe.columns if col.startswith('&-')]
+            if freqai_cols:
+                trace(pair, "FreqAI columns: {}", freqai_cols)
+                if '&-enter_long' in dataframe.columns:
+                    signal_range = dataframe['&-enter_long'].dropna()
+                    if len(signal_range) > 0:
+                        trace(pair, "FreqAI signal range: {:.3f} - {:.3f}", signal_range.min(), signal_range.max())
+                        trace(pair, "Recent signals: {}", signal_range.tail(5).tolist())
+                    else:
+                        trace(pair, "FreqAI column exists but contains only NaN values")
+            else:
+                trace(pair, "No FreqAI columns found")
 
         return dataframe
 
@@ -70,7 +71,8 @@ class PerpSpotBasisStrategy_Simple(IStrategy):
 
     def populate_entry_trend(self, dataframe: DataFrame, metadata: dict) -> DataFrame:
         pair = metadata['pair']
-        print(f"\n=== ENTRY LOGIC for {pair} ===")
+        trace = self.tracer
+        trace(pair, "=== ENTRY LOGIC for {} ===", pair)
         
         # Initialize entry column
         dataframe.loc[:, 'enter_long'] = 0
@@ -86,11 +88,11 @@ class PerpSpotBasisStrategy_Simple(IStrategy):
             freqai_entries = freqai_condition.sum()
             if freqai_entries > 0:
                 dataframe.loc[freqai_condition, 'enter_long'] = 1
-                print(f"FreqAI entries: {freqai_entries} (threshold: {threshold})")
+                trace(pair, "FreqAI entries: {} (threshold: {})", freqai_entries, threshold)
         
         # Method 2: Fallback technical analysis
         if freqai_entries == 0:
-            print("Using fallback technical analysis...")
+            trace(pair, "Using fallback technical analysis...")
             
             # Conditions for entry
             oversold = dataframe['rsi'] < 35
@@ -105,18 +107,19 @@ class PerpSpotBasisStrategy_Simple(IStrategy):
             technical_entries = entry_condition.sum()
             if technical_entries > 0:
                 dataframe.loc[entry_condition, 'enter_long'] = 1
-                print(f"Technical analysis entries: {technical_entries}")
-                
+                trace(pair, "Technical analysis entries: {}", technical_entries)
+
                 # Show condition breakdown for the last few signals
-                recent_entries = dataframe[entry_condition].tail(3)
-                for idx in recent_entries.index:
-                    print(f"  Entry at {dataframe.loc[idx, 'date']}: RSI={dataframe.loc[idx, 'rsi']:.1f}, "
-                          f"EMA_cross={dataframe.loc[idx, 'ema_20'] > dataframe.loc[idx, 'ema_50']}, "
-                          f"MACD_pos={dataframe.loc[idx, 'macd'] > dataframe.loc[idx, 'macdsignal']}, "
-                          f"Vol_ratio={dataframe.loc[idx, 'volume_ratio']:.2f}")
-        
-        total_entries = dataframe['enter_long'].sum()
-        print(f"Total entry signals: {total_entries}")
+                if trace.traced(pair):
+                    recent_entries = dataframe[entry_condition].tail(3)
+                    for idx in recent_entries.index:
+                        trace(pair, "  Entry at {}: RSI={:.1f}, EMA_cross={}, MACD_pos={}, Vol_ratio={:.2f}",
+                              dataframe.loc[idx, 'date'], dataframe.loc[idx, 'rsi'],
+                              dataframe.loc[idx, 'ema_20'] > dataframe.loc[idx, 'ema_50'],
+                              dataframe.loc[idx, 'macd'] > dataframe.loc[idx, 'macdsignal'],
+                              dataframe.loc[idx, 'volume_ratio'])
+
+        trace(pair, "Total entry signals: {}", dataframe['enter_long'].sum)
         
         return dataframe
 
@@ -6,9 +6,9 @@ import pandas as pd
 from freqtrade.strategy.interface import IStrategy
 from freqtrade.strategy import DecimalParameter
 from pandas import DataFrame
-import talib.abstract as ta
-import numpy as np
-import os
+
+from shared.features import BASIS_COLUMNS, TECHNICAL_COLUMNS, feature_library
+from shared.futures_data import futures_loader
 
 class PerpSpotBasisStrategy_Working(IStrategy):
     timeframe = "5m"
@@ -35,28 +35,16 @@ class PerpSpotBasisStrategy_Working(IStrategy):
         futures_data = self.load_futures_data(pair)
         if futures_data is not None:
             dataframe = self.merge_futures_data(dataframe, futures_data)
-            dataframe = self.calculate_basis_features(dataframe)
+            dataframe = self.calculate_basis_features(dataframe, pair)
 
         # Volume features
-        dataframe = self.calculate_volume_features(dataframe)
+        dataframe = self.calculate_volume_features(dataframe, pair)
 
         # Technical indicators
-        dataframe["rsi"] = ta.RSI(dataframe, timeperiod=14)
-        dataframe["ema_20"] = ta.EMA(dataframe, timeperiod=20)
-        dataframe["ema_50"] = ta.EMA(dataframe, timeperiod=50)
-        dataframe["adx"] = ta.ADX(dataframe, timeperiod=14)
-        
-        # MACD
-        macd = ta.MACD(dataframe)
-        dataframe['macd'] = macd['macd']
-        dataframe['macdsignal'] = macd['macdsignal']
-        dataframe['macdhist'] = macd['macdhist']
+        dataframe = feature_library.apply(dataframe, pair, TECHNICAL_COLUMNS)
 
         # Bollinger Bands
-        bb = ta.BBANDS(dataframe)
-        dataframe['bb_upper'] = bb['upperband']
-        dataframe['bb_middle'] = bb['middleband'] 
-        dataframe['bb_lower'] = bb['lowerband']
+        dataframe = feature_library.apply(dataframe, pair, ['bb_upper', 'bb_middle', 'bb_lower'])
 
         return dataframe
 
@@ -68,12 +56,9 @@ class PerpSpotBasisStrategy_Working(IStrategy):
                 f'/home/gil/freqtrade/user_data/data/binance/futures/{pair.replace("/", "_")}_USDT-5m-futures.feather',
                 f'/home/gil/freqtrade/user_data/data/binance/{pair.replace("/", "_")}_USDT-5m.feather'
             ]
-            
-            for futures_path in possible_paths:
-                if os.path.exists(futures_path):
-                    df = pd.read_feather(futures_path)
-                    return df
-            return None
+
+            # Cached per file, only re-read when the file changes
+            return futures_loader.load(possible_paths)
             
         except Exception:
             return None
@@ -89,46 +74,27 @@ class PerpSpotBasisStrategy_Working(IStrategy):
         except Exception:
             return spot_df
 
-    def calculate_basis_features(self, dataframe: DataFrame) -> DataFrame:
+    def calculate_basis_features(self, dataframe: DataFrame, pair: str) -> DataFrame:
         """Calculate perp-spot basis features"""
         if 'close_perp' not in dataframe.columns or dataframe['close_perp'].isna().all():
             return dataframe
 
-        # Basic basis calculation (perp - spot) / spot * 100
-        dataframe['basis'] = (dataframe['close_perp'] - dataframe['close']) / dataframe['close'] * 100
-
-        # Basis moving averages
-        dataframe['basis_ma_10'] = ta.SMA(dataframe['basis'], timeperiod=10)
-        dataframe['basis_ma_30'] = ta.SMA(dataframe['basis'], timeperiod=30)
-
-        # Basis rate of change
-        dataframe['basis_roc'] = ta.ROC(dataframe['basis'], timeperiod=5)
-
-        # Z-score of basis
-        basis_mean = dataframe['basis'].rolling(window=50).mean()
-        basis_std = dataframe['basis'].rolling(window=50).std()
-        dataframe['basis_zscore'] = (dataframe['basis'] - basis_mean) / basis_std
+        # Basis (perp - spot) / spot * 100, moving averages, rate of change, z-score and momentum
+        dataframe = feature_library.apply(dataframe, pair, BASIS_COLUMNS)
 
         # Volume ratio
         dataframe['volume_ratio'] = dataframe['volume_perp'] / dataframe['volume']
 
-        # Basis momentum
-        dataframe['basis_momentum'] = dataframe['basis'] - dataframe['basis_ma_30']
-
         return dataframe
 
-    def calculate_volume_features(self, dataframe):
+    def calculate_volume_features(self, dataframe, pair):
         """Calculate volume features"""
         try:
-            dataframe['volume_ma_20'] = ta.SMA(dataframe['volume'], timeperiod=20)
+            dataframe = feature_library.apply(dataframe, pair, ['volume_ma_20'])
             dataframe['volume_ratio_ma'] = dataframe['volume'] / dataframe['volume_ma_20']
-            dataframe['obv'] = ta.OBV(dataframe['close'], dataframe['volume'])
 
-            # VWAP
-            vwap_period = 20
-            cumulative_price_volume = (dataframe['close'] * dataframe['volume']).rolling(vwap_period).sum()
-            cumulative_volume = dataframe['volume'].rolling(vwap_period).sum()
-            dataframe['vwap'] = cumulative_price_volume / cumulative_volume
+            # OBV and VWAP
+            dataframe = feature_library.apply(dataframe, pair, ['obv', 'vwap'])
 
             return dataframe
         except Exception:
@@ -0,0 +1,54 @@
+"""
+Support modules for NostalgiaForInfinityX6.
+
+Kept in a package (rather than next to the strategy file) so the strategy resolver
+does not import them while scanning the strategies directory.
+"""
+
+import importlib
+import logging
+import sys
+import time
+
+log = logging.getLogger(__name__)
+
+
+class lazy_method:
+  """
+  Strategy method whose code lives in `nfi.<module>` and is imported on first use.
+
+  Class level access (the resolver, parameter detection, `list-strategies`) returns
+  the descriptor itself and imports nothing. The first instance access imports the
+  module, replaces the descriptor on the class with the plain function and binds it,
+  so later calls cost exactly the same as a regular method.
+  """
+
+  def __init__(self, module: str):
+    self.module = module
+    self.name = None
+
+  def __set_name__(self, owner, name):
+    self.name = name
+
+  def __get__(self, instance, owner=None):
+    if instance is None:
+      return self
+    function = getattr(import_submodule(self.module), self.name)
+    setattr(type(instance), self.name, function)
+    return function.__get__(instance, type(instance))
+
+
+def import_submodule(module: str):
+  """
+  Import `nfi.<module>`, logging how long the import took when it was not loaded yet.
+
+  :param module: str The submodule name
+  """
+  name = f"{__name__}.{module}"
+  if name in sys.modules:
+    return sys.modules[name]
+  tik = time.perf_counter()
+  loaded = importlib.import_module(name)
+  tok = time.perf_counter()
+  log.debug(f"Imported {name} in {tok - tik:0.4f} seconds.")
+  return loaded
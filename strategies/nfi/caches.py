@@ -0,0 +1,202 @@
+import copy
+import logging
+import rapidjson
+from freqtrade.persistence import Trade
+
+log = logging.getLogger("NostalgiaForInfinityX6")
+
+# +---------------------------------------------------------------------------+
+# |                              Classes                                      |
+# +---------------------------------------------------------------------------+
+
+
+# Cache Class
+# ---------------------------------------------------------------------------------------------
+class Cache:
+  def __init__(self, path):
+    self.path = path
+    self.data = {}
+    self._mtime = None
+    self._previous_data = {}
+    try:
+      self.load()
+    except FileNotFoundError:
+      pass
+
+  @staticmethod
+  def rapidjson_load_kwargs():
+    return {"number_mode": rapidjson.NM_NATIVE, "parse_mode": rapidjson.PM_COMMENTS | rapidjson.PM_TRAILING_COMMAS}
+
+  @staticmethod
+  def rapidjson_dump_kwargs():
+    return {"number_mode": rapidjson.NM_NATIVE}
+
+  def load(self):
+    if not self._mtime or self.path.stat().st_mtime_ns != self._mtime:
+      self._load()
+
+  def save(self):
+    if self.data != self._previous_data:
+      self._save()
+
+  def process_loaded_data(self, data):
+    return data
+
+  def _load(self):
+    # This method only exists to simplify unit testing
+    with self.path.open("r") as rfh:
+      try:
+        data = rapidjson.load(rfh, **self.rapidjson_load_kwargs())
+      except rapidjson.JSONDecodeError as exc:
+        log.error("Failed to load JSON from %s: %s", self.path, exc)
+      else:
+        self.data = self.process_loaded_data(data)
+        self._previous_data = copy.deepcopy(self.data)
+        self._mtime = self.path.stat().st_mtime_ns
+
+  def _save(self):
+    # This method only exists to simplify unit testing
+    rapidjson.dump(self.data, self.path.open("w"), **self.rapidjson_dump_kwargs())
+    self._mtime = self.path.stat().st_mtime
+    self._previous_data = copy.deepcopy(self.data)
+
+
+class HoldsCache(Cache):
+  @staticmethod
+  def rapidjson_load_kwargs():
+    return {
+      "number_mode": rapidjson.NM_NATIVE,
+      "parse_mode": rapidjson.PM_COMMENTS | rapidjson.PM_TRAILING_COMMAS,
+      "object_hook": HoldsCache._object_hook,
+    }
+
+  @staticmethod
+  def rapidjson_dump_kwargs():
+    return {
+      "number_mode": rapidjson.NM_NATIVE,
+      "mapping_mode": rapidjson.MM_COERCE_KEYS_TO_STRINGS,
+    }
+
+  def save(self):
+    raise RuntimeError("The holds cache does not allow programatical save")
+
+  def process_loaded_data(self, data):
+    trade_ids = data.get("trade_ids")
+    trade_pairs = data.get("trade_pairs")
+
+    if not trade_ids and not trade_pairs:
+      return data
+
+    open_trades = {}
+    for trade in Trade.get_trades_proxy(is_open=True):
+      open_trades[trade.id] = open_trades[trade.pair] = trade
+
+    r_trade_ids = {}
+    if trade_ids:
+      if isinstance(trade_ids, dict):
+        # New syntax
+        for trade_id, profit_ratio in trade_ids.items():
+          if not isinstance(trade_id, int):
+            log.error("The trade_id(%s) defined under 'trade_ids' in %s is not an integer", trade_id, self.path)
+            continue
+          if not isinstance(profit_ratio, float):
+            log.error(
+              "The 'profit_ratio' config value(%s) for trade_id %s in %s is not a float",
+              profit_ratio,
+              trade_id,
+              self.path,
+            )
+          if trade_id in open_trades:
+            formatted_profit_ratio = f"{profit_ratio * 100}%"
+            log.warning(
+              "The trade %s is configured to HOLD until the profit ratio of %s is met",
+              open_trades[trade_id],
+              formatted_profit_ratio,
+            )
+            r_trade_ids[trade_id] = profit_ratio
+          else:
+            log.warning(
+              "The trade_id(%s) is no longer open. Please remove it from 'trade_ids' in %s",
+              trade_id,
+              self.path,
+            )
+      else:
+        # Initial Syntax
+        profit_ratio = data.get("profit_ratio")
+        if profit_ratio:
+          if not isinstance(profit_ratio, float):
+            log.error("The 'profit_ratio' config value(%s) in %s is not a float", profit_ratio, self.path)
+        else:
+          profit_ratio = 0.005
+        formatted_profit_ratio = f"{profit_ratio * 100}%"
+        for trade_id in trade_ids:
+          if not isinstance(trade_id, int):
+            log.error("The trade_id(%s) defined under 'trade_ids' in %s is not an integer", trade_id, self.path)
+            continue
+          if trade_id in open_trades:
+            log.warning(
+              "The trade %s is configured to HOLD until the profit ratio of %s is met",
+              open_trades[trade_id],
+              formatted_profit_ratio,
+            )
+            r_trade_ids[trade_id] = profit_ratio
+          else:
+            log.warning(
+              "The trade_id(%s) is no longer open. Please remove it from 'trade_ids' in %s",
+              trade_id,
+              self.path,
+            )
+
+    r_trade_pairs = {}
+    if trade_pairs:
+      for trade_pair, profit_ratio in trade_pairs.items():
+        if not isinstance(trade_pair, str):
+          log.error("The trade_pair(%s) defined under 'trade_pairs' in %s is not a string", trade_pair, self.path)
+          continue
+        if "/" not in trade_pair:
+          log.error(
+            "The trade_pair(%s) defined under 'trade_pairs' in %s does not look like "
+            "a valid '<TOKEN_NAME>/<STAKE_CURRENCY>' formatted pair.",
+            trade_pair,
+            self.path,
+          )
+          continue
+        if not isinstance(profit_ratio, float):
+          log.error(
+            "The 'profit_ratio' config value(%s) for trade_pair %s in %s is not a float",
+            profit_ratio,
+            trade_pair,
+            self.path,
+          )
+        formatted_profit_ratio = f"{profit_ratio * 100}%"
+        if trade_pair in open_trades:
+          log.warning(
+            "The trade %s is configured to HOLD until the profit ratio of %s is met",
+            open_trades[trade_pair],
+            formatted_profit_ratio,
+          )
+        else:
+          log.warning(
+            "The trade pair %s is configured to HOLD until the profit ratio of %s is met",
+            trade_pair,
+            formatted_profit_ratio,
+          )
+        r_trade_pairs[trade_pair] = profit_ratio
+
+    r_data = {}
+    if r_trade_ids:
+      r_data["trade_ids"] = r_trade_ids
+    if r_trade_pairs:
+      r_data["trade_pairs"] = r_trade_pairs
+    return r_data
+
+  @staticmethod
+  def _object_hook(data):
+    _data = {}
+    for key, value in data.items():
+      try:
+        key = int(key)
+      except ValueError:
+        pass
+      _data[key] = value
+    return _data
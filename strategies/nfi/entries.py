@@ -0,0 +1,7856 @@
+import numpy as np
+import pandas as pd
+from freqtrade.persistence import Trade
+from functools import reduce
+from pandas import DataFrame
+
+# +---------------------------------------------------------------------------+
+# |                  NostalgiaForInfinityX6 Entry Conditions                  |
+# +---------------------------------------------------------------------------+
+#
+# Bound to the strategy class through `nfi.lazy_method`, imported on first use.
+
+
+# Populate Entry Conditions
+# ---------------------------------------------------------------------------------------------
+def populate_entry_conditions(self, df: DataFrame, metadata: dict) -> DataFrame:
+  long_entry_conditions = []
+  short_entry_conditions = []
+
+  df.loc[:, "enter_tag"] = ""
+  df.loc[:, "enter_long"] = ""
+  df.loc[:, "enter_short"] = ""
+
+  is_backtest = self.dp.runmode.value in ["backtest", "hyperopt", "plot", "webserver"]
+  # the number of free slots
+  current_free_slots = self.config["max_open_trades"]
+  if not is_backtest:
+    current_free_slots = self.config["max_open_trades"] - Trade.get_open_trade_count()
+  # Grind mode
+  num_open_long_grind_mode = 0
+  is_pair_long_grind_mode = metadata["pair"].split("/")[0] in self.grind_mode_coins
+  if not is_backtest:
+    open_trades = Trade.get_trades_proxy(is_open=True)
+    for open_trade in open_trades:
+      enter_tag = open_trade.enter_tag
+      if enter_tag is not None:
+        enter_tags = enter_tag.split()
+        if all(c in self.long_grind_mode_tags for c in enter_tags):
+          num_open_long_grind_mode += 1
+  # Top Coins mode
+  is_pair_long_top_coins_mode = metadata["pair"].split("/")[0] in self.top_coins_mode_coins
+  is_pair_short_top_coins_mode = metadata["pair"].split("/")[0] in self.top_coins_mode_coins
+  # if BTC/ETH stake
+  is_btc_stake = self.config["stake_currency"] in self.btc_stakes
+  allowed_empty_candles_288 = 144 if is_btc_stake else 60
+
+  ###############################################################################################
+
+  # LONG ENTRY CONDITIONS STARTS HERE
+
+  ###############################################################################################
+
+  #
+  #  /$$       /$$$$$$ /$$   /$$ /$$$$$$        /$$$$$$$$/$$   /$$/$$$$$$$$/$$$$$$$$/$$$$$$$
+  # | $$      /$$__  $| $$$ | $$/$$__  $$      | $$_____| $$$ | $|__  $$__| $$_____| $$__  $$
+  # | $$     | $$  \ $| $$$$| $| $$  \__/      | $$     | $$$$| $$  | $$  | $$     | $$  \ $$
+  # | $$     | $$  | $| $$ $$ $| $$ /$$$$      | $$$$$  | $$ $$ $$  | $$  | $$$$$  | $$$$$$$/
+  # | $$     | $$  | $| $$  $$$| $$|_  $$      | $$__/  | $$  $$$$  | $$  | $$__/  | $$__  $$
+  # | $$     | $$  | $| $$\  $$| $$  \ $$      | $$     | $$\  $$$  | $$  | $$     | $$  \ $$
+  # | $$$$$$$|  $$$$$$| $$ \  $|  $$$$$$/      | $$$$$$$| $$ \  $$  | $$  | $$$$$$$| $$  | $$
+  # |________/\______/|__/  \__/\______/       |________|__/  \__/  |__/  |________|__/  |__/
+  #
+
+  for enabled_long_entry_signal in self.long_entry_signal_params:
+    long_entry_condition_index = int(enabled_long_entry_signal.split("_")[3])
+    item_buy_protection_list = [True]
+    if self.long_entry_signal_params[f"{enabled_long_entry_signal}"]:
+      # Long Entry Conditions Starts Here
+      # -----------------------------------------------------------------------------------------
+      long_entry_logic = []
+      long_entry_logic.append(reduce(lambda x, y: x & y, item_buy_protection_list))
+
+      # Condition #1 - Normal mode (Long).
+      if long_entry_condition_index == 1:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(
+          # 5m & 15m & 1h down move
+          ((df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 3.0) | (df["RSI_3_change_pct_1h"] > -50.0))
+          # 5m & 15m down move, 5h high
+          & ((df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 5.0) | (df["RSI_14_4h"] < 60.0))
+          # 5m & 15m down move, 4h high
+          & ((df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_4h"] < 100.0))
+          # 5m & 1h down move, 15m still not low enough
+          & ((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_15m"] < 30.0))
+          # 5m down move, 15m high
+          & ((df["RSI_3"] > 3.0) | (df["AROONU_14_15m"] < 80.0))
+          # 15m down move, 1h downtrend, 1h high
+          & ((df["RSI_3_15m"] > 1.0) | (df["CMF_20_1h"] > -0.1) | (df["AROONU_14_1h"] < 70.0))
+          # 15m & 1h down move, 15m still high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_15m"] < 40.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+          # 15m & 1h down move, 1h still high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+          # 15m & 1h & 4h down move
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0))
+          # 15m & 1h down move, 1h still high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+          # 15m & 1h & 4h & 1d down move
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 80.0))
+          # 15m & 4h down move, 4h still high
+          & ((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+          # 15m down move, 1h & 4h high
+          & ((df["RSI_3_15m"] > 3.0) | (df["AROONU_14_1h"] < 85.0) | (df["AROONU_14_4h"] < 90.0))
+          # 15m down move, 4h high, 1d overbought
+          & ((df["RSI_3_15m"] > 3.0) | (df["AROONU_14_4h"] < 85.0) | (df["ROC_9_1d"] < 100.0))
+          # 15m & 1h down move, 1d overbought
+          & ((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 5.0) | (df["ROC_9_1d"] < 40.0))
+          # 5m & 1h down move, 1h overbought
+          & ((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 60.0) | (df["ROC_9_1h"] < 40.0))
+          # 15m down move, 15m & 4h still high
+          & ((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 60.0))
+          # 15m down move, 15m still high, 1d overbought
+          & ((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 50.0) | (df["ROC_9_1d"] < 80.0))
+          # 15m down move, 4h high, 1d overbought
+          & ((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_4h"] < 60.0) | (df["ROC_9_1d"] < 80.0))
+          # 15m & 1h down move, 4h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_14_4h"] < 80.0))
+          # 15m & 1h down move, 4h overbought
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["ROC_9_4h"] < 80.0))
+          # 15m & 4h down move, 15m still high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+          # 15m & 4h down move, 1h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_1h"] < 75.0))
+          # 15m & 4h down move, 1h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1h"] < 85.0))
+          # 15m & 4h down move, 4h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+          # 15m down move & downtrend, 4h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["CMF_20_15m"] > -0.3) | (df["AROONU_14_4h"] < 100.0))
+          # 15m down move, 1h high, 1d overbought
+          & ((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_1h"] < 100.0) | (df["ROC_9_1d"] < 80.0))
+          # 15m down move, 1h high, 4h downtrend
+          & ((df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["ROC_9_4h"] > -25.0))
+          # 15m down move, 15m still high, 4h overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_14_15m"] < 50.0) | (df["ROC_9_4h"] < 50.0))
+          # 15m down move, 15m & 1h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 80.0) | (df["AROONU_14_1h"] < 90.0))
+          # 1h & 1d down move, 4h still high
+          & ((df["RSI_3_1h"] > 3.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+          # 1h & 4h down move, 1h downtrend
+          & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.3))
+          # 1h & 4h down move, 4h high
+          & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 70.0))
+          # 1h & 4h down move, 1d overbought
+          & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 40.0))
+          # 1h & 4h down move, 15m still not low enough
+          & ((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 30.0))
+          # 1h & 4h down move, 1h still high
+          & ((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+          # 1h & 1d down move, 4h high
+          & ((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_4h"] < 80.0))
+          # 1h down move, 4h high
+          & ((df["RSI_3_1h"] > 10.0) | (df["RSI_14_4h"] < 75.0))
+          # 1h down move, 4h overbought
+          & ((df["RSI_3_1h"] > 10.0) | (df["ROC_9_4h"] < 50.0))
+          # 1h & 4h down move, 4h overbought
+          & ((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 50.0) | (df["ROC_9_4h"] < 80.0))
+          # 1h down move, 4h high & overbought
+          & ((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 100.0) | (df["ROC_9_4h"] < 50.0))
+          # 1h down move, 4h & 1d overbought
+          & ((df["RSI_3_1h"] > 25.0) | (df["ROC_9_4h"] < 80.0) | (df["ROC_9_1d"] < 100.0))
+          # 1h down move, 1h downtrend, 1h high
+          & ((df["RSI_3_1h"] > 40.0) | (df["CMF_20_1h"] > -0.25) | (df["AROONU_14_1h"] < 90.0))
+          # 1h down move, 1h still high, 4h high
+          & ((df["RSI_3_1h"] > 60.0) | (df["AROONU_14_1h"] < 50.0) | (df["RSI_14_4h"] < 90.0))
+          # 4h & 1d down move, 4h still not low enough
+          & ((df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_4h"] < 20.0))
+          # 1d down move, 1h still high, 4h high
+          & ((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+          # 1d down move, 1h & 4h high
+          & ((df["RSI_3_1d"] > 25.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+          # 1d down move, 4h still high, 1d overbought
+          & ((df["RSI_3_1d"] > 50.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 200.0))
+          # 1h down move, 4h high, 1d overbought
+          & ((df["RSI_3_change_pct_1h"] > -75.0) | (df["AROONU_14_4h"] < 90.0) | (df["ROC_9_1d"] < 100.0))
+          # 15m & 1h & 4h downtrend
+          & ((df["CMF_20_15m"] > -0.3) | (df["CMF_20_1h"] > -0.3) | (df["CMF_20_4h"] > -0.3))
+          # 5m down move, 15m still not low enough, 1h high
+          & ((df["ROC_2"] > -10.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 80.0))
+          # 5m down move, 15m still high
+          & ((df["ROC_2"] > -10.0) | (df["AROONU_14_15m"] < 50.0))
+          # 5m down move, 15m & 1h down move, 15m still high
+          & (
+            (df["ROC_9"] > -15.0) | (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_15m"] < 50.0)
+          )
+          # 5m down move, 4h down move, 15m downtrend, 1h high
+          & (
+            (df["ROC_9"] > -15.0) | (df["RSI_3_4h"] > 45.0) | (df["CMF_20_15m"] > -0.3) | (df["AROONU_14_1h"] < 60.0)
+          )
+          # 1h downtrend, 4h high & overbought
+          & ((df["ROC_9_1h"] > -25.0) | (df["AROONU_14_4h"] < 80.0) | (df["ROC_9_4h"] < 80.0))
+          # 1d P&D, 1d downtrend
+          & ((df["change_pct_1d"] > -5.0) | (df["change_pct_1d"].shift(288) < 30.0) | (df["CMF_20_1d"] > -0.0))
+          # 1d green with top wick, 1h down move
+          & ((df["change_pct_1d"] < 20.0) | (df["top_wick_pct_1d"] < 15.0) | (df["RSI_3_1h"] > 20.0))
+          # 1d green with top wick, 4h high
+          & ((df["change_pct_1d"] < 25.0) | (df["top_wick_pct_1d"] < 25.0) | (df["AROONU_14_4h"] < 80.0))
+          # 1d green, 1h down move, 1d downtrend
+          & ((df["change_pct_1d"] < 40.0) | (df["RSI_3_1h"] > 25.0) | (df["CMF_20_1d"] > -0.2))
+          # 1d green with top wick, 4h overbought
+          & ((df["change_pct_1d"] < 50.0) | (df["top_wick_pct_1d"] < 30.0) | (df["ROC_9_4h"] < 80.0))
+          # big drop in the last hour, 15m downtrend
+          & ((df["close"] > (df["close_max_12"] * 0.65)) | (df["CMF_20_15m"] > -0.5))
+          # big drop in the last 6 hours, 1h down move, 1h high
+          & ((df["close"] > (df["high_max_6_1h"] * 0.60)) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 60.0))
+          # big drop in the last 24 hours,  1h still high
+          & ((df["close"] > (df["high_max_24_1h"] * 0.40)) | (df["STOCHRSIk_14_14_3_3_1h"] < 45.0))
+          # big drop in the last 4 days, 1h high
+          & ((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["AROONU_14_1h"] < 70.0))
+        )
+
+        # Logic
+        long_entry_logic.append(
+          (df["EMA_26"] > df["EMA_12"])
+          & ((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.034))
+          & ((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+          & (df["close"] < (df["BBL_20_2.0"] * 0.999))
+        )
+
+      # Condition #2 - Normal mode (Long).
+      if long_entry_condition_index == 2:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append((df["RSI_3"] > 3.0) & (df["RSI_3_15m"] > 3.0))
+
+        long_entry_logic.append(
+          # 5m & 15m & 1h down move, 1h & 4h high, 4h overbought
+          (
+            (df["RSI_3"] > 5.0)
+            | (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 100.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+            | (df["ROC_9_4h"] < 20.0)
+          )
+          # 5m & 15m & 1h & 4h down move, 1h & 4h still not low enough, 1h still high
+          & (
+            (df["RSI_3"] > 5.0)
+            | (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["AROONU_14_1h"] < 20.0)
+            | (df["AROONU_14_4h"] < 20.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m downtrend, 1h still not low enough
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["CMF_20_15m"] > -0.25)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+          )
+          # 5m & 15m & 1h down move, 15m still high, 1h & 4h high
+          & (
+            (df["RSI_3"] > 5.0)
+            | (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 60.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 5m & 15m & 4h down move, 15m downtrend, 1d high, 1h & 4h still not low enough
+          & (
+            (df["RSI_3"] > 10.0)
+            | (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_14_4h"] < 10.0)
+            | (df["CMF_20_15m"] > -0.20)
+            | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+            | (df["CCI_20_1h"] < -150.0)
+            | (df["CCI_20_4h"] < -250.0)
+          )
+          # 15m & 1h & 4h down move, 4h still not low enough
+          & ((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_14_4h"] < 30.0))
+          # 15m & 1h down move, 4h still high
+          & ((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_14_4h"] < 50.0))
+          # 15m & 1h & 4h down move, 15m & 1h downtrend
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 15.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["CMF_20_15m"] > -0.5)
+            | (df["CCI_20_change_pct_15m"] > -0.0)
+            | (df["CCI_20_change_pct_1h"] > -0.0)
+          )
+          # 15m & 1h & 4h down move, 1h still not low enough, 4h still high
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_3_4h"] > 25.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 40.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_3_4h"] > 55.0)
+            | (df["AROONU_14_1h"] < 50.0)
+            | (df["AROONU_14_4h"] < 80.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still not low enough
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 5.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_1h"] < 75.0)
+          )
+          # 15m & 4h down move, 1h still not low enough
+          & ((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+          # 15m & 1h & 4h & 1d down move, 1h & 4h still not low enough
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 10.0)
+            | (df["RSI_3_4h"] > 25.0)
+            | (df["RSI_3_1d"] > 25.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+          )
+          # 15m & 1h & 4h down move, 1h still high, 1h downtrend
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 10.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["AROONU_14_1h"] < 40.0)
+            | (df["ROC_9_1h"] > -20.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h downtrend
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 15.0)
+            | (df["RSI_3_4h"] > 35.0)
+            | (df["CMF_20_15m"] > -0.30)
+            | (df["CMF_20_1h"] > -0.30)
+            | (df["CMF_20_4h"] > -0.25)
+          )
+          # 15m & 1h down move, 1h & 4h & 1d high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_1d"] < 100.0)
+          )
+          # 15m & 1h down move, 1h & 4h still high, 15m & 1h downtrend
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["CMF_20_15m"] > -0.25)
+            | (df["CMF_20_1h"] > -0.25)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["ROC_9_1d"] < 30.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still not low enough, 1d high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 35.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+            | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+          )
+          # 15m & 1h & 4h down move, 1h still high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 35.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m downtrend, 1d high, 1h & 4h downtrend
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["CMF_20_15m"] > -0.25)
+            | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+            | (df["CCI_20_1h"] < -150.0)
+            | (df["CCI_20_4h"] < -250.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still not low enough, 1h high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+          )
+          # 15m & 1h down move, 1h & 4h still high, 1d high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still not low enough, 1 high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h down move, 1h & 4h still high, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 60.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_1h"] < 80.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+          )
+          # 15m & 1h down move, 1h still high, 4h high & overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["AROONU_14_1h"] < 40.0)
+            | (df["AROONU_14_4h"] < 85.0)
+            | (df["ROC_9_4h"] < 40.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still not low enough
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_3_4h"] > 10.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 35.0)
+          )
+          # 15m & 1h & 4h & 1d down move, 1h & 4h still not low enough
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_3_4h"] > 20.0)
+            | (df["RSI_3_1d"] > 40.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 35.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 80.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h downtrend, 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["CMF_20_1h"] > -0.0)
+            | (df["CMF_20_4h"] > -0.25)
+            | (df["AROONU_14_1h"] < 40.0)
+            | (df["AROONU_14_4h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still high, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 55.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["ROC_9_1d"] < 50.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h stil high, 1h & 4h high, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 60.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 100.0)
+            | (df["ROC_9_4h"] < 20.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_14_15m"] < 35.0)
+            | (df["AROONU_14_1h"] < 80.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 15m & 1h down move, 4h high, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 20.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 70.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 1h still not low enough, 4h still high, 1d downtrend
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_3_4h"] > 25.0)
+            | (df["AROONU_14_1h"] < 20.0)
+            | (df["AROONU_14_4h"] < 50.0)
+            | (df["ROC_9_1d"] > -30.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 60.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 15m & 1h down move, 15m & 1h & 4h still high, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 55.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 40.0)
+            | (df["AROONU_14_4h"] < 85.0)
+            | (df["ROC_9_4h"] < 80.0)
+          )
+          # 15m & 1h down move, 15m still high, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 60.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["AROONU_14_1h"] < 80.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 1h down move, 15m still high, 1h & 4h high, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 60.0)
+            | (df["RSI_14_4h"] < 60.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+            | (df["ROC_9_4h"] < 40.0)
+          )
+          # 15m & 1h down move, 15m downtrend, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["CMF_20_15m"] > -0.30)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["AROONU_14_4h"] < 70.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 35.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 1h still high, 4h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 60.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 35.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 50.0)
+            | (df["AROONU_14_4h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m high
+          & (
+            (df["RSI_3_15m"] > 45.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+          )
+          # 1h & 4h & 1d down move, 4h downtrend, 1d downtrend
+          & (
+            (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["RSI_3_1d"] > 30.0)
+            | (df["CMF_20_4h"] > -0.40)
+            | (df["ROC_9_1d"] > -50.0)
+          )
+          # 4h down move, 4h still high
+          & ((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_4h"] < 50.0))
+          # 1d down move, 4h downtrend, 1h high
+          & ((df["RSI_3_1d"] > 10.0) | (df["CMF_20_4h"] > -0.30) | (df["AROONU_14_1h"] < 80.0))
+          & (
+            # 1d green, 15m down move, 1h & 4h still high, 4h overbought
+            (df["change_pct_1d"] < 30.0)
+            | (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["ROC_9_4h"] < 50.0)
+          )
+        )
+
+        # Logic
+        long_entry_logic.append(
+          (df["AROONU_14"] < 25.0)
+          & (df["STOCHRSIk_14_14_3_3"] < 20.0)
+          & (df["AROONU_14_15m"] < 25.0)
+          & (df["close"] < (df["EMA_20"] * 0.944))
+        )
+
+      # Condition #3 - Normal mode (Long).
+      if long_entry_condition_index == 3:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(
+          # 5m & 15m down move, 15m & 1h & 4h still high, 15m & 4h high, 1h & 4h still high
+          (
+            (df["RSI_14"] < 5.0)
+            | (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["AROONU_14_4h"] < 70.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+          )
+          # 5m & 15m & dh down move, 15m & 1h still high, 15m high
+          & (
+            (df["RSI_3"] > 5.0)
+            | (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_4h"] > 25.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+          )
+          # 5m & 15m & 4h down move, 15m still not low enough, 1h & 4h still high, 15m still high
+          & (
+            (df["RSI_3"] > 10.0)
+            | (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_4h"] > 20.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_15m"] < 50.0)
+          )
+          # 5m & 15m & 1h down move, 15m still high, 4h high, 1d overbought
+          & (
+            (df["RSI_3"] > 10.0)
+            | (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_4h"] < 70.0)
+            | (df["ROC_9_1d"] < 40.0)
+          )
+          # 5m & 15m & 4h down move, 15m & 1h & 4h still high, 15m & 1h & 4h high
+          & (
+            (df["RSI_3"] > 10.0)
+            | (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_4h"] > 60.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["AROONU_14_1h"] < 60.0)
+            | (df["AROONU_14_4h"] < 60.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still not low enough, 1h still high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+          )
+          # 5m & 15m & 4h & 1d down move, 15m & 4h still not low enough, 4h downtrend
+          & (
+            (df["RSI_3"] > 10.0)
+            | (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["RSI_3_1d"] > 40.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+            | (df["ROC_9_4h"] > -10.0)
+          )
+          # 15m down move, 15m still not low enough, 1h high
+          & (
+            (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+          )
+          # 5m & 15m & 1h down move, 15m still not low enough, 1h high
+          & (
+            (df["RSI_3"] > 15.0)
+            | (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_1h"] < 70.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 15m still not low enough, 1h high
+          & (
+            (df["RSI_3_15m"] > 10.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 30.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h still not low enough, 15m & 1h still high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["AROONU_14_1h"] < 85.0)
+            | (df["AROONU_14_4h"] < 85.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["ROC_9_1d"] < 80.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_3_4h"] > 55.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+          )
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h still high, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["ROC_9_4h"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["ROC_9_4h"] < 20.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m still high, 1h still high, 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 65.0)
+            | (df["RSI_3_1d"] > 65.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+          )
+          # 15m & 1d down move, 15m & 1h & 4h still high, 15m still high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1d"] > 20.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_15m"] < 50.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 40.0)
+            | (df["RSI_3_4h"] > 60.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m still not low enough, 1h & 4h still high, 15m high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 30.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 60.0)
+          )
+          # 15m & 4h down move, 15m & 4h still high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_4h"] > 35.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 50.0)
+          )
+          # 15m & 4h down move, 15m & 1h & 4h still high, 15m & 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["AROONU_14_4h"] < 60.0)
+          )
+          # 15m down move, 1h & 4h high, 15m high, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_14_1h"] < 60.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["ROC_9_1d"] < 50.0)
+          )
+          # 15m down move, 15m & 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["AROONU_14_1h"] < 50.0)
+            | (df["AROONU_14_4h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+          )
+          # 15m & 1h down move, 15m still high, 4h high & overbought
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_4h"] < 80.0)
+            | (df["ROC_9_4h"] < 40.0)
+          )
+          # 15m & 1h down move, 15m & 1h still high, 4h downtrend, 15m still not low enough, 1h high
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["CMF_20_4h"] > -0.20)
+            | (df["AROONU_14_15m"] < 30.0)
+            | (df["AROONU_14_1h"] < 80.0)
+          )
+          # 15m & 4h down move, 15m high
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_4h"] > 40.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0)
+          )
+          # 15m & 4h down move, 15m & 1h & 4h still high, 15m high, 1h & 4h still not low enough, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+            | (df["ROC_9_1d"] < 50.0)
+          )
+          # 15m & 4h down move, 15m & 1h still high, 4h high & overbought
+          & (
+            (df["RSI_3_15m"] > 25.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 60.0)
+            | (df["ROC_9_4h"] < 50.0)
+          )
+          # 15m & 1h down move, 15m & 1h & 4h still high, 1h & 4h downtrend, 15m stil high, 1h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["CMF_20_1h"] > -0.10)
+            | (df["CMF_20_4h"] > -0.10)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["AROONU_14_1h"] < 90.0)
+          )
+          # 15m & 1h & 4h & 1d down move, 15m & 1h & 4h still not low enough, 15m still high, 1d downtrend
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["RSI_3_1d"] > 15.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["ROC_9_1d"] > -40.0)
+          )
+          # 15m & 1h down move, 15m & 1h & 4h still high, 1h & 4h downtrend, 15m still high, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["CMF_20_1h"] > -0.10)
+            | (df["CMF_20_4h"] > -0.10)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["AROONU_14_1h"] < 85.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 15m & 1h down move, 15m still high, 1h & 4h high, 15m & 4h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 55.0)
+            | (df["RSI_14_15m"] < 45.0)
+            | (df["RSI_14_1h"] < 55.0)
+            | (df["RSI_14_4h"] < 60.0)
+            | (df["AROONU_14_15m"] < 60.0)
+            | (df["AROONU_14_4h"] < 80.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 65.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+          )
+          # 15m & 1h down move, 15m & 1h & 4h still high, 15m & 1h still not low enough, 4h high, 1d overbought
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 65.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 30.0)
+            | (df["AROONU_14_1h"] < 30.0)
+            | (df["AROONU_14_4h"] < 80.0)
+            | (df["ROC_9_1d"] < 150.0)
+          )
+          # 15m & 1h & 4h & 1d down move, 15m still not low enough, 1h & 4h still high, 15m still high, 4h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 55.0)
+            | (df["RSI_3_1d"] > 55.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 40.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["AROONU_14_4h"] < 70.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h & 4h still high, 15m & 1h still not low enough, 4h high
+          & (
+            (df["RSI_3_15m"] > 35.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_4h"] > 60.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["AROONU_14_15m"] < 30.0)
+            | (df["AROONU_14_1h"] < 30.0)
+            | (df["AROONU_14_4h"] < 70.0)
+          )
+          # 15m & 1h down move, 15m & 1h & 4h still high, 1h & 4h downtrend, 15m still high, 4h high & overbought
+          & (
+            (df["RSI_3_15m"] > 35.0)
+            | (df["RSI_3_1h"] > 60.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["CMF_20_1h"] > -0.0)
+            | (df["CMF_20_4h"] > -0.1)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_4h"] < 70.0)
+            | (df["ROC_9_4h"] < 10.0)
+          )
+          # 15m & 4h down move, 15m still not low enough, 1h still high, 4h high, 4h downtrend, 4h overbought
+          & (
+            (df["RSI_3_15m"] > 45.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 40.0)
+            | (df["RSI_14_4h"] < 50.0)
+            | (df["CMF_20_4h"] > -0.10)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_4h"] < 70.0)
+            | (df["ROC_9_4h"] < 20.0)
+          )
+          # 15m & 1h & 4h down move, 15m & 1h high
+          & (
+            (df["RSI_3_15m"] > 50.0)
+            | (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 50.0)
+            | (df["AROONU_14_15m"] < 70.0)
+            | (df["AROONU_14_1h"] < 100.0)
+          )
+          # 1h & 4h down move, 15m still high
+          & ((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 50.0))
+          # 4h down move, 15m high, 4h still not low enough
+          & (
+            (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+          )
+          # 4h & 1d down move, 15m & 1h & 4h still not low enough, 15m high
+          & (
+            (df["RSI_3_4h"] > 20.0)
+            | (df["RSI_3_1d"] > 20.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 30.0)
+            | (df["RSI_14_4h"] < 30.0)
+            | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0)
+          )
+          # 4h down move, 15m stil high, 1h high, 4h & 1d downtrend
+          & (
+            (df["RSI_3_4h"] > 20.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+            | (df["ROC_9_4h"] > -25.0)
+            | (df["ROC_9_1d"] > -50.0)
+          )
+        )
+
+        # Logic
+        long_entry_logic.append(
+          (df["RSI_20"] < df["RSI_20"].shift(1))
+          & (df["RSI_4"] < 45.0)
+          & (df["RSI_14"] > 32.0)
+          & (df["AROONU_14"] < 10.0)
+          & (df["STOCHRSIk_14_14_3_3"] < 10.0)
+          & (df["close"] < df["SMA_16"] * 0.965)
+          & (df["close"] < df["SMA_16_1h"] * 0.985)
+        )
+
+      # Condition #4 - Normal mode (Long).
+      if long_entry_condition_index == 4:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_3_1h"] <= 95.0)
+        long_entry_logic.append(df["RSI_3_4h"] <= 80.0)
+        long_entry_logic.append(df["RSI_3_1d"] <= 80.0)
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 90.0)
+        # 5m down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0))
+        # 5m down move, 1h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["AROONU_14_1d"] < 90.0)
+        )
+        # 5m down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 5m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 20.0))
+        # 5m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 80.0))
+        # 5m & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 30.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 20.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 30.0))
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0))
+        # 1h & 4h down move, drop in the last hour
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["close"] > (df["close_max_12"] * 0.90))
+        )
+        # 1h down move, 1h still not low enough, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0) | (df["AROONU_14_4h"] < 60.0)
+        )
+        # 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 5.0))
+        # 1h down move, 15m still not low enough, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 55.0) | (df["AROONU_14_1h"] < 75.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 25.0)
+        )
+        # 4h down move, drop in last 1h
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["close"] > (df["close_max_12"] * 0.85)))
+        # 4h & 1d down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 15m still high, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 5m not low enough, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3"] < 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 1h red, 1h high
+        long_entry_logic.append(
+          (df["change_pct_1h"] > -5.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 4h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 25.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # 1d overbought, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 200.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 6.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # big drop in last 24 hours, 1h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_1h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # big drop in last 4 hours, 4h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in last 4 hours, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.30)) | (df["RSI_3_1h"] > 10.0))
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.30)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_1h"] > 20.0))
+        # big drop in the last 30 days, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.05)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 25.0)
+        long_entry_logic.append(df["close"] < (df["EMA_9"] * 0.946))
+        long_entry_logic.append(df["close"] < (df["EMA_20"] * 0.960))
+
+      # Condition #5 - Normal mode (Long).
+      if long_entry_condition_index == 5:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 5m down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m down move, 1h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 5m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 5m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 80.0))
+        # 5m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["AROONU_14_15m"] < 25.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 25.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 1d down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 20.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m down move, 15m still not low enough, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 30.0))
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 75.0))
+        # 15m down move, 4h stil high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 50.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_1h"] < 35.0))
+        # 1h & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 40.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 1h & 4h down move, 1d low
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1d"] > -0.2))
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 5.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 25.0)
+        )
+        # 4h down move, drop in last 1h
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["close"] > (df["close_max_12"] * 0.85)))
+        # 4h & 1d down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 4h down move, 1h high, 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["AROONU_14_1h"] < 75.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0))
+        # 1d down move, 4h high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_4h"] < 75.0) | (df["ROC_2_1d"] > -30.0))
+        # 1h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 25.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 70.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.80))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 100.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 6.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # big drop in last 6 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_6_1h"] * 0.65)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in last 12 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_12_1h"] * 0.50)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in last 4 hours, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["RSI_3_4h"] > 10.0))
+        # big drop in last 24 hours, 1h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_1h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # big drop in last 4 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.30)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 12 days, 4h still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.25)) | (df["AROONU_14_4h"] < 50.0))
+        # big drop in the last 30 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.15)) | (df["RSI_3_4h"] > 15.0))
+        # big drop in the last 30 days
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.05)))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 50.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["AROOND_14"] > 75.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 30.0)
+        long_entry_logic.append(df["EMA_26"] > df["EMA_12"])
+        long_entry_logic.append((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.030))
+        long_entry_logic.append((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+
+      # Condition #6 - Normal mode (Long).
+      if long_entry_condition_index == 6:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # big drop in the last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # 5m & 15m down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 5m & 15m down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 5m & 15m down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m & 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 20.0))
+        # 5m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 5m & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 10.0)
+        )
+        # 5m down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_14_15m"] < 30.0))
+        # 5m down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0))
+        # 5m down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 5m down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 5m & 15m down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m & 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_4h"] < 70.0))
+        # 5m & 15m down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 5m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0))
+        # 5h & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_4h"] > 5.0))
+        # 5m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 5m down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 80.0))
+        # 5m down move, 15m not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 5m & 15m down move, 15m still high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0))
+        # 5m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m down move, 15m still not low enough, 1h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 90.0))
+        # 5m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 5m down move, 15m & 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 5m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 95.0)
+        )
+        # 5m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 5m down move, 15m still not low enough, 4h high
+        long_entry_logic.append((df["RSI_3"] > 15.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 90.0))
+        # 5m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 5m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 5m down move, 15m & 1h high
+        long_entry_logic.append((df["RSI_3"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0))
+        # 5m down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 75.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 5m down move, 15m & 4h high
+        long_entry_logic.append((df["RSI_3"] > 20.0) | (df["AROONU_14_15m"] < 75.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 2.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 40.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_14_4h"] < 35.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m & 4h down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 40.0) | (df["RSI_14_1h"] < 40.0) | (df["RSI_14_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 10.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_15m"] < 40.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 5.0) | (df["AROONU_14_15m"] < 25.0))
+        # 15m & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["ROC_9_1d"] < 80.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0))
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 25.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 10.0)
+        )
+        # 15m & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 30.0))
+        # 15m & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1d"] < 90.0))
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1d down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 15m down move, 1h still not low enough, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 15m down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1d down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m down move, 4h stil high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 85.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 15m still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_1h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 15m & 1h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 50.0) | (df["RSI_3_4h"] > 55.0) | (df["AROONU_14_4h"] < 80.0)
+        )
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1d down move, 1d still high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1d"] > 30.0) | (df["ROC_9_1d"] < 20.0))
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0))
+        # 15m down move, 1h high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 40.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["RSI_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0) | (df["AROONU_14_4h"] < 80.0)
+        )
+        # 15m down move, 1h high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_1h"] < 70.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["AROONU_14_15m"] < 60.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["AROONU_14_15m"] < 60.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["AROONU_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 20.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1h"] < 40.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 10.0) | (df["AROONU_14_1h"] < 40.0))
+        # 1h & 1d down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 1h down move, 15m & 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 5.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h down move, 15m & 4h still now lot enough
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 30.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h, 4h still high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] > -50.0))
+        # 1h down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_15m"] < 70.0))
+        # 1h down move, 15m high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_15m"] < 80.0))
+        # 1h down move, 4h high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 55.0) | (df["RSI_14_4h"] < 80.0) | (df["ROC_9_1d"] < 150.0))
+        # 1h down move, 15m & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 65.0) | (df["AROONU_14_15m"] < 60.0) | (df["AROONU_14_4h"] < 80.0))
+        # 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (df["AROONU_14_4h"] < 20.0))
+        # 4h down move, 5m going down
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (((df["EMA_12"] - df["EMA_26"]) / df["EMA_26"]) > -0.02))
+        # 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 4h & 1d down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 4h down move, 15m still high, 1d downtrend
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["ROC_9_1d"] > -50.0)
+        )
+        # 4h down move, 15m high, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 90.0))
+        # 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 80.0))
+        # 4h down move, 4h still not low enough, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 25.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 4h down move, 4h still high, 4h overbought
+        long_entry_logic.append((df["RSI_3_4h"] > 60.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_4h"] < 80.0))
+        # 1d down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1d down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1d down move, 1h high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1d down move, 4h high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_4h"] < 75.0) | (df["ROC_2_1d"] > -30.0))
+        # 15m still high, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m still not low enough, 4h high & overbought
+        long_entry_logic.append((df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 80.0) | (df["ROC_9_4h"] < 80.0))
+        # 15m still not low enough, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 80.0) | (df["ROC_9_1d"] < 150.0)
+        )
+        # 15m still high, 1h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m still high, 4h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 15m & 1h still high, 1d overbought
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 15m high, 1d overbought
+        long_entry_logic.append((df["AROONU_14_15m"] < 70.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m high, 1h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+        # 15m still high, 1h & 4h high
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m still not low enough, 4h still high, 1d overbought
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 1h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.60))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_1h"] < 80.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 70.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.80))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["ROC_9_4h"] < 50.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.60))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_12_1d"] - df["low_min_12_1d"]) / df["low_min_12_1d"]) < 2.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.60))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 200.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # 5m red, 1h still high
+        long_entry_logic.append((df["change_pct"] > -5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 4h top wick, 1h & 4h high
+        long_entry_logic.append(
+          (df["top_wick_pct_4h"] < 25.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 85.0)
+        )
+        # 1d top wick, 15m still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 6.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # big drop in last 48 hours, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_4h"] * 0.30)) | (df["RSI_3_4h"] > 15.0))
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.30)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 20 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_20_1d"] * 0.40)) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # big drop in the last 20 days, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_20_1d"] * 0.25)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_1h"] > 20.0))
+        # big drop in the last 30 days, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 45.0) | (df["RSI_14_4h"] < 40.0)
+        )
+        # big drop in the last 30 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.20)) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # big drop in the last 30 days, 1h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.05)) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # big drop in the last 30 days, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.05)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in the last 30 days
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.01)))
+
+        # Logic
+        long_entry_logic.append(df["RSI_20"] < df["RSI_20"].shift(1))
+        long_entry_logic.append(df["RSI_3"] < 46.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 80.0)
+        long_entry_logic.append(df["close"] < df["SMA_16"] * 0.952)
+
+      # Condition #21 - Pump mode (Long).
+      if long_entry_condition_index == 21:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["AROONU_14_15m"] < 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 90.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_14_15m"] < 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 85.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 25.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m down move, 4h high & overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0) | (df["ROC_9_4h"] < 80.0)
+        )
+        # 1h down move, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0) | (df["ROC_9_1d"] < 250.0)
+        )
+        # 1h down move, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0) | (df["ROC_9_1d"] < 100.0)
+        )
+        # 1h down move, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0))
+        # 15m still high, 4h high & overbought
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0) | (df["ROC_9_4h"] < 50.0)
+        )
+        # 15m still high, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m still high, 1h & overbought
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["ROC_9_1h"] < 40.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 55.0) | (df["AROONU_14_4h"] < 80.0))
+        # 5m down move, 4h high
+        long_entry_logic.append((df["ROC_2"] > -5.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h red, 4h big green, 1h still high
+        long_entry_logic.append(
+          (df["change_pct_1h"] > -5.0) | (df["change_pct_4h"] < 40.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 1h P&D
+        long_entry_logic.append((df["change_pct_1h"] > -10.0) | (df["change_pct_1h"].shift(12) < 10.0))
+        # 4h P&D, 4h overbought
+        long_entry_logic.append(
+          (df["change_pct_4h"] > -2.0) | (df["change_pct_4h"].shift(48) < 20.0) | (df["ROC_9_4h"] < 50.0)
+        )
+        # 4h P&D, 4h high
+        long_entry_logic.append(
+          (df["change_pct_4h"] > -10.0) | (df["change_pct_4h"].shift(48) < 20.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # big drop in last 4 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.40)) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # big drop in the last 12 days, 1h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.20)) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # big drop in the last 12 days, 1h still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.10)) | (df["AROONU_14_1h"] < 50.0))
+        # big drop in the last 20 days, 4h high
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.15)) | (df["AROONU_14_4h"] < 90.0))
+
+        # Logic
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 50.0)
+        long_entry_logic.append(df["close"] < df["EMA_16"] * 0.942)
+        long_entry_logic.append(((df["EMA_50"] - df["EMA_200"]) / df["close"] * 100.0) > 7.0)
+
+      # Condition #41 - Quick mode (Long).
+      if long_entry_condition_index == 41:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # big drop in the last hour, 5m down move
+        long_entry_logic.append((df["close"] > (df["close_max_12"] * 0.75)) | (df["RSI_3"] > 3.0))
+        # big drop in the last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # 5m down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0))
+        # 5m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m & 15m & 1h down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_15m"] > 50.0) | (df["RSI_3_1h"] > 15.0))
+        # 5m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 5m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 20.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 10.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1d down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 60.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 40.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 75.0))
+        # 15m down move, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 75.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 85.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 30.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 1h still not low enough, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_1h"] < 30.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 1h high. 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_1h"] < 70.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m down move, 4h high & overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0) | (df["ROC_9_4h"] < 50.0)
+        )
+        # 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["AROONU_14_15m"] < 40.0))
+        # 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["AROONU_14_1h"] < 30.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+        )
+        # 1h & 4h down move, drop in the last hour
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["close"] > (df["close_max_12"] * 0.90))
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_1h"] < 40.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 1h & 4h down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 20.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["AROONU_14_1h"] < 80.0)
+        )
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 40.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h down move, 1h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 25.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h, 4h still high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] > -50.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 75.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 85.0)
+        )
+        # 4h down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 25.0)
+        )
+        # 4h down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 4h down move, drop in last 1h
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["close"] > (df["close_max_12"] * 0.85)))
+        # 4h & 1d down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0))
+        # 1d down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+        # 1h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # 1d overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 50.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.75))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1h down move, drop but not yet near the previous lows in last 6 days
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.50))
+          | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # 1d red, 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["change_pct_1d"] > -30.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1d top wick, 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["top_wick_pct_1d"] < 50.0) | (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # big drop in last 6 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_6_1h"] * 0.65)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in last 24 hours, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_1h"] * 0.50)) | (df["RSI_3_4h"] > 10.0))
+        # big drop in last 4 hours, 4h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 30 days, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 45.0) | (df["RSI_14_4h"] < 40.0)
+        )
+        # big drop in the last 30 days, 1h downtrend
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.10)) | (df["RSI_3_1h"] > 10.0))
+        # big drop in the last 30 days, 1h high
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.10)) | (df["AROONU_14_1h"] < 80.0))
+        # big drop in the last 30 days
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.01)))
+
+        # Logic
+        long_entry_logic.append(df["RSI_14"] < 36.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["AROOND_14"] > 75.0)
+        long_entry_logic.append(df["EMA_9"] < (df["EMA_26"] * 0.960))
+
+      # Condition #42 - Quick mode (Long).
+      if long_entry_condition_index == 42:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_3_1h"] <= 95.0)
+        long_entry_logic.append(df["RSI_3_4h"] <= 80.0)
+        long_entry_logic.append(df["RSI_3_1d"] <= 80.0)
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 90.0)
+        # 5m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 30.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0))
+        # 15m & 4h down move, 1d downtrend
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1d"] > -0.4))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 15m & 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 10.0) | (df["AROONU_14_4h"] < 30.0)
+        )
+        # 15m & 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 60.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m & 4h down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 30.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m & 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 20.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_14_4h"] < 30.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 1h & 1d down move, 1d still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_1d"] < 50.0))
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 10.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 1h & 1d down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 1h down move, 15m sitll not low enough, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1d"] < 90.0)
+        )
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 80.0)
+        )
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 75.0)
+        )
+        # 1h down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["AROONU_14_1h"] < 40.0)
+        )
+        # 1h down move, 4h high & overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 70.0) | (df["ROC_9_4h"] < 50.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 4h & 1d down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 5.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0))
+        # 4h down move, 5m going down
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (((df["EMA_12"] - df["EMA_26"]) / df["EMA_26"]) > -0.02))
+        # 4h down move, drop in last 1h
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["close"] > (df["close_max_12"] * 0.85)))
+        # 4h & 1d down move, 1d still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
+        )
+        # 4h down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 75.0))
+        # 4h down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 4h down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1d down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1d down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m & 1h still high, 4h high
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 15m & 4h high, 1d downtrend
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0) | (df["ROC_9_1d"] > -40.0)
+        )
+        # 1d overbought, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 200.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in last 4 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_1d"] > 20.0))
+        # big drop in the last 4 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["RSI_3_1h"] > 15.0))
+        # big drop in last 4 hours, 4h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in the last 4 days, 1d high
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["AROONU_14_1d"] < 75.0))
+        # big drop in the last 6 days, 4h still high
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.25)) | (df["AROONU_14_4h"] < 50.0))
+        # big drop in the last 30 days, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 45.0) | (df["RSI_14_4h"] < 40.0)
+        )
+        # big drop in the last 30 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 30 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.05)) | (df["RSI_3_1h"] > 15.0))
+        # big drop in the last 30 days, 15m still high
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.05)) | (df["AROONU_14_15m"] < 50.0))
+        # big drop in the last 30 days
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.01)))
+        # 1d top wick, 1h down move
+        long_entry_logic.append((df["top_wick_pct_1d"] < 30.0) | (df["RSI_3_1h"] > 20.0))
+
+        # Logic
+        long_entry_logic.append(df["WILLR_14"] < -50.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["WILLR_84_1h"] < -70.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        long_entry_logic.append(df["BBB_20_2.0_1h"] > 16.0)
+        long_entry_logic.append(df["close_max_48"] >= (df["close"] * 1.10))
+
+      # Condition #43 - Quick mode (Long).
+      if long_entry_condition_index == 43:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 90.0)
+        # 5m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 20.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 50.0))
+        # 5m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 5m down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m down move, 4h high, 1d overbought
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["AROONU_14_4h"] < 80.0) | (df["ROC_9_1d"] < 80.0))
+        # 5m down move, 15m still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0))
+        # 5m down move, 1h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 5m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 5m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 20.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 30.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0))
+        # 15m & 1h down move, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1d"] > 5.0))
+        # 15m down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 60.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_4h"] < 75.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_15m"] < 40.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 1h & 4h down move, drop in the last hour
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["close"] > (df["close_max_12"] * 0.90))
+        )
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h & 1d down move, 1d still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 45.0)
+        )
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 1h down move, 1h & 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 60.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h, 4h still high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] > -50.0))
+        # 4h down move, 15m still high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 25.0)
+        )
+        # 1d down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+        # 1d down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1d top wick, 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["top_wick_pct_1d"] < 50.0) | (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 70.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.80))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1d red, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["change_pct_1d"] > -20.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 200.0)
+          | (df["close"] > (df["high_max_12_1d"] * 0.50))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 6.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # big drop in the last 30 days
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.01)))
+
+        # Logic
+        long_entry_logic.append(df["RSI_14"] < 40.0)
+        long_entry_logic.append(df["MFI_14"] < 40.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["EMA_26"] > df["EMA_12"])
+        long_entry_logic.append((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.024))
+        long_entry_logic.append((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+        long_entry_logic.append(df["close"] < (df["EMA_20"] * 0.958))
+        long_entry_logic.append(df["close"] < (df["BBL_20_2.0"] * 0.992))
+
+      # Condition #44 - Quick mode (Long).
+      if long_entry_condition_index == 44:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 15m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 20.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 15.0))
+        # 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0))
+        # 1h & 4h down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1h"] < 20.0))
+        # 1h & 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1d"] < 85.0))
+        # 15m & 1h & 4h down move, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 30.0)
+        )
+        # 15m & 1h & 4h down move, 4h overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 45.0) | (df["ROC_9_4h"] < 25.0)
+        )
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 35.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 10.0))
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h & 1d down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 14 down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+        # 1h down move, 4h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 80.0))
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_14_4h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1d down move, 4h high
+        long_entry_logic.append((df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+        # 1d P&D, 1d high
+        long_entry_logic.append(
+          (df["change_pct_1d"] > -10.0)
+          | (df["change_pct_1d"].shift(288) < 10.0)
+          | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 40.0) | (df["AROONU_14_4h"] < 50.0))
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.75))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_12_1d"] - df["low_min_12_1d"]) / df["low_min_12_1d"]) < 2.0)
+          | (df["close"] > (df["high_max_24_4h"] * 0.70))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["close"] < (df["low_min_6_1d"] * 1.25))
+        )
+        # drop but not yet near the previous lows in last 12 days
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.50)) | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # big drop in last hour, 1d down move
+        long_entry_logic.append((df["close"] > (df["close_max_12"] * 0.85)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 12 hours
+        long_entry_logic.append((df["close"] > (df["high_max_12_1h"] * 0.50)))
+        # big drop in the last 12 hours, 4h high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1h"] * 0.70)) | (df["AROONU_14_4h"] < 70.0))
+        # big drop in the last 2 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_4h"] * 0.30)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 4 days, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["ROC_9_1d"] < 100.0))
+        # big drop in the last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.30)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 12 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.25)) | (df["RSI_3_1h"] > 15.0))
+        # big drop in the last 20 days
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)))
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.30)) | (df["RSI_3_1h"] > 10.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 40.0)
+        long_entry_logic.append(df["RSI_3_15m"] < 50.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 25.0)
+        long_entry_logic.append(df["AROOND_14_15m"] > 75.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        long_entry_logic.append(df["EMA_26_15m"] > df["EMA_12_15m"])
+        long_entry_logic.append((df["EMA_26_15m"] - df["EMA_12_15m"]) > (df["open_15m"] * 0.035))
+        long_entry_logic.append((df["EMA_26_15m"].shift() - df["EMA_12_15m"].shift()) > (df["open_15m"] / 100.0))
+
+      # Condition #45 - Quick mode (Long).
+      if long_entry_condition_index == 45:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 15m down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 15m & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 35.0))
+        # 15m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_1h"] < 30.0))
+        # 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 10.0))
+        # 15m & 1h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["ROC_9_1d"] < 30.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["AROONU_14_4h"] < 30.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1h"] < 20.0))
+        # 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["AROONU_14_1h"] < 30.0))
+        # 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0))
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h & 1d down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1d down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 70.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h down move, 1h still not low enough, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0) | (df["AROONU_14_1d"] < 85.0)
+        )
+        # 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h & 4h down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 70.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 1h & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_14_4h"] < 80.0))
+        # 14 down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h down move, 1h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 50.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 4h & 1d down move, 1d still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
+        )
+        # 4h downmove, 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_4h"] < 40.0))
+        # 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 30.0))
+        # 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0))
+        # 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_4h"] > 55.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+        # 1d down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 15m still high, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 4h high, 1d overbought
+        long_entry_logic.append((df["AROONU_14_4h"] < 70.0) | (df["ROC_9_1d"] < 80.0))
+        # 4h high & overbought
+        long_entry_logic.append((df["AROONU_14_4h"] < 90.0) | (df["ROC_9_4h"] < 80.0))
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 40.0) | (df["AROONU_14_4h"] < 50.0))
+        # pump, 4h still high
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.75))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_12_1d"] - df["low_min_12_1d"]) / df["low_min_12_1d"]) < 2.0)
+          | (df["close"] > (df["high_max_24_4h"] * 0.70))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # big drop in last hour, 1d down move
+        long_entry_logic.append((df["close"] > (df["close_max_12"] * 0.80)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 12 hours, 4h still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1h"] * 0.50)) | (df["AROONU_14_4h"] < 50.0))
+        # big drop in the last 6 days, 1h still high
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.25)) | (df["AROONU_14_1h"] < 50.0))
+        # big drop in the last 12 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.45)) | (df["RSI_3_1h"] > 5.0))
+        # big drop in the last 12 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.40)) | (df["RSI_3_4h"] > 15.0))
+        # big drop in the last 12 days, 1h still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.25)) | (df["AROONU_14_1h"] < 75.0))
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.35)) | (df["RSI_3_1h"] > 10.0))
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.25)) | (df["RSI_3_1h"] > 15.0))
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_1h"] > 20.0))
+        # big drop in the last 30 days, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 45.0) | (df["RSI_14_4h"] < 40.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 50.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        long_entry_logic.append(df["close_15m"] < (df["EMA_20_15m"] * 0.924))
+
+      # Condition #46 - Quick mode (Long).
+      if long_entry_condition_index == 46:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0))
+        # 15m & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 40.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m down move, 4h still high, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_4h"] < 50.0) | (df["AROONU_14_1d"] < 90.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 40.0))
+        # 15m & 1h & 1d down move, 1h still not low enough, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0)
+          | (df["RSI_3_1h"] > 20.0)
+          | (df["RSI_3_1d"] > 30.0)
+          | (df["RSI_14_1h"] < 30.0)
+          | (df["AROONU_14_1d"] < 80.0)
+        )
+        # 15m down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_15m"] < 15.0))
+        # 1h down move, 1h still not low enough, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["AROONU_14_1h"] < 20.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 10.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_14_4h"] < 30.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 30.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 1h & 1d down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 1d down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 4h still high, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 60.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 30.0))
+        # 1h & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 40.0) | (df["RSI_14_1h"] < 40.0) | (df["RSI_14_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 1d down move, 1d still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_1d"] < 50.0))
+        # 1h down move, 1h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 40.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_1h"] < 30.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 65.0))
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 1h down move, 1h still high, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 40.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 60.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 55.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 20.0))
+        # 4h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 50.0) | (df["AROONU_14_1d"] < 90.0))
+        # 4h & 1d down move, 1d low
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 25.0) | (df["CMF_20_1d"] > -0.2))
+        # 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 35.0) | (df["AROONU_14_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 4h top wick, 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["top_wick_pct_4h"] < 20.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 2.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.05))
+        )
+        # 1d overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 50.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.70))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_12_1d"] - df["low_min_12_1d"]) / df["low_min_12_1d"]) < 2.5)
+          | (df["close"] > (df["high_max_6_1d"] * 0.60))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in the last 2 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_4h"] * 0.30)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 12 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.30)) | (df["RSI_3_1h"] > 20.0))
+        # big drop in the last 12 days, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.40)) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # big drop in the last 20 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.40)) | (df["RSI_3_1h"] > 10.0))
+        # big drop in the last 20 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_4h"] > 25.0))
+        # big drop in the last 30 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.40)) | (df["RSI_3_4h"] > 15.0))
+        # big drop in the last 30 days, 4h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 40.0)
+        long_entry_logic.append(df["RSI_3_15m"] < 50.0)
+        long_entry_logic.append(df["WILLR_14_15m"] < -50.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        long_entry_logic.append(df["WILLR_84_1h"] < -70.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        long_entry_logic.append(df["BBB_20_2.0_1h"] > 12.0)
+        long_entry_logic.append(df["close_max_48"] >= (df["close"] * 1.10))
+
+      # Condition #61 - Rebuy mode (Long).
+      if long_entry_condition_index == 61:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0))
+        # 15m & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1d"] > 10.0))
+        # 15m down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 5.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 4h stil high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 40.0))
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m down move, 4h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["ROC_9_1d"] < 80.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 85.0)
+        )
+        # 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 60.0) | (df["ROC_9_1d"] < 150.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 80.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 1h & 1d down move, 4h still high
+        long_entry_logic.append(
+          ((df["RSI_3_1h"] > 3.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        )
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 1h & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 40.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h & 4h down move, 1h low
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.4) | (df["CMF_20_4h"] > -0.4)
+        )
+        # 1h & 4h down move, 4h downtrend
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["ROC_9_4h"] > -40.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h & 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 90.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 55.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+        # 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_4h"] < 25.0))
+        # 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0))
+        # 15m still high, 4h high
+        long_entry_logic.append((df["RSI_14_15m"] < 40.0) | (df["RSI_14_4h"] < 90.0))
+        # 15m still high, 4h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 5m down move, 15m & 1h down move, 15m still high
+        long_entry_logic.append(
+          (df["ROC_9"] > -15.0) | (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_15m"] < 50.0)
+        )
+        # 1d green with top wick, 1d low
+        long_entry_logic.append(
+          (df["change_pct_1d"] < 25.0) | (df["top_wick_pct_1d"] < 10.0) | (df["CMF_20_1d"] > -0.2)
+        )
+        # 1d top wick, 4h still high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 40.0) | (df["AROONU_14_4h"] < 50.0))
+        # pump, 4h high
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.60))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # pump, 1d overbought
+        long_entry_logic.append(
+          (((df["high_max_6_1d"] - df["low_min_6_1d"]) / df["low_min_6_1d"]) < 3.0) | (df["ROC_9_1d"] < 100.0)
+        )
+        # big drop in last 6 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_6_1h"] * 0.65)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in last 12 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_12_1h"] * 0.50)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in the last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.20)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 20 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.15)) | (df["RSI_3_1d"] > 10.0))
+        # big drop in the last 20 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.25)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 20 days, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # big drop in the last 30 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.15)) | (df["RSI_3_1h"] > 15.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 50.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["AROOND_14"] > 75.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["ROC_2"] > -5.0)
+        long_entry_logic.append(df["EMA_26"] > df["EMA_12"])
+        long_entry_logic.append((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.030))
+        long_entry_logic.append((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+
+      # Condition #62 - Rebuy mode (Long).
+      if long_entry_condition_index == 62:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 3.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_14_4h"] < 35.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0))
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 15.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_1h"] < 40.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 3h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still not low enough, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 35.0) | (df["RSI_14_4h"] < 40.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 5.0))
+        # 1h & 4h down move, 1d still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 60.0) | (df["AROONU_14_4h"] < 60.0))
+        # 1h & 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 1h & 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0))
+        # 4h down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 4h & 1d down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 4h & 1d down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["RSI_3_1d"] > 45.0) | (df["ROC_9_1d"] < 50.0))
+        # 4h down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 1d top wick, 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["top_wick_pct_1d"] < 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 1d top wick, 4h down move, 4h high
+        long_entry_logic.append(
+          (df["top_wick_pct_1d"] < 10.0) | (df["RSI_3_4h"] > 60.0) | (df["AROONU_14_4h"] < 80.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.60))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # big drop in the last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # big drop in last 6 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_6_1h"] * 0.65)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in the last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 12 days, 15m & 4h down move
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.40)) | (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0)
+        )
+        # big drop in the last 20 days, 15m & 1h down move
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_20_1d"] * 0.40)) | (df["RSI_14_15m"] < 10.0) | (df["RSI_14_1h"] < 10.0)
+        )
+        # big drop in the last 20 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.25)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 20 days, 4h still not low enough
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_14_4h"] < 30.0))
+        # big drop in the last 30 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.20)) | (df["RSI_3_1d"] > 20.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 40.0)
+        long_entry_logic.append(df["AROONU_14"] < 30.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+        long_entry_logic.append(df["WILLR_84_1h"] < -70.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        long_entry_logic.append(df["BBB_20_2.0_1h"] > 12.0)
+        long_entry_logic.append(df["close_max_48"] >= (df["close"] * 1.12))
+
+      # Condition #101 - Rapid mode (Long).
+      if long_entry_condition_index == 101:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 80.0)
+        # big drop in the last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # 5 & 15m down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 5m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["AROONU_14_1h"] < 85.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_14_4h"] < 40.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 75.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+        )
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_4h"] < 30.0))
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 1h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 20.0))
+        # 15m down move, 1h still not low enough, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0) | (df["AROONU_14_1d"] < 90.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1d"] > 5.0))
+        # 15m & 1d down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 25.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 10.0)
+        )
+        # 15m & 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1d"] < 85.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 1d down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 75.0)
+        )
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1d down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_1h"] < 85.0))
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 25.0) | (df["AROONU_14_4h"] < 60.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 70.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 20.0)
+        )
+        # 1h & 4h down move, 1d low
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1d"] > -0.2))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 20.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 1d down move, 5m moving down
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["ROC_2"] > -0.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 10.0) | (df["AROONU_14_1h"] < 40.0))
+        # 1h down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0) | (df["AROONU_14_4h"] < 80.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h down move, 15m high
+        long_entry_logic.append((df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 80.0))
+        # 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0))
+        # 4h down move, 15m 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 4h & 1d down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1d down move, 15 still high
+        long_entry_logic.append((df["RSI_3_4h"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0))
+        # 1d down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 85.0))
+        # 4h still high, 4h moving lower, 4h overbought
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 50.0) | (df["AROONU_14_4h"] > df["AROONU_14_4h"].shift(48)) | (df["ROC_9_4h"] < 40.0)
+        )
+        # 1d red, 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["change_pct_1d"] > -30.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.75))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 70.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.80))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 80.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1h down move, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.50))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 50.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.70))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in last 6 hours, 1d overbought
+        long_entry_logic.append((df["close"] > (df["high_max_6_1h"] * 0.65)) | (df["ROC_9_1d"] < 50.0))
+        # big drop in last 4 hours, 4h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_24_4h"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # big drop in the last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 6 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_6_1d"] * 0.30)) | (df["RSI_3_1d"] > 15.0))
+        # big drop in the last 12 days, 4h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.50)) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # big drop in the last 30 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_4h"] > 30.0))
+        # big drop in the last 20 days, 1h still high
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.05)) | (df["AROONU_14_1h"] < 50.0))
+        # big drop in the last 30 days, 1h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_1h"] > 15.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] > 3.0)
+        long_entry_logic.append(df["RSI_14"] < 36.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["close"] < (df["SMA_16"] * 0.946))
+        long_entry_logic.append(df["AROONU_14_15m"] < 50.0)
+
+      # Condition #102 - Rapid mode (Long).
+      if long_entry_condition_index == 102:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_3"] < 46.0)
+        long_entry_logic.append(df["RSI_3_15m"] > 5.0)
+        long_entry_logic.append(df["RSI_3_1h"] > 10.0)
+        long_entry_logic.append(df["RSI_3_4h"] > 10.0)
+        # 5m & 15m down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m & 15m down move, 15m still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 40.0))
+        # 5m & 15m down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 5m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 5m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0))
+        # 5m down move, 15m high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["AROONU_14_15m"] < 70.0))
+        # 5m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["AROONU_14_1h"] < 40.0)
+        )
+        # 5m down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 5m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 70.0))
+        # 5m down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 80.0))
+        # 5m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["AROONU_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 5m down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 5m & 15m down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_4h"] < 90.0))
+        # 5m & 15m down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 5m & 15m down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 5m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 5m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3"] > 10.0) | (df["AROONU_14_1h"] < 85.0) | (df["AROONU_14_4h"] < 90.0))
+        # 5m down move, 4h high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3"] > 10.0) | (df["AROONU_14_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 5m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 5m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 15.0) | (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m& 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 4h down move, 1d high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1d"] < 85.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1d down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 15.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 25.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 35.0) | (df["AROONU_14_4h"] < 60.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_14_15m"] < 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 15m down move, 4h still high 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m & 1h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_15m"] < 60.0))
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 60.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1d down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_14_15m"] < 35.0) | (df["RSI_14_4h"] < 85.0))
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_1h"] < 85.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m & 1d down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1d"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m down move, 15m high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 70.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 85.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m down move, 4h high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_4h"] < 80.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 40.0) | (df["RSI_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m down move, 15m high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 45.0) | (df["AROONU_14_15m"] < 90.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 40.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 1h still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 1h down move, 4h high, 1d downtrend
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 70.0) | (df["ROC_9_1d"] > -50.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 55.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1h down move, 4h high, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["RSI_14_4h"] < 75.0) | (df["ROC_9_1d"] < 100.0))
+        # 4h down move, 4h still not low enough, 1d overbought
+        long_entry_logic.append((df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 30.0) | (df["ROC_9_1d"] < 100.0))
+        # 4h & 1d down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        )
+        # 1d down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m still not low enough, 1h high, 1d overbought
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["ROC_9_1d"] < 100.0)
+        )
+        # 15m & 1h & 4h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m high
+        long_entry_logic.append((df["AROONU_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0))
+        # 15m & 4h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 15m high, 1d overbought
+        long_entry_logic.append((df["AROONU_14_15m"] < 80.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m & 4h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 90.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 90.0) | (df["AROONU_14_1h"] < 90.0))
+        # 1h still high, 4h high & overbought
+        long_entry_logic.append((df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0) | (df["ROC_9_4h"] < 80.0))
+        # 4h high & overbought
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 85.0) | (df["ROC_9_4h"] < 50.0)
+        )
+        # 5m red, 1h still high
+        long_entry_logic.append((df["change_pct"] > -5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+        # 1d top wick, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["top_wick_pct_1d"] < 30.0) | (df["RSI_3_4h"] > 60.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.75))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+          | (df["close"] > (df["close_max_48"] * 0.85))
+          | (df["close"] < (df["low_min_24_1h"] * 1.25))
+        )
+        # 4h high, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["AROONU_14_4h"] < 70.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.80))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # 1d overbought, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (df["ROC_9_1d"] < 50.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.70))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in the last 4 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_4h"] > 20.0))
+        # big drop in the last 12 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.30)) | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # big drop in the last 20 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.40)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 30 days, 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 45.0) | (df["RSI_14_4h"] < 40.0)
+        )
+        # big drop in the last 30 days, 1h high
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_30_1d"] * 0.20)) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["WILLR_14"] < -95.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 10.0)
+        long_entry_logic.append(df["close"] < (df["BBL_20_2.0"] * 0.999))
+        long_entry_logic.append(df["close"] < (df["EMA_20"] * 0.960))
+
+      # Condition #103 - Rapid mode (Long).
+      if long_entry_condition_index == 103:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["ROC_2"] > -0.0)
+        # 15m down move, 4h high, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 45.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 20.0) | (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_4h"] < 90.0))
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 1h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 15m & 1h down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 90.0)
+        )
+        # 15m down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 80.0)
+        )
+        # 15m down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 35.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m down move, 1h high, 4h overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 35.0) | (df["AROONU_14_1h"] < 85.0) | (df["ROC_9_4h"] < 80.0))
+        # 1h & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 1h down move, 15m still not low enough, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_15m"] < 25.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 15m & 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 50.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 85.0))
+        # 1h down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 4h down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m still not low enough, 4h high
+        long_entry_logic.append((df["RSI_3_4h"] > 35.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 70.0))
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 60.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0))
+        # 1d down move, 4h high
+        long_entry_logic.append((df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0))
+        # 1d down move, 15m still high, 1h high
+        long_entry_logic.append((df["RSI_3_1d"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 85.0))
+        # 15m still high, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_14_15m"] < 45.0) | (df["AROONU_14_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 15m still high, 4h high & overbought
+        long_entry_logic.append((df["RSI_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 90.0) | (df["ROC_9_4h"] < 80.0))
+        # 15m still high, 1h high, 4h still high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m still high, 1d high
+        long_entry_logic.append((df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0))
+        # 15m & 1h & 4h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+        # 15m & 1h
+        long_entry_logic.append((df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 90.0))
+        # 15m still high, 1h high
+        long_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+          | (df["AROONU_14_1h"] < 90.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # 15m still high, 1d high
+        long_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0))
+        # 1d top wick, 4h high
+        long_entry_logic.append((df["top_wick_pct_1d"] < 30.0) | (df["AROONU_14_4h"] < 90.0))
+        # pump, 4h overbought
+        long_entry_logic.append(
+          (((df["high_max_6_1h"] - df["low_min_6_1h"]) / df["low_min_6_1h"]) < 0.5) | (df["ROC_9_4h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_6_4h"] * 0.85))
+          | (df["close"] < (df["low_min_24_4h"] * 1.25))
+        )
+        # pump, 1h high
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 4.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] < 90.0)
+        )
+        # big drop in the last 2 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_12_4h"] * 0.30)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 12 days, 1h still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.25)) | (df["AROONU_14_1h"] < 50.0))
+        # big drop in the last 12 days, 1h still not low enough
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.10)) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # big drop in the last 12 days, 15m still high
+        long_entry_logic.append((df["close"] > (df["high_max_12_1d"] * 0.20)) | (df["AROONU_14_15m"] < 50.0))
+        # big drop in the last 20 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_3_4h"] > 20.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_4"] < 45.0)
+        long_entry_logic.append(df["RSI_14"] > 35.0)
+        long_entry_logic.append(df["RSI_20"] < df["RSI_20"].shift(1))
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["close"] < df["SMA_16"] * 0.960)
+
+      # Condition #104 - Rapid mode (Long).
+      if long_entry_condition_index == 104:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 15m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 15.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 3.0))
+        # 15m & 1h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_14_4h"] < 35.0))
+        # 15m & 1h down move, 1j still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 30.0) | (df["RSI_14_4h"] < 40.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0))
+        # 15m & 1h & 4h down move, 15m downtrend
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["CMF_20_15m"] > -0.20)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 15m & 1h downtrend
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["CMF_20_15m"] > -0.40) | (df["CMF_20_1h"] > -0.40)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 4h down move, 1h & 4h downtrend
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.20) | (df["CMF_20_4h"] > -0.20)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 40.0))
+        # 15m & 3h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["RSI_14_1h"] < 40.0))
+        # 15m down move, 15m still not low enough, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 5.0))
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 50.0))
+        # 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["AROONU_14_4h"] < 85.0))
+        # 1h & 4h down move, 1d still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 50.0)
+        )
+        # 1h & 1d down move, 1h still moving lower
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["CCI_20_change_pct_1h"] > -0.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 30.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 25.0) | (df["AROONU_14_1d"] < 70.0))
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_1d"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 70.0)
+        )
+        # 1h down move, 1h & 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 60.0) | (df["AROONU_14_4h"] < 60.0))
+        # 1h & 4h down move, 1d overbought
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["ROC_9_1d"] < 50.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h & 1d down move, 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_1d"] < 70.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 70.0))
+        # 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 80.0))
+        # 4h down move, 15m not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 3.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 4h down move, 1h downtrend, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["CMF_20_1h"] > -0.25) | (df["AROONU_14_1h"] < 30.0))
+        # 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+        # 4h down move, 4h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 40.0) | (df["ROC_9_1d"] < 100.0))
+        # 1d down move, 1h still not low enough
+        long_entry_logic.append((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0))
+        # 1d red, 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["change_pct_1d"] > -30.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_24_4h"] - df["low_min_24_4h"]) / df["low_min_24_4h"]) < 2.0)
+          | (df["close"] > (df["high_max_12_4h"] * 0.60))
+          | (df["close"] < (df["low_min_24_4h"] * 1.10))
+        )
+        # pump, drop but not yet near the previous lows
+        long_entry_logic.append(
+          (((df["high_max_12_1d"] - df["low_min_12_1d"]) / df["low_min_12_1d"]) < 5.0)
+          | (df["close"] > (df["high_max_6_1d"] * 0.30))
+          | (df["close"] < (df["low_min_12_1d"] * 1.25))
+        )
+        # big drop in the last hour
+        long_entry_logic.append(df["close"] > (df["close_max_12"] * 0.50))
+        # big drop in the last 12 days, 15m & 4h down move
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_12_1d"] * 0.40)) | (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 10.0)
+        )
+        # big drop in the last 20 days, 15m & 1h down move
+        long_entry_logic.append(
+          (df["close"] > (df["high_max_20_1d"] * 0.40)) | (df["RSI_14_15m"] < 10.0) | (df["RSI_14_1h"] < 10.0)
+        )
+        # big drop in the last 20 days, 1d down move
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.25)) | (df["RSI_3_1d"] > 30.0))
+        # big drop in the last 20 days, 4h still not low enough
+        long_entry_logic.append((df["close"] > (df["high_max_20_1d"] * 0.10)) | (df["RSI_14_4h"] < 30.0))
+        # big drop in the last 30 days, 4h down move
+        long_entry_logic.append((df["close"] > (df["high_max_30_1d"] * 0.25)) | (df["RSI_3_4h"] > 20.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 40.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 25.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        long_entry_logic.append(df["close"] < df["EMA_16"] * 0.975)
+        long_entry_logic.append(((df["EMA_50"] - df["EMA_200"]) / df["close"] * 100.0) < -5.5)
+
+      # Condition #120 - Grind mode (Long).
+      if long_entry_condition_index == 120:
+        # Protections
+        long_entry_logic.append(num_open_long_grind_mode < self.grind_mode_max_slots)
+        long_entry_logic.append(df["protections_long_global"] == True)
+        long_entry_logic.append(is_pair_long_grind_mode)
+        long_entry_logic.append(df["RSI_3"] <= 50.0)
+        long_entry_logic.append(df["RSI_3_15m"] >= 20.0)
+        long_entry_logic.append(df["RSI_3_1h"] >= 10.0)
+        long_entry_logic.append(df["RSI_3_4h"] >= 10.0)
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 80.0)
+
+        # Logic
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["WILLR_14"] < -80.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["close"] < (df["EMA_20"] * 0.978))
+
+      # Condition #141 - Top Coins mode (Long).
+      if long_entry_condition_index == 141:
+        # Protections
+        long_entry_logic.append(is_pair_long_top_coins_mode)
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 90.0)
+        # 5m & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 5m down move, 4h high
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        # 5m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 5m & 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_15m"] < 50.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 1h high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 1h & 4h down move, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 35.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 25.0)
+        )
+        # 15m & 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m down move, 15m still high 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 1h & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_1h"] < 50.0))
+        # 1h down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 5.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 4h down move, 15m still not low enough, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 20.0))
+        # 4h down move, 15m still not low enough, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 40.0)
+        )
+        # 15m & 1h & 4h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 90.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["RSI_20"] < df["RSI_20"].shift(1))
+        long_entry_logic.append(df["RSI_3"] < 30.0)
+        long_entry_logic.append(df["AROONU_14"] < 25.0)
+        long_entry_logic.append(df["close"] < df["SMA_16"] * 0.956)
+
+      # Condition #142 - Top Coins mode (Long).
+      if long_entry_condition_index == 142:
+        # Protections
+        long_entry_logic.append(is_pair_long_top_coins_mode)
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m & 15m down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_15m"] > 5.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 5m & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 5m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_15m"] < 30.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h & 4h down move, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 35.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 55.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 60.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 25.0)
+        )
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 35.0) | (df["AROONU_14_4h"] < 60.0))
+        # 15m & 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_15m"] < 70.0))
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 4h down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 15m down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 70.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["RSI_14_4h"] < 80.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 45.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 85.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["RSI_14_4h"] < 30.0))
+        # 1h & 4h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_14_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 70.0))
+        # 4h & 1d down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 5.0) | (df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 4h down move, 15m still not low enough, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["AROONU_14_4h"] < 20.0))
+        # 4h down move, 15m still not low enough, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 4h & 1d down move, 15m still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0)
+        )
+        # 4h down move, 15m still not low enough, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_4h"] < 40.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 15m & 1h & 4h high
+        long_entry_logic.append(
+          (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_1h"] < 90.0) | (df["AROONU_14_4h"] < 90.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["RSI_4"] < 46.0)
+        long_entry_logic.append(df["RSI_20"] < df["RSI_20"].shift(1))
+        long_entry_logic.append(df["close"] < df["SMA_16"] * 0.958)
+
+      # Condition #143 - Top Coins mode (Long).
+      if long_entry_condition_index == 143:
+        # Protections
+        long_entry_logic.append(is_pair_long_top_coins_mode)
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 90.0)
+        # 5m & 4h down move
+        long_entry_logic.append((df["RSI_3"] > 3.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0))
+        # 15m & 1h & 4h strong downtrend
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 1h down move, 1h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 3.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 20.0)
+        )
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 3.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 40.0))
+        # 15m & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 20.0))
+        # 15m & 1h & 4h down move, 1d overbought
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 35.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 15m still high 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 15m & 1h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 15.0) | (df["RSI_3_1d"] > 25.0))
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 4h & 1d down move, 1h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 10.0) | (df["RSI_3_1d"] > 10.0) | (df["AROONU_14_1h"] < 50.0))
+        # 4h down move, 1h & 4h downtrend
+        long_entry_logic.append((df["RSI_3_4h"] > 3.0) | (df["CMF_20_1h"] > -0.20) | (df["CMF_20_4h"] > -0.25))
+
+        # Logic
+        long_entry_logic.append(df["RSI_3"] < 40.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 20.0)
+        long_entry_logic.append(df["EMA_26"] > df["EMA_12"])
+        long_entry_logic.append((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.020))
+        long_entry_logic.append((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+
+      # Condition #144 - Top Coins mode (Long).
+      if long_entry_condition_index == 144:
+        # Protections
+        long_entry_logic.append(is_pair_long_top_coins_mode)
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(df["RSI_14_1h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_4h"] < 80.0)
+        long_entry_logic.append(df["RSI_14_1d"] < 80.0)
+        # 5m & 1h down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3"] > 3.0) | (df["RSI_3_1h"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 40.0))
+        # 5m & 1h down move, 1h still high
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 50.0))
+        # 5m & 4h & 1d down move
+        long_entry_logic.append((df["RSI_3"] > 5.0) | (df["RSI_3_4h"] > 5.0) | (df["RSI_3_1d"] > 10.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_1h"] > 15.0) | (df["RSI_3_4h"] > 30.0))
+        # 15m & 4h down move, 4h still not low enough
+        long_entry_logic.append((df["RSI_3_15m"] > 5.0) | (df["RSI_3_4h"] > 15.0) | (df["AROONU_14_4h"] < 30.0))
+        # 15m & 1h & 4h down move
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["RSI_3_4h"] > 10.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 10.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m down move, 15m still high 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 15.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 10.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 1h & 4h & 1d down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 35.0) | (df["AROONU_14_4h"] < 40.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 20.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 85.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 60.0) | (df["AROONU_14_4h"] < 90.0))
+        # 4h & 1d down move, 15m still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 5.0) | (df["RSI_3_1d"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+        )
+
+        # Logic
+        long_entry_logic.append(df["WILLR_14"] < -50.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3"] < 30.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 30.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+        long_entry_logic.append(df["BBB_20_2.0_1h"] > 12.0)
+        long_entry_logic.append(df["close_max_48"] >= (df["close"] * 1.10))
+
+      # Condition #161 - Scalp mode (Long).
+      if long_entry_condition_index == 161:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        # 5m down move, 15m high
+        long_entry_logic.append((df["RSI_3"] > 15.0) | (df["AROONU_14_15m"] < 80.0))
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m & 4h down move, 4h still high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # 15m down move, 15m high
+        long_entry_logic.append((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 80.0))
+        # 15m down move, 4h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0) | (df["AROONU_14_1d"] < 90.0)
+        )
+        # 15m & 1h down move, 15m still high
+        long_entry_logic.append((df["RSI_3_15m"] > 30.0) | (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_15m"] < 50.0))
+        # 15m down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m & 4h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 35.0) | (df["RSI_3_4h"] > 60.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_15m"] > 40.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        long_entry_logic.append((df["RSI_3_15m"] > 40.0) | (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_4h"] < 80.0))
+        # 15m & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0)
+        )
+        # 15m & 4h down move, 15m high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["AROONU_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 15m down move, 4h still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 40.0) | (df["AROONU_14_4h"] < 50.0) | (df["ROC_9_1d"] < 100.0))
+        # 15m & 1h down move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 45.0) | (df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 15m high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 45.0) | (df["AROONU_14_15m"] < 60.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 45.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 45.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 15m down move, 15m still high, 1d overbought
+        long_entry_logic.append((df["RSI_3_15m"] > 50.0) | (df["AROONU_14_15m"] < 50.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 55.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 15m down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 55.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 1h & 4h down move, 1h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 65.0) | (df["AROONU_14_1h"] < 50.0))
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 1h & 4h down move, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 55.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1h down move, 15m & 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0))
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 40.0) | (df["AROONU_14_4h"] < 85.0) | (df["AROONU_14_1d"] < 90.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["AROONU_14_1h"] < 50.0) | (df["AROONU_14_4h"] < 90.0))
+        # 1h down move, 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 45.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0))
+        # 1h & 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_1h"] > 50.0) | (df["RSI_3_4h"] > 60.0) | (df["AROONU_14_15m"] < 70.0))
+        # 1h down move, 15m still high, 4h high
+        long_entry_logic.append((df["RSI_3_1h"] > 50.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 80.0))
+        # 1h down move, 15m high, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+        )
+        # 1h down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 80.0)
+        )
+        # 1h down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 60.0) | (df["AROONU_14_1h"] < 60.0)
+        )
+        # 1h down move, 1h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 50.0) | (df["AROONU_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 90.0)
+        )
+        # 1h down move, 5m up move, 1h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["RSI_3"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+        )
+        # 1h down move, 15m still not low enough, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 1h down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["AROONU_14_1h"] < 70.0)
+        )
+        # 1h down move, 15m still not low enough, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 60.0)
+        )
+        # 1h down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+        )
+        # 1h down move, 15m & 1h high
+        long_entry_logic.append((df["RSI_3_1h"] > 60.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_1h"] < 90.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["AROONU_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+        )
+        # 1h down move, 1h high, 4h still high
+        long_entry_logic.append((df["RSI_3_1h"] > 60.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 40.0))
+        # 1h down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 1h down move, 1h & 1d high
+        long_entry_logic.append(
+          (df["RSI_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_1d"] < 90.0)
+        )
+        # 1h down move, 4h & 1d high
+        long_entry_logic.append((df["RSI_3_1h"] > 60.0) | (df["RSI_14_4h"] < 70.0) | (df["RSI_14_1d"] < 80.0))
+        # 15m & 1h & 4h down move, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_15m"] > 50.0) | (df["RSI_3_1h"] > 65.0) | (df["RSI_3_4h"] > 65.0) | (df["AROONU_14_4h"] < 85.0)
+        )
+        # 4h down move, 15m high
+        long_entry_logic.append((df["RSI_3_4h"] > 20.0) | (df["AROONU_14_15m"] < 80.0))
+        # 4h down move, 1h high
+        long_entry_logic.append((df["RSI_3_4h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+        # 4h down move, 15m & 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 50.0) | (df["AROONU_14_4h"] < 50.0))
+        # 4h down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 4h down move, 15m & 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+        )
+        # 4h down move, 1h & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["RSI_14_4h"] < 50.0)
+        )
+        # 4h down move, 1h still high, 4h still moving down
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["CCI_20_change_pct_4h"] > -0.0)
+        )
+        # 4h down move, 1h high, 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 45.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 50.0))
+        # 4h down move, 15m high, 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 40.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h still high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_4h"] < 50.0)
+        )
+        # 4h down move, 15m high, 4h still not low enough
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+        )
+        # 4h down move, 1h still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h high
+        long_entry_logic.append((df["RSI_3_4h"] > 60.0) | (df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_4h"] < 70.0))
+        # 4h down move, 15m high, 4h still high
+        long_entry_logic.append((df["RSI_3_4h"] > 60.0) | (df["AROONU_14_15m"] < 80.0) | (df["AROONU_14_4h"] < 40.0))
+        # 4h down move, 15m still high, 1h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["AROONU_14_1h"] < 70.0)
+        )
+        # 4h down move, 15m still high, 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 60.0)
+        )
+        # 4h down move, 1h & 4h high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["AROONU_14_4h"] < 70.0)
+        )
+        # 4h down move, 4h still high, 1d high
+        long_entry_logic.append(
+          (df["RSI_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 80.0)
+        )
+        # 15m high, 4h high
+        long_entry_logic.append((df["AROONU_14_15m"] < 70.0) | (df["AROONU_14_4h"] < 85.0))
+        # 15m high, 4h still high
+        long_entry_logic.append((df["AROONU_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+        # 15m high, 1h still high
+        long_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0))
+        # 15m & 4h high
+        long_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] < 70.0) | (df["AROONU_14_4h"] < 70.0))
+        # 15m high, 1h still not low enough
+        long_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 30.0))
+
+        # Logic
+        long_entry_logic.append(df["RSI_14"] < 50.0)
+        long_entry_logic.append(df["AROONU_14_15m"] < 90.0)
+        long_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] < 90.0)
+        long_entry_logic.append(
+          (df["SMA_21"].shift(1) < df["SMA_200"].shift(1).infer_objects(copy=False).fillna(np.nan))
+          & df["SMA_200"].shift(1).notna()
+        )
+        long_entry_logic.append(
+          (df["SMA_21"] > df["SMA_200"].infer_objects(copy=False).fillna(np.nan)) & df["SMA_200"].notna()
+        )
+        long_entry_logic.append(
+          (df["close"] > df["EMA_200_1h"].infer_objects(copy=False).fillna(np.nan)) & df["EMA_200_1h"].notna()
+        )
+        long_entry_logic.append(
+          (df["close"] > df["EMA_200_4h"].infer_objects(copy=False).fillna(np.nan)) & df["EMA_200_4h"].notna()
+        )
+        long_entry_logic.append(df["BBB_20_2.0"] > 1.5)
+        long_entry_logic.append(df["BBB_20_2.0_1h"] > 6.0)
+
+      # Condition #162 - Scalp mode (Long).
+      if long_entry_condition_index == 162:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append(
+          (df["RSI_3"] > 5.0) & (df["RSI_3_15m"] > 5.0) & (df["ROC_9_15m"] > -10.0) & (df["ROC_9_1d"] < 200.0)
+        )
+
+        long_entry_logic.append(
+          # 15m & 1h down move, 4h high
+          ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+          # 15m & 4h down move, 1h still high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_4h"] > 40.0) | (df["RSI_14_1h"] < 50.0))
+          # 15m & 1d down move, 4h high
+          & ((df["RSI_3_15m"] > 10.0) | (df["RSI_3_1d"] > 20.0) | (df["AROONU_14_4h"] < 90.0))
+          # 15m down move, 15m high
+          & ((df["RSI_3_15m"] > 10.0) | (df["AROONU_14_15m"] < 70.0))
+          # 15m & 1h down move, 15m still not low enough
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0))
+          # 15m & 1h down nove, 1h still high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+          # 15m & 1h down move, 4h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 100.0))
+          # 15m & 1h down move, 4h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 70.0))
+          # 15m & 1h down move, 4h high
+          & ((df["RSI_3_15m"] > 25.0) | (df["RSI_3_1h"] > 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0))
+          # 15m down move, 15m high, 1d overbought
+          & ((df["RSI_3_15m"] > 25.0) | (df["AROONU_14_15m"] < 60.0) | (df["ROC_9_1d"] < 150.0))
+          # 15m down move, 1h & 4h high
+          & ((df["RSI_3_15m"] > 35.0) | (df["AROONU_14_1h"] < 80.0) | (df["RSI_14_4h"] < 80.0))
+          # 1h & 4h down move, 1h still high
+          & ((df["RSI_3_1h"] > 3.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_1h"] < 40.0))
+          # 1h & 4h down move, 4h high
+          & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 20.0) | (df["AROONU_14_4h"] < 60.0))
+          # 1h & 4h down move, 4h high
+          & ((df["RSI_3_1h"] > 5.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_4h"] < 90.0))
+          # 1h down move, 1h high, 1d overbought
+          & ((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 60.0) | (df["ROC_9_1d"] < 100.0))
+          # 1h down move, 1h high
+          & ((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 90.0))
+          # 1h & 4h down move, 4h high
+          & ((df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+          # 1h down move, 1h high, 4h overbought
+          & ((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 60.0) | (df["ROC_9_4h"] < 50.0))
+          # 1h down move,  4h high, 1d overbought
+          & ((df["RSI_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0) | (df["ROC_9_1d"] < 150.0))
+          # 4h & 1d down move
+          & ((df["RSI_3_4h"] > 5.0) | (df["RSI_3_1d"] > 10.0))
+          # 4h & 1d down move, 4h still not low enough
+          & ((df["RSI_3_4h"] > 20.0) | (df["RSI_3_1d"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 30.0))
+          # 1d down move, 1h high
+          & ((df["RSI_3_1d"] > 3.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+          # 1d down move, 15m still high
+          & ((df["RSI_3_1d"] > 3.0) | (df["AROONU_14_15m"] < 50.0))
+          # 1d down move, 15m still high, 1h high
+          & ((df["RSI_3_1d"] > 10.0) | (df["AROONU_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0))
+          # 1d down move, 1h & 4h high
+          & ((df["RSI_3_1d"] > 10.0) | (df["AROONU_14_1h"] < 70.0) | (df["AROONU_14_4h"] < 90.0))
+          # 1d down move, 4h high
+          & ((df["RSI_3_1d"] > 20.0) | (df["RSI_14_4h"] < 80.0))
+          # 1h P&D, 1h down move
+          & ((df["change_pct_1h"] > -10.0) | (df["change_pct_1h"].shift(12) < 10.0) | (df["RSI_3_1h"] > 50.0))
+          # 4h P&D, 4h high
+          & ((df["change_pct_4h"] > -15.0) | (df["change_pct_4h"].shift(48) < 30.0) | (df["AROONU_14_4h"] < 90.0))
+          # 4h green, 15m & 1h down move
+          & ((df["change_pct_4h"] < 10.0) | (df["RSI_3_15m"] > 10.0) | (df["RSI_3_1h"] > 35.0))
+          # 4h green, 1h down move
+          & ((df["change_pct_4h"] < 40.0) | (df["RSI_3_1h"] > 50.0))
+          # 4h green with top wick
+          & ((df["change_pct_4h"] < 50.0) | (df["change_pct_4h"] < 50.0))
+          # 1d green with top wick, 15m still high
+          & ((df["change_pct_1d"] < 10.0) | (df["top_wick_pct_1d"] < 8.0) | (df["AROONU_14_15m"] < 50.0))
+          # 1d green, 4h down move, 4h still high
+          & ((df["change_pct_1d"] < 40.0) | (df["RSI_3_4h"] > 35.0) | (df["AROONU_14_4h"] < 50.0))
+          # 1d green with top wick, 4h down move
+          & ((df["change_pct_1d"] < 40.0) | (df["top_wick_pct_1d"] < 8.0) | (df["RSI_3_4h"] > 55.0))
+          # 1d top wick, 4h still high
+          & ((df["top_wick_pct_1d"] < 50.0) | (df["AROONU_14_4h"] < 50.0))
+          # big drop in last 4 days, 1d down move
+          & ((df["close"] > (df["high_max_24_4h"] * 0.20)) | (df["RSI_3_1d"] > 20.0))
+          # big drop in the last 20 days, 4h down move
+          & ((df["close"] > (df["high_max_20_1d"] * 0.15)) | (df["RSI_3_4h"] > 20.0))
+          # big drop in the last 20 days, 1d down move
+          & ((df["close"] > (df["high_max_20_1d"] * 0.05)) | (df["RSI_3_1d"] > 20.0))
+          # big drop in the last 20 days, 1h still high
+          & ((df["close"] > (df["high_max_20_1d"] * 0.05)) | (df["STOCHRSIk_14_14_3_3_1h"] < 45.0))
+          # big drop in the last 20 days, 4h high
+          & ((df["close"] > (df["high_max_20_1d"] * 0.05)) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+        )
+
+        # Logic
+        long_entry_logic.append(
+          (df["AROONU_14"] < 25.0)
+          & (df["AROOND_14"] > 75.0)
+          & (df["STOCHRSIk_14_14_3_3"] < 30.0)
+          & (df["EMA_26"] > df["EMA_12"])
+          & ((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.030))
+          & ((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+          & (df["close"] < df["SMA_9"])
+        )
+
+      # Condition #163 - Scalp mode (Long).
+      if long_entry_condition_index == 163:
+        # Protections
+        long_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        long_entry_logic.append(df["protections_long_global"] == True)
+
+        long_entry_logic.append((df["RSI_3"] > 10.0) & (df["RSI_3_15m"] > 10.0) & (df["RSI_3_1h"] > 20.0))
+
+        long_entry_logic.append(
+          # 5m & 15m & 4h down mnove, 4h high
+          ((df["RSI_3"] > 15.0) | (df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 40.0) | (df["AROONU_14_4h"] < 80.0))
+          # 5m & 15m & 1d down move, 1h high
+          & ((df["RSI_3"] > 15.0) | (df["RSI_3_15m"] > 25.0) | (df["RSI_3_1d"] > 25.0) | (df["AROONU_14_1h"] < 90.0))
+          # 5m & 1h down move, 15m still high, 4h high
+          & (
+            (df["RSI_3"] > 20.0) | (df["RSI_3_1h"] > 40.0) | (df["RSI_14_15m"] < 40.0) | (df["AROONU_14_4h"] < 100.0)
+          )
+          # 5m & 1h & 15m down move, 1h still not low enough
+          & ((df["RSI_3"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_1d"] > 15.0) | (df["AROONU_14_1h"] < 30.0))
+          # 15m & 4h down move, 4h high
+          & ((df["RSI_3"] > 15.0) | (df["RSI_3_4h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+          # 5m & 4h down move, 15m high
+          & ((df["RSI_3"] > 15.0) | (df["RSI_3_4h"] > 45.0) | (df["AROONU_14_15m"] < 60.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 12.0) | (df["RSI_3_1h"] > 40.0) | (df["AROONU_14_1h"] < 100.0))
+          # 15m & 1h & 4h & 1d down move
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 25.0) | (df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0))
+          # 15m & 1h down move, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 25.0)
+            | (df["AROONU_14_1h"] < 75.0)
+            | (df["AROONU_14_4h"] < 100.0)
+          )
+          # 15m & 1h & 4h down move, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_3_4h"] > 35.0) | (df["ROC_9_1d"] < 40.0))
+          # 15m & 1h & 4h down move, 1h downtrend, 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["RSI_3_4h"] > 55.0)
+            | (df["CMF_20_1h"] > -0.10)
+            | (df["AROONU_14_4h"] < 80.0)
+          )
+          # 15m & 1h down move, 15m high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_15m"] < 60.0))
+          # 15m & 1h down move, 4h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["RSI_14_4h"] < 85.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0))
+          # 15m & 1h & 4h down move, 4h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 65.0) | (df["MFI_14_4h"] < 85.0))
+          # 15m & 1h down move, 1h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 35.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 85.0))
+          # 15m & 1h down move, 4h high & overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 45.0) | (df["RSI_14_4h"] < 70.0) | (df["ROC_9_4h"] < 50.0))
+          # 15m & 4h down move, 15m high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] > 30.0) | (df["AROONU_14_15m"] < 60.0))
+          # 15m down move, 4h & 1d up move, 1d downtrend
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_4h"] < 90.0) | (df["RSI_3_1d"] < 80.0) | (df["CMF_20_1d"] > -0.2))
+          # 15m & 1d down move, 4h high
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 70.0))
+          # 15m & 1d down move, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["RSI_3_1d"] > 40.0) | (df["ROC_9_1d"] < 50.0))
+          # 15m down move, 15m still not low enough, 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+          )
+          # 15m down move, 1h high, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 90.0) | (df["ROC_9_1d"] < 80.0))
+          # 15m down move, 1h high, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["AROONU_14_1h"] < 100.0) | (df["ROC_9_1d"] < 40.0))
+          # 15m & 1h & 1d down move, 15m high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["RSI_3_1d"] > 40.0)
+            | (df["AROONU_14_15m"] < 60.0)
+          )
+          # 15m & 1h down move, 1h & 4h still high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_3_1d"] > 15.0)
+            | (df["AROONU_14_1h"] < 50.0)
+            | (df["AROONU_14_4h"] < 50.0)
+          )
+          # 15m down move, 1h high, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0) | (df["ROC_9_1d"] < 150.0))
+          # 15m down move, 1h high & overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["ROC_9_1h"] < 20.0))
+          # 15m down move, 1h high, 1d overbought
+          & ((df["RSI_3_15m"] > 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0) | (df["ROC_9_1d"] < 100.0))
+          # 15m down move, 4h high
+          & (
+            (df["RSI_3_15m"] > 15.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0)
+            | (df["EMA_9"] < (df["EMA_26"] * 0.972))
+          )
+          # 15m down move, 4h high and downtrend
+          & ((df["RSI_3_15m"] > 15.0) | (df["CMF_20_4h"] > -0.2) | (df["AROONU_14_4h"] < 80.0))
+          # 15m & 4h down move, 15m high
+          & ((df["RSI_3_15m"] > 20.0) | (df["RSI_3_4h"] > 25.0) | (df["AROONU_14_15m"] < 60.0))
+          # 15m & 1h down move, 1h downtrend, 1h downtrend, 15m still high, 1h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_3_1h"] > 35.0)
+            | (df["CMF_20_1h"] > -0.10)
+            | (df["AROONU_14_15m"] < 40.0)
+            | (df["AROONU_14_1h"] < 85.0)
+          )
+          # 15m & 1h down move, 4h high & overbought
+          & ((df["RSI_3_15m"] > 20.0) | (df["RSI_3_1h"] > 45.0) | (df["RSI_14_4h"] < 70.0) | (df["ROC_9_4h"] < 50.0))
+          # 15m down move, 15m still high, 4h high
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["RSI_14_15m"] < 40.0)
+            | (df["RSI_14_4h"] < 75.0)
+            | (df["AROONU_14_4h"] < 100.0)
+          )
+          # 15m down move, 1h & 4h high, 1f overbought
+          & (
+            (df["RSI_3_15m"] > 20.0)
+            | (df["AROONU_14_1h"] < 85.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["ROC_9_1d"] < 80.0)
+          )
+          # 15m down move, 4h downtrend, 4h overbought
+          & ((df["RSI_3_15m"] > 20.0) | (df["CMF_20_4h"] > -0.0) | (df["ROC_9_4h"] < 40.0))
+          # 1h & 1d down move, 1d high
+          & ((df["RSI_3_1h"] > 25.0) | (df["RSI_3_1d"] > 30.0) | (df["AROONU_14_1d"] < 90.0))
+          # 1h down move, 15m downtrend, 4h still high
+          & ((df["RSI_3_1h"] > 25.0) | (df["CMF_20_15m"] > -0.4) | (df["AROONU_14_4h"] < 50.0))
+          # 1h down move, 4h downtrend, 4h high
+          & ((df["RSI_3_1h"] > 25.0) | (df["CMF_20_4h"] > -0.25) | (df["AROONU_14_4h"] < 70.0))
+          # 1h down move, 1h high, 1d downtrend
+          & ((df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 90.0) | (df["CMF_20_1d"] > -0.2))
+          # 15m & 1h down move, 15m still not low enough, 1h & 4h high
+          & (
+            (df["RSI_3_15m"] > 30.0)
+            | (df["RSI_3_1h"] > 45.0)
+            | (df["RSI_14_15m"] < 30.0)
+            | (df["RSI_14_1h"] < 50.0)
+            | (df["RSI_14_4h"] < 70.0)
+            | (df["AROONU_14_15m"] < 20.0)
+            | (df["AROONU_14_1h"] < 60.0)
+            | (df["AROONU_14_4h"] < 100.0)
+          )
+          # 15m & 4h down move, 4h overbought
+          & ((df["RSI_3_15m"] > 30.0) | (df["RSI_3_4h"] > 60.0) | (df["ROC_9_4h"] < 60.0))
+          # 1h down move, 15m & 4h high
+          & ((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 95.0))
+          # 1h down move, 1h high
+          & ((df["RSI_3_1h"] > 30.0) | (df["MFI_14_1h"] < 80.0) | (df["AROONU_14_1h"] < 90.0))
+          # 1h down move, 1h & 4h high
+          & ((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 100.0))
+          # 1h down move, 1h high, 1d downtrend
+          & ((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 90.0) | (df["CMF_20_1d"] > -0.2))
+          # 1h down move, 1h highm 1d overbought
+          & ((df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 90.0) | (df["ROC_9_1d"] < 40.0))
+          # 1h & 4h down move, 1h still high, 4h high
+          & ((df["RSI_3_1h"] > 35.0) | (df["RSI_3_4h"] > 60.0) | (df["RSI_14_1h"] < 50.0) | (df["RSI_14_4h"] < 70.0))
+          # 1h down move, 1h high, 4h & 1d overbought
+          & (
+            (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 70.0) | (df["ROC_9_4h"] < 40.0) | (df["ROC_9_1d"] < 40.0)
+          )
+          # 1h & 4h down move, 1h & 4h high
+          & (
+            (df["RSI_3_1h"] > 50.0)
+            | (df["RSI_3_4h"] > 65.0)
+            | (df["AROONU_14_1h"] < 85.0)
+            | (df["AROONU_14_4h"] < 100.0)
+          )
+          # 1h down move, 15m & 1h high
+          & ((df["RSI_3_1h"] > 50.0) | (df["AROONU_14_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+          # 1h down move, 15m & 1h high, 1d downtrend
+          & (
+            (df["RSI_3_1h"] > 60.0)
+            | (df["AROONU_14_15m"] < 65.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+            | (df["CMF_20_1d"] > -0.0)
+          )
+          # 4h down move, 15m high
+          & ((df["RSI_3_4h"] > 3.0) | (df["AROONU_14_15m"] < 50.0))
+          # 4h down move, 15m & 1h still not low enough
+          & ((df["RSI_3_4h"] > 10.0) | (df["AROONU_14_15m"] < 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 25.0))
+          # 4h down move, 1h still high, 4h downtrend
+          & ((df["RSI_3_4h"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0) | (df["CMF_20_4h"] > -0.3))
+          # 4h & 1d down move, 1h & 4h low
+          & ((df["RSI_3_4h"] > 25.0) | (df["RSI_3_1d"] > 25.0) | (df["CMF_20_1h"] > -0.3) | (df["CMF_20_4h"] > -0.4))
+          # 4h down move, 15m still high, 1d overbought
+          & ((df["RSI_3_4h"] > 55.0) | (df["AROONU_14_15m"] < 40.0) | (df["ROC_9_1d"] < 100.0))
+          # 4h & 1d down move, 4h high, 1d overbought
+          & (
+            (df["RSI_3_4h"] > 60.0) | (df["RSI_3_1d"] > 60.0) | (df["AROONU_14_4h"] < 75.0) | (df["ROC_9_1d"] < 40.0)
+          )
+          # 1d down move, 1h high
+          & ((df["RSI_3_1d"] > 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+          # 1d down move, 15m & 1h still high
+          & ((df["RSI_3_1d"] > 10.0) | (df["RSI_14_15m"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 50.0))
+          # 1d down move, 1h & 4h high
+          & ((df["RSI_3_1d"] > 10.0) | (df["AROONU_14_1h"] < 80.0) | (df["AROONU_14_4h"] < 90.0))
+          # 1d down move, 1h & 4h still high
+          & ((df["RSI_3_1d"] > 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 40.0) | (df["AROONU_14_4h"] < 40.0))
+          # 1d down move, 1h high, 1d overbought
+          & ((df["RSI_3_1d"] > 60.0) | (df["AROONU_14_1h"] < 80.0) | (df["ROC_9_1d"] < 80.0))
+          # 1d down move, 15m still high, 1d overbought
+          & ((df["RSI_3_1d"] > 65.0) | (df["AROONU_14_15m"] < 40.0) | (df["ROC_9_1d"] < 100.0))
+          # 5m still high, 1h down move, 15m still high, 1h high
+          & (
+            (df["RSI_3"] < 40.0)
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["AROONU_14_15m"] < 50.0)
+            | (df["AROONU_14_4h"] < 90.0)
+          )
+          # 5m still high, 15m high
+          & ((df["RSI_3"] < 45.0) | (df["AROONU_14_15m"] < 70.0))
+          # 5m still high, 1h down move, 4h high
+          & ((df["RSI_3"] < 50.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_4h"] < 100.0))
+          # 15m down move, 1h high
+          & ((df["RSI_14_15m"] > 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0))
+          # 15m down move, 4h & 1d high
+          & (
+            (df["RSI_14_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] < 70.0)
+          )
+          # 1h downtrend, 4h high, 1d downtrend
+          & ((df["CMF_20_1h"] > -0.2) | (df["STOCHRSIk_14_14_3_3_4h"] < 90.0) | (df["CMF_20_1d"] > -0.25))
+          # 4h top wick, 15m & 1h down move
+          & ((df["top_wick_pct_4h"] < 10.0) | (df["RSI_3_15m"] > 15.0) | (df["RSI_3_1h"] > 40.0))
+          # 4h top wick, 1h down move, 1h high
+          & ((df["top_wick_pct_4h"] < 10.0) | (df["RSI_3_1h"] > 30.0) | (df["AROONU_14_1h"] < 70.0))
+          # 1d red, 1h down move, 1h still high
+          & ((df["change_pct_1d"] > -15.0) | (df["RSI_3_1h"] > 25.0) | (df["AROONU_14_1h"] < 50.0))
+          # 1d P&D, 1h high
+          & (
+            (df["change_pct_1d"] > -15.0)
+            | (df["change_pct_1d"].shift(288) < 15.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 80.0)
+          )
+          # 1d P&D, 1d downtrend
+          & ((df["change_pct_1d"] > -5.0) | (df["change_pct_1d"].shift(288) < 30.0) | (df["CMF_20_1d"] > -0.1))
+          # 1d P&D, 15m high
+          & ((df["change_pct_1d"] > -10.0) | (df["change_pct_1d"].shift(288) < 40.0) | (df["AROONU_14_15m"] < 50.0))
+          # 1d P&D, 1h high
+          & (
+            (df["change_pct_1d"] > -10.0)
+            | (df["change_pct_1d"].shift(288) < 40.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 70.0)
+          )
+          # 1d red with top wick, 1h high
+          & ((df["change_pct_1d"] > -10.0) | (df["top_wick_pct_1d"] < 10.0) | (df["AROONU_14_1h"] < 80.0))
+          # 1d green, 4m down move, 4h high
+          & ((df["change_pct_1d"] < 25.0) | (df["RSI_3_4h"] > 50.0) | (df["AROONU_14_4h"] < 80.0))
+          # 1d green with top wick, 1d low
+          & ((df["change_pct_1d"] < 25.0) | (df["top_wick_pct_1d"] < 10.0) | (df["CMF_20_1d"] > -0.2))
+          # 1d top wick, 1h still high
+          & ((df["top_wick_pct_1d"] < 25.0) | (df["AROONU_14_1h"] < 50.0))
+          # 1d top wick, 4h still high
+          & ((df["top_wick_pct_1d"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 50.0))
+          # 1d top wick, 1h down move
+          & ((df["top_wick_pct_1d"] < 50.0) | (df["RSI_3_1h"] > 30.0))
+          # big drop in the last 12 days, 1h down move, 1h high
+          & ((df["close"] > (df["high_max_12_1d"] * 0.35)) | (df["RSI_3_1h"] > 35.0) | (df["AROONU_14_1h"] < 70.0))
+          # big drop in the last 20 days, 1h down move, 1h high
+          & (
+            (df["close"] > (df["high_max_20_1d"] * 0.30))
+            | (df["RSI_3_1h"] > 30.0)
+            | (df["STOCHRSIk_14_14_3_3_1h"] < 75.0)
+          )
+        )
+
+        # Logic
+        long_entry_logic.append(
+          (df["RSI_14"] < 30.0)
+          & (df["AROONU_14"] < 25.0)
+          & (df["AROOND_14"] > 75.0)
+          & (df["STOCHRSIk_14_14_3_3"] < 20.0)
+          & (df["EMA_9"] < (df["EMA_26"] * 0.982))
+          & (df["close"] < df["SMA_9"])
+        )
+
+      ###############################################################################################
+
+      # LONG ENTRY CONDITIONS ENDS HERE
+
+      ###############################################################################################
+
+      long_entry_logic.append(df["volume"] > 0)
+      item_long_entry = reduce(lambda x, y: x & y, long_entry_logic)
+      df.loc[item_long_entry, "enter_tag"] += f"{long_entry_condition_index} "
+      long_entry_conditions.append(item_long_entry)
+      df.loc[:, "enter_long"] = item_long_entry
+
+  if long_entry_conditions:
+    df.loc[:, "enter_long"] = reduce(lambda x, y: x | y, long_entry_conditions)
+
+  ###############################################################################################
+
+  # SHORT ENTRY CONDITIONS STARTS HERE
+
+  ###############################################################################################
+
+  #   ______  __    __  ______  _______ ________        ________ __    __ ________ ________ _______
+  #  /      \|  \  |  \/      \|       |        \      |        |  \  |  |        |        |       \
+  # |  $$$$$$| $$  | $|  $$$$$$| $$$$$$$\$$$$$$$$      | $$$$$$$| $$\ | $$\$$$$$$$| $$$$$$$| $$$$$$$\
+  # | $$___\$| $$__| $| $$  | $| $$__| $$ | $$         | $$__   | $$$\| $$  | $$  | $$__   | $$__| $$
+  #  \$$    \| $$    $| $$  | $| $$    $$ | $$         | $$  \  | $$$$\ $$  | $$  | $$  \  | $$    $$
+  #  _\$$$$$$| $$$$$$$| $$  | $| $$$$$$$\ | $$         | $$$$$  | $$\$$ $$  | $$  | $$$$$  | $$$$$$$\
+  # |  \__| $| $$  | $| $$__/ $| $$  | $$ | $$         | $$_____| $$ \$$$$  | $$  | $$_____| $$  | $$
+  #  \$$    $| $$  | $$\$$    $| $$  | $$ | $$         | $$     | $$  \$$$  | $$  | $$     | $$  | $$
+  #   \$$$$$$ \$$   \$$ \$$$$$$ \$$   \$$  \$$          \$$$$$$$$\$$   \$$   \$$   \$$$$$$$$\$$   \$$
+  #
+
+  for enabled_short_entry_signal in self.short_entry_signal_params:
+    short_entry_condition_index = int(enabled_short_entry_signal.split("_")[3])
+    item_short_buy_protection_list = [True]
+    if self.short_entry_signal_params[f"{enabled_short_entry_signal}"]:
+      # Short Entry Conditions Starts Here
+      # -----------------------------------------------------------------------------------------
+      # IMPORTANT: Short Condition Descriptions are not for shorts. These are for longs but completely mirrored opposite side
+      # Please dont change these comment descriptions. With these descriptions we are comparing long/short positions.
+
+      short_entry_logic = []
+      short_entry_logic.append(reduce(lambda x, y: x & y, item_short_buy_protection_list))
+
+      # Condition #501 - Normal mode (Short).
+      if short_entry_condition_index == 501:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        short_entry_logic.append(df["protections_short_global"] == True)
+        short_entry_logic.append(df["global_protections_short_pump"] == True)
+        short_entry_logic.append(df["global_protections_short_dump"] == True)
+
+        short_entry_logic.append(df["RSI_3_1h"] >= 5.0)
+        short_entry_logic.append(df["RSI_3_4h"] >= 20.0)
+        short_entry_logic.append(df["RSI_3_1d"] >= 20.0)
+        short_entry_logic.append(df["RSI_14_1h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_4h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_1d"] > 10.0)
+        # 5m up move, 4h still low
+        short_entry_logic.append((df["RSI_3"] < 97.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0))
+        # 5m & 15m strong up move
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_15m"] < 95.0))
+        # 5m & 1h up move, 1d uptrend
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["ROC_9_1d"] < 100.0))
+        # 5m up move, 15m & 1h still not high enough
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["AROOND_14_15m"] < 25.0) | (df["AROOND_14_1h"] < 25.0))
+        # 4m up move, 1h & 4h still low
+        short_entry_logic.append(
+          (df["RSI_3"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 4m & 1h up move, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["RSI_3_1h"] < 80.0) | (df["AROONU_14_4h"] > 20.0))
+        # 5m up move, 15m & 1h uptrend
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["CMF_20_15m"] < 0.30) | (df["CMF_20_1h"] < 0.30))
+        # 5m up move, 15m stil low
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["AROONU_14_15m"] > 50.0))
+        # 5m up move, 15m & 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 15m up move, 1h low
+        short_entry_logic.append((df["RSI_3_15m"] < 97.0) | (df["AROONU_14_1h"] > 30.0))
+        # 15m & 1h up move, 4h still going up
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["CCI_20_change_pct_4h"] < -0.0)
+        )
+        # 15m & 1h up move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m & 1h up move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h up move, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 4h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 15m up move, 15m stil not high enough, 1h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 10.0)
+        )
+        # 15m up move, 1h still not high enough, 4h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["AROONU_14_4h"] > 20.0)
+        )
+        # 15m up move, 1h & 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["AROONU_14_4h"] > 70.0))
+        # 15m up move, 1h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_change_pct_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 1h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 15m & 1h up move, 1h not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["AROOND_14_1h"] < 50.0))
+        # 15m & 1h up move, 1d stil not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["RSI_14_1h"] > 80.0))
+        # 15m & 1h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0)
+        )
+        # 15m & 4h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 15m & 4h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+        )
+        # 15m & 4h up move, 1d low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 20.0)
+        )
+        # 15m & 4h up move, 4h not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["AROOND_14_4h"] < 50.0))
+        # 15m & 4h up move, 1h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0)
+        )
+        # 15m & 4h up move, 4h low
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 60.0) | (df["AROONU_14_4h"] > 30.0))
+        # 15m up move, 1h & 4h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["AROONU_14_1h"] > 40.0) | (df["AROONU_14_4h"] > 10.0)
+        )
+        # 15m up move, 1h still low, 4h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["AROONU_14_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m up move, 1h low, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 15m & 1h up move, 4h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
+        )
+        # 15m & 1h up move, 1d still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 60.0)
+        )
+        # 15m & 1h up move, 1h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 15m & 1h up move, 4h low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m & 4h down move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 15m & 4h up move, 15m low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0)
+        )
+        # 15m & 1h up move, 1h still not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 80.0) | (df["RSI_3_1h"] < 70.0) | (df["AROONU_14_1h"] > 60.0))
+        # 15m & 4h up move, 15m still low
+        short_entry_logic.append((df["RSI_3_15m"] < 80.0) | (df["RSI_3_4h"] < 80.0) | (df["AROONU_14_15m"] > 50.0))
+        # 15m up move, 15m still not high enough, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0))
+        # 1h & 4h up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["UO_7_14_28_4h"] > 60.0))
+        # 1h & 4h up move, 4h still low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h up move, 4h uptrend
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 85.0) | (df["ROC_9_4h"] < 40.0))
+        # 1h & 1d strong up move
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_1d"] < 95.0))
+        # 1h & 4h strong up move
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["MFI_14_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0))
+        # 1h strong up move, 15m still move higher
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["CCI_20_change_pct_15m"] < -0.0))
+        # 1h & 4h up move, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 1h & 4h up move, 1d still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 70.0)
+        )
+        # 1h up move, 1h still not high enough, 1d low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0)
+        )
+        # 1h up move, 15m & 4h still low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h up move, 15m still not high enough
+        short_entry_logic.append((df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 85.0) | (df["AROOND_14_15m"] < 50.0))
+        # 1h & 4h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0)
+        )
+        # 1h up move, 15m still not high enough, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 1h up move, 1h still low
+        short_entry_logic.append((df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 40.0))
+        # 4h & 1d strong up move
+        short_entry_logic.append((df["RSI_3_4h"] < 95.0) | (df["RSI_3_1d"] < 95.0))
+        # 4h up move, 15m still low, 1h not high enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["AROOND_14_1h"] < 25.0)
+        )
+        # 4h up move, 1h still low
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["AROONU_14_1h"] > 40.0))
+        # 1d up move, 1h & 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1d"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h uptrend, 4h still low
+        short_entry_logic.append(
+          (df["CMF_20_15m"] < 0.30) | (df["CMF_20_1h"] < 0.30) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 5m green, 15m still not high enough
+        short_entry_logic.append((df["change_pct"] < 5.0) | (df["AROOND_14_15m"] < 50.0))
+        # 5m green, 15m still not high enough
+        short_entry_logic.append((df["change_pct"] < 5.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0))
+        # big pump in the last 4 hours, 15m still low
+        short_entry_logic.append((df["close"] < (df["close_min_48"] * 1.50)) | (df["AROONU_14_15m"] > 50.0))
+
+        # Logic
+        short_entry_logic.append(df["EMA_12"] > df["EMA_26"])
+        short_entry_logic.append((df["EMA_12"] - df["EMA_26"]) > (df["open"] * 0.030))
+        short_entry_logic.append((df["EMA_12"].shift() - df["EMA_26"].shift()) > (df["open"] / 100.0))
+        short_entry_logic.append(df["close"] > (df["BBU_20_2.0"] * 1.004))
+
+      # Condition #502 - Normal mode (Short).
+      if short_entry_condition_index == 502:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        short_entry_logic.append(df["protections_short_global"] == True)
+
+        # 5m & 15m & 1h & 4h up move
+        short_entry_logic.append(
+          (df["RSI_3"] < 97.0) | (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 80.0)
+        )
+        # 5m & 4h up move
+        short_entry_logic.append((df["RSI_3"] < 97.0) | (df["RSI_3_4h"] < 95.0))
+        # 5m up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3"] < 97.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0))
+        # 5m & 15m strong up move
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_15m"] < 95.0))
+        # 5m & 15m up move, 4h low
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_15m"] < 90.0) | (df["AROONU_14_4h"] > 30.0))
+        # 5m & 1h & 4h down move
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0))
+        # 5m & 1h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0)
+        )
+        # 5m up move, 15m still low
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0))
+        # 5m up move, 4h low
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["AROONU_14_4h"] > 20.0))
+        # 15m & 1h down move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 97.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m up move, 1h still low
+        short_entry_logic.append((df["RSI_3_15m"] < 97.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0))
+        # 15m & 1h & 4h up move
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 85.0))
+        # 15m & 1h up move, 4h still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 15m up move, 1h still low
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 40.0))
+        # 15m up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["AROONU_14_4h"] > 70.0))
+        # 15m & 1h & 4h up move
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0))
+        # 15m & 1h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
+        )
+        # 15m & 1h up move, 1d low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 40.0)
+        )
+        # 15m & 1h up move, 1h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 15m & 4h up move, 1d low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0)
+        )
+        # 15m up move, 1h still low
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0))
+        # 15m & 1h up move, 1h still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
+        )
+        # 15m up move, 1h low
+        short_entry_logic.append((df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0))
+        # 15m up move, 1h low
+        short_entry_logic.append((df["RSI_3_15m"] < 80.0) | (df["AROONU_14_1h"] > 10.0))
+        # 15m up move, 4h still low
+        short_entry_logic.append((df["RSI_3_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0))
+        # 1h & 1d strong up move
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_1d"] < 95.0))
+        # 1h up move, 1h still not high enough
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0))
+        # 1h up move, 4h still low, 1h moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h up move, 1d low
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_14_1d"] > 40.0))
+        # 1h strong up move, 15m still move higher
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["CCI_20_change_pct_15m"] < -0.0))
+        # 1h up move, relative stable before the hour
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["close_min_12"] > (df["close_min_48"] * 1.10)))
+        # 1h up move, 1d low
+        short_entry_logic.append((df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 10.0))
+        # 1h up move, 4h still low
+        short_entry_logic.append((df["RSI_3_1h"] < 85.0) | (df["AROONU_14_4h"] > 50.0))
+        # 1h up move, 1h still not high enough
+        short_entry_logic.append((df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0))
+        # 1h up move, 4h still low, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["RSI_14_4h"] > 60.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 80.0) | (df["AROONU_14_4h"] > 10.0))
+        # 1h up move, 1h still low
+        short_entry_logic.append((df["RSI_3_1h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0))
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 70.0) | (df["RSI_14_4h"] > 40.0))
+        # 1h up move, 1h low
+        short_entry_logic.append((df["RSI_3_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0))
+        # 4h up move, 1d still low
+        short_entry_logic.append((df["RSI_3_4h"] < 97.0) | (df["RSI_14_1d"] > 50.0))
+        # 4h up move, 1h still not high enough
+        short_entry_logic.append((df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0))
+        # 4h up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0))
+        # 4h up move, 15m still not high enough, 4h moving higher
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["CCI_20_change_pct_4h"] < 0.0)
+        )
+        # 4h up move, 15m still low
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0))
+        # 4h up move, 1h still low
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["AROONU_14_1h"] > 40.0))
+        # 4h up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0))
+        # 4h up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0))
+        # 4h up move, 1h low
+        short_entry_logic.append((df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0))
+        # 1d up move, 1h still not high enough
+        short_entry_logic.append((df["RSI_3_1d"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0))
+        # 1d up move, 1h still low
+        short_entry_logic.append((df["RSI_3_1d"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0))
+        # 1d up move, 4h still low
+        short_entry_logic.append((df["RSI_3_1d"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 40.0))
+        # 15m low, 1h still low
+        short_entry_logic.append((df["AROONU_14_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0))
+        # 15m low, 4h low
+        short_entry_logic.append((df["AROONU_14_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 15m still low, 1h low
+        short_entry_logic.append((df["AROONU_14_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0))
+        # 15m still not high enough, 4h low
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["AROONU_14_4h"] > 10.0))
+        # 1h & 4h low
+        short_entry_logic.append((df["AROONU_14_1h"] > 20.0) | (df["AROONU_14_4h"] > 20.0))
+        # 1h & 4h low
+        short_entry_logic.append((df["AROONU_14_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 1h low, 1d low
+        short_entry_logic.append((df["AROONU_14_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0))
+        # 1h & 4h low
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_1h"] > 20.0) | (df["AROONU_14_4h"] > 20.0))
+        # 1d big green, 1d still not high enough
+        short_entry_logic.append((df["change_pct_1d"] < 30.0) | (df["RSI_14_1d"] > 65.0))
+        # rise in the last hour, relatively stable before the hour
+        short_entry_logic.append(
+          (df["close"] < (df["close_min_12"] * 1.10)) | (df["close_min_12"] > (df["close_min_48"] * 1.10))
+        )
+        # big pump in the last 6 days, 4h still not high enough
+        short_entry_logic.append((df["close"] < (df["low_min_6_1d"] * 4.0)) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0))
+        # big pump in the last 20 days, 1h up move
+        short_entry_logic.append((df["close"] < (df["low_min_20_1d"] * 6.0)) | (df["RSI_3_1h"] < 90.0))
+
+        # Logic
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["STOCHRSIk_14_14_3_3"] > 80.0)
+        short_entry_logic.append(df["close"] > (df["EMA_20"] * 1.060))
+        short_entry_logic.append(df["close"] > (df["BBU_20_2.0"] * 0.995))
+        short_entry_logic.append(df["AROOND_14_15m"] < 25.0)
+
+      # Condition #503 - Normal mode (Short).
+      if short_entry_condition_index == 503:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        short_entry_logic.append(df["RSI_3_1h"] >= 5.0)
+        short_entry_logic.append(df["RSI_3_4h"] >= 20.0)
+        short_entry_logic.append(df["RSI_3_1d"] >= 20.0)
+        short_entry_logic.append(df["RSI_14_1h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_4h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_1d"] > 10.0)
+        # 5m strong down move
+        short_entry_logic.append((df["RSI_3"] < 98.0) | (df["ROC_9"] < 50.0))
+        # 5m down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["MFI_14"] > 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 5m & 1h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 5m down move, 4h downtrend, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3"] < 95.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 5m & 4h strong down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 5m down move, 1h high, 1d overbought
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["ROC_9_1h"] < 15.0) | (df["ROC_9_1d"] > -40.0))
+        # 5m down move, 1h & 4h high
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["UO_7_14_28_1h"] > 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 5m down move, 1h high, 4h downtrend
+        short_entry_logic.append(
+          (df["RSI_3"] < 98.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 10.0) | (df["ROC_9_4h"] < 10.0)
+        )
+        # 5m & 1h down move, 4h down
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["RSI_3_1h"] < 85.0) | (df["CMF_20_4h"] > -0.2))
+        # 5m down move, 1h high
+        short_entry_logic.append((df["RSI_14_change_pct"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0))
+        # 5m down move, 1h high
+        short_entry_logic.append((df["RSI_14_change_pct"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0))
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 15m still not low enough, 1h & 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0)
+          | (df["AROOND_14_15m"] < 25.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+          | (df["MFI_14_4h"] > 50.0)
+        )
+        # 5m & 1h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 4h down move, 1h still not low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 15m & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 15m down move, 1h & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["RSI_14_4h"] > 50.0)
+        )
+        # 15m & 1h & 4h down move
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_change_pct_1h"] > -60.0) | (df["RSI_3_change_pct_4h"] > -40.0)
+        )
+        # 15m down move, 1d downtrend, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["ROC_9_1d"] > -25.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 15m & 1d down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1d"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 15m & 4h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m down move, 15m still not low enough, 4h down move
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["AROOND_14_15m"] < 50.0) | (df["RSI_3_4h"] < 85.0))
+        # 15m down move, 1h still high, 1d strong downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 80.0) | (df["AROOND_14_1h"] < 25.0) | (df["MFI_14_1d"] < 90.0))
+        # 15m down move, 1h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m down move, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m & 4h down move, 1d downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 85.0) | (df["ROC_9_1d"] > -70.0))
+        # 15m down move, 15m not low enough, 1h overbought
+        short_entry_logic.append(
+          (df["RSI_14_change_pct_15m"] > -40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 90.0) | (df["RSI_14_1h"] > 30.0)
+        )
+        # 15m strong down move, 1h still high
+        short_entry_logic.append((df["ROC_9_15m"] < 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0))
+        # 15m downtrend, 1h & 4h still high
+        short_entry_logic.append(
+          (df["ROC_9_15m"] < 10.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h & 4h down move
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["CCI_20_change_pct_4h"] < 0.0)
+        )
+        # 15m strong down move
+        short_entry_logic.append((df["RSI_3_15m"] < 90.0) | (df["MFI_14_15m"] < 85.0) | (df["AROOND_14_15m"] < 25.0))
+        # 14m down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 80.0) | (df["AROOND_14_15m"] < 50.0) | (df["UO_7_14_28_4h"] > 50.0)
+        )
+        # 15m down move, 1h stil high, 1d overbought
+        short_entry_logic.append((df["RSI_3_15m"] < 85.0) | (df["AROOND_14_1h"] < 25.0) | (df["ROC_9_1d"] > -80.0))
+        # 15m down move, 1h high, 1d overbought
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["ROC_9_1d"] > -50.0)
+        )
+        # 1h & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_change_pct_4h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] < 10.0)
+        )
+        # 1h down move, 4h still not low enough, 1d overbought
+        short_entry_logic.append((df["RSI_3_1h"] < 90.0) | (df["AROOND_14_4h"] < 25.0) | (df["ROC_9_1d"] > -120.0))
+        # 1h down move, 1h still not low enough, 4h still not low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["RSI_14_4h"] > 50.0)
+        )
+        # 1h down move, 4h still high
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_14_4h"] > 60.0))
+        # 1h down move, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 1h down move, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_change_pct_1h"] > -65.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 4h & 1d down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 90.0) | (df["ROC_2_1d"] < 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m still high, 1h down move, 4h high
+        short_entry_logic.append(
+          (df["AROOND_14_15m"] < 50.0) | (df["RSI_3_change_pct_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m still high, 1h & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["AROOND_14_15m"] < 50.0)
+          | (df["RSI_3_1h"] < 85.0)
+          | (df["RSI_3_4h"] < 80.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m & 1h still high, 4h overbought
+        short_entry_logic.append(
+          (df["AROOND_14_15m"] < 50.0) | (df["AROOND_14_1h"] < 50.0) | (df["ROC_9_4h"] > -40.0)
+        )
+        # 15m still high, 1h down move, 1d downtrend
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["RSI_3_4h"] < 90.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 1h & 4h still high, 1d strong down move
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["UO_7_14_28_4h"] > 55.0) | (df["RSI_3_1d"] < 90.0)
+        )
+        # 1h still high, 4h & 1d downtrend
+        short_entry_logic.append((df["AROOND_14_1h"] < 25.0) | (df["ROC_9_4h"] < 20.0) | (df["ROC_9_1d"] < 50.0))
+        # 4h moving down, 1d P&D
+        short_entry_logic.append(
+          (df["ROC_9_4h"] < 30.0) | (df["RSI_3_change_pct_1d"] < 50.0) | (df["ROC_9_1d"] > -50.0)
+        )
+        # 1d strong downtrend, 4h still high
+        short_entry_logic.append(
+          (df["ROC_2_1d"] < 20.0) | (df["ROC_9_1d"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 1d P&D, 1d overbought
+        short_entry_logic.append(
+          (df["ROC_2_1d"] < 10.0) | (df["ROC_9_1d"] > -50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 5.0)
+        )
+        # 1h red, previous 1h green, 1h overbought
+        short_entry_logic.append(
+          (df["change_pct_1h"] < 1.0) | (df["change_pct_1h"].shift(12) > -5.0) | (df["RSI_14_1h"].shift(12) < 80.0)
+        )
+        # 1h red, 1h stil high, 4h downtrend
+        short_entry_logic.append(
+          (df["change_pct_1h"] < 5.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["ROC_9_4h"] > -25.0)
+        )
+        # 4h red, 15m down move, 4h still high
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 5.0) | (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 4h red, previous 4h green, 4h overbought
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 5.0) | (df["change_pct_4h"].shift(48) > -5.0) | (df["ROC_9_4h"].shift(48) > -25.0)
+        )
+        # 4h red, 4h still not low enough, 1h downtrend, 1h overbought
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 10.0)
+          | (df["AROOND_14_4h"] < 25.0)
+          | (df["ROC_9_1h"] < 20.0)
+          | (df["ROC_9_1d"] > -40.0)
+        )
+        # 4h red, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 10.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0) | (df["ROC_9_1d"] < 40.0)
+        )
+        # 1d P&D, 1d overbought
+        short_entry_logic.append(
+          (df["change_pct_1d"] < 10.0) | (df["change_pct_1d"].shift(288) > -10.0) | (df["ROC_9_1d"] > -100.0)
+        )
+        # 1d P&D, 4h still high
+        short_entry_logic.append(
+          (df["change_pct_1d"] < 15.0) | (df["change_pct_1d"].shift(288) > -15.0) | (df["AROOND_14_4h"] < 50.0)
+        )
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 95.0) | (df["CCI_20_change_pct_4h"] < 0.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["RSI_20"] > df["RSI_20"].shift(1))
+        short_entry_logic.append(df["RSI_4"] > 54.0)
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["close"] > df["SMA_16"] * 1.058)
+
+      # Condition #504 - Normal mode (Short).
+      if short_entry_condition_index == 504:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        short_entry_logic.append(df["RSI_3_1h"] >= 5.0)
+        short_entry_logic.append(df["RSI_3_4h"] >= 20.0)
+        short_entry_logic.append(df["RSI_3_1d"] >= 20.0)
+        short_entry_logic.append(df["RSI_14_1h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_4h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_1d"] > 10.0)
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0)
+          | (df["MFI_14_15m"] < 90.0)
+          | (df["RSI_3_1h"] < 80.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["MFI_14_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 14m & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 15m down move, 1h & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["UO_7_14_28_1h"] < 45.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 1h strong down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_14_change_pct_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 1h strong down move, 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_change_pct_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 75.0) | (df["AROOND_14_4h"] < 50.0))
+        # 15m down move, 1h strong downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["MFI_14_1h"] > 5.0))
+        # 15m downtrend, 4h down move, 4h stil high
+        short_entry_logic.append(
+          (df["ROC_9_15m"] > -20.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["AROOND_14_15m"] < 25.0)
+        short_entry_logic.append(df["close"] > (df["EMA_9"] * 1.058))
+        short_entry_logic.append(df["close"] > (df["EMA_20"] * 1.040))
+
+      # Condition #541 - Quick mode (Short).
+      if short_entry_condition_index == 541:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        # 5m & 15m down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3"] < 95.0) | (df["RSI_3_change_pct_15m"] < 50.0) | (df["RSI_14_4h"] > 50.0)
+        )
+        # 5m & 15m & 1h down move
+        short_entry_logic.append((df["RSI_3"] < 95.0) | (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0))
+        # 5m strong down move
+        short_entry_logic.append((df["RSI_3"] < 98.0) | (df["ROC_9"] < 50.0))
+        # 15m & 1h strong down move & downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["MFI_14_1h"] > 5.0))
+        # 15m strong down move, 4h high
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0))
+        # 15m & 1h down move
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["CCI_20_change_pct_1h"] > 0.0)
+        )
+        # 15m & 1h down move, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_change_pct_1h"] < 50.0) | (df["MFI_14_4h"] > 50.0)
+        )
+        # 15m strong down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["MFI_14_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 1h down move, 1h not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 15m down move, 1h strong down move
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_14_change_pct_1h"] < 70.0))
+        # 15m down move, 4h & 1d downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["ROC_9_4h"] < 30.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m down move, 1h strong down move, 4h stil high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 1h & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 1h downtrend, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["ROC_9_1h"] < 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m down move, 1h down move, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_change_pct_1h"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 1m down move, 1h still dropping, 4h overbought
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["CCI_20_change_pct_1h"] < 0.0) | (df["RSI_14_4h"] > 20.0)
+        )
+        # 15m down move, 1h high
+        short_entry_logic.append((df["RSI_3_change_pct_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 10.0))
+        # 1h strong down move, 4h high
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0))
+        # 1h down move, 4h downtrend, 4h not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["CMF_20_4h"] > -0.25) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 1h down move, 4h high, 1d overbought
+        short_entry_logic.append((df["RSI_3_1h"] < 90.0) | (df["RSI_14_4h"] > 40.0) | (df["ROC_9_1d"] > -50.0))
+        # 1h down move, 4h strong down move
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_14_change_pct_4h"] < 40.0))
+        # 1h & 4h down move, 4h still going down
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["CCI_20_change_pct_4h"] < 0.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_change_pct_4h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 1h down move, 4h down move, 4h P&D
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_change_pct_4h"] < 70.0) | (df["RSI_14_4h"].shift(48) > 30.0)
+        )
+        # 1h & 4h down move, 4h still not low enough, 1d still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0)
+          | (df["RSI_3_change_pct_4h"] < 50.0)
+          | (df["AROOND_14_4h"] < 25.0)
+          | (df["STOCHRSIk_14_14_3_3_1d"] > 60.0)
+        )
+        # 1h down move, 1h still high, 1d going down
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["ROC_2_1d"] > -50.0)
+        )
+        # 4h downtrend, 4h still high, 1d strong downtrend
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0) | (df["ROC_9_1d"] < 60.0)
+        )
+        # 15m down move, 1h strong down move, 1d overbought
+        short_entry_logic.append(
+          (df["MFI_14_15m"] < 80.0) | (df["RSI_3_change_pct_1h"] < 80.0) | (df["ROC_9_1d"] > -50.0)
+        )
+        # 1h not low enough, 4h high, 1d strong downtrend
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0) | (df["ROC_9_1d"] < 60.0)
+        )
+        # 1h down move, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_change_pct_1h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 15m strong down move, 1h still high
+        short_entry_logic.append((df["ROC_9_15m"] < 15.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0))
+        # 15m downtrend, 4h down move, 4h stil high
+        short_entry_logic.append(
+          (df["ROC_9_15m"] < 15.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 1h downtrend, 4h overbought
+        short_entry_logic.append((df["ROC_2_1h"] < 5.0) | (df["RSI_14_4h"] > 20.0) | (df["ROC_9_4h"] > -25.0))
+        # 1h P&D, 4h still high
+        short_entry_logic.append(
+          (df["ROC_2_1h"] < 10.0) | (df["ROC_9_1h"] > -5.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 1h downtrend, 4h down move, 1d downtrend
+        short_entry_logic.append((df["ROC_9_1h"] < 40.0) | (df["RSI_3_4h"] < 90.0) | (df["ROC_9_1d"] < 50.0))
+        short_entry_logic.append((df["ROC_9_4h"] > -200.0) | (df["RSI_14_4h"] > 20.0))
+        # 4h down move, 1d P&D
+        short_entry_logic.append((df["ROC_9_4h"] < 20.0) | (df["ROC_2_1d"] < 20.0) | (df["ROC_9_1d"] > -50.0))
+        # 1h P&D, 4h overbought
+        short_entry_logic.append(
+          (df["change_pct_1h"] < 2.0) | (df["change_pct_1h"].shift(12) > 2.0) | (df["RSI_14_4h"] > 20.0)
+        )
+        # 1h P&D, 1d overbought
+        short_entry_logic.append(
+          (df["change_pct_1h"] < 5.0) | (df["change_pct_1h"].shift(12) > -5.0) | (df["ROC_9_1d"] > -100.0)
+        )
+        # 1h & 4h red, 1h not low enough
+        short_entry_logic.append(
+          (df["change_pct_1h"] < 10.0) | (df["change_pct_4h"] < 10.0) | (df["MFI_14_1h"] > 50.0)
+        )
+        # 1h red, 1h still not low enough, 1d down move
+        short_entry_logic.append((df["change_pct_1h"] < 15.0) | (df["MFI_14_1h"] > 50.0) | (df["RSI_3_1d"] < 90.0))
+        # 4h red, previous 4h green, 4h overbought
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 5.0) | (df["change_pct_4h"].shift(48) > -5.0) | (df["RSI_14_4h"].shift(48) > 20.0)
+        )
+        # 1d P&D, 1d overbought
+        short_entry_logic.append(
+          (df["change_pct_1d"] < 10.0) | (df["change_pct_1d"].shift(288) > -10.0) | (df["ROC_9_1d"] > -100.0)
+        )
+        # 1d P&D, 4h still high
+        short_entry_logic.append(
+          (df["change_pct_1d"] < 15.0) | (df["change_pct_1d"].shift(288) > -15.0) | (df["AROOND_14_4h"] < 50.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["RSI_14"] > 64.0)
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["AROONU_14"] > 75.0)
+        short_entry_logic.append(df["EMA_9"] > (df["EMA_26"] * 1.040))
+
+      # Condition #542 - Quick mode (Short).
+      if short_entry_condition_index == 542:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+        short_entry_logic.append(df["protections_short_global"] == True)
+
+        # 5m & 15m up move, 15m stil low
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["RSI_3_15m"] < 80.0) | (df["AROONU_14_15m"] > 60.0))
+        # 15m & 1h up move, 4h still low
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["RSI_14_4h"] > 60.0))
+        # 15m & 1h up move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m & 1h up move, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 15m & 4h up move, 4h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 95.0) | (df["CCI_20_change_pct_4h"] < -0.0)
+        )
+        # 15m up move, 15m still not high enough, 1d uptrend
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["ROC_9_1d"] < 80.0)
+        )
+        # 15m & 4h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0)
+        )
+        # 15m & 4h up move, 4h still not high enough
+        short_entry_logic.append((df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 80.0) | (df["RSI_14_4h"] > 60.0))
+        # 15m up move, 15m still not high enough, 4h still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["AROONU_14_4h"] > 50.0)
+        )
+        # 15m & 1h up move, 15m still low
+        short_entry_logic.append((df["RSI_3_15m"] < 70.0) | (df["RSI_3_1h"] < 70.0) | (df["AROONU_14_15m"] > 40.0))
+        # 15m & 1h up move, 15m still low
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 40.0)
+        )
+        # # 15m & 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_15m"] < 70.0) | (df["RSI_3_1h"] < 60.0) | (df["AROONU_14_4h"] > 40.0))
+        # 1h & 1d up move, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 97.0) | (df["RSI_3_1d"] < 95.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h & 4h up move, 15m still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0)
+        )
+        # 1h & 4h up move, 1d uptrend
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["ROC_9_1d"] < 100.0))
+        # 1h & 4h up move, 1d still low
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 85.0) | (df["RSI_14_1d"] > 50.0))
+        # 1h up move, 4h still low, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_14_4h"] > 60.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["AROONU_14_4h"] > 10.0))
+        # 1h & 4h up move, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h & 4h up move, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 1h & 1d up move, 15m still low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_1d"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0)
+        )
+        # 1h up move, 4h low
+        short_entry_logic.append((df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0))
+        # 1h up move, 4h still low, 1h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0) | (df["CCI_20_change_pct_1h"] < -0.0)
+        )
+        # 1h & 4h up move, 4h still moving higher
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 80.0) | (df["CCI_20_change_pct_4h"] < -0.0)
+        )
+        # 1h up move, 15m low
+        short_entry_logic.append((df["RSI_3_1h"] < 85.0) | (df["AROONU_14_15m"] > 40.0))
+        # 1h up move, 4h still not high enough, 1d low
+        short_entry_logic.append((df["RSI_3_1h"] < 85.0) | (df["AROONU_14_4h"] > 80.0) | (df["RSI_14_1d"] > 40.0))
+        # 4h up move, 1d low
+        short_entry_logic.append((df["RSI_3_4h"] < 95.0) | (df["RSI_14_1d"] > 40.0))
+        # 4h down move, 15m still not high enough, 1d low
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["AROOND_14_1d"] < 75.0)
+        )
+        # 4h up move, 15m low
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 45.0))
+        # 4h up move, 15m still not high enough
+        short_entry_logic.append((df["RSI_3_4h"] < 85.0) | (df["AROONU_14_15m"] > 60.0))
+        # 4h up move, 15m low
+        short_entry_logic.append((df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 30.0))
+        # 4h up move, 15m still low, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["AROONU_14_4h"] > 80.0)
+        )
+        # 4h up move, 15m still low, 4h still not high enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 1d up move, 4h low
+        short_entry_logic.append((df["RSI_3_1d"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 40.0))
+        # 15m & 4h still not high enough
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0))
+        # 1d bot wick, 4h still not high enough
+        short_entry_logic.append((df["bot_wick_pct_1d"] < 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0))
+        # rise in the last 12 hours, relatively stable before the 12 hours
+        short_entry_logic.append(
+          (df["close"] < (df["low_min_12_1h"] * 1.30)) | (df["low_min_12_1h"] > (df["low_min_24_1h"] * 1.10))
+        )
+        # big pump in the last 30 days, 4h up move
+        short_entry_logic.append((df["close"] < (df["low_min_30_1d"] * 4.0)) | (df["RSI_3_4h"] < 85.0))
+
+        # Logic
+        short_entry_logic.append(df["WILLR_14"] > -50.0)
+        short_entry_logic.append(df["AROONU_14"] > 75.0)
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["STOCHRSIk_14_14_3_3"] > 80.0)
+        short_entry_logic.append(df["WILLR_84_1h"] > -30.0)
+        short_entry_logic.append(df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        short_entry_logic.append(df["BBB_20_2.0_1h"] > 20.0)
+        short_entry_logic.append(df["close_min_48"] <= (df["close"] * 0.90))
+
+      # Condition #543 - Rapid mode (Short).
+      if short_entry_condition_index == 543:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        short_entry_logic.append(df["RSI_14_1h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_4h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_1d"] > 10.0)
+        # 5m strong down move
+        short_entry_logic.append((df["RSI_3"] < 98.0) | (df["ROC_9"] < 50.0))
+        # 15m down move, 1h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_change_pct_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m down move, 1h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_change_pct_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 5m down move, 1h down, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["CMF_20_1h"] < 0.2) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 1h still not low enough, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["AROOND_14_1h"] < 25.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 15m down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["OBV_change_pct_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 5m & 1h strong down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 5m & 1h strong downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["MFI_14_1h"] < 90.0))
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0)
+          | (df["RSI_3_1h"] < 80.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+          | (df["AROOND_14_4h"] < 50.0)
+        )
+        # 15m & 1h down move, 4h still high, 4h downtrend
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["UO_7_14_28_4h"] > 60.0) | (df["ROC_9_4h"] < 20.0)
+        )
+        # 15m & 1h down move, 1d strong downtrend
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 90.0) | (df["ROC_9_1d"] < 50.0))
+        # 15m & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 55.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 15m & 1h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 15m down move, 15m still not low enoug, 1h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["AROOND_14_15m"] < 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 10.0)
+        )
+        # 15m down move, 1h downtrend, 4h overbought
+        short_entry_logic.append((df["RSI_3_15m"] < 85.0) | (df["ROC_9_1h"] < 5.0) | (df["ROC_9_4h"] > -35.0))
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 1h & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_change_pct_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_change_pct_4h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 1h down move, 1h still not low enough, 4h still not low
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["RSI_14_4h"] > 50.0)
+        )
+        # 1h down move, 1h not low enough, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["AROOND_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 4h down move, 15m still not low enough, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 4h down move, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 4h & 1d down move, 1d strong downtrend
+        short_entry_logic.append((df["RSI_3_4h"] < 90.0) | (df["RSI_3_1d"] < 90.0) | (df["ROC_9_1d"] < 60.0))
+        # 4h overbought, 1h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["ROC_9_4h"] > -50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["ROC_9_1d"] < 50.0)
+        )
+        # 4h red, previous 4h green, 4h overbought
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 5.0) | (df["change_pct_4h"].shift(48) > -5.0) | (df["RSI_14_4h"].shift(48) > 20.0)
+        )
+        # 4h red, 4h moving down, 4h still high, 1d downtrend
+        short_entry_logic.append(
+          (df["change_pct_4h"] < 10.0)
+          | (df["CCI_20_change_pct_4h"] < 0.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+          | (df["ROC_9_1d"] < 40.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["RSI_14"] > 60.0)
+        short_entry_logic.append(df["MFI_14"] > 60.0)
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["EMA_26"] < df["EMA_12"])
+        short_entry_logic.append((df["EMA_26"] - df["EMA_12"]) > (df["open"] * 0.024))
+        short_entry_logic.append((df["EMA_26"].shift() - df["EMA_12"].shift()) > (df["open"] / 100.0))
+        short_entry_logic.append(df["close"] < (df["EMA_20"] * 0.958))
+        short_entry_logic.append(df["close"] < (df["BBL_20_2.0"] * 0.992))
+
+      # # Condition #620 - Grind mode (Short).
+      # if short_entry_condition_index == 620:
+      #   # Protections
+      #   short_entry_logic.append(num_open_short_grind_mode < self.grind_mode_max_slots)
+      #   short_entry_logic.append(is_pair_short_grind_mode)
+      #   short_entry_logic.append(df["RSI_3"] <= 40.0)
+      #   short_entry_logic.append(df["RSI_3_15m"] >= 10.0)
+      #   short_entry_logic.append(df["RSI_3_1h"] >= 5.0)
+      #   short_entry_logic.append(df["RSI_3_4h"] >= 5.0)
+      #   short_entry_logic.append(df["RSI_14_1h"] < 85.0)
+      #   short_entry_logic.append(df["RSI_14_4h"] < 85.0)
+      #   short_entry_logic.append(df["RSI_14_1d"] < 85.0)
+      #   short_entry_logic.append(df["close_max_48"] >= (df["close"] * 1.10))
+
+      #   # Logic
+      #   short_entry_logic.append(df["STOCHRSIk_14_14_3_3"] > 80.0)
+      #   short_entry_logic.append(df["WILLR_14"] > -20.0)
+      #   short_entry_logic.append(df["AROOND_14"] < 25.0)
+
+      # Condition #641 - Top Coins mode (Short).
+      if short_entry_condition_index == 641:
+        # Protections
+        short_entry_logic.append(is_pair_short_top_coins_mode)
+
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        short_entry_logic.append(df["RSI_3_1h"] >= 5.0)
+        short_entry_logic.append(df["RSI_3_4h"] >= 20.0)
+        short_entry_logic.append(df["RSI_3_1d"] >= 20.0)
+        short_entry_logic.append(df["RSI_14_1h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_4h"] > 20.0)
+        short_entry_logic.append(df["RSI_14_1d"] > 10.0)
+        # 5m down move, 1h still not low enough, 4h high
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 5m down move, 1h high, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 90.0)
+        )
+        # 15m down move, 15m still not low enough, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["AROOND_14_15m"] < 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 1h down move, 1d still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 70.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_1h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 15m down move, 1h high, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 15m & 1h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 80.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 1h still not low enough, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 1h & 4h & 1d down move
+        short_entry_logic.append((df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 90.0) | (df["RSI_3_1d"] < 80.0))
+        # 1h & 4h down move, 15m not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 75.0)
+        )
+        # 1h down move, 1h still not low enough, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+        )
+        # 1h & 4h down move, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 1h down move, 1h & 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 4h down move, 15m still high, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 4h down move, 15m & 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 15.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["RSI_20"] > df["RSI_20"].shift(1))
+        short_entry_logic.append(df["RSI_3"] > 70.0)
+        short_entry_logic.append(df["AROOND_14"] < 25.0)
+        short_entry_logic.append(df["close"] > df["SMA_16"] * 1.044)
+
+      # Condition #642 - Top Coins mode (Short).
+      if short_entry_condition_index == 642:
+        # Protections
+        short_entry_logic.append(is_pair_short_top_coins_mode)
+
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        # 5m & 1h & 4h down move
+        short_entry_logic.append((df["RSI_3"] < 90.0) | (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 90.0))
+        # 5m down move, 15m & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 5m down move, 15m still high, 1h high
+        short_entry_logic.append(
+          (df["RSI_3"] < 85.0) | (df["AROOND_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0)
+        )
+        # 15m & 1h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+        )
+        # 15m & 1h down move, 1d still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 70.0)
+        )
+        # 15m strong down move, 4h high
+        short_entry_logic.append((df["RSI_3_15m"] < 95.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 15m & 1h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 15m down move, 15m stil high, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 15m down move, 1h & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 15m & 1h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 95.0) | (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
+        )
+        # 15m down move, 4h still high, 1d high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0)
+        )
+        # 15m & 4h down move, 1d still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 85.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+        # 15m & 1h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 80.0) | (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 15m & 1h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["RSI_3_1h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 15m & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 15m down move, 1h still high, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 15m down move, 1h still not low enough, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 15m down move, 1h high, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 90.0)
+        )
+        # 15m down move, 4h high, 1d stil high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+        # 15m & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+        )
+        # 15m & 4h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["RSI_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m down move, 15m still high 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 1h still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 95.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 95.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 90.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 80.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 85.0)
+        )
+        # 1h & 4h down move, 1d still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 90.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 85.0) | (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 85.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0)
+        )
+        # 1h & 4h down move, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 1h & 4h down move, 15m still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 80.0) | (df["RSI_3_4h"] < 80.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0)
+        )
+        # 1h & 4h down move, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 75.0) | (df["RSI_3_4h"] < 90.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+        )
+        # 1h & 4h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 70.0) | (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
+        )
+        # 1h down move, 1h still not low enough, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 4h down move, 15m still high, 1h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 85.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 80.0)
+        )
+        # 4h down move, 15m still high, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 4h down move, 1h still not low enough, 1d still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 25.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+        # 15m & 1h still high, 4h high
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] > 70.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 15m still high, 1h & 1d high
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] > 60.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+          | (df["STOCHRSIk_14_14_3_3_1d"] > 30.0)
+        )
+        # 15m & 4h high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 15m high, 1h & 4h still not low enough
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_15m"] > 30.0)
+          | (df["STOCHRSIk_14_14_3_3_1h"] > 75.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 75.0)
+        )
+        # 15m & 4h high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0))
+        # 1h & 4h still high, 1d high
+        short_entry_logic.append(
+          (df["STOCHRSIk_14_14_3_3_1h"] > 70.0)
+          | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+          | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+        # 1h & 4h high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0))
+        # 1h & 4h high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_1h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0))
+        # 4h & 1d high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_4h"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 20.0))
+        # 1d red, 1d high
+        short_entry_logic.append((df["change_pct_1d"] < 5.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 20.0))
+        # 1d P&D, 1d high
+        short_entry_logic.append(
+          (df["change_pct_1d"] < 10.0)
+          | (df["change_pct_1d"].shift(288) > -10.0)
+          | (df["STOCHRSIk_14_14_3_3_1d"] > 50.0)
+        )
+
+        # Logic
+        short_entry_logic.append(df["RSI_4"] > 54.0)
+        short_entry_logic.append(df["RSI_20"] > df["RSI_20"].shift(1))
+        short_entry_logic.append(df["close"] > df["SMA_16"] * 1.042)
+
+      # Condition #661 - Scalp mode (Short).
+      if short_entry_condition_index == 661:
+        # Protections
+        short_entry_logic.append(df["num_empty_288"] <= allowed_empty_candles_288)
+
+        # 15m down move, 15m high
+        short_entry_logic.append((df["RSI_3_15m"] < 75.0) | (df["AROOND_14_15m"] < 80.0))
+        # 15m & 1h down move, 15m still high
+        short_entry_logic.append((df["RSI_3_15m"] < 70.0) | (df["RSI_3_1h"] < 40.0) | (df["AROOND_14_15m"] < 50.0))
+        # 15m down move, 15m & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m & 1h down move, 1h high
+        short_entry_logic.append((df["RSI_3_15m"] < 60.0) | (df["RSI_3_1h"] < 60.0) | (df["AROOND_14_1h"] < 70.0))
+        # 15m & 1h down move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 60.0) | (df["RSI_3_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m & 1h down move, 4h high
+        short_entry_logic.append((df["RSI_3_15m"] < 60.0) | (df["RSI_3_1h"] < 40.0) | (df["AROOND_14_4h"] < 80.0))
+        # 15m & 4h down move, 15m high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 60.0) | (df["RSI_3_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0)
+        )
+        # 15m & 4h down move, 15m high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 60.0) | (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 30.0)
+        )
+        # 15m down move, 15m & 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 60.0) | (df["AROOND_14_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 15m down move, 4h still high, 1d overbought
+        short_entry_logic.append((df["RSI_3_15m"] < 60.0) | (df["AROOND_14_4h"] < 50.0) | (df["ROC_9_1d"] > -100.0))
+        # 15m down move, 15m high, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 55.0) | (df["AROOND_14_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 15m down move, 15m & 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 55.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 55.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
+        )
+        # 15m down move, 15m still not low enough, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_15m"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 75.0) | (df["AROOND_14_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 10.0)
+        )
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 10.0)
+        )
+        # 1h & 4h down move, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 65.0) | (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
+        )
+        # 1h down move, 15m & 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 1h down move, 1h high
+        short_entry_logic.append((df["RSI_3_1h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 40.0))
+        # 1h down move, 4h & 1d high
+        short_entry_logic.append((df["RSI_3_1h"] < 60.0) | (df["AROOND_14_4h"] < 85.0) | (df["AROOND_14_1d"] < 90.0))
+        # 1h down move, 1h still high, 4h high
+        short_entry_logic.append((df["RSI_3_1h"] < 55.0) | (df["AROOND_14_1h"] < 50.0) | (df["AROOND_14_4h"] < 90.0))
+        # 1h down move, 1h high
+        short_entry_logic.append((df["RSI_3_1h"] < 55.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 40.0))
+        # 1h & 4h down move, 15m high
+        short_entry_logic.append((df["RSI_3_1h"] < 50.0) | (df["RSI_3_4h"] < 40.0) | (df["AROOND_14_15m"] < 70.0))
+        # 1h down move, 15m still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["AROOND_14_15m"] < 50.0) | (df["AROOND_14_4h"] < 80.0)
+        )
+        # 1h down move, 15m high, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["AROOND_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0)
+        )
+        # 1h down move, 15m still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 20.0)
+        )
+        # 1h down move, 15m & 1h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 40.0) | (df["AROOND_14_1h"] < 60.0)
+        )
+        # 1h down move, 1h & 1d high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["AROOND_14_1h"] < 70.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 20.0)
+        )
+        # 1h down move, 4h still high, 1d high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 10.0)
+        )
+        # 1h down move, 5m up move, 1h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["RSI_3"] > 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0)
+        )
+        # 1h down move, 15m still not low enough, 1h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["AROOND_14_1h"] < 70.0)
+        )
+        # 1h down move, 15m still not low enough, 1h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 70.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 40.0)
+        )
+        # 1h down move, 15m & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0)
+        )
+        # 1h down move, 15m & 1h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["AROOND_14_15m"] < 70.0) | (df["AROOND_14_1h"] < 90.0)
+        )
+        # 1h down move, 1h still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["AROOND_14_1h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 10.0)
+        )
+        # 1h down move, 1h high, 4h still high
+        short_entry_logic.append((df["RSI_3_1h"] < 40.0) | (df["AROOND_14_1h"] < 80.0) | (df["AROOND_14_4h"] < 40.0))
+        # 1h down move, 1h still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0) | (df["AROOND_14_4h"] < 70.0)
+        )
+        # 1h down move, 1h & 1d high
+        short_entry_logic.append(
+          (df["RSI_3_1h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["AROOND_14_1d"] < 90.0)
+        )
+        # 1h down move, 4h & 1d high
+        short_entry_logic.append((df["RSI_3_1h"] < 40.0) | (df["RSI_14_4h"] > 30.0) | (df["RSI_14_1d"] > 20.0))
+        # 4h down move, 15m high
+        short_entry_logic.append((df["RSI_3_4h"] < 80.0) | (df["AROOND_14_15m"] < 80.0))
+        # 4h down move, 1h high
+        short_entry_logic.append((df["RSI_3_4h"] < 75.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0))
+        # 4h down move, 1h & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 65.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["AROOND_14_4h"] < 50.0)
+        )
+        # 4h down move, 15m & 1h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 60.0) | (df["AROOND_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 20.0)
+        )
+        # 4h down move, 1h still high, 4h still moving down
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["CCI_20_change_pct_4h"] < 0.0)
+        )
+        # 4h down move, 1h high, 4h still high
+        short_entry_logic.append((df["RSI_3_4h"] < 55.0) | (df["AROOND_14_1h"] < 70.0) | (df["AROOND_14_4h"] < 50.0))
+        # 4h down move, 15m high, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 50.0) | (df["AROOND_14_15m"] < 70.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 60.0)
+        )
+        # 4h down move, 15m still high, 1h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 60.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        )
+        # 4h down move, 15m & 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["AROOND_14_4h"] < 50.0)
+        )
+        # 4h down move, 15m high, 4h still not low enough
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 70.0)
+        )
+        # 4h down move, 1h still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 50.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 50.0) | (df["AROOND_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m & 4h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["AROOND_14_15m"] < 70.0) | (df["AROOND_14_4h"] < 70.0)
+        )
+        # 4h down move, 15m high, 4h still high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["AROOND_14_15m"] < 80.0) | (df["AROOND_14_4h"] < 40.0)
+        )
+        # 4h down move, 15m still high, 4h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 50.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        )
+        # 4h down move, 15m & 4h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 40.0)
+        )
+        # 4h down move, 1h & 4h high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 30.0) | (df["AROOND_14_4h"] < 70.0)
+        )
+        # 4h down move, 4h still high, 1d high
+        short_entry_logic.append(
+          (df["RSI_3_4h"] < 40.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0) | (df["STOCHRSIk_14_14_3_3_1d"] > 20.0)
+        )
+        # 15m high, 4h high
+        short_entry_logic.append((df["AROOND_14_15m"] < 70.0) | (df["AROOND_14_4h"] < 85.0))
+        # 15m high, 4h still high
+        short_entry_logic.append((df["AROOND_14_15m"] < 80.0) | (df["STOCHRSIk_14_14_3_3_4h"] > 50.0))
+        # 15m high, 1h still high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 60.0))
+        # 15m & 4h high
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 30.0) | (df["AROOND_14_4h"] < 70.0))
+        # 15m high, 1h still not low enough
+        short_entry_logic.append((df["STOCHRSIk_14_14_3_3_15m"] > 20.0) | (df["STOCHRSIk_14_14_3_3_1h"] > 70.0))
+
+        # Logic
+        short_entry_logic.append(df["RSI_14"] > 50.0)
+        short_entry_logic.append(df["AROOND_14_15m"] < 90.0)
+        short_entry_logic.append(df["STOCHRSIk_14_14_3_3_15m"] > 10.0)
+        if isinstance(df["SMA_200"].iloc[-1], np.float64):
+          short_entry_logic.append(df["SMA_21"].shift(1) > df["SMA_200"].shift(1))
+          short_entry_logic.append(df["SMA_21"] < df["SMA_200"])
+        else:
+          short_entry_logic.append(pd.Series([False]))
+        if isinstance(df["EMA_200_1h"].iloc[-1], np.float64):
+          short_entry_logic.append(df["close"] < df["EMA_200_1h"])
+        else:
+          short_entry_logic.append(pd.Series([False]))
+        if isinstance(df["EMA_200_4h"].iloc[-1], np.float64):
+          short_entry_logic.append(df["close"] < df["EMA_200_4h"])
+        else:
+          short_entry_logic.append(pd.Series([False]))
+        short_entry_logic.append(df["BBB_20_2.0_1h"] > 4.0)
+
+      ###############################################################################################
+
+      # SHORT ENTRY CONDITIONS ENDS HERE
+
+      ###############################################################################################
+
+      short_entry_logic.append(df["volume"] > 0)
+      item_short_entry = reduce(lambda x, y: x & y, short_entry_logic)
+      df.loc[item_short_entry, "enter_tag"] += f"{short_entry_condition_index} "
+      short_entry_conditions.append(item_short_entry)
+      df.loc[:, "enter_short"] = item_short_entry
+
+  if short_entry_conditions:
+    df.loc[:, "enter_short"] = reduce(lambda x, y: x | y, short_entry_conditions)
+
+  return df
@@ -0,0 +1,6201 @@
+import logging
+from datetime import datetime, timedelta
+from typing import Optional
+from freqtrade.persistence import Trade
+from pandas import Series
+
+log = logging.getLogger("NostalgiaForInfinityX6")
+
+# +---------------------------------------------------------------------------+
+# |                    NostalgiaForInfinityX6 Short Grind Functions           |
+# +---------------------------------------------------------------------------+
+#
+# Bound to the strategy class through `nfi.lazy_method`, imported on first use.
+
+
+#
+#   ______  __    __  ______  _______ ________         ______  _______  ______ __    __ _______
+#  /      \|  \  |  \/      \|       |        \       /      \|       \|      |  \  |  |       \
+# |  $$$$$$| $$  | $|  $$$$$$| $$$$$$$\$$$$$$$$      |  $$$$$$| $$$$$$$\\$$$$$| $$\ | $| $$$$$$$\
+# | $$___\$| $$__| $| $$  | $| $$__| $$ | $$         | $$ __\$| $$__| $$ | $$ | $$$\| $| $$  | $$
+#  \$$    \| $$    $| $$  | $| $$    $$ | $$         | $$|    | $$    $$ | $$ | $$$$\ $| $$  | $$
+#  _\$$$$$$| $$$$$$$| $$  | $| $$$$$$$\ | $$         | $$ \$$$| $$$$$$$\ | $$ | $$\$$ $| $$  | $$
+# |  \__| $| $$  | $| $$__/ $| $$  | $$ | $$         | $$__| $| $$  | $$_| $$_| $$ \$$$| $$__/ $$
+#  \$$    $| $$  | $$\$$    $| $$  | $$ | $$          \$$    $| $$  | $|   $$ | $$  \$$| $$    $$
+#   \$$$$$$ \$$   \$$ \$$$$$$ \$$   \$$  \$$           \$$$$$$ \$$   \$$\$$$$$$\$$   \$$\$$$$$$$
+#
+
+# Short Grinding Adjust Trade Position v2
+# ---------------------------------------------------------------------------------------------
+def short_grind_adjust_trade_position_v2(
+  self,
+  trade: Trade,
+  enter_tags,
+  current_time: datetime,
+  current_rate: float,
+  current_profit: float,
+  min_stake: Optional[float],
+  max_stake: float,
+  current_entry_rate: float,
+  current_exit_rate: float,
+  current_entry_profit: float,
+  current_exit_profit: float,
+  **kwargs,
+):
+  is_backtest = self.is_backtest_mode()
+  min_stake = self.correct_min_stake(min_stake)
+  df, _ = self.dp.get_analyzed_dataframe(trade.pair, self.timeframe)
+  if len(df) < 2:
+    return None
+  last_candle = df.iloc[-1].squeeze()
+  previous_candle = df.iloc[-2].squeeze()
+
+  # we already waiting for an order to get filled
+  if trade.has_open_orders:
+    return None
+
+  filled_orders = trade.select_filled_orders()
+  filled_entries = trade.select_filled_orders(trade.entry_side)
+  filled_exits = trade.select_filled_orders(trade.exit_side)
+  count_of_entries = trade.nr_of_successful_entries
+  count_of_exits = trade.nr_of_successful_exits
+
+  exit_rate = current_rate
+  if self.dp.runmode.value in ("live", "dry_run"):
+    ticker = self.dp.ticker(trade.pair)
+    if ("bid" in ticker) and ("ask" in ticker):
+      if trade.is_short:
+        if self.config["exit_pricing"]["price_side"] in ["ask", "other"]:
+          if ticker["ask"] is not None:
+            exit_rate = ticker["ask"]
+      else:
+        if self.config["exit_pricing"]["price_side"] in ["bid", "other"]:
+          if ticker["bid"] is not None:
+            exit_rate = ticker["bid"]
+
+  profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = self.calc_total_profit(
+    trade, filled_entries, filled_exits, exit_rate
+  )
+
+  current_stake_amount = trade.amount * exit_rate
+  slice_amount = filled_entries[0].cost
+  slice_profit = (exit_rate - filled_orders[-1].safe_price) / filled_orders[-1].safe_price
+  slice_profit_entry = (exit_rate - filled_entries[-1].safe_price) / filled_entries[-1].safe_price
+  slice_profit_exit = (
+    ((exit_rate - filled_exits[-1].safe_price) / filled_exits[-1].safe_price) if count_of_exits > 0 else 0.0
+  )
+
+  is_rebuy_mode = all(c in self.short_rebuy_mode_tags for c in enter_tags) or (
+    any(c in self.short_rebuy_mode_tags for c in enter_tags)
+    and all(c in (self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags)
+  )
+
+  has_order_tags = False
+  if hasattr(filled_orders[0], "ft_order_tag"):
+    has_order_tags = True
+
+  fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
+  fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
+
+  grind_1_max_sub_grinds = 0
+  grind_1_stakes = (
+    self.grinding_v2_grind_1_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.grinding_v2_grind_1_stakes_spot.copy()
+  )
+  grind_1_sub_thresholds = (
+    self.grinding_v2_grind_1_thresholds_futures if self.is_futures_mode else self.grinding_v2_grind_1_thresholds_spot
+  )
+  if (slice_amount * grind_1_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_1_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_1_stakes):
+      grind_1_stakes[i] *= multi
+  grind_1_max_sub_grinds = len(grind_1_stakes)
+  grind_1_derisk_grinds = (
+    self.grinding_v2_grind_1_derisk_futures if self.is_futures_mode else self.grinding_v2_grind_1_derisk_spot
+  )
+  grind_1_profit_threshold = (
+    self.grinding_v2_grind_1_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grinding_v2_grind_1_profit_threshold_spot
+  )
+
+  grind_2_max_sub_grinds = 0
+  grind_2_stakes = (
+    self.grinding_v2_grind_2_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.grinding_v2_grind_2_stakes_spot.copy()
+  )
+  grind_2_sub_thresholds = (
+    self.grinding_v2_grind_2_thresholds_futures if self.is_futures_mode else self.grinding_v2_grind_2_thresholds_spot
+  )
+  if (slice_amount * grind_2_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_2_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_2_stakes):
+      grind_2_stakes[i] *= multi
+  grind_2_max_sub_grinds = len(grind_2_stakes)
+  grind_2_derisk_grinds = (
+    self.grinding_v2_grind_2_derisk_futures if self.is_futures_mode else self.grinding_v2_grind_2_derisk_spot
+  )
+  grind_2_profit_threshold = (
+    self.grinding_v2_grind_2_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grinding_v2_grind_2_profit_threshold_spot
+  )
+
+  grind_3_max_sub_grinds = 0
+  grind_3_stakes = (
+    self.grinding_v2_grind_3_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.grinding_v2_grind_3_stakes_spot.copy()
+  )
+  grind_3_sub_thresholds = (
+    self.grinding_v2_grind_3_thresholds_futures if self.is_futures_mode else self.grinding_v2_grind_3_thresholds_spot
+  )
+  if (slice_amount * grind_3_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_3_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_3_stakes):
+      grind_3_stakes[i] *= multi
+  grind_3_max_sub_grinds = len(grind_3_stakes)
+  grind_3_derisk_grinds = (
+    self.grinding_v2_grind_3_derisk_futures if self.is_futures_mode else self.grinding_v2_grind_3_derisk_spot
+  )
+  grind_3_profit_threshold = (
+    self.grinding_v2_grind_3_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grinding_v2_grind_3_profit_threshold_spot
+  )
+
+  grind_4_max_sub_grinds = 0
+  grind_4_stakes = (
+    self.grinding_v2_grind_4_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.grinding_v2_grind_4_stakes_spot.copy()
+  )
+  grind_4_sub_thresholds = (
+    self.grinding_v2_grind_4_thresholds_futures if self.is_futures_mode else self.grinding_v2_grind_4_thresholds_spot
+  )
+  if (slice_amount * grind_4_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_4_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_4_stakes):
+      grind_4_stakes[i] *= multi
+  grind_4_max_sub_grinds = len(grind_4_stakes)
+  grind_4_derisk_grinds = (
+    self.grinding_v2_grind_4_derisk_futures if self.is_futures_mode else self.grinding_v2_grind_4_derisk_spot
+  )
+  grind_4_profit_threshold = (
+    self.grinding_v2_grind_4_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grinding_v2_grind_4_profit_threshold_spot
+  )
+
+  grind_5_max_sub_grinds = 0
+  grind_5_stakes = (
+    self.grinding_v2_grind_5_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.grinding_v2_grind_5_stakes_spot.copy()
+  )
+  grind_5_sub_thresholds = (
+    self.grinding_v2_grind_5_thresholds_futures if self.is_futures_mode else self.grinding_v2_grind_5_thresholds_spot
+  )
+  if (slice_amount * grind_5_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_5_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_5_stakes):
+      grind_5_stakes[i] *= multi
+  grind_5_max_sub_grinds = len(grind_5_stakes)
+  grind_5_derisk_grinds = (
+    self.grinding_v2_grind_5_derisk_futures if self.is_futures_mode else self.grinding_v2_grind_5_derisk_spot
+  )
+  grind_5_profit_threshold = (
+    self.grinding_v2_grind_5_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grinding_v2_grind_5_profit_threshold_spot
+  )
+
+  is_derisk_1 = False
+  is_derisk_1_found = False  # derisk_level_1 de-risk exit
+  derisk_1_order = None
+  is_derisk_2 = False
+  is_derisk_2_found = False  # derisk_level_2 de-risk exit
+  derisk_2_order = None
+  is_derisk_3 = False
+  is_derisk_3_found = False  # derisk_level_3 de-risk exit
+  derisk_3_order = None
+  buyback_1_sub_grind_count = 0
+  buyback_1_total_amount = 0.0
+  buyback_1_total_cost = 0.0
+  buyback_1_current_open_rate = 0.0
+  buyback_1_current_grind_stake = 0.0
+  buyback_1_current_grind_stake_profit = 0.0
+  buyback_1_is_exit_found = False
+  buyback_1_found = False
+  buyback_1_buy_orders = []
+  buyback_1_orders = []
+  buyback_1_distance_ratio = 0.0
+  buyback_1_exit_order = None
+  buyback_1_exit_distance_ratio = 0.0
+  buyback_2_sub_grind_count = 0
+  buyback_2_total_amount = 0.0
+  buyback_2_total_cost = 0.0
+  buyback_2_current_open_rate = 0.0
+  buyback_2_current_grind_stake = 0.0
+  buyback_2_current_grind_stake_profit = 0.0
+  buyback_2_is_exit_found = False
+  buyback_2_found = False
+  buyback_2_buy_orders = []
+  buyback_2_orders = []
+  buyback_2_distance_ratio = 0.0
+  buyback_2_exit_order = None
+  buyback_2_exit_distance_ratio = 0.0
+  buyback_3_sub_grind_count = 0
+  buyback_3_total_amount = 0.0
+  buyback_3_total_cost = 0.0
+  buyback_3_current_open_rate = 0.0
+  buyback_3_current_grind_stake = 0.0
+  buyback_3_current_grind_stake_profit = 0.0
+  buyback_3_is_exit_found = False
+  buyback_3_found = False
+  buyback_3_buy_orders = []
+  buyback_3_orders = []
+  buyback_3_distance_ratio = 0.0
+  buyback_3_exit_order = None
+  buyback_3_exit_distance_ratio = 0.0
+  grind_1_sub_grind_count = 0
+  grind_1_total_amount = 0.0
+  grind_1_total_cost = 0.0
+  grind_1_current_open_rate = 0.0
+  grind_1_current_grind_stake = 0.0
+  grind_1_current_grind_stake_profit = 0.0
+  grind_1_is_exit_found = False
+  grind_1_found = False
+  grind_1_buy_orders = []
+  grind_1_orders = []
+  grind_1_distance_ratio = 0.0
+  grind_1_exit_order = None
+  grind_1_exit_distance_ratio = 0.0
+  grind_2_sub_grind_count = 0
+  grind_2_total_amount = 0.0
+  grind_2_total_cost = 0.0
+  grind_2_current_open_rate = 0.0
+  grind_2_current_grind_stake = 0.0
+  grind_2_current_grind_stake_profit = 0.0
+  grind_2_is_exit_found = False
+  grind_2_found = False
+  grind_2_buy_orders = []
+  grind_2_orders = []
+  grind_2_distance_ratio = 0.0
+  grind_2_exit_order = None
+  grind_2_exit_distance_ratio = 0.0
+  grind_3_sub_grind_count = 0
+  grind_3_total_amount = 0.0
+  grind_3_total_cost = 0.0
+  grind_3_current_open_rate = 0.0
+  grind_3_current_grind_stake = 0.0
+  grind_3_current_grind_stake_profit = 0.0
+  grind_3_is_exit_found = False
+  grind_3_found = False
+  grind_3_buy_orders = []
+  grind_3_orders = []
+  grind_3_distance_ratio = 0.0
+  grind_3_exit_order = None
+  grind_3_exit_distance_ratio = 0.0
+  grind_4_sub_grind_count = 0
+  grind_4_total_amount = 0.0
+  grind_4_total_cost = 0.0
+  grind_4_current_open_rate = 0.0
+  grind_4_current_grind_stake = 0.0
+  grind_4_current_grind_stake_profit = 0.0
+  grind_4_is_exit_found = False
+  grind_4_found = False
+  grind_4_buy_orders = []
+  grind_4_orders = []
+  grind_4_distance_ratio = 0.0
+  grind_4_exit_order = None
+  grind_4_exit_distance_ratio = 0.0
+  grind_5_sub_grind_count = 0
+  grind_5_total_amount = 0.0
+  grind_5_total_cost = 0.0
+  grind_5_current_open_rate = 0.0
+  grind_5_current_grind_stake = 0.0
+  grind_5_current_grind_stake_profit = 0.0
+  grind_5_is_exit_found = False
+  grind_5_found = False
+  grind_5_buy_orders = []
+  grind_5_orders = []
+  grind_5_distance_ratio = 0.0
+  grind_5_exit_order = None
+  grind_5_exit_distance_ratio = 0.0
+  for order in reversed(filled_orders):
+    if (order.ft_order_side == "sell") and (order is not filled_orders[0]):
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          order_tag = order.ft_order_tag
+      if not buyback_1_is_exit_found and order_tag == "buyback_1_entry":
+        buyback_1_sub_grind_count += 1
+        buyback_1_total_amount += order.safe_filled
+        buyback_1_total_cost += order.safe_filled * order.safe_price
+        buyback_1_buy_orders.append(order.id)
+        buyback_1_orders.append(order)
+        if not buyback_1_found:
+          buyback_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          buyback_1_found = True
+      elif not buyback_2_is_exit_found and order_tag == "buyback_2_entry":
+        buyback_2_sub_grind_count += 1
+        buyback_2_total_amount += order.safe_filled
+        buyback_2_total_cost += order.safe_filled * order.safe_price
+        buyback_2_buy_orders.append(order.id)
+        buyback_2_orders.append(order)
+        if not buyback_2_found:
+          buyback_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          buyback_2_found = True
+      elif not buyback_3_is_exit_found and order_tag == "buyback_3_entry":
+        buyback_3_sub_grind_count += 1
+        buyback_3_total_amount += order.safe_filled
+        buyback_3_total_cost += order.safe_filled * order.safe_price
+        buyback_3_buy_orders.append(order.id)
+        buyback_3_orders.append(order)
+        if not buyback_3_found:
+          buyback_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          buyback_3_found = True
+      elif not grind_1_is_exit_found and order_tag == "grind_1_entry":
+        grind_1_sub_grind_count += 1
+        grind_1_total_amount += order.safe_filled
+        grind_1_total_cost += order.safe_filled * order.safe_price
+        grind_1_buy_orders.append(order.id)
+        grind_1_orders.append(order)
+        if not grind_1_found:
+          grind_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_1_found = True
+      elif not grind_2_is_exit_found and order_tag == "grind_2_entry":
+        grind_2_sub_grind_count += 1
+        grind_2_total_amount += order.safe_filled
+        grind_2_total_cost += order.safe_filled * order.safe_price
+        grind_2_buy_orders.append(order.id)
+        grind_2_orders.append(order)
+        if not grind_2_found:
+          grind_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_2_found = True
+      elif not grind_3_is_exit_found and order_tag == "grind_3_entry":
+        grind_3_sub_grind_count += 1
+        grind_3_total_amount += order.safe_filled
+        grind_3_total_cost += order.safe_filled * order.safe_price
+        grind_3_buy_orders.append(order.id)
+        grind_3_orders.append(order)
+        if not grind_3_found:
+          grind_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_3_found = True
+      elif not grind_4_is_exit_found and order_tag == "grind_4_entry":
+        grind_4_sub_grind_count += 1
+        grind_4_total_amount += order.safe_filled
+        grind_4_total_cost += order.safe_filled * order.safe_price
+        grind_4_buy_orders.append(order.id)
+        grind_4_orders.append(order)
+        if not grind_4_found:
+          grind_4_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_4_found = True
+      elif not grind_5_is_exit_found and order_tag == "grind_5_entry":
+        grind_5_sub_grind_count += 1
+        grind_5_total_amount += order.safe_filled
+        grind_5_total_cost += order.safe_filled * order.safe_price
+        grind_5_buy_orders.append(order.id)
+        grind_5_orders.append(order)
+        if not grind_5_found:
+          grind_5_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_5_found = True
+    elif order.ft_order_side == "buy":
+      if (
+        order is filled_exits[-1]
+        and (order.safe_remaining * exit_rate / (trade.leverage if self.is_futures_mode else 1.0)) > min_stake
+      ):
+        partial_sell = True
+        # break
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          sell_order_tag = order.ft_order_tag
+          order_mode = sell_order_tag.split(" ", 1)
+          if len(order_mode) > 0:
+            order_tag = order_mode[0]
+      if order_tag in ["derisk_level_1", "d"]:
+        if not is_derisk_1_found:
+          is_derisk_1_found = True
+          is_derisk_1 = True
+          derisk_1_order = order
+      elif order_tag in ["derisk_level_2"]:
+        if not is_derisk_2_found:
+          is_derisk_2_found = True
+          is_derisk_2 = True
+          derisk_2_order = order
+      elif order_tag in ["derisk_level_3"]:
+        if not is_derisk_3_found:
+          is_derisk_3_found = True
+          is_derisk_3 = True
+          derisk_3_order = order
+      elif not buyback_1_is_exit_found and order_tag in ["buyback_1_exit", "buyback_1_derisk"]:
+        buyback_1_is_exit_found = True
+        buyback_1_exit_order = order
+      elif not buyback_2_is_exit_found and order_tag in ["buyback_2_exit", "buyback_2_derisk"]:
+        buyback_2_is_exit_found = True
+        buyback_2_exit_order = order
+      elif not buyback_3_is_exit_found and order_tag in ["buyback_3_exit", "buyback_3_derisk"]:
+        buyback_3_is_exit_found = True
+        buyback_3_exit_order = order
+      elif not grind_1_is_exit_found and order_tag in ["grind_1_exit", "grind_1_derisk"]:
+        grind_1_is_exit_found = True
+        grind_1_exit_order = order
+      elif not grind_2_is_exit_found and order_tag in ["grind_2_exit", "grind_2_derisk"]:
+        grind_2_is_exit_found = True
+        grind_2_exit_order = order
+      elif not grind_3_is_exit_found and order_tag in ["grind_3_exit", "grind_3_derisk"]:
+        grind_3_is_exit_found = True
+        grind_3_exit_order = order
+      elif not grind_4_is_exit_found and order_tag in ["grind_4_exit", "grind_4_derisk"]:
+        grind_4_is_exit_found = True
+        grind_4_exit_order = order
+      elif not grind_5_is_exit_found and order_tag in ["grind_5_exit", "grind_5_derisk"]:
+        grind_5_is_exit_found = True
+        grind_5_exit_order = order
+      elif order_tag in ["derisk_global"]:
+        if not buyback_1_is_exit_found:
+          buyback_1_is_exit_found = True
+          buyback_1_exit_order = order
+        if not buyback_2_is_exit_found:
+          buyback_2_is_exit_found = True
+          buyback_2_exit_order = order
+        if not buyback_3_is_exit_found:
+          buyback_3_is_exit_found = True
+          buyback_3_exit_order = order
+        if not grind_1_is_exit_found:
+          grind_1_is_exit_found = True
+          grind_1_exit_order = order
+        if not grind_2_is_exit_found:
+          grind_2_is_exit_found = True
+          grind_2_exit_order = order
+        if not grind_3_is_exit_found:
+          grind_3_is_exit_found = True
+          grind_3_exit_order = order
+        if not grind_4_is_exit_found:
+          grind_4_is_exit_found = True
+          grind_4_exit_order = order
+        if not grind_5_is_exit_found:
+          grind_5_is_exit_found = True
+          grind_5_exit_order = order
+
+  if buyback_1_sub_grind_count > 0:
+    buyback_1_current_open_rate = buyback_1_total_cost / buyback_1_total_amount
+    buyback_1_current_grind_stake = buyback_1_total_amount * exit_rate * (1 - trade.fee_close)
+    buyback_1_current_grind_stake_profit = buyback_1_current_grind_stake - buyback_1_total_cost
+  if buyback_2_sub_grind_count > 0:
+    buyback_2_current_open_rate = buyback_2_total_cost / buyback_2_total_amount
+    buyback_2_current_grind_stake = buyback_2_total_amount * exit_rate * (1 - trade.fee_close)
+    buyback_2_current_grind_stake_profit = buyback_2_current_grind_stake - buyback_2_total_cost
+  if buyback_3_sub_grind_count > 0:
+    buyback_3_current_open_rate = buyback_3_total_cost / buyback_3_total_amount
+    buyback_3_current_grind_stake = buyback_3_total_amount * exit_rate * (1 - trade.fee_close)
+    buyback_3_current_grind_stake_profit = buyback_3_current_grind_stake - buyback_3_total_cost
+  if grind_1_sub_grind_count > 0:
+    grind_1_current_open_rate = grind_1_total_cost / grind_1_total_amount
+    grind_1_current_grind_stake = grind_1_total_amount * exit_rate * (1 - trade.fee_close)
+    grind_1_current_grind_stake_profit = grind_1_current_grind_stake - grind_1_total_cost
+  if grind_2_sub_grind_count > 0:
+    grind_2_current_open_rate = grind_2_total_cost / grind_2_total_amount
+    grind_2_current_grind_stake = grind_2_total_amount * exit_rate * (1 - trade.fee_close)
+    grind_2_current_grind_stake_profit = grind_2_current_grind_stake - grind_2_total_cost
+  if grind_3_sub_grind_count > 0:
+    grind_3_current_open_rate = grind_3_total_cost / grind_3_total_amount
+    grind_3_current_grind_stake = grind_3_total_amount * exit_rate * (1 - trade.fee_close)
+    grind_3_current_grind_stake_profit = grind_3_current_grind_stake - grind_3_total_cost
+  if grind_4_sub_grind_count > 0:
+    grind_4_current_open_rate = grind_4_total_cost / grind_4_total_amount
+    grind_4_current_grind_stake = grind_4_total_amount * exit_rate * (1 - trade.fee_close)
+    grind_4_current_grind_stake_profit = grind_4_current_grind_stake - grind_4_total_cost
+  if grind_5_sub_grind_count > 0:
+    grind_5_current_open_rate = grind_5_total_cost / grind_5_total_amount
+    grind_5_current_grind_stake = grind_5_total_amount * exit_rate * (1 - trade.fee_close)
+    grind_5_current_grind_stake_profit = grind_5_current_grind_stake - grind_5_total_cost
+
+  if grind_1_is_exit_found:
+    grind_1_exit_distance_ratio = (exit_rate - grind_1_exit_order.safe_price) / grind_1_exit_order.safe_price
+  if grind_2_is_exit_found:
+    grind_2_exit_distance_ratio = (exit_rate - grind_2_exit_order.safe_price) / grind_2_exit_order.safe_price
+  if grind_3_is_exit_found:
+    grind_3_exit_distance_ratio = (exit_rate - grind_3_exit_order.safe_price) / grind_3_exit_order.safe_price
+  if grind_4_is_exit_found:
+    grind_4_exit_distance_ratio = (exit_rate - grind_4_exit_order.safe_price) / grind_4_exit_order.safe_price
+  if buyback_1_is_exit_found:
+    buyback_1_exit_distance_ratio = (exit_rate - buyback_1_exit_order.safe_price) / buyback_1_exit_order.safe_price
+  elif is_derisk_1_found:
+    buyback_1_exit_distance_ratio = (exit_rate - derisk_1_order.safe_price) / derisk_1_order.safe_price
+  if buyback_2_is_exit_found:
+    buyback_2_exit_distance_ratio = (exit_rate - buyback_2_exit_order.safe_price) / buyback_2_exit_order.safe_price
+  elif is_derisk_2_found:
+    buyback_2_exit_distance_ratio = (exit_rate - derisk_2_order.safe_price) / derisk_2_order.safe_price
+  if buyback_3_is_exit_found:
+    buyback_3_exit_distance_ratio = (exit_rate - buyback_3_exit_order.safe_price) / buyback_3_exit_order.safe_price
+  elif is_derisk_3_found:
+    buyback_3_exit_distance_ratio = (exit_rate - derisk_3_order.safe_price) / derisk_3_order.safe_price
+
+  # all buybacks & grinds
+  current_open_grind_stake_profit = (
+    buyback_1_current_grind_stake_profit
+    + buyback_2_current_grind_stake_profit
+    + buyback_3_current_grind_stake_profit
+    + grind_1_current_grind_stake_profit
+    + grind_2_current_grind_stake_profit
+    + grind_3_current_grind_stake_profit
+    + grind_4_current_grind_stake_profit
+    + grind_5_current_grind_stake_profit
+  )
+  num_open_grinds_and_buybacks = (
+    buyback_1_sub_grind_count
+    + buyback_2_sub_grind_count
+    + buyback_3_sub_grind_count
+    + grind_1_sub_grind_count
+    + grind_2_sub_grind_count
+    + grind_3_sub_grind_count
+    + grind_4_sub_grind_count
+    + grind_5_sub_grind_count
+  )
+
+  # Rebuy mode, the first entry is lower than normal slot stake
+  if is_rebuy_mode:
+    slice_amount /= self.rebuy_mode_stake_multiplier
+  # not reached the max allowed stake for all grinds
+  is_not_trade_max_stake = (current_stake_amount < (slice_amount * self.grinding_v2_max_stake)) and (
+    num_open_grinds_and_buybacks < self.grinding_v2_max_grinds_and_buybacks
+  )
+
+  is_short_extra_checks_entry = (
+    (current_time - timedelta(minutes=5) > filled_entries[-1].order_filled_utc)
+    and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.06))
+    and (
+      (current_stake_amount < (filled_entries[0].cost * 0.50))
+      or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+      or (slice_profit > 0.06)
+    )
+  )
+  is_short_buyback_entry = self.short_buyback_entry_v2(last_candle, previous_candle, slice_profit, True)
+  is_short_grind_entry = (
+    self.short_grind_entry_v2(last_candle, previous_candle, slice_profit, True)
+    or (
+      (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+      and (num_open_grinds_and_buybacks == 0)
+      and (
+        (last_candle["RSI_3"] < 90.0)
+        and (last_candle["RSI_3_15m"] < 80.0)
+        and (last_candle["RSI_3_1h"] < 80.0)
+        and (last_candle["RSI_3_1h"] < 80.0)
+        and (last_candle["AROOND_14"] < 50.0)
+        and (last_candle["AROOND_14_15m"] < 50.0)
+      )
+    )
+    or (
+      self.is_futures_mode
+      and trade.liquidation_price is not None
+      and (
+        (trade.is_short and current_rate > trade.liquidation_price * 0.90)
+        or (not trade.is_short and current_rate < trade.liquidation_price * 1.10)
+      )
+      and (slice_profit > 0.03)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 80.0)
+      # and (last_candle["RSI_3_1h"] < 80.0)
+      # and (last_candle["RSI_3_1h"] < 80.0)
+      and (last_candle["AROOND_14"] < 50.0)
+      and (last_candle["AROOND_14_15m"] < 50.0)
+    )
+  )
+
+  # De-risk level 1
+
+  # flag it
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_1_enable
+    and (not is_derisk_1_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_1_flag") is None)
+    and (
+      profit_stake
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_derisk_level_1_futures[0]
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_1_spot[0]
+        )
+      )
+      / trade.leverage
+    )
+  ):
+    trade.set_custom_data(key="grinding_v2_derisk_level_1_flag", value=True)
+    trade.set_custom_data(key="grinding_v2_derisk_level_1_profit", value=profit_stake)
+    trade.set_custom_data(key="grinding_v2_derisk_level_1_time", value=current_time.isoformat())
+
+  flag_is_derisk_level_1 = False
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_1_enable
+    and (not is_derisk_1_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_1_flag") is True)
+  ):
+    flag_profit = trade.get_custom_data(key="grinding_v2_derisk_level_1_profit")
+    flag_time = datetime.fromisoformat(trade.get_custom_data(key="grinding_v2_derisk_level_1_time"))
+    if current_time - timedelta(hours=24) > flag_time:
+      if profit_stake > flag_profit:
+        trade.set_custom_data(key="grinding_v2_derisk_level_1_flag", value=None)
+      else:
+        flag_is_derisk_level_1 = True
+
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_1_enable
+    and (not is_derisk_1_found)
+    and not is_rebuy_mode
+    and (
+      flag_is_derisk_level_1
+      or (
+        profit_stake
+        < (
+          slice_amount
+          * (
+            self.grinding_v2_derisk_level_1_futures[1]
+            if self.is_futures_mode
+            else self.grinding_v2_derisk_level_1_spot[1]
+          )
+        )
+        / trade.leverage
+      )
+    )
+  ):
+    sell_amount = (
+      (
+        filled_entries[0].safe_filled
+        * (
+          self.grinding_v2_derisk_level_1_stake_futures
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_1_stake_spot
+        )
+      )
+      * exit_rate
+      / trade.leverage
+    )
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="Level 1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk Level 1 [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "derisk_level_1"
+
+  # De-risk level 2
+
+  # flag it
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_2_enable
+    and (not is_derisk_2_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_2_flag") is None)
+    and (
+      profit_stake
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_derisk_level_2_futures[0]
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_2_spot[0]
+        )
+      )
+      / trade.leverage
+    )
+  ):
+    trade.set_custom_data(key="grinding_v2_derisk_level_2_flag", value=True)
+    trade.set_custom_data(key="grinding_v2_derisk_level_2_profit", value=profit_stake)
+    trade.set_custom_data(key="grinding_v2_derisk_level_2_time", value=current_time.isoformat())
+
+  flag_is_derisk_level_2 = False
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_2_enable
+    and (not is_derisk_2_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_2_flag") is True)
+  ):
+    flag_profit = trade.get_custom_data(key="grinding_v2_derisk_level_2_profit")
+    flag_time = datetime.fromisoformat(trade.get_custom_data(key="grinding_v2_derisk_level_2_time"))
+    if current_time - timedelta(hours=24) > flag_time:
+      if profit_stake > flag_profit:
+        trade.set_custom_data(key="grinding_v2_derisk_level_2_flag", value=None)
+      else:
+        flag_is_derisk_level_2 = True
+
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_2_enable
+    and (not is_derisk_2_found)
+    and not is_rebuy_mode
+    and (
+      flag_is_derisk_level_2
+      or (
+        profit_stake
+        < (
+          slice_amount
+          * (
+            self.grinding_v2_derisk_level_2_futures[1]
+            if self.is_futures_mode
+            else self.grinding_v2_derisk_level_2_spot[1]
+          )
+        )
+        / trade.leverage
+      )
+    )
+  ):
+    sell_amount = (
+      (
+        filled_entries[0].safe_filled
+        * (
+          self.grinding_v2_derisk_level_2_stake_futures
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_2_stake_spot
+        )
+      )
+      * exit_rate
+      / trade.leverage
+    )
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="Level 2",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk Level 2 [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "derisk_level_2"
+
+  # De-risk level 3
+
+  # flag it
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_3_enable
+    and (not is_derisk_3_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_3_flag") is None)
+    and (
+      profit_stake
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_derisk_level_3_futures[0]
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_3_spot[0]
+        )
+      )
+      / trade.leverage
+    )
+  ):
+    trade.set_custom_data(key="grinding_v2_derisk_level_3_flag", value=True)
+    trade.set_custom_data(key="grinding_v2_derisk_level_3_profit", value=profit_stake)
+    trade.set_custom_data(key="grinding_v2_derisk_level_3_time", value=current_time.isoformat())
+
+  flag_is_derisk_level_3 = False
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_3_enable
+    and (not is_derisk_3_found)
+    and not is_rebuy_mode
+    and (trade.get_custom_data(key="grinding_v2_derisk_level_3_flag") is True)
+  ):
+    flag_profit = trade.get_custom_data(key="grinding_v2_derisk_level_3_profit")
+    flag_time = datetime.fromisoformat(trade.get_custom_data(key="grinding_v2_derisk_level_3_time"))
+    if current_time - timedelta(hours=24) > flag_time:
+      if profit_stake > flag_profit:
+        trade.set_custom_data(key="grinding_v2_derisk_level_3_flag", value=None)
+      else:
+        flag_is_derisk_level_3 = True
+
+  if (
+    self.derisk_enable
+    and self.grinding_v2_derisk_level_3_enable
+    and (not is_derisk_3_found)
+    and not is_rebuy_mode
+    and (
+      flag_is_derisk_level_3
+      or (
+        profit_stake
+        < (
+          slice_amount
+          * (
+            self.grinding_v2_derisk_level_3_futures[1]
+            if self.is_futures_mode
+            else self.grinding_v2_derisk_level_3_spot[1]
+          )
+        )
+        / trade.leverage
+      )
+    )
+  ):
+    sell_amount = (
+      (
+        filled_entries[0].safe_filled
+        * (
+          self.grinding_v2_derisk_level_3_stake_futures
+          if self.is_futures_mode
+          else self.grinding_v2_derisk_level_3_stake_spot
+        )
+      )
+      * exit_rate
+      / trade.leverage
+    )
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="Level 3",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk Level 3 [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "derisk_level_3"
+
+  # De-risk global
+  if (
+    self.grinding_v2_derisk_global_enable
+    and is_derisk_1_found
+    and (
+      current_open_grind_stake_profit
+      < (
+        slice_amount
+        * (self.grinding_v2_derisk_global_futures if self.is_futures_mode else self.grinding_v2_derisk_global_spot)
+      )
+      / trade.leverage
+    )
+  ):
+    sell_amount = trade.amount * exit_rate / trade.leverage - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="Global",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk Global [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "derisk_global"
+
+  # Grinding 1
+
+  if (
+    (self.grinding_v2_grind_1_enable)
+    and (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+    and is_short_grind_entry
+    and is_short_extra_checks_entry
+    and (grind_1_sub_grind_count < grind_1_max_sub_grinds)
+    and (grind_1_sub_grind_count == 0 or (-grind_1_distance_ratio < grind_1_sub_thresholds[grind_1_sub_grind_count]))
+    and is_not_trade_max_stake
+  ):
+    buy_amount = slice_amount * grind_1_stakes[grind_1_sub_grind_count] / trade.leverage
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="grind_1_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Grinding entry (grind_1_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "grind_1_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if grind_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+    if (grind_profit > (grind_1_profit_threshold + fee_open_rate + fee_close_rate)) and self.short_grind_exit_v2(
+      last_candle, previous_candle, slice_profit, True
+    ):
+      sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="grind_1_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (grind_1_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "grind_1_exit"
+        for grind_entry_id in grind_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_grind_1_use_derisk
+  #   and (grind_1_sub_grind_count > 0)
+  #   and ((-(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate) < grind_1_derisk_grinds)
+  #   and (grind_1_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_grind_1_use_derisk
+    and (grind_1_sub_grind_count > 0)
+    and (grind_1_current_grind_stake_profit < (slice_amount * grind_1_derisk_grinds))
+    and (grind_1_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_1_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate)
+          if grind_1_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-derisk",
+          tag="grind_1_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding de-risk (grind_1_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "grind_1_derisk"
+      for grind_entry_id in grind_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 2
+
+  if (
+    (self.grinding_v2_grind_2_enable)
+    # and (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+    and is_short_grind_entry
+    and is_short_extra_checks_entry
+    and (grind_2_sub_grind_count < grind_2_max_sub_grinds)
+    and (grind_2_sub_grind_count == 0 or (-grind_2_distance_ratio < grind_2_sub_thresholds[grind_2_sub_grind_count]))
+    and is_not_trade_max_stake
+  ):
+    buy_amount = slice_amount * grind_2_stakes[grind_2_sub_grind_count] / trade.leverage
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="grind_2_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Grinding entry (grind_2_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "grind_2_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if grind_2_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
+    if (grind_profit > (grind_2_profit_threshold + fee_open_rate + fee_close_rate)) and self.short_grind_exit_v2(
+      last_candle, previous_candle, slice_profit, True
+    ):
+      sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="grind_2_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (grind_2_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "grind_2_exit"
+        for grind_entry_id in grind_2_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_grind_2_use_derisk
+  #   and (grind_2_sub_grind_count > 0)
+  #   and ((-(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate) < grind_2_derisk_grinds)
+  #   and (grind_2_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_grind_2_use_derisk
+    and (grind_2_sub_grind_count > 0)
+    and (grind_2_current_grind_stake_profit < (slice_amount * grind_2_derisk_grinds))
+    and (grind_2_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_2_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate)
+          if grind_2_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-derisk",
+          tag="grind_2_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding de-risk (grind_2_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "grind_2_derisk"
+      for grind_entry_id in grind_2_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 3
+
+  if (
+    (self.grinding_v2_grind_3_enable)
+    # and (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+    and is_short_grind_entry
+    and is_short_extra_checks_entry
+    and (grind_3_sub_grind_count < grind_3_max_sub_grinds)
+    and (grind_3_sub_grind_count == 0 or (-grind_3_distance_ratio < grind_3_sub_thresholds[grind_3_sub_grind_count]))
+    and is_not_trade_max_stake
+  ):
+    buy_amount = slice_amount * grind_3_stakes[grind_3_sub_grind_count] / trade.leverage
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="grind_3_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Grinding entry (grind_3_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "grind_3_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if grind_3_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
+    if (grind_profit > (grind_3_profit_threshold + fee_open_rate + fee_close_rate)) and self.short_grind_exit_v2(
+      last_candle, previous_candle, slice_profit, True
+    ):
+      sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="grind_3_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (grind_3_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "grind_3_exit"
+        for grind_entry_id in grind_3_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_grind_3_use_derisk
+  #   and (grind_3_sub_grind_count > 0)
+  #   and ((-(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate) < grind_3_derisk_grinds)
+  #   and (grind_3_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_grind_3_use_derisk
+    and (grind_3_sub_grind_count > 0)
+    and (grind_3_current_grind_stake_profit < (slice_amount * grind_3_derisk_grinds))
+    and (grind_3_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_3_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate)
+          if grind_3_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-derisk",
+          tag="grind_3_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding de-risk (grind_3_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "grind_3_derisk"
+      for grind_entry_id in grind_3_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 4
+
+  if (
+    (self.grinding_v2_grind_4_enable)
+    # and (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+    and (
+      is_short_grind_entry
+      # or (
+      #   is_derisk_1_found
+      #   # only queue 4 grinds open
+      #   and (num_open_grinds_and_buybacks == grind_4_sub_grind_count)
+      #   and (last_candle["protections_short_global"] == True)
+      #   and (
+      #     (slice_profit > 0.04)
+      #     and (last_candle["RSI_3"] < 90.0)
+      #     and (last_candle["RSI_3_15m"] < 80.0)
+      #     and (last_candle["AROOND_14"] < 50.0)
+      #     and (last_candle["AROOND_14_15m"] < 50.0)
+      #   )
+      # )
+    )
+    and is_short_extra_checks_entry
+    and (grind_4_sub_grind_count < grind_4_max_sub_grinds)
+    and (grind_4_sub_grind_count == 0 or (-grind_4_distance_ratio < grind_4_sub_thresholds[grind_4_sub_grind_count]))
+    and is_not_trade_max_stake
+  ):
+    buy_amount = slice_amount * grind_4_stakes[grind_4_sub_grind_count] / trade.leverage
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="grind_4_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Grinding entry (grind_4_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "grind_4_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if grind_4_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
+    if (grind_profit > (grind_4_profit_threshold + fee_open_rate + fee_close_rate)) and self.short_grind_exit_v2(
+      last_candle, previous_candle, slice_profit, True
+    ):
+      sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="grind_4_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (grind_4_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "grind_4_exit"
+        for grind_entry_id in grind_4_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_grind_4_use_derisk
+  #   and (grind_4_sub_grind_count > 0)
+  #   and ((-(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate) < grind_4_derisk_grinds)
+  #   and (grind_4_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_grind_4_use_derisk
+    and (grind_4_sub_grind_count > 0)
+    and (grind_4_current_grind_stake_profit < (slice_amount * grind_4_derisk_grinds))
+    and (grind_4_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_4_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate)
+          if grind_4_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-derisk",
+          tag="grind_4_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding de-risk (grind_4_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "grind_4_derisk"
+      for grind_entry_id in grind_4_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 5
+
+  if (
+    (self.grinding_v2_grind_5_enable)
+    and (is_derisk_1_found or is_derisk_2_found or is_derisk_3_found)
+    and (
+      is_short_grind_entry
+      or (
+        is_derisk_1_found
+        and (slice_profit_entry > 0.10)
+        and (slice_profit_exit > 0.04)
+        and (last_candle["protections_short_global"] == True)
+        # and (
+        #   (slice_profit > 0.04)
+        #   and (last_candle["RSI_3"] < 90.0)
+        #   and (last_candle["RSI_3_15m"] < 80.0)
+        #   and (last_candle["AROOND_14"] < 50.0)
+        #   and (last_candle["AROOND_14_15m"] < 50.0)
+        # )
+      )
+    )
+    and is_short_extra_checks_entry
+    and (grind_5_sub_grind_count < grind_5_max_sub_grinds)
+    and (grind_5_sub_grind_count == 0 or (-grind_5_distance_ratio < grind_5_sub_thresholds[grind_5_sub_grind_count]))
+    and is_not_trade_max_stake
+  ):
+    buy_amount = slice_amount * grind_5_stakes[grind_5_sub_grind_count] / trade.leverage
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="grind_5_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Grinding entry (grind_5_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "grind_5_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if grind_5_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
+    if (grind_profit > (grind_5_profit_threshold + fee_open_rate + fee_close_rate)) and self.short_grind_exit_v2(
+      last_candle, previous_candle, slice_profit, True
+    ):
+      sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="grind_5_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (grind_5_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "grind_5_exit"
+        for grind_entry_id in grind_5_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_grind_5_use_derisk
+  #   and (grind_5_sub_grind_count > 0)
+  #   and ((-(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate) < grind_5_derisk_grinds)
+  #   and (grind_5_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_grind_5_use_derisk
+    and (grind_5_sub_grind_count > 0)
+    and (grind_5_current_grind_stake_profit < (slice_amount * grind_5_derisk_grinds))
+    and (grind_5_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_5_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate)
+          if grind_5_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-derisk",
+          tag="grind_5_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding de-risk (grind_5_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "grind_5_derisk"
+      for grind_entry_id in grind_5_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Buyback 1
+
+  if (
+    self.grinding_v2_buyback_1_enable
+    and is_derisk_1_found
+    and is_short_buyback_entry
+    and is_short_extra_checks_entry
+    and (buyback_1_current_open_rate == 0)
+    and (
+      -buyback_1_exit_distance_ratio
+      < (
+        self.grinding_v2_buyback_1_distance_ratio_futures
+        if self.is_futures_mode
+        else self.grinding_v2_buyback_1_distance_ratio_spot
+      )
+    )
+    and is_not_trade_max_stake
+  ):
+    buy_amount = (
+      slice_amount
+      * (self.grinding_v2_buyback_1_stake_futures if self.is_futures_mode else self.grinding_v2_buyback_1_stake_spot)
+      / trade.leverage
+    )
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "buyback-entry",
+        tag="buyback_1_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Buyback entry (buyback_1_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "buyback_1_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if buyback_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - buyback_1_current_open_rate) / buyback_1_current_open_rate
+    if (
+      grind_profit
+      > (
+        (
+          self.grinding_v2_buyback_1_profit_threshold_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_1_profit_threshold_spot
+        )
+        + fee_open_rate
+        + fee_close_rate
+      )
+    ) and self.short_grind_exit_v2(last_candle, previous_candle, slice_profit, True):
+      sell_amount = buyback_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "buyback-exit",
+            tag="buyback_1_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_1_total_amount,
+          )
+        )
+        log.info(
+          f"Buyback exit (buyback_1_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "buyback_1_exit"
+        for grind_entry_id in buyback_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_buyback_1_use_derisk
+  #   and (buyback_1_sub_grind_count > 0)
+  #   and (
+  #     (-(exit_rate - buyback_1_current_open_rate) / buyback_1_current_open_rate)
+  #     < (
+  #       self.grinding_v2_buyback_1_derisk_futures if self.is_futures_mode else self.grinding_v2_buyback_1_derisk_spot
+  #     )
+  #   )
+  #   and (buyback_1_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_buyback_1_use_derisk
+    and (buyback_1_sub_grind_count > 0)
+    and (
+      buyback_1_current_grind_stake_profit
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_buyback_1_derisk_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_1_derisk_spot
+        )
+      )
+    )
+    and (buyback_1_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = buyback_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if buyback_1_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - buyback_1_current_open_rate) / buyback_1_current_open_rate)
+          if buyback_1_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "buyback-derisk",
+          tag="buyback_1_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          coin_amount=buyback_1_total_amount,
+        )
+      )
+      log.info(
+        f"Buyback de-risk (buyback_1_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "buyback_1_derisk"
+      for grind_entry_id in buyback_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # # Buyback 2
+
+  if (
+    self.grinding_v2_buyback_2_enable
+    and is_derisk_2_found
+    and is_short_buyback_entry
+    and is_short_extra_checks_entry
+    and (buyback_2_current_open_rate == 0)
+    and (
+      -buyback_2_exit_distance_ratio
+      < (
+        self.grinding_v2_buyback_2_distance_ratio_futures
+        if self.is_futures_mode
+        else self.grinding_v2_buyback_2_distance_ratio_spot
+      )
+    )
+    and is_not_trade_max_stake
+  ):
+    buy_amount = (
+      slice_amount
+      * (self.grinding_v2_buyback_2_stake_futures if self.is_futures_mode else self.grinding_v2_buyback_2_stake_spot)
+      / trade.leverage
+    )
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "buyback-entry",
+        tag="buyback_2_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Buyback entry (buyback_2_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "buyback_2_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if buyback_2_sub_grind_count > 0:
+    grind_profit = -(exit_rate - buyback_2_current_open_rate) / buyback_2_current_open_rate
+    if (
+      grind_profit
+      > (
+        (
+          self.grinding_v2_buyback_2_profit_threshold_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_2_profit_threshold_spot
+        )
+        + fee_open_rate
+        + fee_close_rate
+      )
+    ) and self.short_grind_exit_v2(last_candle, previous_candle, slice_profit, True):
+      sell_amount = buyback_2_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "buyback-exit",
+            tag="buyback_2_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_2_total_amount,
+          )
+        )
+        log.info(
+          f"Buyback exit (buyback_2_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "buyback_2_exit"
+        for grind_entry_id in buyback_2_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_buyback_2_use_derisk
+  #   and (buyback_2_sub_grind_count > 0)
+  #   and (
+  #     (-(exit_rate - buyback_2_current_open_rate) / buyback_2_current_open_rate)
+  #     < (
+  #       self.grinding_v2_buyback_2_derisk_futures if self.is_futures_mode else self.grinding_v2_buyback_2_derisk_spot
+  #     )
+  #   )
+  #   and (buyback_2_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_buyback_2_use_derisk
+    and (buyback_2_sub_grind_count > 0)
+    and (
+      buyback_2_current_grind_stake_profit
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_buyback_2_derisk_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_2_derisk_spot
+        )
+      )
+    )
+    and (buyback_2_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = buyback_2_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if buyback_2_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - buyback_2_current_open_rate) / buyback_2_current_open_rate)
+          if buyback_2_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "buyback-derisk",
+          tag="buyback_2_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          coin_amount=buyback_2_total_amount,
+        )
+      )
+      log.info(
+        f"Buyback de-risk (buyback_2_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "buyback_2_derisk"
+      for grind_entry_id in buyback_2_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # # Buyback 3
+
+  if (
+    self.grinding_v2_buyback_3_enable
+    and is_derisk_3_found
+    and is_short_buyback_entry
+    and is_short_extra_checks_entry
+    and (buyback_3_current_open_rate == 0)
+    and (
+      -buyback_3_exit_distance_ratio
+      < (
+        self.grinding_v2_buyback_3_distance_ratio_futures
+        if self.is_futures_mode
+        else self.grinding_v2_buyback_3_distance_ratio_spot
+      )
+    )
+    and is_not_trade_max_stake
+  ):
+    buy_amount = (
+      slice_amount
+      * (self.grinding_v2_buyback_3_stake_futures if self.is_futures_mode else self.grinding_v2_buyback_3_stake_spot)
+      / trade.leverage
+    )
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    self.dp.send_msg(
+      self.notification_msg(
+        "buyback-entry",
+        tag="buyback_3_entry",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+      )
+    )
+    log.info(
+      f"Buyback entry (buyback_3_entry) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+    )
+    order_tag = "buyback_3_entry"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  if buyback_3_sub_grind_count > 0:
+    grind_profit = -(exit_rate - buyback_3_current_open_rate) / buyback_3_current_open_rate
+    if (
+      grind_profit
+      > (
+        (
+          self.grinding_v2_buyback_3_profit_threshold_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_3_profit_threshold_spot
+        )
+        + fee_open_rate
+        + fee_close_rate
+      )
+    ) and self.short_grind_exit_v2(last_candle, previous_candle, slice_profit, True):
+      sell_amount = buyback_3_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "buyback-exit",
+            tag="buyback_3_exit",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=buyback_3_total_amount,
+          )
+        )
+        log.info(
+          f"Buyback exit (buyback_3_exit) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "buyback_3_exit"
+        for grind_entry_id in buyback_3_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # if (
+  #   self.grinding_v2_buyback_3_use_derisk
+  #   and (buyback_3_sub_grind_count > 0)
+  #   and (
+  #     (-(exit_rate - buyback_3_current_open_rate) / buyback_3_current_open_rate)
+  #     < (
+  #       self.grinding_v2_buyback_3_derisk_futures if self.is_futures_mode else self.grinding_v2_buyback_3_derisk_spot
+  #     )
+  #   )
+  #   and (buyback_3_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  # ):
+  if (
+    self.grinding_v2_buyback_3_use_derisk
+    and (buyback_3_sub_grind_count > 0)
+    and (
+      buyback_3_current_grind_stake_profit
+      < (
+        slice_amount
+        * (
+          self.grinding_v2_buyback_3_derisk_futures
+          if self.is_futures_mode
+          else self.grinding_v2_buyback_3_derisk_spot
+        )
+      )
+    )
+    and (buyback_3_orders[-1].order_date_utc.replace(tzinfo=None) >= datetime(2025, 8, 3) or is_backtest)
+  ):
+    sell_amount = buyback_3_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if buyback_3_current_open_rate > 0.0:
+        grind_profit = (
+          -((exit_rate - buyback_3_current_open_rate) / buyback_3_current_open_rate)
+          if buyback_3_is_exit_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "buyback-derisk",
+          tag="buyback_3_derisk",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          coin_amount=buyback_3_total_amount,
+        )
+      )
+      log.info(
+        f"Buyback de-risk (buyback_3_derisk) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {buyback_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "buyback_3_derisk"
+      for grind_entry_id in buyback_3_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  return None
+
+def short_buyback_entry_v2(
+  self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
+) -> float:
+  if (last_candle["protections_short_global"] == True) and (
+    (last_candle["enter_short"] == True)
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 80.0)
+      and (last_candle["RSI_3_15m"] < 70.0)
+      and (last_candle["RSI_3_1h"] < 70.0)
+      and (last_candle["RSI_3_4h"] < 70.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      # and (last_candle["ROC_9_4h"] > -20.0)
+      # and (last_candle["ROC_9_4h"] < 40.0)
+      # and (last_candle["ROC_9_1d"] > -20.0)
+      # and (last_candle["ROC_9_1d"] < 50.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 80.0)
+      and (last_candle["STOCHRSIk_14_14_3_3_15m"] > 80.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      # and (last_candle["close"] < (last_candle["low_min_24_4h"] * 1.20))
+      and (last_candle["close"] > (last_candle["EMA_16"] * 1.120))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 85.0)
+      and (last_candle["RSI_3_1h"] < 85.0)
+      and (last_candle["RSI_3_4h"] < 85.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      # and (last_candle["ROC_2_1d"] > -10.0)
+      # and (last_candle["ROC_9_1h"] > -10.0)
+      # and (last_candle["ROC_9_4h"] > -10.0)
+      and (last_candle["ROC_9_1d"] < 5.0)
+      and (last_candle["EMA_12"] > last_candle["EMA_26"])
+      and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.020))
+      and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      and (last_candle["ROC_2_1d"] < 5.0)
+      and (last_candle["ROC_9_1h"] < 5.0)
+      and (last_candle["ROC_9_4h"] < 5.0)
+      and (last_candle["ROC_9_1d"] < 10.0)
+      # and (last_candle["ROC_9_4h"] < 40.0)
+      # and (last_candle["ROC_9_1d"] < 50.0)
+      and (last_candle["AROOND_14_15m"] < 25.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      # and (last_candle["close"] < (last_candle["low_min_24_4h"] * 1.20))
+      and (last_candle["close"] > (last_candle["EMA_12"] * 1.020))
+    )
+    or (
+      (last_candle["RSI_14"] < 64.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      # and (last_candle["ROC_2_1d"] > -5.0)
+      and (last_candle["ROC_9_1h"] < 5.0)
+      and (last_candle["ROC_9_4h"] < 5.0)
+      and (last_candle["ROC_9_1d"] < 5.0)
+      and (last_candle["STOCHRSIk_14_14_3_3_1h"] > 20.0)
+      and (last_candle["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+      # and (last_candle["close"] > (last_candle["close_max_48"] * 0.90))
+      # and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      # and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      and (last_candle["close"] > (last_candle["EMA_26"] * 1.040))
+      and (last_candle["close"] > (last_candle["BBU_20_2.0"] * 1.001))
+    )
+  ):
+    return True
+
+  return False
+
+def short_grind_entry_v2(
+  self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
+) -> float:
+  if (last_candle["protections_short_global"] == True) and (
+    (last_candle["enter_short"] == True)
+    or (
+      (last_candle["RSI_14"] > 54.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 85.0)
+      and (last_candle["RSI_3_1h"] < 85.0)
+      and (last_candle["RSI_3_4h"] < 85.0)
+      and (last_candle["ROC_2_1h"] < 10.0)
+      and (last_candle["ROC_2_4h"] < 10.0)
+      and (last_candle["ROC_2_1d"] < 10.0)
+      and (last_candle["ROC_9_1h"] < 25.0)
+      and (last_candle["ROC_9_4h"] < 25.0)
+      and (last_candle["ROC_9_1d"] < 25.0)
+      # and (last_candle["ROC_9_1d"] < 40.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 30.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 30.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      and (last_candle["close"] > (last_candle["high_max_24_4h"] * 0.85))
+      and (last_candle["close"] > (last_candle["EMA_16"] * 1.032))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 85.0)
+      and (last_candle["RSI_3_1h"] < 85.0)
+      and (last_candle["RSI_3_4h"] < 85.0)
+      # and (last_candle["RSI_3_1d"] > 15.0)
+      and (last_candle["ROC_2_1h"] < 10.0)
+      and (last_candle["ROC_2_4h"] < 10.0)
+      # and (last_candle["ROC_2_1d"] > -10.0)
+      and (last_candle["ROC_9_1h"] < 10.0)
+      and (last_candle["ROC_9_4h"] < 10.0)
+      and (last_candle["ROC_9_1d"] < 30.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 50.0)
+      and (last_candle["EMA_12"] > last_candle["EMA_26"])
+      and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.020))
+      and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      and (last_candle["ROC_2_1d"] < 5.0)
+      and (last_candle["ROC_9_1h"] < 10.0)
+      and (last_candle["ROC_9_4h"] < 10.0)
+      and (last_candle["ROC_9_1d"] < 10.0)
+      # and (last_candle["ROC_9_4h"] < 40.0)
+      # and (last_candle["ROC_9_1d"] < 50.0)
+      and (last_candle["AROOND_14_15m"] < 25.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      # and (last_candle["close"] < (last_candle["low_min_24_4h"] * 1.20))
+      and (last_candle["close"] > (last_candle["EMA_12"] * 1.020))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["ROC_2_1h"] < 10.0)
+      and (last_candle["ROC_2_4h"] < 10.0)
+      and (last_candle["ROC_2_1d"] < 10.0)
+      # and (last_candle["ROC_9_1h"] > -10.0)
+      # and (last_candle["ROC_9_4h"] > -10.0)
+      # and (last_candle["ROC_9_1d"] > -10.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      and (last_candle["close"] > (last_candle["EMA_26"] * 1.038))
+      and (last_candle["close"] > (last_candle["BBU_20_2.0"] * 1.0))
+    )
+    or (
+      (last_candle["RSI_14"] > 65.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      # and (last_candle["RSI_3_1d"] > 10.0)
+      and (last_candle["ROC_2_1h"] < 10.0)
+      and (last_candle["ROC_2_4h"] < 10.0)
+      and (last_candle["ROC_2_1d"] < 10.0)
+      and (last_candle["ROC_9_1h"] < 10.0)
+      and (last_candle["ROC_9_4h"] < 10.0)
+      # and (last_candle["ROC_9_1d"] > -10.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      # and (last_candle["AROONU_14_15m"] < 25.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+      # and (last_candle["close"] > (last_candle["close_max_48"] * 0.90))
+      # and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      # and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      and (last_candle["close"] > (last_candle["high_max_12_4h"] * 0.80))
+      and (last_candle["close"] > (last_candle["EMA_9"] * 1.032))
+      and (last_candle["close"] > (last_candle["EMA_20"] * 1.020))
+    )
+    or (
+      (last_candle["RSI_14"] > 65.0)
+      and (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3"] > 60.0)
+      # and (last_candle["RSI_4"] < 40.0)
+      and (last_candle["RSI_3_15m"] < 85.0)
+      # and (last_candle["RSI_3_1h"] > 20.0)
+      # and (last_candle["RSI_3_4h"] > 20.0)
+      # and (last_candle["RSI_3_1d"] > 20.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      # and (last_candle["ROC_2_1d"] > -5.0)
+      and (last_candle["ROC_9_1h"] < 10.0)
+      and (last_candle["ROC_9_4h"] < 10.0)
+      # and (last_candle["ROC_9_1d"] > -10.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      # and (last_candle["AROONU_14_15m"] < 25.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_15m"] < 20.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 50.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_4h"] < 50.0)
+      # and (last_candle["close"] > (last_candle["close_max_48"] * 0.90))
+      # and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.18))
+      # and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.25))
+      and (last_candle["RSI_20"] > previous_candle["RSI_20"])
+      and (last_candle["close"] > (last_candle["SMA_16"] * 1.045))
+      # and (last_candle["close"] < (last_candle["EMA_20"] * 0.980))
+    )
+    or (
+      (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["ROC_2_1h"] < 5.0)
+      and (last_candle["ROC_2_4h"] < 5.0)
+      and (last_candle["ROC_9_1h"] < 5.0)
+      and (last_candle["ROC_9_4h"] < 5.0)
+      and (last_candle["WILLR_14"] > -50.0)
+      # and (last_candle["AROONU_14"] < 25.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 80.0)
+      and (last_candle["WILLR_84_1h"] > -30.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3_1h"] < 40.0)
+      and (last_candle["close"] < (last_candle["high_max_24_4h"] * 0.77))
+      and (last_candle["BBB_20_2.0_1h"] > 12.0)
+      and (last_candle["close_min_48"] <= (last_candle["close"] * 0.90))
+    )
+    or (
+      (last_candle["RSI_3"] > 70.0)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 95.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      # and (last_candle["ROC_2_1h"] > -5.0)
+      # and (last_candle["ROC_2_4h"] > -5.0)
+      # and (last_candle["ROC_9_1h"] > -5.0)
+      # and (last_candle["ROC_9_4h"] > -5.0)
+      and (last_candle["ROC_9_1d"] < 30.0)
+      # and (last_candle["STOCHRSIk_14_14_3_3"] < 20.0)
+      # and (last_candle["close"] < (last_candle["low_min_24_4h"] * 1.50))
+      and (last_candle["EMA_12"] > last_candle["EMA_26"])
+      and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.034))
+      and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+    )
+    or (
+      (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 75.0)
+      and (last_candle["RSI_3_1h"] < 70.0)
+      and (last_candle["close"] > (last_candle["low_min_24_4h"] * 1.10))
+      and (last_candle["close"] > (last_candle["close_min_48"] * 1.10))
+      and (last_candle["close"] < (last_candle["close_max_12"] * 0.92))
+    )
+    or (
+      (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 95.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 80.0)
+      and (last_candle["RSI_14"] > (last_candle["RSI_14_1h"] + 45.0))
+    )
+    or (
+      (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 80.0)
+      and (last_candle["close"] > (last_candle["SMA_30"] * 1.022))
+      and (last_candle["close"] > (last_candle["BBU_20_2.0"] * 1.0))
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_3_1d"] < 90.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 70.0)
+      and (last_candle["close"] < (last_candle["close_min_48"] * 1.15))
+      and (last_candle["close"] < (last_candle["low_min_6_1h"] * 1.20))
+      and (last_candle["close"] < (last_candle["low_min_12_1h"] * 1.33))
+      and (last_candle["close"] > (last_candle["high_max_12_4h"] * 0.75))
+      and (last_candle["EMA_12"] > last_candle["EMA_26"])
+      and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.018))
+      and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+    )
+    or (
+      (last_candle["RSI_3"] < 95.0)
+      and (previous_candle["SMA_9"] > previous_candle["SMA_21"])
+      and (last_candle["SMA_9"] < last_candle["SMA_21"])
+      and (last_candle["close"] > (last_candle["EMA_100"] * 1.016))
+      and (last_candle["RSI_3_1h"] < 80.0)
+      and (last_candle["RSI_3_4h"] < 80.0)
+    )
+    or (
+      (slice_profit > 0.12)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      and (last_candle["RSI_14"] > 60.0)
+      and (last_candle["AROOND_14"] < 25.0)
+      and (last_candle["AROOND_14_15m"] < 30.0)
+      and (last_candle["STOCHRSIk_14_14_3_3"] > 80.0)
+      and (last_candle["STOCHRSIk_14_14_3_3_15m"] > 70.0)
+      and (last_candle["RSI_14_1h"] > 50.0)
+      and (last_candle["RSI_14_4h"] > 50.0)
+    )
+    or (
+      (last_candle["RSI_14"] > 64.0)
+      and (last_candle["RSI_3"] < 95.0)
+      and (last_candle["RSI_3_1h"] < 90.0)
+      and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["close"] > (last_candle["EMA_12"] * 1.001))
+      and (last_candle["close"] > (last_candle["BBL_20_2.0"] * 1.004))
+    )
+  ):
+    return True
+
+  return False
+
+def short_buyback_exit_v2(
+  self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
+) -> float:
+  if (
+    (last_candle["RSI_3"] < 1.0)
+    or (last_candle["RSI_14"] < 30.0)
+    or (last_candle["WILLR_14"] < -99.9)
+    or (last_candle["STOCHRSIk_14_14_3_3"] > 5.0)
+    or (last_candle["close"] < (last_candle["BBL_20_2.0"] * 0.99))
+    or ((last_candle["RSI_3"] < 10.0) and (last_candle["RSI_14"] > 50.0))
+  ):
+    return True
+
+  return False
+
+def short_grind_exit_v2(
+  self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
+) -> float:
+  if (
+    (last_candle["RSI_3"] < 1.0)
+    or (last_candle["RSI_14"] < 30.0)
+    or (last_candle["WILLR_14"] < -99.9)
+    or (last_candle["STOCHRSIk_14_14_3_3"] < 5.0)
+    or (last_candle["close"] < (last_candle["BBL_20_2.0"] * 0.99))
+    or ((last_candle["RSI_3"] < 10.0) and (last_candle["RSI_14"] > 50.0))
+  ):
+    return True
+
+  return False
+
+# Short Grinding Adjust Trade Position
+# ---------------------------------------------------------------------------------------------
+def short_grind_adjust_trade_position(
+  self,
+  trade: Trade,
+  enter_tags,
+  current_time: datetime,
+  current_rate: float,
+  current_profit: float,
+  min_stake: Optional[float],
+  max_stake: float,
+  current_entry_rate: float,
+  current_exit_rate: float,
+  current_entry_profit: float,
+  current_exit_profit: float,
+  **kwargs,
+):
+  is_backtest = self.dp.runmode.value in ["backtest", "hyperopt"]
+  min_stake = self.correct_min_stake(min_stake)
+  df, _ = self.dp.get_analyzed_dataframe(trade.pair, self.timeframe)
+  if len(df) < 2:
+    return None
+  last_candle = df.iloc[-1].squeeze()
+  previous_candle = df.iloc[-2].squeeze()
+
+  # we already waiting for an order to get filled
+  if trade.has_open_orders:
+    return None
+
+  filled_orders = trade.select_filled_orders()
+  filled_entries = trade.select_filled_orders(trade.entry_side)
+  filled_exits = trade.select_filled_orders(trade.exit_side)
+  count_of_entries = trade.nr_of_successful_entries
+  count_of_exits = trade.nr_of_successful_exits
+
+  if count_of_entries == 0:
+    return None
+
+  if len(filled_orders) < 1:
+    return None
+  has_order_tags = False
+  if hasattr(filled_orders[0], "ft_order_tag"):
+    has_order_tags = True
+
+  exit_rate = current_rate
+  if self.dp.runmode.value in ("live", "dry_run"):
+    ticker = self.dp.ticker(trade.pair)
+    if ("bid" in ticker) and ("ask" in ticker):
+      if trade.is_short:
+        if self.config["exit_pricing"]["price_side"] in ["ask", "other"]:
+          if ticker["ask"] is not None:
+            exit_rate = ticker["ask"]
+      else:
+        if self.config["exit_pricing"]["price_side"] in ["bid", "other"]:
+          if ticker["bid"] is not None:
+            exit_rate = ticker["bid"]
+
+  profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = self.calc_total_profit(
+    trade, filled_entries, filled_exits, exit_rate
+  )
+
+  slice_amount = filled_entries[0].cost
+  slice_profit = (exit_rate - filled_orders[-1].safe_price) / filled_orders[-1].safe_price
+  slice_profit_entry = (exit_rate - filled_entries[-1].safe_price) / filled_entries[-1].safe_price
+  slice_profit_exit = (
+    ((exit_rate - filled_exits[-1].safe_price) / filled_exits[-1].safe_price) if count_of_exits > 0 else 0.0
+  )
+
+  current_stake_amount = trade.amount * current_rate
+  is_derisk = trade.amount < (filled_entries[0].safe_filled * 0.95)
+  is_derisk_calc = False
+  is_rebuy_mode = all(c in self.short_rebuy_mode_tags for c in enter_tags) or (
+    any(c in self.short_rebuy_mode_tags for c in enter_tags)
+    and all(c in (self.short_rebuy_mode_tags + self.short_grind_mode_tags) for c in enter_tags)
+  )
+  is_grind_mode = all(c in self.short_grind_mode_tags for c in enter_tags)
+
+  fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
+  fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
+
+  # Rebuy mode
+  if is_rebuy_mode:
+    slice_amount /= self.rebuy_mode_stake_multiplier
+  # Grind mode
+  elif is_grind_mode:
+    slice_amount /= (
+      self.grind_mode_stake_multiplier_futures[0]
+      if self.is_futures_mode
+      else self.grind_mode_stake_multiplier_spot[0]
+    )
+  elif not is_derisk and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 2, 5) or is_backtest):
+    rebuy_stake, order_tag, is_derisk_calc = self.short_adjust_trade_position_no_derisk(
+      trade,
+      enter_tags,
+      current_time,
+      current_rate,
+      current_profit,
+      min_stake,
+      max_stake,
+      current_entry_rate,
+      current_exit_rate,
+      current_entry_profit,
+      current_exit_profit,
+      last_candle,
+      previous_candle,
+      filled_orders,
+      filled_entries,
+      filled_exits,
+      exit_rate,
+      slice_amount,
+      slice_profit_entry,
+      slice_profit,
+      profit_ratio,
+      profit_stake,
+      profit_init_ratio,
+      current_stake_amount,
+      has_order_tags,
+    )
+    if rebuy_stake is not None:
+      if has_order_tags:
+        return rebuy_stake, order_tag
+      else:
+        return rebuy_stake
+    elif count_of_exits == 0:
+      return None
+    elif not is_derisk_calc:
+      return None
+
+  if not is_rebuy_mode and not is_grind_mode:
+    # First entry is lower now, therefore the grinds must adjust
+    if trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest:
+      slice_amount /= (
+        self.regular_mode_stake_multiplier_futures[0]
+        if self.is_futures_mode
+        else self.regular_mode_stake_multiplier_spot[0]
+      )
+
+  is_not_trade_max_stake = current_stake_amount < (
+    (filled_entries[0].cost * self.grinding_v1_max_stake)
+    / (
+      (
+        self.grind_mode_stake_multiplier_futures[0]
+        if self.is_futures_mode
+        else self.grind_mode_stake_multiplier_spot[0]
+      )
+      if is_grind_mode
+      else 1.0
+    )
+  )
+
+  grind_1_max_sub_grinds = 0
+  grind_1_stakes = self.grind_1_stakes_futures.copy() if self.is_futures_mode else self.grind_1_stakes_spot.copy()
+  grind_1_sub_thresholds = (
+    self.grind_1_sub_thresholds_futures if self.is_futures_mode else self.grind_1_sub_thresholds_spot
+  )
+  if (slice_amount * grind_1_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_1_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_1_stakes):
+      grind_1_stakes[i] *= multi
+  grind_1_max_sub_grinds = len(grind_1_stakes)
+  grind_1_stop_grinds = self.grind_1_stop_grinds_futures if self.is_futures_mode else self.grind_1_stop_grinds_spot
+  grind_1_profit_threshold = (
+    self.grind_1_profit_threshold_futures if self.is_futures_mode else self.grind_1_profit_threshold_spot
+  )
+
+  grind_2_max_sub_grinds = 0
+  grind_2_stakes = self.grind_2_stakes_futures.copy() if self.is_futures_mode else self.grind_2_stakes_spot.copy()
+  grind_2_sub_thresholds = (
+    self.grind_2_sub_thresholds_futures if self.is_futures_mode else self.grind_2_sub_thresholds_spot
+  )
+  if (slice_amount * grind_2_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_2_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_2_stakes):
+      grind_2_stakes[i] *= multi
+  grind_2_max_sub_grinds = len(grind_2_stakes)
+  grind_2_stop_grinds = self.grind_2_stop_grinds_futures if self.is_futures_mode else self.grind_2_stop_grinds_spot
+  grind_2_profit_threshold = (
+    self.grind_2_profit_threshold_futures if self.is_futures_mode else self.grind_2_profit_threshold_spot
+  )
+
+  grind_3_max_sub_grinds = 0
+  grind_3_stakes = self.grind_3_stakes_futures.copy() if self.is_futures_mode else self.grind_3_stakes_spot.copy()
+  grind_3_sub_thresholds = (
+    self.grind_3_sub_thresholds_futures if self.is_futures_mode else self.grind_3_sub_thresholds_spot
+  )
+  if (slice_amount * grind_3_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_3_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_3_stakes):
+      grind_3_stakes[i] *= multi
+  grind_3_max_sub_grinds = len(grind_3_stakes)
+  grind_3_stop_grinds = self.grind_3_stop_grinds_futures if self.is_futures_mode else self.grind_3_stop_grinds_spot
+  grind_3_profit_threshold = (
+    self.grind_3_profit_threshold_futures if self.is_futures_mode else self.grind_3_profit_threshold_spot
+  )
+
+  grind_4_max_sub_grinds = 0
+  grind_4_stakes = self.grind_4_stakes_futures.copy() if self.is_futures_mode else self.grind_4_stakes_spot.copy()
+  grind_4_sub_thresholds = (
+    self.grind_4_sub_thresholds_futures if self.is_futures_mode else self.grind_4_sub_thresholds_spot
+  )
+  if (slice_amount * grind_4_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_4_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_4_stakes):
+      grind_4_stakes[i] *= multi
+  grind_4_max_sub_grinds = len(grind_4_stakes)
+  grind_4_stop_grinds = self.grind_4_stop_grinds_futures if self.is_futures_mode else self.grind_4_stop_grinds_spot
+  grind_4_profit_threshold = (
+    self.grind_4_profit_threshold_futures if self.is_futures_mode else self.grind_4_profit_threshold_spot
+  )
+
+  grind_5_max_sub_grinds = 0
+  grind_5_stakes = self.grind_5_stakes_futures.copy() if self.is_futures_mode else self.grind_5_stakes_spot.copy()
+  grind_5_sub_thresholds = (
+    self.grind_5_sub_thresholds_futures if self.is_futures_mode else self.grind_5_sub_thresholds_spot
+  )
+  if (slice_amount * grind_5_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_5_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_5_stakes):
+      grind_5_stakes[i] *= multi
+  grind_5_max_sub_grinds = len(grind_5_stakes)
+  grind_5_stop_grinds = self.grind_5_stop_grinds_futures if self.is_futures_mode else self.grind_5_stop_grinds_spot
+  grind_5_profit_threshold = (
+    self.grind_5_profit_threshold_futures if self.is_futures_mode else self.grind_5_profit_threshold_spot
+  )
+
+  grind_6_max_sub_grinds = 0
+  grind_6_stakes = self.grind_6_stakes_futures.copy() if self.is_futures_mode else self.grind_6_stakes_spot.copy()
+  grind_6_sub_thresholds = (
+    self.grind_6_sub_thresholds_futures if self.is_futures_mode else self.grind_6_sub_thresholds_spot
+  )
+  if (slice_amount * grind_6_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_6_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_6_stakes):
+      grind_6_stakes[i] *= multi
+  grind_6_max_sub_grinds = len(grind_6_stakes)
+  grind_6_stop_grinds = self.grind_6_stop_grinds_futures if self.is_futures_mode else self.grind_6_stop_grinds_spot
+  grind_6_profit_threshold = (
+    self.grind_6_profit_threshold_futures if self.is_futures_mode else self.grind_6_profit_threshold_spot
+  )
+
+  grind_1_derisk_1_max_sub_grinds = 0
+  grind_1_derisk_1_stakes = (
+    self.grind_1_derisk_1_stakes_futures.copy() if self.is_futures_mode else self.grind_1_derisk_1_stakes_spot.copy()
+  )
+  grind_1_derisk_1_sub_thresholds = (
+    self.grind_1_derisk_1_sub_thresholds_futures
+    if self.is_futures_mode
+    else self.grind_1_derisk_1_sub_thresholds_spot
+  )
+  if (slice_amount * grind_1_derisk_1_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_1_derisk_1_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_1_derisk_1_stakes):
+      grind_1_derisk_1_stakes[i] *= multi
+  grind_1_derisk_1_max_sub_grinds = len(grind_1_derisk_1_stakes)
+  grind_1_derisk_1_stop_grinds = (
+    self.grind_1_derisk_1_stop_grinds_futures if self.is_futures_mode else self.grind_1_derisk_1_stop_grinds_spot
+  )
+  grind_1_derisk_1_profit_threshold = (
+    self.grind_1_derisk_1_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grind_1_derisk_1_profit_threshold_spot
+  )
+
+  grind_2_derisk_1_max_sub_grinds = 0
+  grind_2_derisk_1_stakes = (
+    self.grind_2_derisk_1_stakes_futures.copy() if self.is_futures_mode else self.grind_2_derisk_1_stakes_spot.copy()
+  )
+  grind_2_derisk_1_sub_thresholds = (
+    self.grind_2_derisk_1_sub_thresholds_futures
+    if self.is_futures_mode
+    else self.grind_2_derisk_1_sub_thresholds_spot
+  )
+  if (slice_amount * grind_2_derisk_1_stakes[0] / (trade.leverage if self.is_futures_mode else 1.0)) < min_stake:
+    multi = min_stake / slice_amount / grind_2_derisk_1_stakes[0] * trade.leverage
+    for i, _ in enumerate(grind_2_derisk_1_stakes):
+      grind_2_derisk_1_stakes[i] *= multi
+  grind_2_derisk_1_max_sub_grinds = len(grind_2_derisk_1_stakes)
+  grind_2_derisk_1_stop_grinds = (
+    self.grind_2_derisk_1_stop_grinds_futures if self.is_futures_mode else self.grind_2_derisk_1_stop_grinds_spot
+  )
+  grind_2_derisk_1_profit_threshold = (
+    self.grind_2_derisk_1_profit_threshold_futures
+    if self.is_futures_mode
+    else self.grind_2_derisk_1_profit_threshold_spot
+  )
+
+  partial_sell = False
+  is_derisk_found = False  # d de-risk
+  is_derisk_1 = False
+  is_derisk_1_found = False  # d1 de-risk exit
+  derisk_1_order = None
+  derisk_1_reentry_order = None
+  derisk_1_sub_grind_count = 0
+  derisk_1_total_amount = 0.0
+  derisk_1_total_cost = 0.0
+  derisk_1_current_open_rate = 0.0
+  derisk_1_current_grind_stake = 0.0
+  derisk_1_current_grind_stake_profit = 0.0
+  derisk_1_is_sell_found = False
+  derisk_1_reentry_found = False
+  derisk_1_buy_orders = []
+  derisk_1_distance_ratio = 0.0
+  grind_1_sub_grind_count = 0
+  grind_1_total_amount = 0.0
+  grind_1_total_cost = 0.0
+  grind_1_current_open_rate = 0.0
+  grind_1_current_grind_stake = 0.0
+  grind_1_current_grind_stake_profit = 0.0
+  grind_1_is_sell_found = False
+  grind_1_found = False
+  grind_1_buy_orders = []
+  grind_1_distance_ratio = 0.0
+  grind_2_sub_grind_count = 0
+  grind_2_total_amount = 0.0
+  grind_2_total_cost = 0.0
+  grind_2_current_open_rate = 0.0
+  grind_2_current_grind_stake = 0.0
+  grind_2_current_grind_stake_profit = 0.0
+  grind_2_is_sell_found = False
+  grind_2_found = False
+  grind_2_buy_orders = []
+  grind_2_distance_ratio = 0.0
+  grind_3_sub_grind_count = 0
+  grind_3_total_amount = 0.0
+  grind_3_total_cost = 0.0
+  grind_3_current_open_rate = 0.0
+  grind_3_current_grind_stake = 0.0
+  grind_3_current_grind_stake_profit = 0.0
+  grind_3_is_sell_found = False
+  grind_3_found = False
+  grind_3_buy_orders = []
+  grind_3_distance_ratio = 0.0
+  grind_4_sub_grind_count = 0
+  grind_4_total_amount = 0.0
+  grind_4_total_cost = 0.0
+  grind_4_current_open_rate = 0.0
+  grind_4_current_grind_stake = 0.0
+  grind_4_current_grind_stake_profit = 0.0
+  grind_4_is_sell_found = False
+  grind_4_found = False
+  grind_4_buy_orders = []
+  grind_4_distance_ratio = 0.0
+  grind_5_sub_grind_count = 0
+  grind_5_total_amount = 0.0
+  grind_5_total_cost = 0.0
+  grind_5_current_open_rate = 0.0
+  grind_5_current_grind_stake = 0.0
+  grind_5_current_grind_stake_profit = 0.0
+  grind_5_is_sell_found = False
+  grind_5_found = False
+  grind_5_buy_orders = []
+  grind_5_distance_ratio = 0.0
+  grind_6_sub_grind_count = 0
+  grind_6_total_amount = 0.0
+  grind_6_total_cost = 0.0
+  grind_6_current_open_rate = 0.0
+  grind_6_current_grind_stake = 0.0
+  grind_6_current_grind_stake_profit = 0.0
+  grind_6_is_sell_found = False
+  grind_6_found = False
+  grind_6_buy_orders = []
+  grind_6_distance_ratio = 0.0
+  grind_1_derisk_1_sub_grind_count = 0
+  grind_1_derisk_1_total_amount = 0.0
+  grind_1_derisk_1_total_cost = 0.0
+  grind_1_derisk_1_current_open_rate = 0.0
+  grind_1_derisk_1_current_grind_stake = 0.0
+  grind_1_derisk_1_current_grind_stake_profit = 0.0
+  grind_1_derisk_1_is_sell_found = False
+  grind_1_derisk_1_found = False
+  grind_1_derisk_1_buy_orders = []
+  grind_1_derisk_1_distance_ratio = 0.0
+  grind_2_derisk_1_sub_grind_count = 0
+  grind_2_derisk_1_total_amount = 0.0
+  grind_2_derisk_1_total_cost = 0.0
+  grind_2_derisk_1_current_open_rate = 0.0
+  grind_2_derisk_1_current_grind_stake = 0.0
+  grind_2_derisk_1_current_grind_stake_profit = 0.0
+  grind_2_derisk_1_is_sell_found = False
+  grind_2_derisk_1_found = False
+  grind_2_derisk_1_buy_orders = []
+  grind_2_derisk_1_distance_ratio = 0.0
+  for order in reversed(filled_orders):
+    if (order.ft_order_side == "sell") and (order is not filled_orders[0]):
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          order_tag = order.ft_order_tag
+      if not is_derisk_1 and order_tag == "d1":
+        derisk_1_sub_grind_count += 1
+        derisk_1_total_amount += order.safe_filled
+        derisk_1_total_cost += order.safe_filled * order.safe_price
+        derisk_1_buy_orders.append(order.id)
+        if not derisk_1_reentry_found and not is_derisk_1:
+          derisk_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          derisk_1_reentry_found = True
+          derisk_1_reentry_order = order
+      elif not grind_1_derisk_1_is_sell_found and order_tag == "dl1":
+        grind_1_derisk_1_sub_grind_count += 1
+        grind_1_derisk_1_total_amount += order.safe_filled
+        grind_1_derisk_1_total_cost += order.safe_filled * order.safe_price
+        grind_1_derisk_1_buy_orders.append(order.id)
+        if not grind_1_derisk_1_found:
+          grind_1_derisk_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_1_derisk_1_found = True
+      elif not grind_2_derisk_1_is_sell_found and order_tag == "dl2":
+        grind_2_derisk_1_sub_grind_count += 1
+        grind_2_derisk_1_total_amount += order.safe_filled
+        grind_2_derisk_1_total_cost += order.safe_filled * order.safe_price
+        grind_2_derisk_1_buy_orders.append(order.id)
+        if not grind_2_derisk_1_found:
+          grind_2_derisk_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_2_derisk_1_found = True
+      elif not grind_6_is_sell_found and order_tag == "gd6":
+        grind_6_sub_grind_count += 1
+        grind_6_total_amount += order.safe_filled
+        grind_6_total_cost += order.safe_filled * order.safe_price
+        grind_6_buy_orders.append(order.id)
+        if not grind_6_found:
+          grind_6_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_6_found = True
+      elif not grind_5_is_sell_found and order_tag == "gd5":
+        grind_5_sub_grind_count += 1
+        grind_5_total_amount += order.safe_filled
+        grind_5_total_cost += order.safe_filled * order.safe_price
+        grind_5_buy_orders.append(order.id)
+        if not grind_5_found:
+          grind_5_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_5_found = True
+      elif not grind_4_is_sell_found and order_tag == "gd4":
+        grind_4_sub_grind_count += 1
+        grind_4_total_amount += order.safe_filled
+        grind_4_total_cost += order.safe_filled * order.safe_price
+        grind_4_buy_orders.append(order.id)
+        if not grind_4_found:
+          grind_4_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_4_found = True
+      elif not grind_3_is_sell_found and order_tag == "gd3":
+        grind_3_sub_grind_count += 1
+        grind_3_total_amount += order.safe_filled
+        grind_3_total_cost += order.safe_filled * order.safe_price
+        grind_3_buy_orders.append(order.id)
+        if not grind_3_found:
+          grind_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_3_found = True
+      elif not grind_2_is_sell_found and order_tag == "gd2":
+        grind_2_sub_grind_count += 1
+        grind_2_total_amount += order.safe_filled
+        grind_2_total_cost += order.safe_filled * order.safe_price
+        grind_2_buy_orders.append(order.id)
+        if not grind_2_found:
+          grind_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_2_found = True
+      elif not grind_1_is_sell_found and order_tag not in [
+        "r",
+        "d1",
+        "dl1",
+        "dl2",
+        "g1",
+        "g2",
+        "g3",
+        "g4",
+        "g5",
+        "g6",
+        "sg1",
+        "sg2",
+        "sg3",
+        "sg4",
+        "sg5",
+        "sg6",
+        "gd2",
+        "gd3",
+        "gd4",
+        "gd5",
+        "gd6",
+        "gm0",
+        "gmd0",
+        "gdr",
+      ]:
+        grind_1_sub_grind_count += 1
+        grind_1_total_amount += order.safe_filled
+        grind_1_total_cost += order.safe_filled * order.safe_price
+        grind_1_buy_orders.append(order.id)
+        if not grind_1_found:
+          grind_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_1_found = True
+    elif order.ft_order_side == "buy":
+      if (
+        order is filled_exits[-1]
+        and (order.safe_remaining * exit_rate / (trade.leverage if self.is_futures_mode else 1.0)) > min_stake
+      ):
+        partial_sell = True
+        break
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          sell_order_tag = order.ft_order_tag
+          order_mode = sell_order_tag.split(" ", 1)
+          if len(order_mode) > 0:
+            order_tag = order_mode[0]
+      if order_tag in ["dl1", "ddl1"]:
+        grind_1_derisk_1_is_sell_found = True
+      elif order_tag in ["dl2", "ddl2"]:
+        grind_2_derisk_1_is_sell_found = True
+      elif order_tag in ["gd6", "dd6"]:
+        grind_6_is_sell_found = True
+      elif order_tag in ["gd5", "dd5"]:
+        grind_5_is_sell_found = True
+      if order_tag in ["gd4", "dd4"]:
+        grind_4_is_sell_found = True
+      elif order_tag in ["gd3", "dd3"]:
+        grind_3_is_sell_found = True
+      elif order_tag in ["gd2", "dd2"]:
+        grind_2_is_sell_found = True
+      elif order_tag in ["d1"]:
+        if not is_derisk_1_found:
+          is_derisk_1_found = True
+          is_derisk_1 = True
+          derisk_1_order = order
+      elif order_tag in ["p", "r", "d", "dd0", "partial_exit", "force_exit", ""]:
+        if order_tag in ["d"]:
+          is_derisk_found = True
+          is_derisk = True
+        grind_1_is_sell_found = True
+        grind_2_is_sell_found = True
+        grind_3_is_sell_found = True
+        grind_4_is_sell_found = True
+        grind_5_is_sell_found = True
+        grind_6_is_sell_found = True
+        grind_1_derisk_1_is_sell_found = True
+        grind_2_derisk_1_is_sell_found = True
+      elif order_tag not in [
+        "dl1",
+        "ddl1",
+        "dl2",
+        "ddl2",
+        "g1",
+        "g2",
+        "g3",
+        "g4",
+        "g5",
+        "g6",
+        "sg1",
+        "sg2",
+        "sg3",
+        "sg4",
+        "sg5",
+        "sg6",
+        "gd2",
+        "gd3",
+        "gd4",
+        "gd5",
+        "gd6",
+        "dd2",
+        "dd3",
+        "dd4",
+        "dd5",
+        "dd6",
+        "gm0",
+        "gmd0",
+        "gdr",
+      ]:
+        grind_1_is_sell_found = True
+
+  if derisk_1_sub_grind_count > 0:
+    derisk_1_current_open_rate = derisk_1_total_cost / derisk_1_total_amount
+    derisk_1_current_grind_stake = derisk_1_total_amount * exit_rate * (1 + trade.fee_close)
+    derisk_1_current_grind_stake_profit = derisk_1_total_cost - derisk_1_current_grind_stake
+  if grind_1_sub_grind_count > 0:
+    grind_1_current_open_rate = grind_1_total_cost / grind_1_total_amount
+    grind_1_current_grind_stake = grind_1_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_1_current_grind_stake_profit = grind_1_total_cost - grind_1_current_grind_stake
+  if grind_2_sub_grind_count > 0:
+    grind_2_current_open_rate = grind_2_total_cost / grind_2_total_amount
+    grind_2_current_grind_stake = grind_2_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_2_current_grind_stake_profit = grind_2_total_cost - grind_2_current_grind_stake
+  if grind_3_sub_grind_count > 0:
+    grind_3_current_open_rate = grind_3_total_cost / grind_3_total_amount
+    grind_3_current_grind_stake = grind_3_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_3_current_grind_stake_profit = grind_3_total_cost - grind_3_current_grind_stake
+  if grind_4_sub_grind_count > 0:
+    grind_4_current_open_rate = grind_4_total_cost / grind_4_total_amount
+    grind_4_current_grind_stake = grind_4_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_4_current_grind_stake_profit = grind_4_total_cost - grind_4_current_grind_stake
+  if grind_5_sub_grind_count > 0:
+    grind_5_current_open_rate = grind_5_total_cost / grind_5_total_amount
+    grind_5_current_grind_stake = grind_5_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_5_current_grind_stake_profit = grind_5_total_cost - grind_5_current_grind_stake
+  if grind_6_sub_grind_count > 0:
+    grind_6_current_open_rate = grind_6_total_cost / grind_6_total_amount
+    grind_6_current_grind_stake = grind_6_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_6_current_grind_stake_profit = grind_6_total_cost - grind_6_current_grind_stake
+  if grind_1_derisk_1_sub_grind_count > 0:
+    grind_1_derisk_1_current_open_rate = grind_1_derisk_1_total_cost / grind_1_derisk_1_total_amount
+    grind_1_derisk_1_current_grind_stake = grind_1_derisk_1_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_1_derisk_1_current_grind_stake_profit = grind_1_derisk_1_total_cost - grind_1_derisk_1_current_grind_stake
+  if grind_2_derisk_1_sub_grind_count > 0:
+    grind_2_derisk_1_current_open_rate = grind_2_derisk_1_total_cost / grind_2_derisk_1_total_amount
+    grind_2_derisk_1_current_grind_stake = grind_2_derisk_1_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_2_derisk_1_current_grind_stake_profit = grind_2_derisk_1_total_cost - grind_2_derisk_1_current_grind_stake
+
+  num_open_grinds = (
+    grind_1_sub_grind_count
+    + grind_2_sub_grind_count
+    + grind_3_sub_grind_count
+    + grind_4_sub_grind_count
+    + grind_5_sub_grind_count
+    + grind_6_sub_grind_count
+    + grind_1_derisk_1_sub_grind_count
+    + grind_2_derisk_1_sub_grind_count
+  )
+  grinds_total_stake_profit = (
+    derisk_1_current_grind_stake_profit
+    + grind_1_derisk_1_current_grind_stake_profit
+    + grind_2_derisk_1_current_grind_stake_profit
+    + grind_1_current_grind_stake_profit
+    + grind_2_current_grind_stake_profit
+    + grind_3_current_grind_stake_profit
+    + grind_4_current_grind_stake_profit
+    + grind_5_current_grind_stake_profit
+    + grind_6_current_grind_stake_profit
+  )
+  grinds_total_amount = (
+    derisk_1_total_amount
+    + grind_1_derisk_1_total_amount
+    + grind_2_derisk_1_total_amount
+    + grind_1_total_amount
+    + grind_2_total_amount
+    + grind_3_total_amount
+    + grind_4_total_amount
+    + grind_5_total_amount
+    + grind_6_total_amount
+  )
+
+  # Sell remaining if partial fill on exit
+  if partial_sell:
+    order = filled_exits[-1]
+    sell_amount = order.safe_remaining * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      self.dp.send_msg(
+        f"Exit (remaining) [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      order_tag = "p"
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          order_tag = order.ft_order_tag
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  if is_grind_mode and (
+    (filled_entries[0].safe_filled * (trade.stake_amount / trade.amount) - (min_stake * 1.5)) > min_stake
+  ):
+    is_first_entry_exit_found = False
+    for order in filled_orders:
+      if order.ft_order_side == "buy":
+        order_tag = ""
+        if has_order_tags:
+          if order.ft_order_tag is not None:
+            sell_order_tag = order.ft_order_tag
+            order_mode = sell_order_tag.split(" ", 1)
+            if len(order_mode) > 0:
+              order_tag = order_mode[0]
+        else:
+          # no order tag support, assume the first exit is for the first buy
+          is_first_entry_exit_found = True
+        if order_tag in ["gm0", "gmd0"]:
+          is_first_entry_exit_found = True
+          break
+    if not is_first_entry_exit_found:
+      first_entry = filled_entries[0]
+      first_entry_distance_ratio = -(exit_rate - first_entry.safe_price) / first_entry.safe_price
+      # First entry exit
+      if first_entry_distance_ratio > (
+        (self.grind_mode_first_entry_profit_threshold_spot + fee_open_rate + fee_close_rate)
+        if self.is_futures_mode
+        else (self.grind_mode_first_entry_profit_threshold_spot + fee_open_rate + fee_close_rate)
+      ):
+        sell_amount = first_entry.safe_filled * exit_rate / trade.leverage
+        if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+          sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+        ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+        if sell_amount > min_stake and ft_sell_amount > min_stake:
+          grind_profit = -(exit_rate - first_entry.safe_price) / first_entry.safe_price
+          coin_amount = sell_amount / exit_rate
+          self.dp.send_msg(
+            self.notification_msg(
+              "grinding-exit",
+              tag="gm0",
+              pair=trade.pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=self.config["stake_currency"],
+              grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
+            )
+          )
+          log.info(
+            f"Grinding exit (gm0) [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {coin_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+          )
+          order_tag = "gm0"
+          for grind_entry_id in grind_1_buy_orders:
+            order_tag += " " + str(grind_entry_id)
+          if has_order_tags:
+            return -ft_sell_amount, order_tag
+          else:
+            return -ft_sell_amount
+      # First entry de-risk
+      if self.derisk_use_grind_stops and (
+        first_entry_distance_ratio
+        < (
+          self.grind_mode_first_entry_stop_threshold_spot
+          if self.is_futures_mode
+          else self.grind_mode_first_entry_stop_threshold_spot
+        )
+      ):
+        sell_amount = first_entry.safe_filled * exit_rate / trade.leverage
+        if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+          sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+        ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+        if sell_amount > min_stake and ft_sell_amount > min_stake:
+          grind_profit = -(exit_rate - first_entry.safe_price) / first_entry.safe_price
+          coin_amount = sell_amount / exit_rate
+          self.dp.send_msg(
+            self.notification_msg(
+              "grinding-derisk",
+              tag="gmd0",
+              pair=trade.pair,
+              rate=exit_rate,
+              stake_amount=sell_amount,
+              profit_stake=profit_stake,
+              profit_ratio=profit_ratio,
+              stake_currency=self.config["stake_currency"],
+              grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+              grind_profit_pct=grind_profit,
+              coin_amount=coin_amount,
+            )
+          )
+          log.info(
+            f"Grinding de-risk (gmd0) [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {coin_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+          )
+          order_tag = "gmd0"
+          for grind_entry_id in grind_1_buy_orders:
+            order_tag += " " + str(grind_entry_id)
+          if has_order_tags:
+            return -ft_sell_amount, order_tag
+          else:
+            return -ft_sell_amount
+
+  is_short_grind_entry = self.short_grind_entry(last_candle, previous_candle, slice_profit, True)
+
+  # Grinding derisk 1
+  # Buy
+  if (
+    has_order_tags
+    and is_derisk_1
+    and not derisk_1_reentry_found
+    and (not partial_sell)
+    and (grind_1_derisk_1_sub_grind_count < grind_1_derisk_1_max_sub_grinds)
+    and is_not_trade_max_stake
+  ):
+    if (
+      (
+        (
+          (grind_1_derisk_1_sub_grind_count > 0)
+          and -grind_1_derisk_1_distance_ratio < grind_1_derisk_1_sub_thresholds[grind_1_derisk_1_sub_grind_count]
+        )
+        or ((is_derisk or is_derisk_calc) and grind_1_derisk_1_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * grind_1_derisk_1_stakes[grind_1_derisk_1_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_1_derisk_1_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate
+        grind_profit_stake = grind_1_derisk_1_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="dl1",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_1_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (dl1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_derisk_1_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "dl1"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_1_derisk_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate
+    if grind_profit > (grind_1_derisk_1_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_1_derisk_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="dl1",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_derisk_1_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (dl1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "dl1"
+        for grind_entry_id in grind_1_derisk_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (grind_1_derisk_1_sub_grind_count > 0)
+    # and (
+    #   (-(exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate)
+    #   < grind_1_derisk_1_stop_grinds
+    # )
+    and (grind_1_derisk_1_current_grind_stake_profit < (slice_amount * grind_1_derisk_1_stop_grinds))
+    and (is_derisk or is_derisk_calc)
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_1_derisk_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_1_derisk_1_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_1_derisk_1_current_open_rate) / grind_1_derisk_1_current_open_rate)
+          if grind_1_derisk_1_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="ddl1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_derisk_1_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (ddl1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_derisk_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "ddl1"
+      for grind_entry_id in grind_1_derisk_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding derisk 2
+  # Buy
+  if (
+    has_order_tags
+    and is_derisk_1
+    and not derisk_1_reentry_found
+    and (not partial_sell)
+    and (grind_2_derisk_1_sub_grind_count < grind_2_derisk_1_max_sub_grinds)
+    and is_not_trade_max_stake
+  ):
+    if (
+      (
+        (
+          (grind_2_derisk_1_sub_grind_count > 0)
+          and -grind_2_derisk_1_distance_ratio < grind_2_derisk_1_sub_thresholds[grind_2_derisk_1_sub_grind_count]
+        )
+        or ((is_derisk or is_derisk_calc) and grind_2_derisk_1_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * grind_2_derisk_1_stakes[grind_2_derisk_1_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_2_derisk_1_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate
+        grind_profit_stake = grind_2_derisk_1_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="dl2",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_2_derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (dl2) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_derisk_1_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "dl2"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_2_derisk_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate
+    if grind_profit > (grind_2_derisk_1_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_2_derisk_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="dl2",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_derisk_1_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (dl2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "dl2"
+        for grind_entry_id in grind_2_derisk_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (grind_2_derisk_1_sub_grind_count > 0)
+    # and (
+    #   (-(exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate)
+    #   < grind_2_derisk_1_stop_grinds
+    # )
+    and (grind_2_derisk_1_current_grind_stake_profit < (slice_amount * grind_2_derisk_1_stop_grinds))
+    and (is_derisk or is_derisk_calc)
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_2_derisk_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_2_derisk_1_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_2_derisk_1_current_open_rate) / grind_2_derisk_1_current_open_rate)
+          if grind_2_derisk_1_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="ddl2",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_derisk_1_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (ddl2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_derisk_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "ddl2"
+      for grind_entry_id in grind_2_derisk_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 1
+  # Buy
+  if (not partial_sell) and (grind_1_sub_grind_count < grind_1_max_sub_grinds):
+    if (
+      (
+        ((grind_1_sub_grind_count > 0) and -grind_1_distance_ratio < grind_1_sub_thresholds[grind_1_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_1_sub_grind_count == 0)
+        or (is_grind_mode and grind_1_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_1_stakes[grind_1_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_1_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+        grind_profit_stake = grind_1_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd1",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd1"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  if (
+    self.is_futures_mode
+    and has_order_tags
+    and (not partial_sell)
+    and slice_profit > (0.65 / trade.leverage)
+    and (is_derisk or is_derisk_calc or is_grind_mode)
+    and (grind_1_sub_grind_count < grind_1_max_sub_grinds)
+  ):
+    buy_amount = (
+      slice_amount * grind_1_stakes[grind_1_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+    )
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None
+    grind_profit = 0.0
+    grind_profit_stake = 0.0
+    if grind_1_sub_grind_count > 0:
+      grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+      grind_profit_stake = grind_1_current_grind_stake_profit
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="gd1",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
+      )
+    )
+    log.info(
+      f"Grinding entry (gd1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {self.config['stake_currency']})"
+    )
+    order_tag = "gd1"
+    if has_order_tags:
+      return buy_amount, order_tag
+    else:
+      return buy_amount
+
+  # Sell
+  if grind_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+    if grind_profit > (grind_1_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd1",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd1"
+        for grind_entry_id in grind_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_1_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate) < grind_1_stop_grinds)
+      and (grind_1_current_grind_stake_profit < (slice_amount * grind_1_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_1_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate)
+          if grind_1_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd1"
+      for grind_entry_id in grind_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 2
+  # Buy
+  if has_order_tags and (not partial_sell) and (grind_2_sub_grind_count < grind_2_max_sub_grinds):
+    if (
+      (
+        ((grind_2_sub_grind_count > 0) and -grind_2_distance_ratio < grind_2_sub_thresholds[grind_2_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_2_sub_grind_count == 0)
+        or (is_grind_mode and grind_2_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_2_stakes[grind_2_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_2_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
+        grind_profit_stake = grind_2_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd2",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd2) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd2"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_2_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
+    if grind_profit > (grind_2_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd2",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd2"
+        for grind_entry_id in grind_2_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_2_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate) < grind_2_stop_grinds)
+      and (grind_2_current_grind_stake_profit < (slice_amount * grind_2_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_2_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate)
+          if grind_2_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd2",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd2"
+      for grind_entry_id in grind_2_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 3
+  # Buy
+  if has_order_tags and (not partial_sell) and (grind_3_sub_grind_count < grind_3_max_sub_grinds):
+    if (
+      (
+        ((grind_3_sub_grind_count > 0) and -grind_3_distance_ratio < grind_3_sub_thresholds[grind_3_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_3_sub_grind_count == 0)
+        or (is_grind_mode and grind_3_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_3_stakes[grind_3_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_3_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
+        grind_profit_stake = grind_3_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd3",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd3) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd3"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_3_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
+    if grind_profit > (grind_3_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd3",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd3) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd3"
+        for grind_entry_id in grind_3_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_3_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate) < grind_3_stop_grinds)
+      and (grind_3_current_grind_stake_profit < (slice_amount * grind_3_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_3_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate)
+          if grind_3_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd3",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd3) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd3"
+      for grind_entry_id in grind_3_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 4
+  # Buy
+  if has_order_tags and (not partial_sell) and (grind_4_sub_grind_count < grind_4_max_sub_grinds):
+    if (
+      (
+        ((grind_4_sub_grind_count > 0) and -grind_4_distance_ratio < grind_4_sub_thresholds[grind_4_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_4_sub_grind_count == 0)
+        or (is_grind_mode and grind_4_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_4_stakes[grind_4_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_4_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
+        grind_profit_stake = grind_4_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd4",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd4) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd4"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_4_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
+    if grind_profit > (grind_4_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd4",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd4) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd4"
+        for grind_entry_id in grind_4_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_4_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate) < grind_4_stop_grinds)
+      and (grind_4_current_grind_stake_profit < (slice_amount * grind_4_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_4_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate)
+          if grind_4_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd4",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd4) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd4"
+      for grind_entry_id in grind_4_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 5
+  # Buy
+  if has_order_tags and (not partial_sell) and (grind_5_sub_grind_count < grind_5_max_sub_grinds):
+    if (
+      (
+        ((grind_5_sub_grind_count > 0) and -grind_5_distance_ratio < grind_5_sub_thresholds[grind_5_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_5_sub_grind_count == 0)
+        or (is_grind_mode and grind_5_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_5_stakes[grind_5_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_5_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
+        grind_profit_stake = grind_5_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd5",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd5) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd5"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_5_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
+    if grind_profit > (grind_5_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd5",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd5) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd5"
+        for grind_entry_id in grind_5_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_5_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate) < grind_5_stop_grinds)
+      and (grind_5_current_grind_stake_profit < (slice_amount * grind_5_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_5_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate)
+          if grind_5_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd5",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd5) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd5"
+      for grind_entry_id in grind_5_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # Grinding 6
+  # Buy
+  if has_order_tags and (not partial_sell) and (grind_6_sub_grind_count < grind_6_max_sub_grinds):
+    if (
+      (
+        ((grind_6_sub_grind_count > 0) and -grind_6_distance_ratio < grind_6_sub_thresholds[grind_6_sub_grind_count])
+        or ((is_derisk or is_derisk_calc) and grind_6_sub_grind_count == 0)
+        or (is_grind_mode and grind_6_sub_grind_count == 0)
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+      and is_not_trade_max_stake
+    ):
+      buy_amount = (
+        slice_amount * grind_6_stakes[grind_6_sub_grind_count] / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_6_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
+        grind_profit_stake = grind_6_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="gd6",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (gd6) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "gd6"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # Sell
+  if grind_6_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
+    if grind_profit > (grind_6_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_6_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="gd6",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (gd6) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "gd6"
+        for grind_entry_id in grind_6_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        if has_order_tags:
+          return -ft_sell_amount, order_tag
+        else:
+          return -ft_sell_amount
+
+  # Grind stop
+  if (
+    self.derisk_use_grind_stops
+    and (
+      (grind_6_sub_grind_count > 0)
+      # and ((-(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate) < grind_6_stop_grinds)
+      and (grind_6_current_grind_stake_profit < (slice_amount * grind_6_stop_grinds))
+      and (is_derisk or is_derisk_calc or is_grind_mode)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = grind_6_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_6_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate)
+          if grind_6_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="dd6",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (dd6) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "dd6"
+      for grind_entry_id in grind_6_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      if has_order_tags:
+        return -ft_sell_amount, order_tag
+      else:
+        return -ft_sell_amount
+
+  # De-risk 1 reentry
+  if (
+    is_derisk_1
+    and not derisk_1_reentry_found
+    and derisk_1_order is not None
+    and (
+      (-(current_rate - derisk_1_order.safe_price) / derisk_1_order.safe_price)
+      < (
+        self.regular_mode_derisk_1_reentry_futures
+        if self.is_futures_mode
+        else self.regular_mode_derisk_1_reentry_spot
+      )
+    )
+  ):
+    if (
+      (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=24) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and (
+        # (last_candle["protections_short_rebuy"] == True)
+        # and (last_candle["protections_short_global"] == True)
+        (last_candle["global_protections_short_pump"] == True)
+        and (last_candle["global_protections_short_dump"] == True)
+      )
+      and is_short_grind_entry
+    ):
+      buy_amount = derisk_1_order.safe_filled * derisk_1_order.safe_price
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if derisk_1_sub_grind_count > 0:
+        grind_profit = -(exit_rate - derisk_1_current_open_rate) / derisk_1_current_open_rate
+        grind_profit_stake = derisk_1_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "re-entry",
+          tag="d1",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=derisk_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Re-entry (d1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({derisk_1_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "d1"
+      if has_order_tags:
+        return buy_amount, order_tag
+      else:
+        return buy_amount
+
+  # De-risk level 1
+  if (
+    has_order_tags
+    # and not is_derisk_1
+    and derisk_1_reentry_found
+    and derisk_1_reentry_order is not None
+    # and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 5) or is_backtest)
+    and -derisk_1_distance_ratio
+    < (
+      (
+        self.regular_mode_derisk_1_reentry_futures
+        if self.is_futures_mode
+        else self.regular_mode_derisk_1_reentry_spot
+      )
+      / (trade.leverage if self.is_futures_mode else 1.0)
+    )
+  ):
+    sell_amount = derisk_1_reentry_order.safe_filled * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="d1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk (d1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "d1"
+
+  return None
+
+# Short Grinding Entry
+# ---------------------------------------------------------------------------------------------
+def short_grind_entry(
+  self, last_candle: Series, previous_candle: Series, slice_profit: float, is_derisk: bool
+) -> float:
+  if (
+    (last_candle["protections_short_global"] == True)
+    and (last_candle["protections_short_rebuy"] == True)
+    and (last_candle["global_protections_short_pump"] == True)
+    and (last_candle["global_protections_short_dump"] == True)
+    and (
+      (last_candle["enter_short"] == True)
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3"] < 90.0)
+        and (last_candle["RSI_3_15m"] < 90.0)
+        and (last_candle["AROOND_14"] < 25.0)
+        and (last_candle["STOCHRSIk_14_14_3_3_1h"] > 30.0)
+        and (last_candle["STOCHRSIk_14_14_3_3_4h"] > 30.0)
+        and (last_candle["close"] > (last_candle["EMA_16"] * 1.012))
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3_15m"] < 95.0)
+        and (last_candle["RSI_3_1h"] < 95.0)
+        and (last_candle["RSI_3_4h"] < 95.0)
+        and (last_candle["EMA_12"] > last_candle["EMA_26"])
+        and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.030))
+        and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3"] < 95.0)
+        and (last_candle["RSI_3_15m"] < 90.0)
+        and (last_candle["RSI_3_1h"] < 90.0)
+        and (last_candle["RSI_3_4h"] < 90.0)
+        and (last_candle["EMA_12"] > last_candle["EMA_26"])
+        and ((last_candle["EMA_12"] - last_candle["EMA_26"]) > (last_candle["open"] * 0.020))
+        and ((previous_candle["EMA_12"] - previous_candle["EMA_26"]) > (last_candle["open"] / 100.0))
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3"] < 84.0)
+        and (last_candle["AROOND_14_15m"] < 25.0)
+        and (last_candle["close"] > (last_candle["EMA_12"] * 1.016))
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3_15m"] < 90.0)
+        and (last_candle["RSI_3_1h"] < 90.0)
+        and (last_candle["RSI_3_4h"] < 90.0)
+        and (last_candle["AROONU_14_1h"] < last_candle["AROOND_14_1h"])
+        and (last_candle["AROONU_14_4h"] < last_candle["AROOND_14_4h"])
+        and (last_candle["close"] > (last_candle["EMA_26"] * 1.022))
+        and (last_candle["close"] > (last_candle["BBL_20_2.0"] * 1.001))
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3_1h"] < 80.0)
+        and (last_candle["RSI_3_4h"] < 80.0)
+        and (last_candle["RSI_14_1h"] > 20.0)
+        and (last_candle["RSI_14_4h"] > 40.0)
+        and (last_candle["AROONU_14"] < last_candle["AROOND_14"])
+        and (previous_candle["AROONU_14"] > previous_candle["AROOND_14"])
+      )
+      or (
+        (last_candle["RSI_14"] > 64.0)
+        and (last_candle["RSI_3_15m"] < 85.0)
+        and (last_candle["RSI_3_1h"] < 80.0)
+        and (last_candle["RSI_3_4h"] < 80.0)
+        and (last_candle["RSI_14_1h"] > 20.0)
+        and (last_candle["RSI_14_4h"] > 40.0)
+        and (last_candle["KST_10_15_20_30_10_10_10_15"] < last_candle["KSTs_9"])
+        and (previous_candle["KST_10_15_20_30_10_10_10_15"] > previous_candle["KSTs_9"])
+      )
+      or (
+        is_derisk
+        and (last_candle["RSI_3"] < 80.0)
+        and (last_candle["RSI_3_15m"] < 80.0)
+        and (last_candle["RSI_14"] > 64.0)
+        and (last_candle["AROOND_14"] < 25.0)
+        and (last_candle["AROOND_14_15m"] < 25.0)
+        and (last_candle["STOCHRSIk_14_14_3_3_15m"] > 50.0)
+      )
+    )
+  ):
+    return True
+
+  return False
+
+# Short Grinding Adjust Trade Position No De-Risk
+# ---------------------------------------------------------------------------------------------
+def short_adjust_trade_position_no_derisk(
+  self,
+  trade: Trade,
+  enter_tags,
+  current_time: datetime,
+  current_rate: float,
+  current_profit: float,
+  min_stake: Optional[float],
+  max_stake: float,
+  current_entry_rate: float,
+  current_exit_rate: float,
+  current_entry_profit: float,
+  current_exit_profit: float,
+  last_candle: Series,
+  previous_candle: Series,
+  filled_orders: "Orders",
+  filled_entries: "Orders",
+  filled_exits: "Orders",
+  exit_rate: float,
+  slice_amount: float,
+  slice_profit_entry: float,
+  slice_profit: float,
+  profit_ratio: float,
+  profit_stake: float,
+  profit_init_ratio: float,
+  current_stake_amount: float,
+  has_order_tags: bool,
+  **kwargs,
+) -> tuple[Optional[float], str, bool]:
+  is_backtest = self.dp.runmode.value in ["backtest", "hyperopt"]
+
+  max_rebuy_sub_grinds = 0
+  regular_mode_rebuy_stakes = (
+    self.regular_mode_rebuy_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_rebuy_stakes_spot.copy()
+  )
+  regular_mode_rebuy_sub_thresholds = (
+    self.regular_mode_rebuy_thresholds_futures if self.is_futures_mode else self.regular_mode_rebuy_thresholds_spot
+  )
+  if (slice_amount * regular_mode_rebuy_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_rebuy_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_rebuy_stakes):
+      regular_mode_rebuy_stakes[i] *= multi
+  max_rebuy_sub_grinds = len(regular_mode_rebuy_stakes)
+
+  max_grind_1_sub_grinds = 0
+  regular_mode_grind_1_stakes = (
+    self.regular_mode_grind_1_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_1_stakes_spot.copy()
+  )
+  regular_mode_grind_1_sub_thresholds = (
+    self.regular_mode_grind_1_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_1_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_1_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_1_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_1_stakes):
+      regular_mode_grind_1_stakes[i] *= multi
+  max_grind_1_sub_grinds = len(regular_mode_grind_1_stakes)
+  regular_mode_grind_1_stop_grinds = (
+    self.regular_mode_grind_1_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_1_stop_grinds_spot
+  )
+  regular_mode_grind_1_profit_threshold = (
+    self.regular_mode_grind_1_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_1_profit_threshold_spot
+  )
+
+  max_grind_2_sub_grinds = 0
+  regular_mode_grind_2_stakes = (
+    self.regular_mode_grind_2_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_2_stakes_spot.copy()
+  )
+  regular_mode_grind_2_sub_thresholds = (
+    self.regular_mode_grind_2_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_2_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_2_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_2_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_2_stakes):
+      regular_mode_grind_2_stakes[i] *= multi
+  max_grind_2_sub_grinds = len(regular_mode_grind_2_stakes)
+  regular_mode_grind_2_stop_grinds = (
+    self.regular_mode_grind_2_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_2_stop_grinds_spot
+  )
+  regular_mode_grind_2_profit_threshold = (
+    self.regular_mode_grind_2_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_2_profit_threshold_spot
+  )
+
+  max_grind_3_sub_grinds = 0
+  regular_mode_grind_3_stakes = (
+    self.regular_mode_grind_3_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_3_stakes_spot.copy()
+  )
+  regular_mode_grind_3_sub_thresholds = (
+    self.regular_mode_grind_3_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_3_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_3_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_3_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_3_stakes):
+      regular_mode_grind_3_stakes[i] *= multi
+  max_grind_3_sub_grinds = len(regular_mode_grind_3_stakes)
+  regular_mode_grind_3_stop_grinds = (
+    self.regular_mode_grind_3_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_3_stop_grinds_spot
+  )
+  regular_mode_grind_3_profit_threshold = (
+    self.regular_mode_grind_3_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_3_profit_threshold_spot
+  )
+
+  max_grind_4_sub_grinds = 0
+  regular_mode_grind_4_stakes = (
+    self.regular_mode_grind_4_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_4_stakes_spot.copy()
+  )
+  regular_mode_grind_4_sub_thresholds = (
+    self.regular_mode_grind_4_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_4_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_4_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_4_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_4_stakes):
+      regular_mode_grind_4_stakes[i] *= multi
+  max_grind_4_sub_grinds = len(regular_mode_grind_4_stakes)
+  regular_mode_grind_4_stop_grinds = (
+    self.regular_mode_grind_4_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_4_stop_grinds_spot
+  )
+  regular_mode_grind_4_profit_threshold = (
+    self.regular_mode_grind_4_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_4_profit_threshold_spot
+  )
+
+  max_grind_5_sub_grinds = 0
+  regular_mode_grind_5_stakes = (
+    self.regular_mode_grind_5_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_5_stakes_spot.copy()
+  )
+  regular_mode_grind_5_sub_thresholds = (
+    self.regular_mode_grind_5_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_5_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_5_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_5_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_5_stakes):
+      regular_mode_grind_5_stakes[i] *= multi
+  max_grind_5_sub_grinds = len(regular_mode_grind_5_stakes)
+  regular_mode_grind_5_stop_grinds = (
+    self.regular_mode_grind_5_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_5_stop_grinds_spot
+  )
+  regular_mode_grind_5_profit_threshold = (
+    self.regular_mode_grind_5_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_5_profit_threshold_spot
+  )
+
+  max_grind_6_sub_grinds = 0
+  regular_mode_grind_6_stakes = (
+    self.regular_mode_grind_6_stakes_futures.copy()
+    if self.is_futures_mode
+    else self.regular_mode_grind_6_stakes_spot.copy()
+  )
+  regular_mode_grind_6_sub_thresholds = (
+    self.regular_mode_grind_6_thresholds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_6_thresholds_spot
+  )
+  if (slice_amount * regular_mode_grind_6_stakes[0] / trade.leverage) < min_stake:
+    multi = min_stake / slice_amount / regular_mode_grind_6_stakes[0] * trade.leverage
+    for i, _ in enumerate(regular_mode_grind_6_stakes):
+      regular_mode_grind_6_stakes[i] *= multi
+  max_grind_6_sub_grinds = len(regular_mode_grind_6_stakes)
+  regular_mode_grind_6_stop_grinds = (
+    self.regular_mode_grind_6_stop_grinds_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_6_stop_grinds_spot
+  )
+  regular_mode_grind_6_profit_threshold = (
+    self.regular_mode_grind_6_profit_threshold_futures
+    if self.is_futures_mode
+    else self.regular_mode_grind_6_profit_threshold_spot
+  )
+
+  partial_sell = False
+  is_derisk = False
+  is_derisk_1 = False
+  rebuy_sub_grind_count = 0
+  rebuy_total_amount = 0.0
+  rebuy_total_cost = 0.0
+  rebuy_current_open_rate = 0.0
+  rebuy_current_grind_stake = 0.0
+  rebuy_current_grind_stake_profit = 0.0
+  rebuy_is_sell_found = False
+  rebuy_found = False
+  rebuy_buy_orders = []
+  rebuy_distance_ratio = 0.0
+  grind_1_sub_grind_count = 0
+  grind_1_total_amount = 0.0
+  grind_1_total_cost = 0.0
+  grind_1_current_open_rate = 0.0
+  grind_1_current_grind_stake = 0.0
+  grind_1_current_grind_stake_profit = 0.0
+  grind_1_is_sell_found = False
+  grind_1_found = False
+  grind_1_buy_orders = []
+  grind_1_distance_ratio = 0.0
+  grind_2_sub_grind_count = 0
+  grind_2_total_amount = 0.0
+  grind_2_total_cost = 0.0
+  grind_2_current_open_rate = 0.0
+  grind_2_current_grind_stake = 0.0
+  grind_2_current_grind_stake_profit = 0.0
+  grind_2_is_sell_found = False
+  grind_2_found = False
+  grind_2_buy_orders = []
+  grind_2_distance_ratio = 0.0
+  grind_3_sub_grind_count = 0
+  grind_3_total_amount = 0.0
+  grind_3_total_cost = 0.0
+  grind_3_current_open_rate = 0.0
+  grind_3_current_grind_stake = 0.0
+  grind_3_current_grind_stake_profit = 0.0
+  grind_3_is_sell_found = False
+  grind_3_found = False
+  grind_3_buy_orders = []
+  grind_3_distance_ratio = 0.0
+  grind_4_sub_grind_count = 0
+  grind_4_total_amount = 0.0
+  grind_4_total_cost = 0.0
+  grind_4_current_open_rate = 0.0
+  grind_4_current_grind_stake = 0.0
+  grind_4_current_grind_stake_profit = 0.0
+  grind_4_is_sell_found = False
+  grind_4_found = False
+  grind_4_buy_orders = []
+  grind_4_distance_ratio = 0.0
+  grind_5_sub_grind_count = 0
+  grind_5_total_amount = 0.0
+  grind_5_total_cost = 0.0
+  grind_5_current_open_rate = 0.0
+  grind_5_current_grind_stake = 0.0
+  grind_5_current_grind_stake_profit = 0.0
+  grind_5_is_sell_found = False
+  grind_5_found = False
+  grind_5_buy_orders = []
+  grind_5_distance_ratio = 0.0
+  grind_6_sub_grind_count = 0
+  grind_6_total_amount = 0.0
+  grind_6_total_cost = 0.0
+  grind_6_current_open_rate = 0.0
+  grind_6_current_grind_stake = 0.0
+  grind_6_current_grind_stake_profit = 0.0
+  grind_6_is_sell_found = False
+  grind_6_found = False
+  grind_6_buy_orders = []
+  grind_6_distance_ratio = 0.0
+  for order in reversed(filled_orders):
+    if (order.ft_order_side == "sell") and (order is not filled_orders[0]):
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          order_tag = order.ft_order_tag
+      if not grind_1_is_sell_found and order_tag == "g1":
+        grind_1_sub_grind_count += 1
+        grind_1_total_amount += order.safe_filled
+        grind_1_total_cost += order.safe_filled * order.safe_price
+        grind_1_buy_orders.append(order.id)
+        if not grind_1_found:
+          grind_1_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_1_found = True
+      elif not grind_2_is_sell_found and order_tag == "g2":
+        grind_2_sub_grind_count += 1
+        grind_2_total_amount += order.safe_filled
+        grind_2_total_cost += order.safe_filled * order.safe_price
+        grind_2_buy_orders.append(order.id)
+        if not grind_2_found:
+          grind_2_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_2_found = True
+      elif not grind_3_is_sell_found and order_tag == "g3":
+        grind_3_sub_grind_count += 1
+        grind_3_total_amount += order.safe_filled
+        grind_3_total_cost += order.safe_filled * order.safe_price
+        grind_3_buy_orders.append(order.id)
+        if not grind_3_found:
+          grind_3_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_3_found = True
+      elif not grind_4_is_sell_found and order_tag == "g4":
+        grind_4_sub_grind_count += 1
+        grind_4_total_amount += order.safe_filled
+        grind_4_total_cost += order.safe_filled * order.safe_price
+        grind_4_buy_orders.append(order.id)
+        if not grind_4_found:
+          grind_4_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_4_found = True
+      elif not grind_5_is_sell_found and order_tag == "g5":
+        grind_5_sub_grind_count += 1
+        grind_5_total_amount += order.safe_filled
+        grind_5_total_cost += order.safe_filled * order.safe_price
+        grind_5_buy_orders.append(order.id)
+        if not grind_5_found:
+          grind_5_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_5_found = True
+      elif not grind_6_is_sell_found and order_tag == "g6":
+        grind_6_sub_grind_count += 1
+        grind_6_total_amount += order.safe_filled
+        grind_6_total_cost += order.safe_filled * order.safe_price
+        grind_6_buy_orders.append(order.id)
+        if not grind_6_found:
+          grind_6_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          grind_6_found = True
+      elif not rebuy_is_sell_found and order_tag not in [
+        "g1",
+        "g2",
+        "g3",
+        "g4",
+        "g5",
+        "g6",
+        "sg1",
+        "sg2",
+        "sg3",
+        "sg4",
+        "sg5",
+        "sg6",
+        "dl1",
+        "dl2",
+        "gd1",
+        "gd2",
+        "gd3",
+        "gd4",
+        "gd5",
+        "gd6",
+        "gm0",
+        "gmd0",
+      ]:
+        rebuy_sub_grind_count += 1
+        rebuy_total_amount += order.safe_filled
+        rebuy_total_cost += order.safe_filled * order.safe_price
+        rebuy_buy_orders.append(order.id)
+        if not rebuy_found:
+          rebuy_distance_ratio = (exit_rate - order.safe_price) / order.safe_price
+          rebuy_found = True
+    elif order.ft_order_side == "buy":
+      if (
+        order is filled_exits[-1]
+        and (order.safe_remaining * exit_rate / (trade.leverage if self.is_futures_mode else 1.0)) > min_stake
+      ):
+        partial_sell = True
+        break
+      order_tag = ""
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          sell_order_tag = order.ft_order_tag
+          order_mode = sell_order_tag.split(" ", 1)
+          if len(order_mode) > 0:
+            order_tag = order_mode[0]
+      if order_tag in ["g1", "sg1"]:
+        grind_1_is_sell_found = True
+      elif order_tag in ["g2", "sg2"]:
+        grind_2_is_sell_found = True
+      elif order_tag in ["g3", "sg3"]:
+        grind_3_is_sell_found = True
+      elif order_tag in ["g4", "sg4"]:
+        grind_4_is_sell_found = True
+      elif order_tag in ["g5", "sg5"]:
+        grind_5_is_sell_found = True
+      elif order_tag in ["g6", "sg6"]:
+        grind_6_is_sell_found = True
+      elif order_tag in ["d", "d1", "dd0", "ddl1", "ddl2", "dd1", "dd2", "dd3", "dd4", "dd5", "dd6"]:
+        is_derisk = True
+        if order_tag in ["d1"]:
+          is_derisk_1 = True
+        grind_1_is_sell_found = True
+        grind_2_is_sell_found = True
+        grind_3_is_sell_found = True
+        grind_4_is_sell_found = True
+        grind_5_is_sell_found = True
+        grind_6_is_sell_found = True
+        rebuy_is_sell_found = True
+      elif order_tag not in [
+        "p",
+        "g1",
+        "g2",
+        "g3",
+        "g4",
+        "g5",
+        "g6",
+        "sg1",
+        "sg2",
+        "sg3",
+        "sg4",
+        "sg5",
+        "sg6",
+        "dl1",
+        "dl2",
+        "gd1",
+        "gd2",
+        "gd3",
+        "gd4",
+        "gd5",
+        "gd6",
+        "gm0",
+        "gmd0",
+      ]:
+        rebuy_is_sell_found = True
+      if not is_derisk:
+        start_amount = filled_orders[0].safe_filled
+        current_amount = 0.0
+        for order2 in filled_orders:
+          if order2.ft_order_side == "sell":
+            current_amount += order2.safe_filled
+          elif order2.ft_order_side == "buy":
+            current_amount -= order2.safe_filled
+          if order2 is order:
+            if current_amount < (start_amount * 0.95):
+              is_derisk = True
+      # found sells for all modes
+      if (
+        rebuy_is_sell_found
+        and grind_1_is_sell_found
+        and grind_2_is_sell_found
+        and grind_3_is_sell_found
+        and grind_4_is_sell_found
+        and grind_5_is_sell_found
+        and grind_6_is_sell_found
+      ):
+        break
+
+  # The trade already de-risked
+  if is_derisk:
+    return None, "", is_derisk
+  if not has_order_tags and len(filled_exits) > 0:
+    return None, "", is_derisk
+
+  if rebuy_sub_grind_count > 0:
+    rebuy_current_open_rate = rebuy_total_cost / rebuy_total_amount
+    rebuy_current_grind_stake = rebuy_total_amount * exit_rate * (1 + trade.fee_close)
+    rebuy_current_grind_stake_profit = rebuy_total_cost - rebuy_current_grind_stake
+  if grind_1_sub_grind_count > 0:
+    grind_1_current_open_rate = grind_1_total_cost / grind_1_total_amount
+    grind_1_current_grind_stake = grind_1_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_1_current_grind_stake_profit = grind_1_total_cost - grind_1_current_grind_stake
+  if grind_2_sub_grind_count > 0:
+    grind_2_current_open_rate = grind_2_total_cost / grind_2_total_amount
+    grind_2_current_grind_stake = grind_2_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_2_current_grind_stake_profit = grind_2_total_cost - grind_2_current_grind_stake
+  if grind_3_sub_grind_count > 0:
+    grind_3_current_open_rate = grind_3_total_cost / grind_3_total_amount
+    grind_3_current_grind_stake = grind_3_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_3_current_grind_stake_profit = grind_3_total_cost - grind_3_current_grind_stake
+  if grind_4_sub_grind_count > 0:
+    grind_4_current_open_rate = grind_4_total_cost / grind_4_total_amount
+    grind_4_current_grind_stake = grind_4_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_4_current_grind_stake_profit = grind_4_total_cost - grind_4_current_grind_stake
+  if grind_5_sub_grind_count > 0:
+    grind_5_current_open_rate = grind_5_total_cost / grind_5_total_amount
+    grind_5_current_grind_stake = grind_5_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_5_current_grind_stake_profit = grind_5_total_cost - grind_5_current_grind_stake
+  if grind_6_sub_grind_count > 0:
+    grind_6_current_open_rate = grind_6_total_cost / grind_6_total_amount
+    grind_6_current_grind_stake = grind_6_total_amount * exit_rate * (1 + trade.fee_close)
+    grind_6_current_grind_stake_profit = grind_6_current_grind_stake - grind_6_total_cost
+
+  num_open_grinds = (
+    grind_1_sub_grind_count
+    + grind_2_sub_grind_count
+    + grind_3_sub_grind_count
+    + grind_4_sub_grind_count
+    + grind_5_sub_grind_count
+    + grind_6_sub_grind_count
+  )
+
+  is_scalp_mode = all(c in self.short_scalp_mode_tags for c in enter_tags)
+
+  fee_open_rate = trade.fee_open if self.custom_fee_open_rate is None else self.custom_fee_open_rate
+  fee_close_rate = trade.fee_close if self.custom_fee_close_rate is None else self.custom_fee_close_rate
+
+  # Sell remaining if partial fill on exit
+  if partial_sell:
+    order = filled_exits[-1]
+    sell_amount = order.safe_remaining * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      self.dp.send_msg(
+        f"Exit (remaining) [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {order.safe_remaining} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      order_tag = "p"
+      if has_order_tags:
+        if order.ft_order_tag is not None:
+          order_tag = order.ft_order_tag
+      return -ft_sell_amount, order_tag, is_derisk
+
+  is_short_grind_entry = self.short_grind_entry(last_candle, previous_candle, slice_profit, False)
+
+  # Rebuy
+  if (not partial_sell) and (not rebuy_is_sell_found) and (rebuy_sub_grind_count < max_rebuy_sub_grinds):
+    if (
+      (0 <= rebuy_sub_grind_count < max_rebuy_sub_grinds)
+      and (slice_profit_entry < regular_mode_rebuy_sub_thresholds[rebuy_sub_grind_count])
+      and (
+        (-rebuy_distance_ratio if (rebuy_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_rebuy_sub_thresholds[rebuy_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=12) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.06))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_rebuy_stakes[rebuy_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount > max_stake:
+        buy_amount = max_stake
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      self.dp.send_msg(
+        self.notification_msg(
+          "rebuy",
+          tag="r",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"Rebuy (r) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      order_tag = "r"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding g1
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_1_sub_grind_count < max_grind_1_sub_grinds):
+    if (
+      (
+        (-grind_1_distance_ratio if (grind_1_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_1_sub_thresholds[grind_1_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_1_stakes[grind_1_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_1_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+        grind_profit_stake = grind_1_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g1",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_1_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g1"
+      return buy_amount, order_tag, is_derisk
+
+  if (
+    self.is_futures_mode
+    and has_order_tags
+    and (not partial_sell)
+    and slice_profit > (0.65 / trade.leverage)
+    and (grind_1_sub_grind_count < max_grind_1_sub_grinds)
+  ):
+    buy_amount = (
+      slice_amount
+      * regular_mode_grind_1_stakes[grind_1_sub_grind_count]
+      / (trade.leverage if self.is_futures_mode else 1.0)
+    )
+    if buy_amount < (min_stake * 1.5):
+      buy_amount = min_stake * 1.5
+    if buy_amount > max_stake:
+      return None, "", is_derisk
+    grind_profit = 0.0
+    grind_profit_stake = 0.0
+    if grind_1_sub_grind_count > 0:
+      grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+      grind_profit_stake = grind_1_current_grind_stake_profit
+    self.dp.send_msg(
+      self.notification_msg(
+        "grinding-entry",
+        tag="g1",
+        pair=trade.pair,
+        rate=current_rate,
+        stake_amount=buy_amount,
+        profit_stake=profit_stake,
+        profit_ratio=profit_ratio,
+        stake_currency=self.config["stake_currency"],
+        grind_profit_stake=grind_1_current_grind_stake_profit,
+        grind_profit_pct=grind_profit,
+      )
+    )
+    log.info(
+      f"Grinding entry (g1) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_1_current_grind_stake_profit} {self.config['stake_currency']})"
+    )
+    order_tag = "g1"
+    return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_1_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate
+    if grind_profit > (regular_mode_grind_1_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g1",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_1_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g1"
+        for grind_entry_id in grind_1_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_1_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate) < regular_mode_grind_1_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_1_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_1_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_1_current_open_rate) / grind_1_current_open_rate)
+          if grind_1_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_1_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_1_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg1"
+      for grind_entry_id in grind_1_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # Grinding g2
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_2_sub_grind_count < max_grind_2_sub_grinds):
+    if (
+      (
+        (-grind_2_distance_ratio if (grind_2_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_2_sub_thresholds[grind_2_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_2_stakes[grind_2_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_2_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
+        grind_profit_stake = grind_2_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g2",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_2_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g2) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_2_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g2"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_2_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate
+    if grind_profit > (regular_mode_grind_2_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g2",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_2_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g2"
+        for grind_entry_id in grind_2_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_2_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate) < regular_mode_grind_2_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_2_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_2_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_2_current_open_rate) / grind_2_current_open_rate)
+          if grind_2_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg2",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_2_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg2) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_2_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg2"
+      for grind_entry_id in grind_2_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # Grinding g3
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_3_sub_grind_count < max_grind_3_sub_grinds):
+    if (
+      (
+        (-grind_3_distance_ratio if (grind_3_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_3_sub_thresholds[grind_3_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_3_stakes[grind_3_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_3_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
+        grind_profit_stake = grind_3_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g3",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_3_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g3) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_3_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g3"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_3_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate
+    if grind_profit > (regular_mode_grind_3_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g3",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_3_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g3) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g3"
+        for grind_entry_id in grind_3_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_3_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate) < regular_mode_grind_3_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_3_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_3_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_3_current_open_rate) / grind_3_current_open_rate)
+          if grind_3_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg3",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_3_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg3) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_3_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg3"
+      for grind_entry_id in grind_3_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # Grinding g4
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_4_sub_grind_count < max_grind_4_sub_grinds):
+    if (
+      (
+        (-grind_4_distance_ratio if (grind_4_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_4_sub_thresholds[grind_4_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_4_stakes[grind_4_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_4_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
+        grind_profit_stake = grind_4_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g4",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_4_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g4) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_4_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g4"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_4_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate
+    if grind_profit > (regular_mode_grind_4_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g4",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_4_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g4) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g4"
+        for grind_entry_id in grind_4_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_4_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate) < regular_mode_grind_4_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_4_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_4_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_4_current_open_rate) / grind_4_current_open_rate)
+          if grind_4_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg4",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_4_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg4) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_4_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg4"
+      for grind_entry_id in grind_4_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # Grinding g5
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_5_sub_grind_count < max_grind_5_sub_grinds):
+    if (
+      (
+        (-grind_5_distance_ratio if (grind_5_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_5_sub_thresholds[grind_5_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and is_short_grind_entry
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_5_stakes[grind_5_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_5_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
+        grind_profit_stake = grind_5_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g5",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_5_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g5) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_5_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g5"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_5_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate
+    if grind_profit > (regular_mode_grind_5_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g5",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_5_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g5) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g5"
+        for grind_entry_id in grind_5_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_5_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate) < regular_mode_grind_5_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_5_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_5_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_5_current_open_rate) / grind_5_current_open_rate)
+          if grind_5_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg5",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_5_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg5) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_5_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg5"
+      for grind_entry_id in grind_5_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # Grinding g6
+  # Grinding entry
+  if has_order_tags and (not partial_sell) and (grind_6_sub_grind_count < max_grind_6_sub_grinds):
+    if (
+      (
+        (-grind_6_distance_ratio if (grind_6_sub_grind_count > 0) else profit_init_ratio)
+        < (regular_mode_grind_6_sub_thresholds[grind_6_sub_grind_count])
+      )
+      and (current_time - timedelta(minutes=10) > filled_entries[-1].order_filled_utc)
+      and ((current_time - timedelta(hours=2) > filled_orders[-1].order_filled_utc) or (slice_profit > 0.02))
+      and (
+        (num_open_grinds == 0)
+        or (current_time - timedelta(hours=6) > filled_orders[-1].order_filled_utc)
+        or (slice_profit > 0.06)
+      )
+      # and ((num_open_grinds == 0) or (slice_profit > 0.03))
+      and (is_short_grind_entry)
+    ):
+      buy_amount = (
+        slice_amount
+        * regular_mode_grind_6_stakes[grind_6_sub_grind_count]
+        / (trade.leverage if self.is_futures_mode else 1.0)
+      )
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None, "", is_derisk
+      grind_profit = 0.0
+      grind_profit_stake = 0.0
+      if grind_6_sub_grind_count > 0:
+        grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
+        grind_profit_stake = grind_6_current_grind_stake_profit
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-entry",
+          tag="g6",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_6_current_grind_stake_profit,
+          grind_profit_pct=grind_profit,
+        )
+      )
+      log.info(
+        f"Grinding entry (g6) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_6_current_grind_stake_profit} {self.config['stake_currency']})"
+      )
+      order_tag = "g6"
+      return buy_amount, order_tag, is_derisk
+
+  # Grinding Exit
+  if has_order_tags and grind_6_sub_grind_count > 0:
+    grind_profit = -(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate
+    if grind_profit > (regular_mode_grind_6_profit_threshold + fee_open_rate + fee_close_rate):
+      sell_amount = grind_6_total_amount * exit_rate / trade.leverage
+      if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+        sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+      ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+      if sell_amount > min_stake and ft_sell_amount > min_stake:
+        self.dp.send_msg(
+          self.notification_msg(
+            "grinding-exit",
+            tag="g6",
+            pair=trade.pair,
+            rate=exit_rate,
+            stake_amount=sell_amount,
+            profit_stake=profit_stake,
+            profit_ratio=profit_ratio,
+            stake_currency=self.config["stake_currency"],
+            grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+            grind_profit_pct=grind_profit,
+            coin_amount=grind_6_total_amount,
+          )
+        )
+        log.info(
+          f"Grinding exit (g6) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}% ({grind_profit * sell_amount * trade.leverage} {self.config['stake_currency']})"
+        )
+        order_tag = "g6"
+        for grind_entry_id in grind_6_buy_orders:
+          order_tag += " " + str(grind_entry_id)
+        return -ft_sell_amount, order_tag, is_derisk
+
+  # Grind stop
+  if (
+    (
+      (grind_6_sub_grind_count > 0)
+      and self.regular_mode_use_grind_stops
+      and ((-(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate) < regular_mode_grind_6_stop_grinds)
+    )
+    # temporary
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 4, 16) or is_backtest)
+  ):
+    sell_amount = grind_6_total_amount * exit_rate / trade.leverage
+    if ((current_stake_amount / trade.leverage) - sell_amount) < (min_stake * 1.55):
+      sell_amount = (trade.amount * exit_rate / trade.leverage) - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      if grind_6_current_open_rate > 0.0:
+        grind_profit = (
+          (-(exit_rate - grind_6_current_open_rate) / grind_6_current_open_rate)
+          if grind_6_is_sell_found
+          else profit_ratio
+        )
+      self.dp.send_msg(
+        self.notification_msg(
+          "grinding-stop",
+          tag="sg6",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+          grind_profit_stake=grind_profit * sell_amount * trade.leverage,
+          grind_profit_pct=grind_profit,
+          coin_amount=grind_6_total_amount,
+        )
+      )
+      log.info(
+        f"Grinding stop exit (sg6) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Coin amount: {grind_6_total_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}% | Grind profit: {(grind_profit * 100.0):.2f}%"
+      )
+      order_tag = "sg6"
+      for grind_entry_id in grind_6_buy_orders:
+        order_tag += " " + str(grind_entry_id)
+      return -ft_sell_amount, order_tag, is_derisk
+
+  # De-risk
+  if (
+    self.derisk_enable
+    and (
+      profit_stake
+      < (
+        slice_amount
+        * (
+          (self.regular_mode_derisk_futures if self.is_futures_mode else self.regular_mode_derisk_spot)
+          if (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+          else (self.regular_mode_derisk_futures_old if self.is_futures_mode else self.regular_mode_derisk_spot_old)
+        )
+        / trade.leverage
+      )
+    )
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+  ):
+    sell_amount = trade.amount * exit_rate / trade.leverage - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="d",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "d", is_derisk
+
+  # De-risk level 1
+  if (
+    self.derisk_enable
+    and has_order_tags
+    and not is_derisk_1
+    and (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+    and profit_stake
+    < (
+      slice_amount
+      * (
+        (
+          self.regular_mode_derisk_1_scalp_mode_futures
+          if self.is_futures_mode
+          else self.regular_mode_derisk_1_scalp_mode_spot
+        )
+        if is_scalp_mode
+        else (
+          (self.regular_mode_derisk_1_futures if self.is_futures_mode else self.regular_mode_derisk_1_spot)
+          if (trade.open_date_utc.replace(tzinfo=None) >= datetime(2024, 9, 13) or is_backtest)
+          else (
+            self.regular_mode_derisk_1_futures_old if self.is_futures_mode else self.regular_mode_derisk_1_spot_old
+          )
+        )
+      )
+      / trade.leverage
+    )
+  ):
+    sell_amount = trade.amount * exit_rate / trade.leverage - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        self.notification_msg(
+          "de-risk",
+          tag="d1",
+          pair=trade.pair,
+          rate=exit_rate,
+          stake_amount=sell_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"De-risk (d1) [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      return -ft_sell_amount, "d1", is_derisk
+
+  return None, "", is_derisk
+
+# Short Rebuy Adjust Trade Position
+# ---------------------------------------------------------------------------------------------
+def short_rebuy_adjust_trade_position(
+  self,
+  trade: Trade,
+  enter_tags,
+  current_time: datetime,
+  current_rate: float,
+  current_profit: float,
+  min_stake: Optional[float],
+  max_stake: float,
+  current_entry_rate: float,
+  current_exit_rate: float,
+  current_entry_profit: float,
+  current_exit_profit: float,
+  **kwargs,
+) -> Optional[float]:
+  # min/max stakes include leverage. The return amounts is before leverage.
+  min_stake /= trade.leverage
+  max_stake /= trade.leverage
+  df, _ = self.dp.get_analyzed_dataframe(trade.pair, self.timeframe)
+  if len(df) < 2:
+    return None
+  last_candle = df.iloc[-1].squeeze()
+  previous_candle = df.iloc[-2].squeeze()
+
+  # we already waiting for an order to get filled
+  if trade.has_open_orders:
+    return None
+
+  filled_orders = trade.select_filled_orders()
+  filled_entries = trade.select_filled_orders(trade.entry_side)
+  filled_exits = trade.select_filled_orders(trade.exit_side)
+  count_of_entries = trade.nr_of_successful_entries
+  count_of_exits = trade.nr_of_successful_exits
+
+  if count_of_entries == 0:
+    return None
+
+  has_order_tags = False
+  if hasattr(filled_orders[0], "ft_order_tag"):
+    has_order_tags = True
+
+  # The first exit is de-risk (providing the trade is still open)
+  if (count_of_exits > 0) and (filled_exits[0].ft_order_tag in ["derisk_level_3"]):
+    return self.short_grind_adjust_trade_position_v2(
+      trade,
+      enter_tags,
+      current_time,
+      current_rate,
+      current_profit,
+      min_stake,
+      max_stake,
+      current_entry_rate,
+      current_exit_rate,
+      current_entry_profit,
+      current_exit_profit,
+    )
+
+  exit_rate = current_rate
+  if self.dp.runmode.value in ("live", "dry_run"):
+    ticker = self.dp.ticker(trade.pair)
+    if ("bid" in ticker) and ("ask" in ticker):
+      if trade.is_short:
+        if self.config["exit_pricing"]["price_side"] in ["ask", "other"]:
+          if ticker["ask"] is not None:
+            exit_rate = ticker["ask"]
+      else:
+        if self.config["exit_pricing"]["price_side"] in ["bid", "other"]:
+          if ticker["bid"] is not None:
+            exit_rate = ticker["bid"]
+
+  profit_stake, profit_ratio, profit_current_stake_ratio, profit_init_ratio = self.calc_total_profit(
+    trade, filled_entries, filled_exits, exit_rate
+  )
+
+  slice_amount = filled_entries[0].cost
+  slice_profit = (exit_rate - filled_orders[-1].safe_price) / filled_orders[-1].safe_price
+  slice_profit_entry = (exit_rate - filled_entries[-1].safe_price) / filled_entries[-1].safe_price
+  slice_profit_exit = (
+    ((exit_rate - filled_exits[-1].safe_price) / filled_exits[-1].safe_price) if count_of_exits > 0 else 0.0
+  )
+
+  current_stake_amount = trade.amount * current_rate
+
+  rebuy_mode_stakes = self.rebuy_mode_stakes_futures if self.is_futures_mode else self.rebuy_mode_stakes_spot
+  max_sub_grinds = len(rebuy_mode_stakes)
+  rebuy_mode_sub_thresholds = (
+    self.rebuy_mode_thresholds_futures if self.is_futures_mode else self.rebuy_mode_thresholds_spot
+  )
+  partial_sell = False
+  sub_grind_count = 0
+  total_amount = 0.0
+  total_cost = 0.0
+  current_open_rate = 0.0
+  current_grind_stake = 0.0
+  current_grind_stake_profit = 0.0
+  for order in reversed(filled_orders):
+    if (order.ft_order_side == "buy") and (order is not filled_orders[0]):
+      sub_grind_count += 1
+      total_amount += order.safe_filled
+      total_cost += order.safe_filled * order.safe_price
+    elif order.ft_order_side == "sell":
+      if (order.safe_remaining * exit_rate / (trade.leverage if self.is_futures_mode else 1.0)) > min_stake:
+        partial_sell = True
+      break
+  if sub_grind_count > 0:
+    current_open_rate = total_cost / total_amount
+    current_grind_stake = total_amount * exit_rate * (1 - trade.fee_close)
+    current_grind_stake_profit = current_grind_stake - total_cost
+
+  if (not partial_sell) and (sub_grind_count < max_sub_grinds):
+    if (
+      (0 <= sub_grind_count < max_sub_grinds) and (slice_profit_entry < rebuy_mode_sub_thresholds[sub_grind_count])
+    ) and (
+      (last_candle["RSI_3"] < 90.0)
+      and (last_candle["RSI_3_15m"] < 90.0)
+      # and (last_candle["RSI_3_1h"] < 90.0)
+      # and (last_candle["RSI_3_4h"] < 90.0)
+      and (last_candle["RSI_14"] > 60.0)
+      and (last_candle["ROC_2"] < 0.0)
+      and (last_candle["close"] > (last_candle["EMA_26"] * 1.012))
+    ):
+      buy_amount = slice_amount * rebuy_mode_stakes[sub_grind_count] / trade.leverage
+      if buy_amount < (min_stake * 1.5):
+        buy_amount = min_stake * 1.5
+      if buy_amount > max_stake:
+        return None
+      self.dp.send_msg(
+        self.notification_msg(
+          "rebuy",
+          tag="r",
+          pair=trade.pair,
+          rate=current_rate,
+          stake_amount=buy_amount,
+          profit_stake=profit_stake,
+          profit_ratio=profit_ratio,
+          stake_currency=self.config["stake_currency"],
+        )
+      )
+      log.info(
+        f"Rebuy (r) [{current_time}] [{trade.pair}] | Rate: {current_rate} | Stake amount: {buy_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      if has_order_tags:
+        return buy_amount, "r"
+      else:
+        return buy_amount
+
+  if self.derisk_enable and (
+    profit_stake
+    < (
+      slice_amount * (self.rebuy_mode_derisk_futures if self.is_futures_mode else self.rebuy_mode_derisk_spot)
+      # / (trade.leverage if self.is_futures_mode else 1.0)
+    )
+  ):
+    sell_amount = trade.amount * exit_rate / trade.leverage - (min_stake * 1.55)
+    ft_sell_amount = sell_amount * trade.leverage * (trade.stake_amount / trade.amount) / exit_rate
+    if sell_amount > min_stake and ft_sell_amount > min_stake:
+      grind_profit = 0.0
+      self.dp.send_msg(
+        f"❌​​ ​**Rebuy De-risk:** `Level 3`\n"
+        f"🪙​ **Pair:** `{trade.pair}`\n"
+        f"〽️​ **Rate:** `{exit_rate}`\n"
+        f"💰 **Stake amount:** `{sell_amount}`\n"
+        f"💵​ **Profit (stake):** `{profit_stake}`\n"
+        f"💸 **Profit (percent):** `{(profit_ratio * 100.0):.2f}%`"
+      )
+      log.info(
+        f"Rebuy De-risk Level 3 [{current_time}] [{trade.pair}] | Rate: {exit_rate} | Stake amount: {sell_amount} | Profit (stake): {profit_stake} | Profit: {(profit_ratio * 100.0):.2f}%"
+      )
+      if has_order_tags:
+        return -ft_sell_amount, "derisk_level_3"
+      else:
+        return -ft_sell_amount
+
+  return None
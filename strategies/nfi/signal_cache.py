@@ -0,0 +1,120 @@
+import hashlib
+import logging
+import pathlib
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import rapidjson
+from pandas import DataFrame
+
+log = logging.getLogger(__name__)
+
+# +---------------------------------------------------------------------------+
+# |                         Backtest Signal Cache                             |
+# +---------------------------------------------------------------------------+
+#
+# Content-addressed on-disk store for populated backtest dataframes. An entry is
+# keyed on everything that can change the indicators or the entry signals: the
+# pair, the candles fed to the strategy (base and informative), the strategy
+# source and the signal parameters. Any change produces a new key, so stale
+# entries are never served; they are only left behind on disk.
+
+OHLCV_COLUMNS = ["open", "high", "low", "close", "volume"]
+
+_source_digests = {}
+
+
+# Digests
+# ---------------------------------------------------------------------------------------------
+def frame_digest(df: Optional[DataFrame]) -> str:
+  """
+  Digest of the candle content of an OHLCV dataframe.
+
+  :param df: DataFrame OHLCV candles with a date column
+  """
+  if df is None or len(df) == 0:
+    return "empty"
+  digest = hashlib.blake2b(digest_size=16)
+  digest.update(np.ascontiguousarray(df["date"].to_numpy(dtype="datetime64[ns]").view(np.int64)).tobytes())
+  digest.update(np.ascontiguousarray(df[OHLCV_COLUMNS].to_numpy(dtype=np.float64)).tobytes())
+  return digest.hexdigest()
+
+
+def source_digest(paths) -> str:
+  """
+  Digest of a set of source files, memoized per process.
+
+  :param paths: list of pathlib.Path The source files the signals depend on
+  """
+  paths = tuple(sorted(str(path) for path in paths))
+  if paths not in _source_digests:
+    digest = hashlib.blake2b(digest_size=16)
+    for path in paths:
+      digest.update(pathlib.Path(path).read_bytes())
+    _source_digests[paths] = digest.hexdigest()
+  return _source_digests[paths]
+
+
+# Signal Cache
+# ---------------------------------------------------------------------------------------------
+class SignalCache:
+  def __init__(self, path: pathlib.Path):
+    self.path = path
+
+  @staticmethod
+  def key(**parts) -> str:
+    payload = rapidjson.dumps(parts, sort_keys=True, default=str)
+    return hashlib.blake2b(payload.encode(), digest_size=20).hexdigest()
+
+  def _indicators_path(self, key: str) -> pathlib.Path:
+    return self.path / f"{key}.feather"
+
+  def _signals_path(self, key: str) -> pathlib.Path:
+    return self.path / f"{key}-signals.feather"
+
+  def load(self, key: str) -> Optional[tuple]:
+    """
+    Return the cached (indicators, signals) frames for a key, or None on a miss.
+    """
+    indicators_path = self._indicators_path(key)
+    signals_path = self._signals_path(key)
+    if not indicators_path.is_file() or not signals_path.is_file():
+      return None
+    try:
+      return pd.read_feather(indicators_path), pd.read_feather(signals_path)
+    except Exception as exc:
+      log.warning("Ignoring unreadable signal cache entry %s: %s", key, exc)
+      return None
+
+  def store_indicators(self, key: str, df: DataFrame) -> None:
+    self._write(df.reset_index(drop=True), self._indicators_path(key))
+
+  def store_signals(self, key: str, df: DataFrame) -> None:
+    signals = df[["date"]].reset_index(drop=True)
+    for column in ["enter_long", "enter_short"]:
+      signals[column] = df[column].replace("", 0).fillna(0).astype(np.int8).to_numpy()
+    signals["enter_tag"] = df["enter_tag"].fillna("").astype(str).to_numpy()
+    self._write(signals, self._signals_path(key))
+
+  def _write(self, df: DataFrame, path: pathlib.Path) -> None:
+    # Write to a temporary file first, a half written entry must never look valid
+    tmp_path = path.with_suffix(".tmp")
+    try:
+      self.path.mkdir(parents=True, exist_ok=True)
+      df.to_feather(tmp_path)
+      tmp_path.replace(path)
+    except Exception as exc:
+      log.warning("Could not write signal cache entry %s: %s", path.name, exc)
+      tmp_path.unlink(missing_ok=True)
+
+  @staticmethod
+  def apply_signals(df: DataFrame, signals: DataFrame) -> DataFrame:
+    """
+    Copy cached entry signals onto a (possibly trimmed) dataframe, aligned on date.
+    """
+    aligned = signals.set_index("date").reindex(df["date"])
+    df["enter_long"] = aligned["enter_long"].fillna(0).astype(np.int8).to_numpy()
+    df["enter_short"] = aligned["enter_short"].fillna(0).astype(np.int8).to_numpy()
+    df["enter_tag"] = aligned["enter_tag"].fillna("").to_numpy()
+    return df
@@ -0,0 +1,139 @@
+import logging
+import pathlib
+import time
+from typing import Optional
+
+import pandas as pd
+import rapidjson
+from pandas import DataFrame
+
+from nfi.signal_cache import frame_digest
+
+log = logging.getLogger(__name__)
+
+# +---------------------------------------------------------------------------+
+# |                             Live Warm Start                               |
+# +---------------------------------------------------------------------------+
+#
+# Snapshots of the populated per pair dataframes, written periodically and on
+# shutdown by a live/dry-run bot. After a restart the first analysis of a pair
+# serves the snapshot instead of recomputing every indicator, provided that:
+#   - the strategy code and the signal parameters are unchanged,
+#   - the fresh 5m candles end on the same candle as the snapshot and match it
+#     row for row (the fresh window may be shorter than the snapshot one),
+#   - every informative timeframe matches the snapshot's candles in full (dates
+#     and OHLCV digests), so a revised older informative candle is detected.
+# NFI indicators carry no incremental state, so a snapshot that is one candle
+# behind cannot be rolled forward; that pair is simply recomputed.
+
+
+class WarmStart:
+  """
+  Populated frames of a live bot, saved to disk and served to the first analysis after a restart.
+
+  A snapshot is only valid within the 5m candle it was taken in: the restart
+  hits when the bot is back (including its startup) before the next candle
+  closes. With the shutdown at a uniformly random time of the candle, the hit
+  rate is 1 - downtime / 5 minutes: about 90% for a 30 s restart, 60% for
+  2 minutes, none from 5 minutes on (benchmarks/check_nfi_warm_start.py
+  measures it). Any other restart recomputes every pair as before.
+  """
+
+  def __init__(self, path: pathlib.Path, interval_minutes: float):
+    self.path = path
+    self.interval = interval_minutes * 60.0
+    self.last_save = time.monotonic()
+    # pair -> (df, indicator columns, meta) of the latest populated frame
+    self.frames = {}
+    # pair -> last candle date of the saved snapshot
+    self.saved = {}
+
+  def _paths(self, pair: str) -> tuple:
+    name = pair.replace("/", "_").replace(":", "_")
+    return self.path / f"{name}.feather", self.path / f"{name}.json"
+
+  def load(self, pair: str, fingerprint: str, df: DataFrame, informative: dict) -> Optional[DataFrame]:
+    """
+    Return the snapshot of a pair restricted to the candles of df, or None if it does not validate.
+
+    :param pair: str The pair
+    :param fingerprint: str Digest of the strategy source and signal parameters
+    :param df: DataFrame The fresh OHLCV candles
+    :param informative: dict Digests of the informative candles
+    """
+    frame_path, meta_path = self._paths(pair)
+    if len(df) == 0 or not meta_path.is_file() or not frame_path.is_file():
+      return None
+    try:
+      meta = rapidjson.loads(meta_path.read_text())
+      if (
+        (meta["fingerprint"] != fingerprint)
+        or (meta["last_date"] != str(df["date"].iloc[-1]))
+        or (meta["informative"] != informative)
+      ):
+        return None
+      snapshot = pd.read_feather(frame_path)
+    except Exception as exc:
+      log.warning(f"Ignoring unreadable warm start snapshot for {pair}: {exc}")
+      return None
+    # The fresh candles must be the tail of the snapshot
+    snapshot = snapshot.iloc[snapshot["date"].searchsorted(df["date"].iloc[0]) :]
+    if (len(snapshot) != len(df)) or (frame_digest(snapshot) != frame_digest(df)):
+      return None
+    snapshot.index = df.index
+    return snapshot
+
+  def record(self, pair: str, df: DataFrame, fingerprint: str, informative: dict) -> None:
+    """
+    Remember the populated frame of a pair for the next snapshot.
+
+    Only a reference is kept; the indicator columns are captured now because the
+    entry and exit signals are later added to the same frame.
+    """
+    self.frames[pair] = (
+      df,
+      list(df.columns),
+      {
+        "fingerprint": fingerprint,
+        "last_date": str(df["date"].iloc[-1]) if len(df) > 0 else None,
+        "informative": informative,
+      },
+    )
+
+  def save_if_due(self) -> None:
+    if (time.monotonic() - self.last_save) >= self.interval:
+      self.save()
+
+  def save(self) -> None:
+    """
+    Write a snapshot of every pair populated since its last snapshot.
+    """
+    tik = time.perf_counter()
+    self.last_save = time.monotonic()
+    num_saved = 0
+    for pair, (df, columns, meta) in list(self.frames.items()):
+      if (meta["last_date"] is None) or (self.saved.get(pair) == meta["last_date"]):
+        continue
+      frame_path, meta_path = self._paths(pair)
+      # The frame goes first: until the meta is replaced as well the old meta no
+      # longer matches the new frame, so a partial snapshot never validates.
+      if self._write(frame_path, lambda tmp_path: df[columns].reset_index(drop=True).to_feather(tmp_path)) and (
+        self._write(meta_path, lambda tmp_path: tmp_path.write_text(rapidjson.dumps(meta)))
+      ):
+        self.saved[pair] = meta["last_date"]
+        num_saved += 1
+    tok = time.perf_counter()
+    if num_saved > 0:
+      log.info(f"Saved warm start snapshots for {num_saved} pairs in {tok - tik:0.4f} seconds.")
+
+  def _write(self, path: pathlib.Path, writer) -> bool:
+    tmp_path = path.with_suffix(".tmp")
+    try:
+      self.path.mkdir(parents=True, exist_ok=True)
+      writer(tmp_path)
+      tmp_path.replace(path)
+      return True
+    except Exception as exc:
+      log.warning(f"Could not write warm start snapshot {path.name}: {exc}")
+      tmp_path.unlink(missing_ok=True)
+      return False
@@ -0,0 +1,6 @@
+"""
+Helpers shared by the PerpSpotBasis and Alex strategy families.
+
+Kept in a package (rather than next to the strategy files) so the strategy
+resolver does not import them while scanning the strategies directory.
+"""
@@ -0,0 +1,214 @@
+"""
+Per pair store of the spot/perp basis features.
+
+The basis features only depend on the spot close and the perp close, so they
+are computed once over the whole history of a pair, kept in memory and in a
+feather file per pair, and extended by the new candles only. A strategy gets
+its columns by slicing the store, and backtests, hyperopt and FreqAI training
+runs read the same file instead of recomputing the features.
+
+Rows of the store are only served when the stored close/close_perp inputs match
+the requested candles exactly; anything else (revised data, a gap, an earlier
+start) recomputes the features over the requested candles. A request starting
+after the first stored candle gets the values a computation over its own
+candles gives: its first `LOOKBACK` candles (after any leading candles without
+a basis, which that computation back fills) are recomputed from the request,
+the rest is served from the store.
+
+Extending a pair keeps the last `LOOKBACK` candles plus the largest window
+served for it, so a live bot's store stays the size of its candle window.
+The file names hold a hash of the sources the features are computed from (this
+module and shared.rolling): a changed formula starts a new file instead of
+serving the values of the previous one.
+"""
+import hashlib
+import inspect
+import pathlib
+import sys
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+import talib
+from pandas import DataFrame, Series
+
+import shared.rolling
+from shared.merge import date_values
+from shared.rolling import rolling_mean_std
+
+BASIS_FEATURES = [
+    'basis', 'basis_ma_5', 'basis_ma_10', 'basis_ma_30', 'basis_ma_100', 'basis_volatility',
+    'basis_momentum', 'basis_acceleration', 'basis_zscore_20', 'basis_zscore_50', 'basis_zscore_100',
+    'basis_zscore', 'basis_regime', 'basis_price_divergence',
+]
+
+# Candles of history the features of a new candle depend on (SMA 100, z-score 100)
+LOOKBACK = 100
+
+
+def feature_version() -> str:
+    """Hash of the sources the stored features are computed from"""
+    sources = [inspect.getsource(sys.modules[__name__]), inspect.getsource(shared.rolling)]
+    return hashlib.sha1(''.join(sources).encode()).hexdigest()[:12]
+
+
+def raw_basis(close: np.ndarray, close_perp: np.ndarray) -> np.ndarray:
+    """(perp - spot) / spot, with infinities as NaN"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        basis = (close_perp - close) / close
+    basis[np.isinf(basis)] = np.nan
+    return basis
+
+
+def basis_features(basis: np.ndarray, close: np.ndarray) -> dict:
+    """
+    Features of an already filled basis series, same maths as
+    PerpSpotBasisStrategy_Enhanced.calculate_enhanced_basis_features.
+
+    :param basis: filled basis values
+    :param close: spot close of the same candles
+    """
+    features = {'basis': basis}
+    for period in [5, 10, 30, 100]:
+        features[f'basis_ma_{period}'] = talib.SMA(basis, timeperiod=period)
+    means, stds = rolling_mean_std(basis, [20, 50, 100])
+    features['basis_volatility'] = stds[0]
+    features['basis_momentum'] = basis - features['basis_ma_10']
+    momentum = features['basis_momentum']
+    features['basis_acceleration'] = momentum - np.concatenate(([np.nan], momentum[:-1]))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        for i, window in enumerate([20, 50, 100]):
+            features[f'basis_zscore_{window}'] = (basis - means[i]) / stds[i]
+    features['basis_zscore'] = np.nan_to_num(features['basis_zscore_50'], nan=0.0)
+    features['basis_regime'] = np.where(np.abs(features['basis_zscore']) > 2, 1, 0)
+    price_momentum = Series(close, copy=False).pct_change(10).to_numpy()
+    features['basis_price_divergence'] = momentum - price_momentum
+    return features
+
+
+class BasisFeatureStore:
+    """Basis features per pair, in memory and persisted as one feather file per pair"""
+
+    def __init__(self, path: pathlib.Path, persist_every: int = 288):
+        """
+        :param path: directory of the feather files
+        :param persist_every: write a pair again once this many candles were appended
+        """
+        self.path = path
+        self.persist_every = persist_every
+        self.version = feature_version()
+        self._stores = {}  # pair -> dict of column -> ndarray (date as int64)
+        self._served = {}  # pair -> largest number of candles served
+        self._unsaved = {}  # pair -> candles appended since the last write
+
+    def features(self, pair: str, df: DataFrame) -> DataFrame:
+        """
+        Basis features for the candles of df (date, close and close_perp columns).
+
+        :param pair: str the spot pair
+        :param df: DataFrame the merged spot/perp candles
+        """
+        dates = date_values(df['date'])
+        close = df['close'].to_numpy(dtype=np.float64)
+        close_perp = df['close_perp'].to_numpy(dtype=np.float64)
+
+        self._served[pair] = max(self._served.get(pair, 0), len(dates))
+        store = self._load(pair)
+        start = self._match(store, dates, close, close_perp)
+        if start is None:
+            store = self._compute(dates, close, close_perp)
+            start = 0
+            self._stores[pair] = store
+            self._save(pair)
+        else:
+            covered = len(store['date']) - start
+            if covered < len(dates):
+                store = self._extend(pair, store, dates[covered:], close[covered:], close_perp[covered:])
+                # The extended store ends with the requested candles
+                start = len(store['date']) - len(dates)
+        stop = start + len(dates)
+        features = {column: store[column][start:stop] for column in BASIS_FEATURES}
+        if start > 0:
+            # The warmup rows depend on where the request starts, not on the stored history
+            valid = np.flatnonzero(~np.isnan(raw_basis(close, close_perp)))
+            head = min(len(dates), (valid[0] if len(valid) else len(dates)) + LOOKBACK)
+            warmup = self._compute(dates[:head], close[:head], close_perp[:head])
+            features = {column: np.concatenate((warmup[column], values[head:])) for column, values in features.items()}
+        return DataFrame(features, index=df.index)
+
+    @staticmethod
+    def _match(store: Optional[dict], dates: np.ndarray, close: np.ndarray, close_perp: np.ndarray) -> Optional[int]:
+        """Row of the store where the candles start, if the overlapping inputs are identical"""
+        if store is None or len(dates) == 0:
+            return None
+        stored_dates = store['date']
+        start = int(np.searchsorted(stored_dates, dates[0]))
+        overlap = min(len(stored_dates) - start, len(dates))
+        if overlap <= 0 or (np.isnan(store['basis'][-1]) and overlap < len(dates)):
+            return None
+        window = slice(start, start + overlap)
+        if (
+            np.array_equal(stored_dates[window], dates[:overlap])
+            and np.array_equal(store['close'][window], close[:overlap], equal_nan=True)
+            and np.array_equal(store['close_perp'][window], close_perp[:overlap], equal_nan=True)
+        ):
+            return start
+        return None
+
+    @staticmethod
+    def _compute(dates: np.ndarray, close: np.ndarray, close_perp: np.ndarray) -> dict:
+        basis = Series(raw_basis(close, close_perp)).ffill().bfill().to_numpy()
+        store = {'date': dates, 'close': close, 'close_perp': close_perp}
+        store.update(basis_features(basis, close))
+        return store
+
+    def _extend(self, pair: str, store: dict, dates: np.ndarray, close: np.ndarray, close_perp: np.ndarray) -> dict:
+        """
+        Append new candles, computing their features from the last LOOKBACK stored candles, and drop
+        the stored candles before the largest window served plus LOOKBACK.
+        """
+        # Forward fill from the last stored basis (never NaN here, see _match)
+        basis = raw_basis(close, close_perp)
+        basis = Series(np.concatenate((store['basis'][-1:], basis))).ffill().to_numpy()[1:]
+        history = slice(max(len(store['date']) - LOOKBACK, 0), None)
+        tail = basis_features(
+            np.concatenate((store['basis'][history], basis)),
+            np.concatenate((store['close'][history], close)),
+        )
+        appended = {'date': dates, 'close': close, 'close_perp': close_perp}
+        appended.update({column: values[-len(dates):] for column, values in tail.items()})
+        drop = max(len(store['date']) + len(dates) - self._served[pair] - LOOKBACK, 0)
+        store = {column: np.concatenate((store[column][drop:], appended[column])) for column in store}
+        self._stores[pair] = store
+        self._unsaved[pair] = self._unsaved.get(pair, 0) + len(dates)
+        if self._unsaved[pair] >= self.persist_every:
+            self._save(pair)
+        return store
+
+    def _file(self, pair: str) -> pathlib.Path:
+        return self.path / f"{pair.replace('/', '_').replace(':', '_')}-{self.version}.feather"
+
+    def _load(self, pair: str) -> Optional[dict]:
+        if pair not in self._stores:
+            path = self._file(pair)
+            if not path.is_file():
+                return None
+            try:
+                df = pd.read_feather(path)
+            except Exception:
+                return None
+            store = {column: df[column].to_numpy() for column in df.columns}
+            store['date'] = store['date'].astype(np.int64)
+            self._stores[pair] = store
+        return self._stores[pair]
+
+    def _save(self, pair: str) -> None:
+        path = self._file(pair)
+        tmp_path = path.with_suffix('.tmp')
+        try:
+            self.path.mkdir(parents=True, exist_ok=True)
+            DataFrame(self._stores[pair]).to_feather(tmp_path)
+            tmp_path.replace(path)
+            self._unsaved[pair] = 0
+        except Exception:
+            tmp_path.unlink(missing_ok=True)
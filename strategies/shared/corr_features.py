@@ -0,0 +1,57 @@
+"""
+Feature columns of the correlated pairs, computed once per candle for all traded pairs.
+
+With `include_corr_pairlist`, FreqAI runs the feature engineering hooks on the
+candles of every correlated pair (BTC, ETH) again for each traded pair it
+trains or predicts, on the same candles. `CorrFeatureCache` keeps the columns
+a hook added for a correlated pair in a `CandleMemo`, keyed on the hook, the
+pair, the timeframe and the hook arguments (the indicator period), and serves
+them while a call brings the same dates and OHLCV. The other traded pairs get
+the cached frame attached to theirs: under pandas copy-on-write the columns
+are shared, not copied, and a write into them copies first.
+
+The hooks must only read the candles (dates and OHLCV) of the frame they get.
+"""
+from typing import Callable
+
+import pandas as pd
+from pandas import DataFrame
+
+from shared.memo import CandleMemo
+
+
+class CorrFeatureCache:
+    """Feature frames of the correlated pairs, shared by every traded pair"""
+
+    def __init__(self, pairs):
+        """
+        :param pairs: list of str the correlated pairs (include_corr_pairlist)
+        """
+        self.pairs = set(pairs)
+        self._memo = CandleMemo()  # (hook name, pair, timeframe, args) -> feature columns
+
+    def apply(self, hook: Callable[..., DataFrame], dataframe: DataFrame, pair: str, timeframe: str,
+              *args, **kwargs) -> DataFrame:
+        """
+        hook(dataframe, *args, **kwargs) for a correlated pair, from the cache when it ran on the same candles.
+
+        :param hook: callable returning dataframe with its feature columns added
+        :param dataframe: DataFrame the pair's candles (date and OHLCV columns)
+        :param pair: str the correlated pair
+        :param timeframe: str the candles' timeframe
+        :param args: hashable hook arguments that select the features (the period)
+        :param kwargs: further hook arguments, not part of the key (metadata)
+        :return: dataframe with the feature columns
+        """
+        def build(candles: DataFrame) -> DataFrame:
+            output = hook(dataframe.copy(), *args, **kwargs)
+            return output[[column for column in output.columns if column not in dataframe.columns]]
+
+        features = self._memo.get((hook.__qualname__, pair, timeframe, args), dataframe, build)
+        features = features.set_axis(dataframe.index, axis=0)
+        if dataframe.columns.isin(features.columns).any():
+            dataframe = dataframe.drop(columns=features.columns)
+        return pd.concat([dataframe, features], axis=1)
+
+    def clear(self) -> None:
+        self._memo.clear()
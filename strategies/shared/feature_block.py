@@ -0,0 +1,65 @@
+"""
+Materialization of the FreqAI `%-` feature columns as two typed blocks.
+
+Writing the features one column at a time (each through its own fillna/clip
+chain) inserts a float64 or int64 block per column into the frame, and FreqAI
+then copies them into its training matrix column by column. Here every
+continuous feature is written into one float32 array and every binary or
+regime feature into one int8 array, and both are attached to the frame in a
+single concat: the frame holds two consolidated blocks, half the size of
+float64 columns (an eighth of int64 ones for the flags).
+"""
+from typing import NamedTuple, Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+class BlockColumn(NamedTuple):
+    source: str  # frame column, `fill` everywhere when the frame lacks it
+    fill: float = 0.0  # replaces NaN
+    clip: Optional[tuple] = None  # (low, high), applied after the fill
+    log1p: bool = False  # log(1 + x), after the clip
+    scale: float = 1.0  # multiplier, applied last
+    binary: bool = False  # 0/1 flag or small integer regime, stored as int8
+
+
+def materialize(dataframe: DataFrame, columns: dict) -> DataFrame:
+    """
+    Add the feature columns as one float32 block and one int8 block.
+
+    :param dataframe: DataFrame holding the source columns
+    :param columns: dict feature column name -> BlockColumn
+    :return: DataFrame with the feature columns (continuous first, then binary)
+    """
+    n = len(dataframe)
+    continuous = [(name, spec) for name, spec in columns.items() if not spec.binary]
+    binary = [(name, spec) for name, spec in columns.items() if spec.binary]
+
+    # (columns, rows) in C order is the layout of a pandas block: no copy when wrapped
+    floats = np.empty((len(continuous), n), dtype=np.float32)
+    for i, (_, spec) in enumerate(continuous):
+        values = _source(dataframe, spec)
+        if spec.clip is not None:
+            values = np.clip(values, *spec.clip)
+        if spec.log1p:
+            values = np.log1p(values)
+        floats[i] = values * spec.scale if spec.scale != 1.0 else values
+    flags = np.empty((len(binary), n), dtype=np.int8)
+    for i, (_, spec) in enumerate(binary):
+        flags[i] = _source(dataframe, spec)
+
+    blocks = [
+        DataFrame(floats.T, columns=[name for name, _ in continuous], index=dataframe.index, copy=False),
+        DataFrame(flags.T, columns=[name for name, _ in binary], index=dataframe.index, copy=False),
+    ]
+    dataframe = dataframe.drop(columns=[name for name in columns if name in dataframe.columns])
+    return pd.concat([dataframe] + blocks, axis=1)
+
+
+def _source(dataframe: DataFrame, spec: BlockColumn) -> np.ndarray:
+    if spec.source not in dataframe.columns:
+        return np.full(len(dataframe), spec.fill, dtype=np.float64)
+    values = dataframe[spec.source].to_numpy(dtype=np.float64, na_value=np.nan)
+    return np.where(np.isnan(values), spec.fill, values)
@@ -0,0 +1,176 @@
+"""
+Feature library shared by the PerpSpotBasis strategy variants.
+
+Every feature declares the candle columns it reads and the columns it writes.
+A strategy asks for output columns, e.g.
+
+    dataframe = feature_library.apply(dataframe, pair, ['rsi', 'ema_20', 'macd', 'macdsignal'])
+
+and the library computes each feature behind them once per (pair, timerange)
+and input data: a multi strategy backtest (`--strategy-list`) analyses the same
+pairs over the same candles with every variant, so the later variants get the
+memoized values. Inputs are identified by a digest of the date column and of
+the declared input columns, so variants that merge the perp candles
+differently never share basis values by mistake.
+
+Only one timerange is memoized per pair (a live bot moves on every candle, a
+backtest has a single one), and the memo is bounded in memory like the futures
+loader.
+"""
+import hashlib
+from collections import OrderedDict
+from typing import Callable, NamedTuple
+
+import numpy as np
+import talib.abstract as ta
+from pandas import DataFrame
+
+from shared.merge import date_values
+from shared.rolling import rolling_vwap, rolling_zscore
+
+
+class Feature(NamedTuple):
+    inputs: tuple  # candle columns read
+    outputs: tuple  # columns written
+    compute: Callable[[DataFrame], dict]  # frame -> {output column: values}
+
+
+def _technical(function, period: int, output: str, inputs: tuple) -> Feature:
+    return Feature(inputs, (output,), lambda df: {output: function(df, timeperiod=period)})
+
+
+def _macd(df: DataFrame) -> dict:
+    macd = ta.MACD(df)
+    return {'macd': macd['macd'], 'macdsignal': macd['macdsignal'], 'macdhist': macd['macdhist']}
+
+
+def _bbands(df: DataFrame) -> dict:
+    bb = ta.BBANDS(df)
+    return {'bb_upper': bb['upperband'], 'bb_middle': bb['middleband'], 'bb_lower': bb['lowerband']}
+
+
+def _vwap(df: DataFrame) -> dict:
+    """Rolling 20 candle VWAP of the close"""
+    return {'vwap': rolling_vwap(df['close'], df['volume'], 20)}
+
+
+def _basis(df: DataFrame) -> dict:
+    """Perp-spot basis in percent and its moving averages, rate of change, z-score and momentum"""
+    basis = (df['close_perp'] - df['close']) / df['close'] * 100
+    basis_ma_30 = ta.SMA(basis, timeperiod=30)
+    return {
+        'basis': basis,
+        'basis_ma_10': ta.SMA(basis, timeperiod=10),
+        'basis_ma_30': basis_ma_30,
+        'basis_roc': ta.ROC(basis, timeperiod=5),
+        'basis_zscore': rolling_zscore(basis, [50])[0],
+        'basis_momentum': basis - basis_ma_30,
+    }
+
+
+FEATURES = {
+    'rsi': _technical(ta.RSI, 14, 'rsi', ('close',)),
+    'adx': _technical(ta.ADX, 14, 'adx', ('high', 'low', 'close')),
+    'macd': Feature(('close',), ('macd', 'macdsignal', 'macdhist'), _macd),
+    'bbands': Feature(('close',), ('bb_upper', 'bb_middle', 'bb_lower'), _bbands),
+    'obv': Feature(('close', 'volume'), ('obv',), lambda df: {'obv': ta.OBV(df['close'], df['volume'])}),
+    'vwap': Feature(('close', 'volume'), ('vwap',), _vwap),
+    'basis': Feature(
+        ('close', 'close_perp'),
+        ('basis', 'basis_ma_10', 'basis_ma_30', 'basis_roc', 'basis_zscore', 'basis_momentum'),
+        _basis,
+    ),
+}
+for _period in [10, 20, 50, 100]:
+    FEATURES[f'ema_{_period}'] = _technical(ta.EMA, _period, f'ema_{_period}', ('close',))
+    FEATURES[f'sma_{_period}'] = _technical(ta.SMA, _period, f'sma_{_period}', ('close',))
+for _period in [10, 20, 30, 50]:
+    FEATURES[f'volume_ma_{_period}'] = Feature(
+        ('volume',), (f'volume_ma_{_period}',),
+        lambda df, period=_period: {f'volume_ma_{period}': ta.SMA(df['volume'], timeperiod=period)},
+    )
+FEATURES['volume_roc'] = Feature(('volume',), ('volume_roc',), lambda df: {'volume_roc': ta.ROC(df['volume'], timeperiod=5)})
+
+# Output column -> name of the feature computing it
+PROVIDERS = {output: name for name, feature in FEATURES.items() for output in feature.outputs}
+
+# Column sets most variants share
+TECHNICAL_COLUMNS = ['rsi', 'ema_20', 'ema_50', 'adx', 'macd', 'macdsignal', 'macdhist']
+BASIS_COLUMNS = ['basis', 'basis_ma_10', 'basis_ma_30', 'basis_roc', 'basis_zscore', 'basis_momentum']
+
+
+class FeatureLibrary:
+    """Computes declared features, memoized per (pair, timerange) and input digest"""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._memo = OrderedDict()  # pair -> (timerange, {(feature, digest): {column: ndarray}}, size)
+        self._bytes = 0
+
+    def apply(self, dataframe: DataFrame, pair: str, columns: list) -> DataFrame:
+        """
+        Add the requested output columns to dataframe.
+
+        :param dataframe: DataFrame the candles (date column plus the declared inputs)
+        :param pair: str the pair
+        :param columns: list of output columns, see FEATURES
+        """
+        dates = date_values(dataframe['date'])
+        timerange = (int(dates[0]), int(dates[-1]), len(dates)) if len(dates) else (0, 0, 0)
+        if pair in self._memo and self._memo[pair][0] == timerange:
+            self._memo.move_to_end(pair)
+        else:
+            self._drop(pair)
+            self._memo[pair] = (timerange, {}, 0)
+        digests = {'date': hashlib.blake2b(dates.tobytes(), digest_size=16).digest()}
+
+        computed = {}
+        for column in columns:
+            name = PROVIDERS[column]
+            if name not in computed:
+                computed[name] = self._feature(pair, name, dataframe, digests)
+            # The memo keeps its own arrays, strategies may write into their columns
+            dataframe[column] = computed[name][column].copy()
+        return dataframe
+
+    def _feature(self, pair: str, name: str, dataframe: DataFrame, digests: dict) -> dict:
+        feature = FEATURES[name]
+        for column in feature.inputs:
+            if column not in digests:
+                values = np.ascontiguousarray(dataframe[column].to_numpy(dtype=np.float64))
+                digests[column] = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+        key = (name, digests['date']) + tuple(digests[column] for column in feature.inputs)
+
+        timerange, entries, size = self._memo[pair]
+        if key not in entries:
+            outputs = feature.compute(dataframe)
+            entries[key] = {
+                column: np.asarray(outputs[column], dtype=np.float64) for column in feature.outputs
+            }
+            added = sum(values.nbytes for values in entries[key].values())
+            self._memo[pair] = (timerange, entries, size + added)
+            self._bytes += added
+            self._evict(pair)
+        return entries[key]
+
+    def _drop(self, pair: str) -> None:
+        entry = self._memo.pop(pair, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def _evict(self, keep: str) -> None:
+        # Least recently used pairs first, never the pair being analysed
+        while self._bytes > self.max_bytes and len(self._memo) > 1:
+            oldest = next(iter(self._memo))
+            if oldest == keep:
+                self._memo.move_to_end(keep)
+                continue
+            self._drop(oldest)
+
+    def clear(self) -> None:
+        self._memo.clear()
+        self._bytes = 0
+
+
+# Process wide library, shared by every strategy of a --strategy-list run
+feature_library = FeatureLibrary()
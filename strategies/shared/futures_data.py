@@ -0,0 +1,147 @@
+"""
+Perpetual futures OHLCV loader shared by the PerpSpotBasis strategies.
+
+Every populate_indicators call used to re-read the whole futures feather file of
+the pair. The loader keeps the files it has read in a process wide LRU cache,
+keyed on path and modification time, so a file is read once and only again
+after it has been re-downloaded. Live bots take the perp candles from the
+DataProvider instead (see FuturesLeg).
+"""
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from shared.merge import aligned_values, date_values
+
+FUTURES_COLUMNS = ['date', 'open', 'high', 'low', 'close', 'volume']
+
+
+class FuturesDataLoader:
+    """Memoized, mtime-aware feather loader with an LRU bounded by memory"""
+
+    def __init__(self, max_bytes: int = 512 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self._cache = OrderedDict()  # path -> (mtime_ns, size in bytes, dataframe)
+        self._bytes = 0
+
+    def load(self, paths) -> Optional[DataFrame]:
+        """
+        Load the first existing file of `paths`, only the OHLCV columns.
+
+        Returns a shallow copy of the cached frame: reassigning its index or
+        columns is safe, writing into its values is not.
+        """
+        for path in paths:
+            try:
+                mtime_ns = os.stat(path).st_mtime_ns
+            except OSError:
+                continue
+            entry = self._cache.get(path)
+            if entry is not None and entry[0] == mtime_ns:
+                self._cache.move_to_end(path)
+                return entry[2].copy(deep=False)
+            df = pd.read_feather(path, columns=FUTURES_COLUMNS)
+            self._store(path, mtime_ns, df)
+            return df.copy(deep=False)
+        return None
+
+    def _store(self, path: str, mtime_ns: int, df: DataFrame) -> None:
+        self._evict(path)
+        size = int(df.memory_usage(index=True).sum())
+        self._cache[path] = (mtime_ns, size, df)
+        self._bytes += size
+        # Keep at least the frame just loaded, even if it alone exceeds the budget
+        while self._bytes > self.max_bytes and len(self._cache) > 1:
+            self._evict(next(iter(self._cache)))
+
+    def _evict(self, path: str) -> None:
+        entry = self._cache.pop(path, None)
+        if entry is not None:
+            self._bytes -= entry[1]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._bytes = 0
+
+
+# One cache per process, shared by every strategy class loaded in it
+futures_loader = FuturesDataLoader()
+
+
+def perp_pair(pair: str) -> str:
+    """Perpetual futures pair of a spot pair (BTC/USDT -> BTC/USDT:USDT)"""
+    if ':' in pair:
+        return pair
+    return f"{pair}:{pair.split('/')[1]}"
+
+
+class FuturesLeg:
+    """
+    Perp side of the spot/perp basis for one strategy instance.
+
+    Live and dry-run bots take the perp candles from the DataProvider (declared
+    through `informative_pairs`), so the basis follows the market instead of
+    the last download. Backtests and hyperopt read the futures files through
+    the shared loader. Merged perp columns are remembered per pair so a new
+    candle only merges the rows that were not merged before.
+    """
+
+    def __init__(self, strategy):
+        self.strategy = strategy
+        self._merged = {}  # pair -> (spot dates as int64, raw perp values before ffill)
+
+    @property
+    def is_live(self) -> bool:
+        return self.strategy.config['runmode'].value in ('live', 'dry_run')
+
+    def informative_pairs(self) -> list:
+        if not self.is_live:
+            return []
+        return [
+            (perp_pair(pair), self.strategy.timeframe, 'futures')
+            for pair in self.strategy.dp.current_whitelist()
+        ]
+
+    def candles(self, pair: str, paths) -> Optional[DataFrame]:
+        """Perp OHLCV of a spot pair: DataProvider when live, else the first existing file of `paths`"""
+        if self.is_live:
+            df = self.strategy.dp.get_pair_dataframe(perp_pair(pair), self.strategy.timeframe, candle_type='futures')
+            if df is not None and not df.empty:
+                return df[FUTURES_COLUMNS]
+        return futures_loader.load(paths)
+
+    def merge(self, pair: str, spot_df: DataFrame, futures_df: DataFrame,
+              columns=('close', 'volume'), suffix: str = '_perp') -> DataFrame:
+        """
+        Left join perp `columns` onto the spot candles by date, then forward fill.
+
+        Same result as `pd.merge(spot_df, futures_df, on='date', how='left')`
+        followed by `ffill`, but rows merged on a previous call (up to the last
+        one that had perp data) are reused and only the rest is looked up.
+        """
+        dates = date_values(spot_df['date'])
+        values = np.full((len(dates), len(columns)), np.nan)
+        reuse = 0
+        cached = self._merged.get(pair)
+        if cached is not None and len(dates) > 0:
+            cached_dates, cached_values = cached
+            start = int(np.searchsorted(cached_dates, dates[0]))
+            overlap = min(len(cached_dates) - start, len(dates))
+            if overlap > 0 and np.array_equal(cached_dates[start:start + overlap], dates[:overlap]):
+                complete = np.flatnonzero(~np.isnan(cached_values[start:start + overlap]).any(axis=1))
+                if len(complete) > 0:
+                    reuse = int(complete[-1]) + 1
+                    values[:reuse] = cached_values[start:start + reuse]
+        if reuse < len(dates):
+            values[reuse:] = aligned_values(dates[reuse:], futures_df, columns)
+        self._merged[pair] = (dates, values)
+
+        for i, column in enumerate(columns):
+            spot_df[f'{column}{suffix}'] = values[:, i]
+        perp_columns = [f'{column}{suffix}' for column in columns]
+        spot_df[perp_columns] = spot_df[perp_columns].ffill()
+        return spot_df
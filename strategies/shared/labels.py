@@ -0,0 +1,113 @@
+"""
+Forward return labels for FreqAI classifier targets.
+
+A candle is labelled 'enter' when its return `horizon` candles ahead exceeds a
+threshold, `min_return * (1 + volatility_factor * volatility)` with volatility
+the rolling std of the candle returns, and 'hold' otherwise (also where the
+future or the volatility is not known yet). `ForwardReturnLabels` evaluates
+every (horizon, scheme) combination in one vectorized pass and keeps the
+labels as int8 codes into `CLASSES`; strategies write the class names from
+those codes (a lookup, no string built per candle).
+
+FreqAI retrains on a window that moves forward with the candles. The codes of
+the previous call of a pair are reused for the candles whose return and
+volatility windows lie in the part of the frame both calls share; only the
+candles at the edges are labelled again.
+"""
+import numpy as np
+from pandas import DataFrame
+
+from shared.merge import date_values
+from shared.rolling import rolling_mean_std
+
+CLASSES = np.array(['hold', 'enter'], dtype=object)
+
+
+def forward_return_codes(close, horizons, schemes, volatility_window: int = 20) -> np.ndarray:
+    """
+    Label codes for every (horizon, scheme), shape (len(horizons) * len(schemes), len(close)).
+
+    :param close: array-like the close prices
+    :param horizons: list of int candles ahead the return is measured
+    :param schemes: list of (min_return, volatility_factor)
+    :param volatility_window: int candles of the returns' rolling std
+    """
+    close = np.asarray(close, dtype=np.float64)
+    n = close.shape[0]
+    returns = np.full(n, np.nan)
+    returns[1:] = close[1:] / close[:-1] - 1
+    volatility = rolling_mean_std(returns, [volatility_window])[1][0]
+    # Factor 0 means a fixed threshold, also during the volatility warmup
+    thresholds = np.array([
+        np.full(n, min_return) if factor == 0 else min_return * (1 + volatility * factor)
+        for min_return, factor in schemes
+    ]).reshape(len(schemes), n)
+
+    future = np.full((len(horizons), n), np.nan)
+    for i, horizon in enumerate(horizons):
+        if horizon < n:
+            future[i, :n - horizon] = close[horizon:] / close[:n - horizon] - 1
+    # NaN compares False: unknown futures and thresholds are 'hold'
+    with np.errstate(invalid='ignore'):
+        codes = future[:, None, :] > thresholds[None, :, :]
+    return codes.reshape(-1, n).astype(np.int8)
+
+
+class ForwardReturnLabels:
+    """Integer coded forward return labels of several horizons and schemes, cached per pair"""
+
+    def __init__(self, horizons, schemes: dict, volatility_window: int = 20):
+        """
+        :param horizons: list of int candles ahead the return is measured
+        :param schemes: dict name -> (min_return, volatility_factor)
+        :param volatility_window: int candles of the returns' rolling std
+        """
+        self.horizons = [int(horizon) for horizon in horizons]
+        self.schemes = dict(schemes)
+        self.volatility_window = volatility_window
+        self.keys = [(horizon, name) for horizon in self.horizons for name in self.schemes]
+        self._pairs = {}  # pair -> (dates as int64, close, codes)
+
+    def codes(self, pair: str, dataframe: DataFrame) -> dict:
+        """(horizon, scheme name) -> int8 codes into CLASSES, one per candle of dataframe"""
+        dates = date_values(dataframe['date'])
+        close = dataframe['close'].to_numpy(dtype=np.float64)
+        n = close.shape[0]
+        codes = None
+        reuse = self._reusable(pair, dates, close)
+        if reuse is not None:
+            start, overlap = reuse
+            # Rows whose volatility window starts inside the frame and whose future is in the overlap
+            first, last = self.volatility_window + 1, overlap - max(self.horizons)
+            if first < last:
+                codes = np.empty((len(self.keys), n), dtype=np.int8)
+                codes[:, first:last] = self._pairs[pair][2][:, start + first:start + last]
+                codes[:, :first] = self._compute(close[:min(first + max(self.horizons), n)])[:, :first]
+                tail_start = last - self.volatility_window - 1
+                codes[:, last:] = self._compute(close[tail_start:])[:, last - tail_start:]
+        if codes is None:
+            codes = self._compute(close)
+        self._pairs[pair] = (dates, close, codes)
+        return {key: codes[i] for i, key in enumerate(self.keys)}
+
+    def labels(self, pair: str, dataframe: DataFrame) -> dict:
+        """(horizon, scheme name) -> class name array ('hold'/'enter'), one per candle of dataframe"""
+        return {key: CLASSES[codes] for key, codes in self.codes(pair, dataframe).items()}
+
+    def _compute(self, close: np.ndarray) -> np.ndarray:
+        return forward_return_codes(close, self.horizons, list(self.schemes.values()), self.volatility_window)
+
+    def _reusable(self, pair: str, dates: np.ndarray, close: np.ndarray):
+        """(start of the frame in the cached frame, candles shared), None without a common part"""
+        cached = self._pairs.get(pair)
+        if cached is None or len(dates) == 0:
+            return None
+        cached_dates, cached_close, _ = cached
+        start = int(np.searchsorted(cached_dates, dates[0]))
+        overlap = min(len(cached_dates) - start, len(dates))
+        if overlap <= 0:
+            return None
+        if not (np.array_equal(cached_dates[start:start + overlap], dates[:overlap])
+                and np.array_equal(cached_close[start:start + overlap], close[:overlap], equal_nan=True)):
+            return None
+        return start, overlap
@@ -0,0 +1,47 @@
+"""
+Results computed from a frame's candles, reused while the candles are the same.
+
+FreqAI calls the feature and target hooks of a strategy several times on the
+same candles: `feature_engineering_expand_all` once per indicator period, the
+targets for a retrain and again for the prediction that follows on the same
+candle. A `CandleMemo` keeps the last result of every key (a pair, a pair and
+timeframe) together with the candles it was built from, and returns it while
+a call brings the same dates and OHLCV; anything else builds it again.
+"""
+from typing import Callable, Hashable
+
+import numpy as np
+from pandas import DataFrame
+
+from shared.merge import date_values
+
+INPUTS = ['open', 'high', 'low', 'close', 'volume']
+
+
+class CandleMemo:
+    """The result built from the last candle frame of every key"""
+
+    def __init__(self):
+        self._entries = {}  # key -> (dates as int64, OHLCV, result)
+
+    def get(self, key: Hashable, dataframe: DataFrame, build: Callable[[DataFrame], object]):
+        """
+        Result of build for dataframe's candles, built unless the key's cached frame has the same candles.
+
+        :param key: hashable the pair (or pair and timeframe) of the frame
+        :param dataframe: DataFrame with date and OHLCV columns
+        :param build: callable OHLCV frame -> result (it may add columns to the frame it gets)
+        """
+        dates = date_values(dataframe['date'])
+        candles = dataframe[INPUTS].to_numpy(dtype=np.float64)
+        cached = self._entries.get(key)
+        # The NaN aware comparison is several times slower, only needed when a candle holds a NaN
+        if (cached is not None and np.array_equal(cached[0], dates)
+                and (np.array_equal(cached[1], candles) or np.array_equal(cached[1], candles, equal_nan=True))):
+            return cached[2]
+        result = build(dataframe[INPUTS].copy())
+        self._entries[key] = (dates, candles, result)
+        return result
+
+    def clear(self) -> None:
+        self._entries.clear()
@@ -0,0 +1,92 @@
+"""
+Timestamp aligned joins of candle frames.
+
+Frames are aligned on their `date` column as int64 nanoseconds with
+`np.searchsorted`. The right frame is first cut down to the time window of the
+left one, so the cost follows the left frame (the strategy window) instead of
+the whole history on the right (a multi-year futures file).
+"""
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+
+def date_values(dates) -> np.ndarray:
+    """Candle dates as int64 nanoseconds since the epoch (UTC)"""
+    return np.asarray(dates.to_numpy(dtype='datetime64[ns]')).view(np.int64)
+
+
+def asof_indexer(left: np.ndarray, right: np.ndarray, tolerance: Optional[int] = None) -> np.ndarray:
+    """
+    Position in `right` of the row matching each `left` date, -1 where there is none.
+
+    :param left: sorted int64 dates to look up
+    :param right: sorted int64 dates to match against
+    :param tolerance: None for exact matches only, otherwise the maximum age in
+        nanoseconds of the latest right row at or before the left date
+    """
+    if len(right) == 0:
+        return np.full(len(left), -1, dtype=np.intp)
+    positions = np.searchsorted(right, left, side='right') - 1
+    found = positions >= 0
+    lag = left - right[np.maximum(positions, 0)]
+    if tolerance is None:
+        found &= lag == 0
+    else:
+        found &= lag <= tolerance
+    return np.where(found, positions, -1)
+
+
+def aligned_values(left_dates: np.ndarray, right: DataFrame, columns,
+                   tolerance: Optional[pd.Timedelta] = None) -> np.ndarray:
+    """
+    Values of `columns` of `right` for each of `left_dates`, NaN where nothing matches.
+
+    :param left_dates: sorted int64 dates (see `date_values`)
+    :param right: DataFrame candles sorted by date
+    :param columns: list of str the columns of `right` to take
+    :param tolerance: pd.Timedelta, optional how old a right row may be to match
+    """
+    columns = list(columns)
+    values = np.full((len(left_dates), len(columns)), np.nan)
+    if len(left_dates) == 0 or len(right) == 0:
+        return values
+    tolerance_ns = None if tolerance is None else int(pd.Timedelta(tolerance).value)
+    # Only the right rows inside the left window (plus the tolerance) can match; find
+    # them by bisection on the raw dates and only convert that slice to nanoseconds
+    # (in their own unit, a key of another unit would convert the whole column)
+    raw_dates = right['date'].values
+    bounds = np.array([left_dates[0] - (tolerance_ns or 0), left_dates[-1]], dtype='datetime64[ns]')
+    bounds = bounds.astype(raw_dates.dtype)
+    start = np.searchsorted(raw_dates, bounds[0], side='left')
+    stop = np.searchsorted(raw_dates, bounds[1], side='right')
+    right_dates = raw_dates[start:stop].astype('datetime64[ns]').view(np.int64)
+    positions = asof_indexer(left_dates, right_dates, tolerance_ns)
+    matched = positions >= 0
+    rows = positions[matched]
+    for i, column in enumerate(columns):
+        values[matched, i] = right[column].to_numpy(dtype=np.float64)[start:stop][rows]
+    return values
+
+
+def merge_on_date(left: DataFrame, right: DataFrame, columns, suffix: str = '',
+                  tolerance: Optional[pd.Timedelta] = None) -> DataFrame:
+    """
+    Add `columns` of `right` to `left`, aligned on date, NaN where nothing matches.
+
+    Equivalent to a left `pd.merge` on date (or `pd.merge_asof` when a
+    tolerance is given) that keeps the index and row order of `left`.
+    Both frames must be sorted by date; `left` is modified in place.
+
+    :param left: DataFrame the candles to add the columns to
+    :param right: DataFrame the candles to take the columns from
+    :param columns: list of str the columns of `right` to add
+    :param suffix: str appended to the added column names
+    :param tolerance: pd.Timedelta, optional how old a right row may be to match
+    """
+    values = aligned_values(date_values(left['date']), right, columns, tolerance)
+    for i, column in enumerate(columns):
+        left[f'{column}{suffix}'] = values[:, i]
+    return left
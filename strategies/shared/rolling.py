@@ -0,0 +1,425 @@
+"""
+Rolling window statistics over several windows at once.
+
+`rolling_mean_std` gives the same values as `Series.rolling(w).mean()` and
+`.std()` (min_periods=w, ddof=1, NaN wherever the window holds a NaN) for every
+window in one pass over the data: each chunk of the series is read once and
+its running sums serve all windows.
+
+Plain running sums of x and x^2 lose precision on long or large valued series
+(an OBV, a price in the tens of thousands): the variance is the difference of
+two huge, nearly equal sums. Like Welford's update, the kernel avoids that by
+working on deviations from a local reference: the sums restart at every chunk,
+from values shifted by the chunk mean, so they stay small and the cancellation
+stays bounded by the chunk length instead of the series length. Short windows
+(up to SHORT_WINDOW candles) can still hold a spread far below the chunk's,
+so they are computed directly with the two-pass formula instead.
+
+Both are more accurate than pandas' online algorithm, so results agree with
+pandas to its precision (about 1e-6 relative), not bit for bit.
+
+`rolling_max` and `rolling_min` compute rolling extremes in O(n) whatever the
+window (NostalgiaForInfinityX6 uses them too); `rolling_drawdown` and
+`rolling_vwap` only read their window, unlike the running totals (cumprod of
+the returns) they replace.
+
+`rolling_mean_std_rows` batches many series (each with its own window) into
+one pass; `RollingMoments` builds the z-score blocks of the Alex strategies
+on it.
+"""
+from typing import Optional
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from pandas import DataFrame, Series
+
+CHUNK = 4096
+QUANTILE_CHUNK = 1024
+SHORT_WINDOW = 16
+
+
+def rolling_mean_std(values, windows, chunk: int = CHUNK) -> tuple:
+    """
+    Rolling mean and sample standard deviation for several windows.
+
+    :param values: array-like the input series
+    :param windows: list of int the window lengths
+    :param chunk: int output rows per chunk
+    :return: (means, stds), float64 arrays of shape (len(windows), len(values))
+    """
+    x = np.asarray(values, dtype=np.float64)
+    windows = [int(window) for window in windows]
+    n = x.shape[0]
+    means = np.full((len(windows), n), np.nan)
+    stds = np.full((len(windows), n), np.nan)
+    if n == 0 or not windows:
+        return means, stds
+    for i, window in enumerate(windows):
+        if 1 <= window <= min(SHORT_WINDOW, n):
+            means[i, window - 1:], stds[i, window - 1:] = _short_moments(x, window)
+    long_windows = [(i, window) for i, window in enumerate(windows) if window > SHORT_WINDOW]
+    if not long_windows:
+        _pin_constant_windows(x, windows, means, stds)
+        return means, stds
+    longest = max(window for _, window in long_windows)
+    is_nan = np.isnan(x)
+    nan_count = np.concatenate(([0], np.cumsum(is_nan)))
+
+    for begin in range(0, n, chunk):
+        end = min(begin + chunk, n)
+        # Inputs of the chunk's windows, shifted by their mean
+        offset = max(begin - longest + 1, 0)
+        segment = x[offset:end]
+        valid = ~is_nan[offset:end]
+        anchor = segment[valid].mean() if valid.any() else 0.0
+        deviation = np.where(valid, segment - anchor, 0.0)
+        sum1 = np.concatenate(([0.0], np.cumsum(deviation)))
+        sum2 = np.concatenate(([0.0], np.cumsum(deviation * deviation)))
+
+        for i, window in long_windows:
+            first = max(begin, window - 1)
+            if first >= end:
+                continue
+            rows = np.arange(first, end)
+            upper = rows + 1 - offset
+            lower = upper - window
+            window_sum1 = sum1[upper] - sum1[lower]
+            window_sum2 = sum2[upper] - sum2[lower]
+            means[i, first:end] = window_sum1 / window + anchor
+            if window > 1:
+                variance = (window_sum2 - window_sum1 * window_sum1 / window) / (window - 1)
+                stds[i, first:end] = np.sqrt(np.maximum(variance, 0.0))
+            has_nan = (nan_count[rows + 1] - nan_count[rows + 1 - window]) > 0
+            means[i, first:end][has_nan] = np.nan
+            stds[i, first:end][has_nan] = np.nan
+    _pin_constant_windows(x, windows, means, stds)
+    return means, stds
+
+
+def _short_moments(x: np.ndarray, window: int) -> tuple:
+    """Two-pass mean and sample std of every full window of x (last axis), from shifted slices"""
+    m = x.shape[-1] - window + 1
+    mean = x[..., :m].copy()
+    for k in range(1, window):
+        np.add(mean, x[..., k:k + m], out=mean)
+    mean /= window
+    if window == 1:
+        return mean, np.full(mean.shape, np.nan)
+    squares = np.zeros(mean.shape)
+    deviation = np.empty(mean.shape)
+    for k in range(window):
+        np.subtract(x[..., k:k + m], mean, out=deviation)
+        np.multiply(deviation, deviation, out=deviation)
+        np.add(squares, deviation, out=squares)
+    squares /= window - 1
+    return mean, np.sqrt(squares, out=squares)
+
+
+def _pin_constant_windows(x: np.ndarray, windows, means: np.ndarray, stds: np.ndarray) -> None:
+    """
+    Exact moments of the windows holding a single value, mean = value and std = 0
+    like pandas (rounding would leave a std of ~1e-17 and a meaningless z-score).
+    """
+    n = x.shape[0]
+    changes = np.zeros(n, dtype=np.int64)
+    np.cumsum(x[1:] != x[:-1], out=changes[1:])
+    for i, window in enumerate(windows):
+        if window < 2 or window > n:
+            continue
+        constant = changes[window - 1:] == changes[:n - window + 1]
+        if constant.any():
+            means[i, window - 1:][constant] = x[window - 1:][constant]
+            stds[i, window - 1:][constant] = 0.0
+
+
+def rolling_zscore(values, windows, chunk: int = CHUNK) -> np.ndarray:
+    """
+    (x - rolling mean) / rolling std for several windows, shape (len(windows), len(values)).
+
+    :param values: array-like the input series
+    :param windows: list of int the window lengths
+    :param chunk: int output rows per chunk
+    """
+    x = np.asarray(values, dtype=np.float64)
+    means, stds = rolling_mean_std(x, windows, chunk)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return (x - means) / stds
+
+
+def rolling_mean_std_rows(values, windows, chunk: int = CHUNK) -> tuple:
+    """
+    Rolling mean and sample standard deviation of several series, each with its own window.
+
+    The batched counterpart of `rolling_mean_std` (same values, same NaN
+    handling): all series are processed together, the long windows from one
+    set of chunk-recentred running sums over the stacked rows.
+
+    :param values: 2-d array-like, one series per row
+    :param windows: list of int the window of each row
+    :param chunk: int output rows per chunk
+    :return: (means, stds), float64 arrays shaped like values
+    """
+    x = np.atleast_2d(np.asarray(values, dtype=np.float64))
+    windows = np.asarray(windows, dtype=np.int64)
+    n = x.shape[1]
+    means = np.full(x.shape, np.nan)
+    stds = np.full(x.shape, np.nan)
+    if n == 0:
+        return means, stds
+    for window in np.unique(windows[(windows >= 1) & (windows <= min(SHORT_WINDOW, n))]):
+        rows = np.flatnonzero(windows == window)
+        means[rows, window - 1:], stds[rows, window - 1:] = _short_moments(x[rows], int(window))
+    for i, window in enumerate(windows):
+        _pin_constant_windows(x[i], [window], means[i:i + 1], stds[i:i + 1])
+    long_rows = np.flatnonzero(windows > SHORT_WINDOW)
+    if not len(long_rows):
+        return means, stds
+    series = x
+    x = x[long_rows]
+    long_windows = windows[long_rows]
+    longest = int(long_windows.max())
+    groups = [(int(window), np.flatnonzero(long_windows == window)) for window in np.unique(long_windows)]
+    is_nan = np.isnan(x)
+    nan_count = np.zeros((len(long_rows), n + 1), dtype=np.int64)
+    np.cumsum(is_nan, axis=1, out=nan_count[:, 1:])
+
+    for begin in range(0, n, chunk):
+        end = min(begin + chunk, n)
+        # Inputs of the chunk's windows, shifted by their mean (per row)
+        offset = max(begin - longest + 1, 0)
+        valid = ~is_nan[:, offset:end]
+        deviation = np.where(valid, x[:, offset:end], 0.0)
+        counts = valid.sum(axis=1, keepdims=True)
+        anchor = deviation.sum(axis=1, keepdims=True) / np.maximum(counts, 1)
+        deviation -= anchor
+        deviation[~valid] = 0.0
+        sum1 = np.zeros((len(long_rows), end - offset + 1))
+        sum2 = np.zeros((len(long_rows), end - offset + 1))
+        np.cumsum(deviation, axis=1, out=sum1[:, 1:])
+        np.cumsum(deviation * deviation, axis=1, out=sum2[:, 1:])
+
+        for window, rows in groups:
+            first = max(begin, window - 1)
+            if first >= end:
+                continue
+            upper = slice(first + 1 - offset, end + 1 - offset)
+            lower = slice(first + 1 - offset - window, end + 1 - offset - window)
+            window_sum1 = sum1[rows, upper] - sum1[rows, lower]
+            window_sum2 = sum2[rows, upper] - sum2[rows, lower]
+            has_nan = (nan_count[rows, first + 1:end + 1] - nan_count[rows, first + 1 - window:end + 1 - window]) > 0
+            mean = window_sum1 / window + anchor[rows]
+            means[long_rows[rows], first:end] = np.where(has_nan, np.nan, mean)
+            if window > 1:
+                variance = (window_sum2 - window_sum1 * window_sum1 / window) / (window - 1)
+                stds[long_rows[rows], first:end] = np.where(has_nan, np.nan, np.sqrt(np.maximum(variance, 0.0)))
+    for i in long_rows:
+        _pin_constant_windows(series[i], [windows[i]], means[i:i + 1], stds[i:i + 1])
+    return means, stds
+
+
+class RollingMoments:
+    """Rolling means, stds and z-scores of several series, from one batched pass"""
+
+    def __init__(self, dataframe: DataFrame, specs: list):
+        """
+        :param dataframe: DataFrame holding the source columns
+        :param specs: list of (name, source, window), source a column of dataframe or an
+            array of the same length (a derived series that is not a column)
+        """
+        self.index = dataframe.index
+        self._rows = {name: i for i, (name, _, _) in enumerate(specs)}
+        self.values = np.empty((len(specs), len(dataframe)))
+        for i, (_, source, _) in enumerate(specs):
+            self.values[i] = dataframe[source] if isinstance(source, str) else np.asarray(source, dtype=np.float64)
+        self.means, self.stds = rolling_mean_std_rows(self.values, [window for _, _, window in specs])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            self.zscores = (self.values - self.means) / self.stds
+
+    def mean(self, name: str) -> np.ndarray:
+        return self.means[self._rows[name]]
+
+    def std(self, name: str) -> np.ndarray:
+        return self.stds[self._rows[name]]
+
+    def zscore(self, name: str) -> np.ndarray:
+        return self.zscores[self._rows[name]]
+
+    def frame(self, names: list, columns: Optional[list] = None) -> DataFrame:
+        """Z-scores of names as one float64 block, columns named `columns` (default names)"""
+        rows = [self._rows[name] for name in names]
+        return DataFrame(self.zscores[rows].T, index=self.index, columns=columns or names, copy=False)
+
+
+def bollinger_bands(values, windows, stds: float) -> tuple:
+    """
+    `qtpylib.bollinger_bands` for several windows from one rolling pass.
+
+    Like qtpylib (min_periods=1) the first window - 1 candles use the candles
+    available so far. The series must be free of NaN (a price): qtpylib skips
+    NaN inside a window where this gives NaN.
+
+    :param values: array-like the input series (typical price)
+    :param windows: list of int the window lengths
+    :param stds: float band width in standard deviations
+    :return: (lower, mid, upper), float64 arrays of shape (len(windows), len(values))
+    """
+    x = np.asarray(values, dtype=np.float64)
+    means, deviations = rolling_mean_std(x, windows)
+    for i, window in enumerate(windows):
+        head = min(int(window) - 1, x.shape[0])
+        if head > 0:
+            expanding = Series(x[:head]).expanding()
+            means[i, :head] = expanding.mean()
+            deviations[i, :head] = expanding.std()
+    band = deviations * stds
+    return means - band, means, means + band
+
+
+def rolling_quantiles(values, window: int, quantiles, chunk: int = QUANTILE_CHUNK) -> np.ndarray:
+    """
+    Several rolling quantiles of one window, shape (len(quantiles), len(values)).
+
+    Same values as `Series.rolling(window).quantile(q)` (linear interpolation,
+    NaN wherever the window holds a NaN); q=0.5 averages the two middle values
+    like `.median()`. Each window is sorted once, chunk by chunk, and every
+    quantile reads its order statistics from the sorted rows (numpy sorts short
+    rows faster than it partitions them around several kth).
+
+    :param values: array-like the input series
+    :param window: int the window length
+    :param quantiles: list of float the quantiles, in [0, 1]
+    :param chunk: int output rows per chunk
+    """
+    x = np.asarray(values, dtype=np.float64)
+    n = x.shape[0]
+    result = np.full((len(quantiles), n), np.nan)
+    if window < 1 or n < window or not quantiles:
+        return result
+    # Lower/upper order statistic and interpolation fraction of each quantile
+    positions = [q * (window - 1) for q in quantiles]
+    lower = [int(np.floor(position)) for position in positions]
+    upper = [min(index + 1, window - 1) for index in lower]
+    fraction = [position - index for position, index in zip(positions, lower)]
+
+    views = sliding_window_view(x, window)
+    has_nan = sliding_window_view(np.isnan(x), window).any(axis=1)
+    for begin in range(0, views.shape[0], chunk):
+        block = np.sort(views[begin:begin + chunk], axis=1)
+        rows = slice(window - 1 + begin, window - 1 + begin + block.shape[0])
+        for i in range(len(quantiles)):
+            low = block[:, lower[i]]
+            if fraction[i] == 0.0:
+                result[i, rows] = low
+            elif fraction[i] == 0.5:
+                result[i, rows] = (low + block[:, upper[i]]) / 2
+            else:
+                result[i, rows] = low + (block[:, upper[i]] - low) * fraction[i]
+    result[:, window - 1:][:, has_nan] = np.nan
+    return result
+
+
+def _rolling_extreme(values, window: int, ufunc) -> np.ndarray:
+    x = np.asarray(values, dtype=np.float64)
+    n = x.shape[0]
+    result = np.full(n, np.nan)
+    if window < 1 or n < window:
+        return result
+    if window == 1:
+        result[:] = x
+        return result
+    # Prefix/suffix extremes inside blocks of `window` (van Herk/Gil-Werman): every window spans
+    # at most two blocks, so its extreme is the suffix of the first block combined with the
+    # prefix of the second. NaN propagates exactly like pandas' min_periods=window.
+    pad = (-n) % window
+    fill = -np.inf if ufunc is np.maximum else np.inf
+    blocks = np.concatenate([x, np.full(pad, fill)]).reshape(-1, window)
+    prefix = ufunc.accumulate(blocks, axis=1).ravel()
+    suffix = ufunc.accumulate(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+    result[window - 1:] = ufunc(suffix[:n - window + 1], prefix[window - 1:n])
+    return result
+
+
+def rolling_max(values, window: int) -> np.ndarray:
+    """
+    Rolling maximum, equivalent to `Series.rolling(window).max()`.
+
+    :param values: array-like the input series
+    :param window: int the window length
+    """
+    return _rolling_extreme(values, window, np.maximum)
+
+
+def rolling_min(values, window: int) -> np.ndarray:
+    """
+    Rolling minimum, equivalent to `Series.rolling(window).min()`.
+
+    :param values: array-like the input series
+    :param window: int the window length
+    """
+    return _rolling_extreme(values, window, np.minimum)
+
+
+def rolling_drawdown(values, window: int) -> np.ndarray:
+    """
+    Drawdown of every candle from the highest value of its window, x / max - 1.
+
+    Equals the cumulative return formulation `cum = (1 + pct_change).cumprod()`,
+    `(cum - cum.rolling(w).max()) / cum.rolling(w).max()`, for prices without
+    gaps: the price of the first candle cancels out, so the running product (it
+    drifts over a long history and depends on where the frame starts) is not
+    needed. That formulation is NaN up to candle w (its first return is
+    unknown), the kernel from w - 1.
+
+    :param values: array-like the prices
+    :param window: int the window length
+    """
+    x = np.asarray(values, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return x / rolling_max(x, window) - 1.0
+
+
+def rolling_vwap(price, volume, window: int, chunk: int = CHUNK) -> np.ndarray:
+    """
+    Rolling volume weighted average price, sum(price * volume) / sum(volume).
+
+    Same values as the two `rolling(window).sum()` of the pandas expression (NaN
+    wherever the window holds a NaN or only zero volume), from one pass over
+    both running sums, recentred per chunk like `rolling_mean_std`.
+
+    :param price: array-like the price of each candle (close, typical price, ...)
+    :param volume: array-like the volume of each candle
+    :param window: int the window length
+    :param chunk: int output rows per chunk
+    """
+    p = np.asarray(price, dtype=np.float64)
+    v = np.asarray(volume, dtype=np.float64)
+    n = p.shape[0]
+    result = np.full(n, np.nan)
+    if window < 1 or n < window:
+        return result
+    stacked = np.vstack((p * v, v))
+    is_nan = np.isnan(stacked[0])
+    # Masks are only built when needed: windows holding a NaN or only zero volume
+    masks = []
+    if is_nan.any():
+        masks.append((np.concatenate(([0], np.cumsum(is_nan))), lambda count: count > 0))
+        # Zeroes keep the NaN out of the sums of the other windows
+        stacked[:, is_nan] = 0.0
+    no_volume = v == 0
+    if no_volume.any():
+        masks.append((np.concatenate(([0], np.cumsum(no_volume))), lambda count: count == window))
+
+    for begin in range(window - 1, n, chunk):
+        end = min(begin + chunk, n)
+        segment = stacked[:, begin - window + 1:end]
+        anchor = segment.mean(axis=1, keepdims=True)
+        sums = np.zeros((2, segment.shape[1] + 1))
+        np.cumsum(segment - anchor, axis=1, out=sums[:, 1:])
+        window_sums = sums[:, window:] - sums[:, :-window] + window * anchor
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result[begin:end] = window_sums[0] / window_sums[1]
+
+    for counts, masked in masks:
+        result[window - 1:][masked(counts[window:] - counts[:-window])] = np.nan
+    return result
+
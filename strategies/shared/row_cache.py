@@ -0,0 +1,48 @@
+"""
+Per pair cache of the analyzed values callbacks read for the current candle.
+
+Sizing and risk callbacks (custom_stake_amount, custom_stoploss, leverage, ...)
+only need a few columns of the candle the decision is made on. Looking them up
+in `dp.get_analyzed_dataframe` costs a frame slice per call in backtests. The
+strategy instead records those columns at the end of `populate_indicators`, and
+the callbacks read the last candle that closed before `current_time`: the last
+row of a live frame, the signal candle of a backtest.
+"""
+from datetime import datetime
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+from pandas import DataFrame
+
+from shared.merge import date_values
+
+
+class RowCache:
+    """Selected columns of the analyzed candles of every pair"""
+
+    def __init__(self, columns: list, timeframe_minutes: int):
+        """
+        :param columns: list of the cached columns
+        :param timeframe_minutes: int candle length, a candle is usable once it closed
+        """
+        self.columns = list(columns)
+        self.timeframe = pd.Timedelta(minutes=timeframe_minutes).value
+        self._pairs = {}  # pair -> (candle close times as int64 ns, {column: ndarray})
+
+    def update(self, pair: str, dataframe: DataFrame) -> None:
+        """Record the cached columns of an analyzed frame (the columns it lacks are skipped)"""
+        closes = date_values(dataframe['date']) + self.timeframe
+        values = {column: dataframe[column].to_numpy() for column in self.columns if column in dataframe.columns}
+        self._pairs[pair] = (closes, values)
+
+    def row(self, pair: str, current_time: datetime) -> Optional[dict]:
+        """Cached values of the last candle closed at current_time, None if there is none"""
+        cached = self._pairs.get(pair)
+        if cached is None:
+            return None
+        closes, values = cached
+        position = int(np.searchsorted(closes, pd.Timestamp(current_time).value, side='right')) - 1
+        if position < 0:
+            return None
+        return {column: column_values[position] for column, column_values in values.items()}
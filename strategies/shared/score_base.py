@@ -0,0 +1,110 @@
+"""
+Weight independent layer of the Alex strategies' target score.
+
+The target `T = S * R * R2 * V * V2` depends on the hyperoptable weights
+w0..w8 through the aggregate score S only, a weighted sum of the normalized
+indicators. Everything else (the TA-Lib indicators, their rolling
+normalizations, the regime and volatility filters) is a function of the
+candles alone. A `ScoreBase` holds that part: the indicator columns, the
+normalized indicators stacked as a (candles, components) matrix and the
+product of the filters. Applying a weight vector is then one matrix-vector
+product, `score(weights)`, and a (k, components) batch of weight vectors gives
+the k scores with one matrix product. `signals` evaluates the threshold entry
+and exit rules of a whole batch of candidate weights and thresholds that way,
+on a float32 copy of the matrix (`astype`) to halve the memory traffic of large
+batches.
+
+`ScoreBaseCache` keeps the base of the last frame of every pair and reuses it
+while the candles (dates and OHLCV) are the same: a retrain and the prediction
+that follows it on the same candle, or several weight vectors on one timerange.
+"""
+import numpy as np
+from pandas import DataFrame
+
+from shared.memo import CandleMemo
+
+# Score components, in the column order of ScoreBase.components
+COMPONENTS = ('ma', 'macd', 'roc', 'rsi', 'bb_width', 'cci', 'momentum', 'stoch', 'atr', 'obv')
+# Weight parameter of every component, the momentum one is scaled by the trend factor
+WEIGHT_PARAMETERS = ('w0', 'w1', 'w2', 'w3', 'w4', 'w5', 'w3', 'w8', 'w7', 'w6')
+PARAMETERS = ('w0', 'w1', 'w2', 'w3', 'w4', 'w5', 'w6', 'w7', 'w8')
+
+_PARAMETER_INDEX = [PARAMETERS.index(name) for name in WEIGHT_PARAMETERS]
+
+
+def component_weights(parameters) -> np.ndarray:
+    """Weights in COMPONENTS order from w0..w8 values, shape (..., 9) -> (..., len(COMPONENTS))"""
+    return np.asarray(parameters, dtype=np.float64)[..., _PARAMETER_INDEX]
+
+
+class ScoreBase:
+    """Indicator columns, normalized component matrix and filter product of one frame"""
+
+    def __init__(self, columns: DataFrame, components: np.ndarray, momentum_factor: np.ndarray,
+                 regime: np.ndarray):
+        """
+        :param columns: DataFrame the weight independent columns added to the frame
+        :param components: (candles, len(COMPONENTS)) array, the normalized indicators with the
+            momentum column already scaled by momentum_factor
+        :param momentum_factor: array the momentum weight of every candle relative to its parameter
+        :param regime: array the product of the regime and volatility filters
+        """
+        self.columns = columns
+        self.components = components
+        self.momentum_factor = momentum_factor
+        self.regime = regime
+        self._converted = {}  # dtype -> ScoreBase
+
+    @staticmethod
+    def weights(strategy) -> np.ndarray:
+        """Weight vector of the strategy's current parameter values, in COMPONENTS order"""
+        return np.array([getattr(strategy, name).value for name in WEIGHT_PARAMETERS], dtype=np.float64)
+
+    def astype(self, dtype) -> 'ScoreBase':
+        """The base with components and regime of dtype (converted once, then kept)"""
+        dtype = np.dtype(dtype)
+        if dtype == self.components.dtype:
+            return self
+        if dtype not in self._converted:
+            self._converted[dtype] = ScoreBase(self.columns, np.ascontiguousarray(self.components, dtype=dtype),
+                                               self.momentum_factor, self.regime.astype(dtype))
+        return self._converted[dtype]
+
+    def score(self, weights) -> np.ndarray:
+        """Aggregate score S for a weight vector, or (candles, k) scores for k stacked weight vectors"""
+        weights = np.asarray(weights, dtype=self.components.dtype)
+        return self.components @ weights.T
+
+    def target(self, weights) -> np.ndarray:
+        """Target score T = S * R * R2 * V * V2, shaped like score(weights)"""
+        score = self.score(weights)
+        return score * (self.regime if score.ndim == 1 else self.regime[:, None])
+
+    def signals(self, weights, threshold_buy, threshold_sell, volume, horizon: int) -> dict:
+        """
+        Threshold rules on the target T shifted `horizon` candles back, for k weight vectors at once.
+
+        Long entries where the target is above threshold_buy, short entries where
+        it is below threshold_sell (both on candles with volume), long exits below
+        threshold_sell and short exits above threshold_buy. Unknown targets give no signal.
+
+        :param weights: (k, len(COMPONENTS)) array the weight vectors
+        :param threshold_buy: float or (k,) array
+        :param threshold_sell: float or (k,) array
+        :param volume: array the candle volumes
+        :param horizon: int candles the target looks ahead
+        :return: dict enter_long, enter_short, exit_long, exit_short -> (candles, k) bool arrays
+        """
+        target = self.target(np.atleast_2d(weights))
+        shifted = np.full(target.shape, np.nan, dtype=target.dtype)
+        if horizon < len(target):
+            shifted[:len(target) - horizon] = target[horizon:]
+        with np.errstate(invalid='ignore'):
+            above = shifted > np.asarray(threshold_buy, dtype=target.dtype)
+            below = shifted < np.asarray(threshold_sell, dtype=target.dtype)
+        traded = (np.asarray(volume) > 0)[:, None]
+        return {'enter_long': above & traded, 'enter_short': below & traded, 'exit_long': below, 'exit_short': above}
+
+
+class ScoreBaseCache(CandleMemo):
+    """The ScoreBase of the last frame of every pair (`get(pair, dataframe, build)`)"""
@@ -0,0 +1,41 @@
+"""
+Weighted combination of per candle sub-scores.
+
+A `WeightedScore` keeps two running arrays, the weighted sum of the sub-scores
+and the total weight that contributed to each row, so sub-scores are folded in
+one at a time and no frame of all sub-scores is ever built. A NaN sub-score is
+skipped for its row, like `DataFrame.mean(axis=1)`.
+"""
+from typing import Optional
+
+import numpy as np
+
+
+class WeightedScore:
+    """NaN aware running weighted mean of sub-score arrays"""
+
+    def __init__(self, length: int, weights: Optional[dict] = None):
+        """
+        :param length: int rows of every sub-score
+        :param weights: dict sub-score name -> weight, names not listed weigh 1.0
+        """
+        self.weights = weights or {}
+        self.total = np.zeros(length)
+        self.weight = np.zeros(length)
+
+    def add(self, name: str, values) -> None:
+        """Fold in one sub-score (array-like of the same length)"""
+        weight = float(self.weights.get(name, 1.0))
+        if weight == 0.0:
+            return
+        values = np.asarray(values, dtype=np.float64)
+        valid = ~np.isnan(values)
+        self.total += np.where(valid, values, 0.0) * weight
+        self.weight += valid * weight
+
+    def mean(self, fill: float = np.nan) -> np.ndarray:
+        """Weighted mean per row, `fill` where no sub-score was available"""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            score = self.total / self.weight
+        score[self.weight == 0] = fill
+        return score
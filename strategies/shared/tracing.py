@@ -0,0 +1,97 @@
+"""
+Sampled debug tracing for the strategy variants.
+
+The debug variants used to print shapes, column lists and signal counts on
+every analysis of every pair, which floods stdout and costs more than the
+analysis itself in long backtests. A `Tracer` instead
+
+- samples: only the first `first` analyses of a pair and then every `every`-th
+  one are traced, the others cost a dict lookup per call;
+- formats lazily: messages are `str.format` templates whose arguments may be
+  callables, evaluated only when the message is recorded, so
+  `tracer(pair, 'columns: {}', lambda: list(dataframe.columns))` builds no list
+  for an untraced candle;
+- records into a ring buffer of the last `capacity` messages, written out by
+  `dump()` (and at exit when `dump_path` is set), optionally echoing each
+  message as it is recorded;
+- is a no-op when disabled.
+
+A traced analysis starts with `begin(pair)` in populate_indicators; the
+messages of populate_entry_trend/populate_exit_trend of the pair belong to the
+same analysis (backtests call them after the indicators of every pair).
+"""
+import atexit
+from collections import deque
+from typing import Callable, Optional, Union
+
+
+class Tracer:
+    """Per pair sampled, lazily formatted trace messages kept in a ring buffer"""
+
+    def __init__(self, enabled: bool = True, first: int = 1, every: int = 0, capacity: int = 10000,
+                 echo: Union[bool, Callable[[str], None]] = False, dump_path: Optional[str] = None):
+        """
+        :param enabled: bool False turns every call into a no-op
+        :param first: int analyses traced at the start of every pair
+        :param every: int then trace every n-th analysis of a pair, 0 for none
+        :param capacity: int messages kept in the ring buffer
+        :param echo: bool or callable, also pass each message to print (True) or the callable
+        :param dump_path: str file the ring buffer is written to at exit
+        """
+        self.enabled = enabled
+        self.first = first
+        self.every = every
+        self.echo = print if echo is True else (echo or None)
+        self.buffer = deque(maxlen=capacity)
+        self._analyses = {}  # pair -> analyses started
+        self._traced = {}  # pair -> analysis number, for pairs whose current analysis is traced
+        if enabled and dump_path:
+            atexit.register(self.dump, dump_path)
+
+    def begin(self, pair: str) -> bool:
+        """Start an analysis (a new candle) of pair, returns whether it is traced"""
+        if not self.enabled:
+            return False
+        count = self._analyses.get(pair, 0)
+        self._analyses[pair] = count + 1
+        if count < self.first or (self.every and (count - self.first + 1) % self.every == 0):
+            self._traced[pair] = count
+            return True
+        self._traced.pop(pair, None)
+        return False
+
+    def traced(self, pair: str) -> bool:
+        """Whether the current analysis of pair is traced"""
+        return pair in self._traced
+
+    def __call__(self, pair: str, message: str, *args) -> None:
+        """
+        Record message for pair if its current analysis is traced.
+
+        :param pair: str the pair
+        :param message: str `str.format` template
+        :param args: template arguments, callables are called (only) when recorded
+        """
+        if pair not in self._traced:
+            return
+        if args:
+            message = message.format(*(arg() if callable(arg) else arg for arg in args))
+        self.buffer.append((pair, self._traced[pair], message))
+        if self.echo is not None:
+            self.echo(f"[{pair} #{self._traced[pair]}] {message}")
+
+    def lines(self) -> list:
+        return [f"[{pair} #{analysis}] {message}" for pair, analysis, message in self.buffer]
+
+    def dump(self, path: Optional[str] = None) -> list:
+        """Buffered messages as lines, also written to path when given"""
+        lines = self.lines()
+        if path:
+            with open(path, 'w') as handle:
+                handle.writelines(line + '\n' for line in lines)
+        return lines
+
+    def clear(self) -> None:
+        self.buffer.clear()
+        self._analyses.clear()
+        self._traced.clear()